@@ -54,7 +54,8 @@ class FormatterAgent:
         Args:
             model_type: 사용할 LLM 모델 (요약은 빠른 모델로 충분)
         """
-        self.llm = get_llm(model_type=model_type, temperature=0.5)
+        # 같은 기획서의 요약은 재사용 (응답 캐시)
+        self.llm = get_llm(model_type=model_type, temperature=0.5, cache=True)
 
     def run(self, state: PlanCraftState) -> PlanCraftState:
         """
@@ -0,0 +1,169 @@
+"""
+Section-scoped Refinement Helper
+
+Refiner가 target_sections를 지정한 경우, 전체 초안을 다시 쓰지 않고
+해당 섹션만 재작성하여 이전 초안에 끼워 넣습니다(Splice).
+- 대상이 아닌 섹션은 이전 초안 그대로 유지 (byte 단위 동일)
+- 섹션 순서/ID/이름은 이전 초안 기준으로 고정
+- 재작성 섹션에서 사라진 인용([Source N])은 RAG 컨텍스트에 실제 출처가 있을 때만 섹션 끝에 다시 붙임
+  (존재하지 않는 출처 인용은 Reviewer 지적에 따라 의도적으로 삭제된 것이므로 복원하지 않음)
+"""
+import re
+from typing import Any, Dict, List, Optional, Set
+
+from graph.state import ensure_dict
+
+# rag/validator.py CitationValidator와 동일한 인용 형식
+CITATION_PATTERN = re.compile(r"\[Source\s+\d+[^\]]*\]")
+_SOURCE_ID_PATTERN = re.compile(r"\[Source\s+(\d+)")
+
+# "3", "섹션 3", "3. 시장 분석", "[3] 시장 분석" 등에서 선두 번호 추출
+_LEADING_ID_PATTERN = re.compile(r"^\s*(?:섹션\s*)?\[?(\d+)\]?[.)]?\s*(.*)$")
+
+
+def _normalize_name(name: str) -> str:
+    return re.sub(r"[\s#*.:()\[\]-]+", "", str(name)).lower()
+
+
+def get_target_sections(refinement_guideline: Any, review: Any = None) -> List[str]:
+    """
+    재작성 대상 섹션 목록 추출 (RefinementStrategy 우선, 없으면 Reviewer 지정값)
+    """
+    for source in (refinement_guideline, review):
+        if not source:
+            continue
+        targets = ensure_dict(source).get("target_sections") or []
+        targets = [str(t).strip() for t in targets if str(t).strip()]
+        if targets:
+            return targets
+    return []
+
+
+def resolve_target_indexes(sections: List[Any], targets: List[str]) -> List[int]:
+    """
+    대상 섹션 이름/ID를 초안의 섹션 인덱스로 변환합니다.
+
+    매칭 순서: 섹션 ID → 정규화된 이름 일치 → 이름 부분 일치
+    매칭되지 않는 대상은 무시합니다.
+
+    Returns:
+        List[int]: 초안 순서대로 정렬된 인덱스 목록
+    """
+    entries = [ensure_dict(s) for s in sections]
+    by_id = {str(e.get("id")): i for i, e in enumerate(entries) if e.get("id") is not None}
+    names = [_normalize_name(e.get("name", "")) for e in entries]
+
+    matched = set()
+    for target in targets:
+        index: Optional[int] = None
+        id_match = _LEADING_ID_PATTERN.match(target)
+        if id_match and id_match.group(1) in by_id:
+            index = by_id[id_match.group(1)]
+        else:
+            key = _normalize_name(id_match.group(2) if id_match else target)
+            if key in names:
+                index = names.index(key)
+            elif key:
+                index = next((i for i, n in enumerate(names) if n and (key in n or n in key)), None)
+        if index is not None:
+            matched.add(index)
+    return sorted(matched)
+
+
+def get_refine_target_indexes(state: Dict[str, Any]) -> List[int]:
+    """
+    이번 라운드의 섹션 단위 재작성 대상 인덱스 (Writer / Structurer 공통 판단)
+
+    개선 라운드(refine_count > 0)이고 이전 초안의 섹션 일부가 대상으로 해석될 때만 반환합니다.
+    대상이 없거나 해석되지 않거나 모든 섹션이 대상이면 빈 리스트 (전체 재작성)
+    """
+    if state.get("refine_count", 0) <= 0:
+        return []
+    previous_sections = ensure_dict(state.get("draft") or {}).get("sections", [])
+    if not previous_sections:
+        return []
+    targets = get_target_sections(state.get("refinement_guideline"), state.get("review"))
+    target_indexes = resolve_target_indexes(previous_sections, targets) if targets else []
+    if len(target_indexes) >= len(previous_sections):
+        return []
+    return target_indexes
+
+
+def build_section_refine_instruction(sections: List[Any], target_indexes: List[int]) -> str:
+    """
+    재작성 대상 섹션만 출력하도록 지시하는 프롬프트 생성 (이전 내용 포함)
+    """
+    blocks = []
+    for i in target_indexes:
+        sec = ensure_dict(sections[i])
+        blocks.append(f"### [섹션 {sec.get('id', i + 1)}] {sec.get('name', '')}\n{sec.get('content', '')}")
+
+    return f"""
+=====================================================================
+✂️ [SECTION REFINEMENT MODE] 지정된 {len(target_indexes)}개 섹션만 다시 작성하세요
+=====================================================================
+
+- 아래 섹션만 sections 배열에 출력하세요. 다른 섹션은 출력하지 마세요 (기존 내용이 그대로 유지됩니다).
+- 각 섹션의 id와 name은 아래 표기를 그대로 사용하세요.
+- 기존 인용([Source N])은 근거가 유효한 한 유지하세요.
+
+[재작성 대상 섹션 - 이전 버전]
+{chr(10).join(blocks)}
+=====================================================================
+"""
+
+
+def _restore_citations(old_content: str, new_content: str, valid_source_ids: Set[str]) -> str:
+    """재작성으로 누락된 인용 중 컨텍스트에 실제 출처가 있는 것만 섹션 끝에 다시 붙입니다."""
+    missing = []
+    for citation in CITATION_PATTERN.findall(old_content):
+        if _SOURCE_ID_PATTERN.match(citation).group(1) not in valid_source_ids:
+            continue
+        if citation not in new_content and citation not in missing:
+            missing.append(citation)
+    if not missing:
+        return new_content
+    return f"{new_content.rstrip()}\n\n출처: {' '.join(missing)}"
+
+
+def splice_sections(
+    previous_sections: List[Any],
+    regenerated_sections: List[Any],
+    target_indexes: List[int],
+    rag_context: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    재작성된 섹션을 이전 초안에 끼워 넣습니다.
+
+    Args:
+        previous_sections: 이전 초안 섹션 목록
+        regenerated_sections: LLM이 재작성한 섹션 목록 (대상 섹션만)
+        target_indexes: 재작성 대상 인덱스
+        rag_context: RAG 컨텍스트 (누락 인용 복원 시 실제 출처 확인용, 없으면 복원하지 않음)
+
+    Returns:
+        dict: {"sections": 병합된 섹션 목록, "replaced": 교체된 섹션 이름, "missing": 결과가 없어 유지된 섹션 이름}
+    """
+    regenerated = [ensure_dict(s) for s in regenerated_sections]
+    by_id = {str(s.get("id")): s for s in regenerated if s.get("id") is not None}
+    by_name = {_normalize_name(s.get("name", "")): s for s in regenerated}
+
+    valid_source_ids = set(_SOURCE_ID_PATTERN.findall(rag_context or ""))
+    merged = list(previous_sections)
+    replaced, missing = [], []
+    for position, index in enumerate(target_indexes):
+        old = ensure_dict(previous_sections[index])
+        new = by_id.get(str(old.get("id"))) or by_name.get(_normalize_name(old.get("name", "")))
+        if new is None and len(regenerated) == len(target_indexes):
+            new = regenerated[position]  # ID/이름을 바꿔 출력한 경우 순서로 대응
+        if not new or not new.get("content"):
+            missing.append(old.get("name", ""))
+            continue
+
+        merged[index] = {
+            **old,
+            "content": _restore_citations(old.get("content", ""), new["content"], valid_source_ids),
+        }
+        replaced.append(old.get("name", ""))
+
+    return {"sections": merged, "replaced": replaced, "missing": missing}
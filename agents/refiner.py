@@ -15,6 +15,7 @@ from utils.llm import get_llm
 from graph.state import PlanCraftState, update_state, ensure_dict
 from utils.schemas import RefinementStrategy
 from utils.settings import settings, get_preset  # [NEW] get_preset 추가
+from utils.budget import budget_cap
 from prompts.refiner_prompt import REFINER_SYSTEM_PROMPT, REFINER_USER_PROMPT
 from utils.file_logger import get_file_logger
 
@@ -50,6 +51,8 @@ def run(state: PlanCraftState) -> PlanCraftState:
     preset_key = state.get("generation_preset", "balanced")
     preset = get_preset(preset_key)
     MAX_RETRIES = preset.max_refine_loops  # [FIX] 프리셋 기반 동적 적용
+    # [NEW] 실행 예산 임계치 초과 시 개선 횟수 축소 (예산 소진 시 LLM 호출 없이 종료)
+    MAX_RETRIES = budget_cap("max_refine_loops", MAX_RETRIES, node="refine")
     
     # PASS 또는 횟수 초과 시 -> Stop Refinement
     if verdict == "PASS" or current_count >= MAX_RETRIES:
@@ -112,6 +115,12 @@ def run(state: PlanCraftState) -> PlanCraftState:
             "additional_search_keywords": []
         }
 
+    # [NEW] 재작성 대상 섹션: 전략에 없으면 Reviewer 지정값 사용 (섹션 단위 재작성)
+    if not strategy_data.get("target_sections"):
+        strategy_data["target_sections"] = list(review_dict.get("target_sections", []) or [])
+    if strategy_data["target_sections"]:
+        logger.info(f"[Refiner] 재작성 대상 섹션: {strategy_data['target_sections']}")
+
     # 3. 상태 업데이트
     # 현재 draft를 백업
     previous_text = ""
@@ -1,12 +1,19 @@
 """
 PlanCraft Reviewer Agent - 기획서 평가 및 심사
 """
+import contextvars
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
 from langchain_core.messages import SystemMessage, HumanMessage
 from utils.llm import get_llm
 from utils.schemas import JudgeResult
+from utils.settings import QualityThresholds
 from graph.state import PlanCraftState, update_state, ensure_dict
 from prompts.reviewer_prompt import REVIEWER_SYSTEM_PROMPT, REVIEWER_USER_PROMPT
 from utils.file_logger import get_file_logger
+from utils.tracing import span
 
 # LLM은 함수 내에서 동적으로 생성 (프리셋 적용)
 
@@ -15,6 +22,8 @@ def run(state: PlanCraftState) -> PlanCraftState:
     기획서 검토 에이전트 실행
     
     작성된 초안(DraftResult)을 평가하고 개선점을 도출합니다.
+    [UPDATE] 인용 검증(CitationValidator)과 Reviewer LLM 호출을 동시에 실행하고,
+    둘 다 끝난 뒤 검증 결과를 심사 결과에 병합합니다 (review["timings_ms"]에 구간별 시간 기록).
     
     Example:
         >>> state = {"draft": {...}}
@@ -51,66 +60,82 @@ def run(state: PlanCraftState) -> PlanCraftState:
     context = f"{rag_context}\n{web_context}"
     if specialist_context:
         context += f"\n\n=== [전문 에이전트 분석 결과 (Fact Check 기준)] ===\n{specialist_context}"
-    
-    # 2.5 인용 검증 (Validator)
+
+    # Quality/Balanced 모드에서만 내용 검증(LLM check) 수행
+    do_content_check = (preset.name in ["quality", "balanced"])
+    timings: Dict[str, float] = {}
+    start = time.perf_counter()
+
+    # 2. 인용 검증(별도 스레드)과 심사 LLM 호출(현재 스레드)을 동시에 실행
+    # [UPDATE] 두 작업은 서로 독립적이므로 순차 실행 시 지연이 합산되던 문제 해소
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="citation") as executor:
+        # Span / 예산 / 우선순위가 이어지도록 컨텍스트 복사 후 제출
+        citation_future = executor.submit(
+            contextvars.copy_context().run,
+            _validate_citations, full_text, context, do_content_check, timings
+        )
+        review_dict, error = _review_with_llm(full_text, context, preset.model_type, timings)
+        citation_result = citation_future.result()
+
+    # 3. 검증 결과 병합 (두 작업 완료 후)
+    if citation_result is not None:
+        review_dict = _merge_citation_result(review_dict, citation_result)
+    timings["total"] = round((time.perf_counter() - start) * 1000, 1)
+    review_dict["timings_ms"] = timings
+
+    if error:
+        return update_state(state, review=review_dict, error=error)
+    return update_state(
+        state,
+        review=review_dict,
+        current_step="review"
+    )
+
+
+def _validate_citations(text: str, context: str, check_content: bool, timings: Dict[str, float]) -> Optional[Dict[str, Any]]:
+    """인용 검증 (실패 시 None - 심사는 검증 없이 진행)"""
     # [NEW] Phase 2: RAG 인용 신뢰도 자동 검증
+    start = time.perf_counter()
     try:
-        from rag.validator import CitationValidator
-        validator = CitationValidator(model_type="gpt-4o-mini")
-        # Quality/Balanced 모드에서만 내용 검증(LLM check) 수행
-        do_content_check = (preset.name in ["quality", "balanced"])
-        citation_result = validator.validate(full_text, context, check_content=do_content_check)
-        
-        validator_report = ""
-        if not citation_result["valid"]:
-            validator_report = f"""
-=== [⚠️ 치명적 오류: 인용 검증 실패] ===
-AI가 작성한 인용구에 심각한 오류가 감지되었습니다. 위조된 인용(Hallucination)일 가능성이 높습니다.
-이 결과를 'Critical Issues'에 포함시키고, 점수를 대폭 감점하세요 (최대 5점).
-- 오류 내역: {chr(10).join(['• ' + issue for issue in citation_result['issues']])}
-"""
-        elif citation_result.get("score", 1.0) < 1.0:
-            validator_report = f"""
-=== [⚠️ 인용 검증 경고] ===
-인용된 내용 중 일부가 원본과 일치하지 않을 수 있습니다.
-- 경고 내역: {chr(10).join(['• ' + issue for issue in citation_result['issues']])}
-"""
-        
-        if validator_report:
-            context += f"\n\n{validator_report}"
-            
+        with span("citation_validation", check_content=check_content):
+            from rag.validator import CitationValidator
+            validator = CitationValidator(model_type="gpt-4o-mini")
+            return validator.validate(text, context, check_content=check_content)
     except Exception as e:
         get_file_logger().warning(f"[Reviewer] Validator 실행 실패: {e}")
+        return None
+    finally:
+        timings["citation_validation"] = round((time.perf_counter() - start) * 1000, 1)
+
+
+def _review_with_llm(draft: str, context: str, model_type: str, timings: Dict[str, float]):
+    """
+    Reviewer LLM 심사
 
-    # 2. 프롬프트 구성
+    Returns:
+        (심사 결과 dict, 에러 메시지 또는 None)
+    """
     # REVIEWER_USER_PROMPT는 {draft}, {context}를 요구함
-    
     messages = [
         {"role": "system", "content": REVIEWER_SYSTEM_PROMPT},
         {"role": "user", "content": REVIEWER_USER_PROMPT.format(
-            draft=full_text,
+            draft=draft,
             context=context if context.strip() else "없음"
         )}
     ]
-    
-    # 3. LLM 호출
+
+    start = time.perf_counter()
     try:
         # 동적 LLM 생성 (프리셋 모델 적용)
         reviewer_llm = get_llm(
-            model_type=preset.model_type, 
+            model_type=model_type, 
             temperature=0.1  # Reviewer는 항상 엄격하게
         ).with_structured_output(JudgeResult)
 
         review_result = reviewer_llm.invoke(messages)
         
-        # 4. 상태 업데이트 (Pydantic -> Dict 일관성 보장)
-        review_dict = ensure_dict(review_result)
-            
-        return update_state(
-            state,
-            review=review_dict,
-            current_step="review"
-        )
+        # Pydantic -> Dict 일관성 보장
+        return ensure_dict(review_result), None
         
     except Exception as e:
         get_file_logger().error(f"[Reviewer] Failed: {e}")
@@ -124,4 +149,43 @@ AI가 작성한 인용구에 심각한 오류가 감지되었습니다. 위조
             "weaknesses": ["자동 심사 실패로 인한 기본값 적용"],
             "action_items": ["전반적인 내용 검토 필요"]
         }
-        return update_state(state, review=fallback_review, error=f"Reviewer Error: {str(e)}")
+        return fallback_review, f"Reviewer Error: {str(e)}"
+    finally:
+        timings["review_llm"] = round((time.perf_counter() - start) * 1000, 1)
+
+
+def _merge_citation_result(review: Dict[str, Any], citation_result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    인용 검증 결과를 심사 결과에 병합
+
+    - 존재하지 않는 출처 인용: Critical Issue + 점수 상한 SCORE_FAIL(5점) + PASS → REVISE
+    - 원문 불일치 인용: Weakness + 점수 상한 SCORE_REVISE_MAX(8점) + PASS → REVISE
+    - 인용 누락: Weakness 만 추가 (점수 유지)
+    """
+    review = dict(review)
+    for key in ("critical_issues", "weaknesses", "action_items"):
+        review[key] = list(review.get(key) or [])
+    score = review.get("overall_score", QualityThresholds.FALLBACK_SCORE)
+
+    invalid_citations = citation_result.get("invalid_citations") or []
+    content_issues = citation_result.get("content_issues") or []
+
+    if invalid_citations:
+        sources = ", ".join(invalid_citations)
+        review["critical_issues"].append(f"[인용 검증] 존재하지 않는 출처 인용 (위조된 인용 가능성): {sources}")
+        review["action_items"].append(f"존재하지 않는 출처 인용({sources})을 삭제하거나 실제 출처로 교체")
+        score = min(score, QualityThresholds.SCORE_FAIL)
+
+    if content_issues:
+        review["weaknesses"].extend(f"[인용 검증] {issue}" for issue in content_issues)
+        review["action_items"].append("원본 출처와 일치하지 않는 인용 문장을 출처 내용에 맞게 수정")
+        score = min(score, QualityThresholds.SCORE_REVISE_MAX)
+
+    if citation_result.get("missing_citations"):
+        review["weaknesses"].append("[인용 검증] 참고 자료가 제공되었으나 인용([Source N])이 없습니다.")
+
+    if (invalid_citations or content_issues) and review.get("verdict") == "PASS":
+        review["verdict"] = "REVISE"
+    review["overall_score"] = score
+    review["citation_check"] = citation_result
+    return review
@@ -17,6 +17,7 @@ from utils.schemas import StructureResult
 from utils.time_context import get_time_context
 from graph.state import PlanCraftState, update_state, ensure_dict
 from prompts.structurer_prompt import STRUCTURER_SYSTEM_PROMPT, STRUCTURER_USER_PROMPT
+from agents.helpers.section_refine import get_refine_target_indexes
 from utils.file_logger import get_file_logger
 
 # LLM 초기화 (run 함수 내에서 동적으로 생성함)
@@ -68,6 +69,12 @@ def run(state: PlanCraftState) -> PlanCraftState:
     previous_structure = state.get("structure")
     feedback_msg = ""
 
+    # [NEW] 섹션 단위 재작성 라운드에서는 기존 구조 유지 (Writer가 대상 섹션만 교체)
+    # 대상이 초안 섹션으로 해석되지 않으면 Writer가 전체 재작성하므로 구조도 재설계
+    if previous_structure and get_refine_target_indexes(state):
+        logger.info("[Structurer] 섹션 단위 재작성 라운드: 기존 구조 유지")
+        return update_state(state, current_step="structure")
+
     # [Logic] 재설계(Refiner -> Restart) 모드 확인
     if previous_structure:
         # Refiner에서 품질 미달로 돌아온 경우: 다양성 확보를 위해 Temperature 상향
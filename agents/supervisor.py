@@ -19,10 +19,15 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from pydantic import BaseModel, Field
 from langchain_core.messages import HumanMessage, SystemMessage, AIMessage
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 
 from utils.llm import get_llm
 from utils.file_logger import get_file_logger
+from utils.tracing import span
+from utils.rate_limiter import current_priority, llm_priority
 
 logger = get_file_logger()
 
@@ -37,12 +42,28 @@ from agents.supervisor_types import (
 )
 
 
+# =============================================================================
+# 전문 에이전트 실행 풀 (프로세스 공유)
+# =============================================================================
+# 실행마다 풀을 만들지 않고, MAX_PARALLEL_AGENTS 크기의 풀 하나를 재사용합니다.
+# 동시에 여러 워크플로우가 실행되어도 전체 에이전트 동시 실행 수가 제한됩니다.
+# 시간 초과로 버려진 스레드가 슬롯을 점유할 수 있으므로, 큐 대기 시간도 AGENT_TIMEOUT_SEC 로 제한합니다.
+_agent_executor: Optional[ThreadPoolExecutor] = None
+_agent_executor_lock = threading.Lock()
 
 
-
-
-
-
+def _get_agent_executor() -> ThreadPoolExecutor:
+    """전문 에이전트 실행용 공유 스레드 풀 반환 (싱글톤)"""
+    global _agent_executor
+    if _agent_executor is None:
+        with _agent_executor_lock:
+            if _agent_executor is None:
+                from utils.settings import settings
+                _agent_executor = ThreadPoolExecutor(
+                    max_workers=max(1, settings.MAX_PARALLEL_AGENTS),
+                    thread_name_prefix="specialist"
+                )
+    return _agent_executor
 
 
 
@@ -326,7 +347,15 @@ class NativeSupervisor:
 
     def _execute_plan(self, plan, results: Dict, context: Dict):
         """
-        실행 계획에 따라 단계별 병렬 실행 (동적 Replan 지원)
+        실행 계획에 따라 의존성 기반 병렬 실행 (동적 Replan 지원)
+
+        [REFACTOR] 의존성 기반 스케줄링:
+        - 단계(Layer) 사이의 배리어 없이, 각 에이전트는 자신의 depends_on 결과가
+          준비되는 즉시 시작합니다. (빠른 에이전트가 같은 단계의 느린 에이전트를 기다리지 않음)
+        - 프로세스 공유 스레드 풀(MAX_PARALLEL_AGENTS)에서 실행합니다.
+        - 타임아웃은 에이전트가 실제로 시작된 시점부터 AGENT_TIMEOUT_SEC 기준입니다.
+        - 풀이 다른 실행으로 가득 차 시작하지 못한 에이전트도 제출 후 AGENT_TIMEOUT_SEC 가 지나면
+          대기를 취소하고 Fallback 을 사용합니다. (다른 실행의 멈춘 에이전트가 이 실행을 무한정 막지 않음)
 
         [REFACTOR] 동적 Replan 패턴 적용:
         - 에이전트 실패 시 재시도 또는 대체 전략 수립
@@ -339,9 +368,11 @@ class NativeSupervisor:
 
         [NEW] 실행 통계 기록:
         - 각 에이전트별 시작/종료 시간, 재시도 횟수, 에러 메시지 추적
+        - Critical Path 및 단계별(Layer) 실행 대비 추정 시간 기록
         - 전체 실행 요약 로그 출력
         """
         from utils.error_handler import categorize_error
+        from agents.agent_config import get_dependency_graph
 
         # [NEW] 이벤트 콜백 추출
         on_event = context.get("on_event")
@@ -362,142 +393,245 @@ class NativeSupervisor:
 
         # 설정 로드
         from utils.settings import settings
-        max_workers = settings.MAX_PARALLEL_AGENTS
         timeout = settings.AGENT_TIMEOUT_SEC
+        executor = _get_agent_executor()
 
-        for step in plan.steps:
-            logger.info(f"--- 단계 {step.step_id}: {step.description} ---")
+        # 실행 대상 및 계획 내부 의존성 (계획에 없는 에이전트는 기다리지 않음)
+        runnable = [a for a in plan.get_all_agents() if a in self.agents]
+        dep_graph = get_dependency_graph()
+        deps = {a: [d for d in dep_graph.get(a, []) if d in runnable] for a in runnable}
+        step_of = {a: step for step in plan.steps for a in step.agent_ids}
+
+        waiting = list(runnable)          # 의존성 대기 중 (계획 순서 유지)
+        completed = set()                 # 결과(성공/Fallback)가 확정된 에이전트
+        pending = {}                      # future -> (agent_id, is_retry)
+        submitted_at = {}                 # (agent_id, is_retry) -> 풀 제출 시각 (monotonic)
+        started_at = {}                   # (agent_id, is_retry) -> 실제 시작 시각 (monotonic)
+        first_errors = {}                 # agent_id -> (error_msg, error_category)
+        started_steps = set()
+
+        # [NEW] 워커 스레드에서도 노드 Span 의 자식으로 기록되도록 컨텍스트 복사 후 제출
+        # [NEW] 병렬 전문 에이전트의 LLM 호출은 실행 우선순위보다 한 단계 낮게 대기열에 들어감
+        #       (HITL 재개 실행의 에이전트 > 일반 실행의 에이전트)
+        background = current_priority() + 1
+
+        def run_task(agent_id: str, agent_context: Dict):
+            started_at[(agent_id, False)] = time.monotonic()
+            stats.get_agent_stats(agent_id).record_start()
+            with span(agent_id, kind="agent"), llm_priority(background):
+                return self.agents[agent_id].run(**agent_context)
+
+        def retry_task(agent_id: str):
+            started_at[(agent_id, True)] = time.monotonic()
+            with span(agent_id, kind="agent", retry=True), llm_priority(background):
+                return self._retry_agent(agent_id, context, results, stats)
+
+        def submit_ready():
+            for agent_id in list(waiting):
+                if not all(d in completed for d in deps[agent_id]):
+                    continue
+                waiting.remove(agent_id)
+
+                step = step_of.get(agent_id)
+                if step is not None and step.step_id not in started_steps:
+                    started_steps.add(step.step_id)
+                    logger.info(f"--- 단계 {step.step_id}: {step.description} ---")
+                    # [Event] 단계 시작 (해당 단계의 첫 에이전트 시작 시점)
+                    if on_event:
+                        on_event({
+                            "type": "step_start",
+                            "step_id": step.step_id,
+                            "description": step.description,
+                            "agents": step.agent_ids
+                        })
+
+                # [Event] 에이전트 시작
+                if on_event:
+                    on_event({
+                        "type": "agent_start",
+                        "agent_id": agent_id,
+                        "timestamp": datetime.now().isoformat()
+                    })
+
+                # 실행 컨텍스트 준비 (의존 에이전트 결과가 모두 반영된 시점)
+                agent_context = self._prepare_agent_context(agent_id, context, results)
+
+                # 비동기 제출
+                submitted_at[(agent_id, False)] = time.monotonic()
+                future = executor.submit(contextvars.copy_context().run, run_task, agent_id, agent_context)
+                pending[future] = (agent_id, False)
+                logger.info(f"  🚀 [Running] {agent_id} (Timeout: {timeout}s)...")
+
+        def record_success(agent_id: str, result: Any, retried: bool):
+            agent_stats = stats.get_agent_stats(agent_id)
+            # 결과 키 매핑 (Registry 기반)
+            results[self._get_result_key(agent_id)] = result
+            # [NEW] 성공 통계 기록
+            agent_stats.record_end(success=True)
+            completed.add(agent_id)
+
+            if retried:
+                logger.info(f"  🔄 [Retried] {agent_id} 재시도 성공 (시도 {agent_stats.retry_count}회)")
+                # [Event] 재시도 성공
+                if on_event:
+                    on_event({
+                        "type": "agent_retry_success",
+                        "agent_id": agent_id
+                    })
+            else:
+                logger.info(f"  ✅ [Done] {agent_id} ({agent_stats.execution_time_ms:.0f}ms)")
+                # [Event] 에이전트 완료
+                if on_event:
+                    on_event({
+                        "type": "agent_success",
+                        "agent_id": agent_id,
+                        "duration_ms": agent_stats.execution_time_ms
+                    })
+
+        def record_fallback(agent_id: str, error_msg: str, error_category: str):
+            agent_stats = stats.get_agent_stats(agent_id)
+            # 재시도 실패 또는 복구 불가 에러
+            failed_agents.append(agent_id)
+            agent_stats.record_end(success=False)
+            agent_stats.fallback_used = True
+            completed.add(agent_id)
+
+            # [NEW] Fallback 데이터 사용
+            fallback = self._get_fallback_result(agent_id, context)
+            results[self._get_result_key(agent_id)] = {
+                "error": error_msg,
+                "error_category": error_category,
+                "agent_id": agent_id,
+                "fallback_used": True,
+                "retry_count": agent_stats.retry_count,
+                **fallback
+            }
             
-            # [Event] 단계 시작
+            # [Event] Fallback 사용
             if on_event:
                 on_event({
-                    "type": "step_start",
-                    "step_id": step.step_id,
-                    "description": step.description,
-                    "agents": step.agent_ids
+                    "type": "agent_fallback",
+                    "agent_id": agent_id,
+                    "reason": fallback.get("_fallback_reason")
                 })
 
-            # 병렬 실행을 위한 Future 목록
-            futures = {}
-
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                for agent_id in step.agent_ids:
-                    if agent_id in self.agents:
-                        # [NEW] 에이전트 통계 시작
-                        agent_stats = stats.get_agent_stats(agent_id)
-                        agent_stats.record_start()
-                        
-                        # [Event] 에이전트 시작
-                        if on_event:
-                            on_event({
-                                "type": "agent_start",
-                                "agent_id": agent_id,
-                                "timestamp": datetime.now().isoformat()
-                            })
-
-                        # 실행 컨텍스트 준비
-                        agent_context = self._prepare_agent_context(agent_id, context, results)
-
-                        # 비동기 제출
-                        future = executor.submit(self.agents[agent_id].run, **agent_context)
-                        futures[future] = agent_id
-                        logger.info(f"  🚀 [Running] {agent_id} (Timeout: {timeout}s)...")
-
-                # 완료 대기 및 결과 수집
-                for future in as_completed(futures):
-                    agent_id = futures[future]
-                    agent_stats = stats.get_agent_stats(agent_id)
-
-                    try:
-                        # [IMPROVE] 타임아웃 적용
-                        result = future.result(timeout=timeout)
-                        
-                        # 결과 키 매핑 (Registry 기반)
-                        result_key = self._get_result_key(agent_id)
-                        results[result_key] = result
-
-                        # [NEW] 성공 통계 기록
-                        agent_stats.record_end(success=True)
-                        logger.info(f"  ✅ [Done] {agent_id} ({agent_stats.execution_time_ms:.0f}ms)")
-                        
-                        # [Event] 에이전트 완료
-                        if on_event:
-                            on_event({
-                                "type": "agent_success",
-                                "agent_id": agent_id,
-                                "duration_ms": agent_stats.execution_time_ms
-                            })
-
-                    except Exception as e:
-                        # [REFACTOR] 에러 카테고리화 적용
-                        error_category = categorize_error(e)
-                        error_msg = str(e)
-                        
-                        # 타임아웃 구체화
-                        if isinstance(e, TimeoutError):
-                            error_category = "TIMEOUT_ERROR"
-                            error_msg = f"실행 시간 초과 ({timeout}초)"
-
-                        # [NEW] 에러 통계 기록
-                        agent_stats.record_error(error_msg, error_category)
-
-                        # 카테고리별 로깅
-                        logger.error(f"  ❌ [{error_category}] {agent_id}: {error_msg}")
-                        
-                        # [Event] 에이전트 에러
-                        if on_event:
-                            on_event({
-                                "type": "agent_error",
-                                "agent_id": agent_id,
-                                "error": error_msg,
-                                "category": error_category
-                            })
-
-                        # [NEW] 동적 Replan: 복구 가능한 에러는 재시도 (TIMEOUT은 재시도하지 않음)
-                        if error_category in ["LLM_ERROR", "NETWORK_ERROR"]:
-                            retry_result = self._retry_agent(agent_id, context, results, stats)
-                            if retry_result:
-                                results[self._get_result_key(agent_id)] = retry_result
-                                agent_stats.record_end(success=True)
-                                logger.info(f"  🔄 [Retried] {agent_id} 재시도 성공 (시도 {agent_stats.retry_count}회)")
-                                
-                                # [Event] 재시도 성공
-                                if on_event:
-                                    on_event({
-                                        "type": "agent_retry_success",
-                                        "agent_id": agent_id
-                                    })
-                                continue
-
-                        # 재시도 실패 또는 복구 불가 에러
-                        failed_agents.append(agent_id)
-                        agent_stats.record_end(success=False)
-                        agent_stats.fallback_used = True
-
-                        # [NEW] Fallback 데이터 사용
-                        fallback = self._get_fallback_result(agent_id, context)
-                        results[self._get_result_key(agent_id)] = {
-                            "error": error_msg,
-                            "error_category": error_category,
-                            "agent_id": agent_id,
-                            "fallback_used": True,
-                            "retry_count": agent_stats.retry_count,
-                            **fallback
-                        }
-                        
-                        # [Event] Fallback 사용
-                        if on_event:
-                            on_event({
-                                "type": "agent_fallback",
-                                "agent_id": agent_id,
-                                "reason": fallback.get("_fallback_reason")
-                            })
+        def record_failure(agent_id: str, e: BaseException, queued: bool = False):
+            agent_stats = stats.get_agent_stats(agent_id)
+
+            # [REFACTOR] 에러 카테고리화 적용
+            error_category = categorize_error(e)
+            error_msg = str(e)
+            
+            # 타임아웃 구체화
+            if isinstance(e, TimeoutError):
+                error_category = "TIMEOUT_ERROR"
+                error_msg = f"실행 대기 시간 초과 ({timeout}초)" if queued else f"실행 시간 초과 ({timeout}초)"
+
+            # [NEW] 에러 통계 기록
+            agent_stats.record_error(error_msg, error_category)
+
+            # 카테고리별 로깅
+            logger.error(f"  ❌ [{error_category}] {agent_id}: {error_msg}")
+            
+            # [Event] 에이전트 에러
+            if on_event:
+                on_event({
+                    "type": "agent_error",
+                    "agent_id": agent_id,
+                    "error": error_msg,
+                    "category": error_category
+                })
+
+            # [NEW] 동적 Replan: 복구 가능한 에러는 재시도 (TIMEOUT은 재시도하지 않음)
+            if error_category in ["LLM_ERROR", "NETWORK_ERROR"]:
+                first_errors[agent_id] = (error_msg, error_category)
+                submitted_at[(agent_id, True)] = time.monotonic()
+                future = executor.submit(contextvars.copy_context().run, retry_task, agent_id)
+                pending[future] = (agent_id, True)
+                return
+
+            record_fallback(agent_id, error_msg, error_category)
+
+        def handle_done(future):
+            agent_id, is_retry = pending.pop(future)
+            if is_retry:
+                error_msg, error_category = first_errors[agent_id]
+                try:
+                    retry_result = future.result()
+                except Exception as e:
+                    retry_result = None
+                    stats.get_agent_stats(agent_id).record_error(str(e), categorize_error(e))
+                if retry_result:
+                    record_success(agent_id, retry_result, retried=True)
+                else:
+                    record_fallback(agent_id, error_msg, error_category)
+                return
+
+            try:
+                result = future.result()
+            except Exception as e:
+                record_failure(agent_id, e)
+                return
+            record_success(agent_id, result, retried=False)
+
+        def expire_overdue():
+            now = time.monotonic()
+            for future, (agent_id, is_retry) in list(pending.items()):
+                key = (agent_id, is_retry)
+                begun = started_at.get(key)
+                if future.done():
+                    continue
+                if begun is None:
+                    # 큐 대기 중: 제출 후 timeout 이 지나면 대기 취소 (방금 시작되어 취소 실패 시 실행 시간 기준으로 계속)
+                    if now - submitted_at[key] < timeout or not future.cancel():
+                        continue
+                elif now - begun < timeout:
+                    continue
+                # 실행 중인 스레드는 중단할 수 없으므로 결과만 버림
+                pending.pop(future)
+                future.cancel()
+                queued = begun is None
+                if is_retry:
+                    reason = "재시도 실행 대기 시간 초과" if queued else "재시도 실행 시간 초과"
+                    stats.get_agent_stats(agent_id).record_error(f"{reason} ({timeout}초)", "TIMEOUT_ERROR")
+                    error_msg, error_category = first_errors[agent_id]
+                    record_fallback(agent_id, error_msg, error_category)
+                else:
+                    if queued:
+                        logger.warning(f"  ⏳ [Queued] {agent_id}: 공유 풀 대기 {timeout}초 초과")
+                    record_failure(agent_id, TimeoutError(f"{agent_id} timed out"), queued=queued)
+
+        def next_wait_timeout() -> float:
+            # 가장 이른 마감까지 (실행 중이면 시작 시각, 큐 대기 중이면 제출 시각 기준)
+            now = time.monotonic()
+            remaining = [
+                timeout - (now - started_at.get(key, submitted_at[key]))
+                for key in pending.values()
+            ]
+            poll = min(1.0, float(timeout))
+            if not remaining:
+                return poll
+            return max(0.0, min(min(remaining), poll))
+
+        submit_ready()
+        while pending:
+            done, _ = wait(list(pending), timeout=next_wait_timeout(), return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in pending:
+                    handle_done(future)
+            expire_overdue()
+            submit_ready()
+
+        if waiting:
+            # 순환 의존성 등으로 시작하지 못한 에이전트 (정상 계획에서는 발생하지 않음)
+            logger.warning(f"[NativeSupervisor] 실행되지 않은 에이전트: {waiting}")
 
         # [NEW] 동적 Replan: 실패한 에이전트가 있으면 의존 에이전트 체크
         if failed_agents:
             self._handle_failed_dependencies(failed_agents, plan, results, context)
 
         # [NEW] 실행 통계 완료 및 로깅
+        stats.record_critical_path(deps, [step.agent_ids for step in plan.steps])
         stats.record_end()
         logger.info(stats.to_summary())
 
@@ -68,6 +68,10 @@ class ExecutionStats:
     retried_agents: int = 0
     fallback_used_count: int = 0
     agent_stats: Dict[str, AgentExecutionStats] = field(default_factory=dict)
+    # [NEW] 의존성 기반 스케줄링 분석용
+    critical_path: List[str] = field(default_factory=list)
+    critical_path_ms: float = 0.0
+    layered_estimate_ms: float = 0.0
 
     def record_start(self, plan_id: str, total_agents: int):
         self.plan_id = plan_id
@@ -87,6 +91,64 @@ class ExecutionStats:
             if stats.fallback_used:
                 self.fallback_used_count += 1
 
+    def record_critical_path(
+        self,
+        dependencies: Dict[str, List[str]],
+        layers: List[List[str]]
+    ):
+        """
+        Critical Path 및 단계별(Layer) 실행 추정 시간 기록
+
+        - critical_path: 에이전트 실행 시간 기준 의존성 그래프의 최장 경로
+        - layered_estimate_ms: 단계 사이에 배리어가 있었다면 걸렸을 시간
+          (각 단계의 가장 느린 에이전트 시간의 합)
+
+        Args:
+            dependencies: 에이전트ID -> 의존 에이전트ID 목록 (실행 대상 내부)
+            layers: 실행 계획의 단계별 에이전트ID 목록
+        """
+        durations = {
+            agent_id: s.execution_time_ms for agent_id, s in self.agent_stats.items()
+        }
+
+        finish: Dict[str, float] = {}
+        parent: Dict[str, Optional[str]] = {}
+
+        def longest(agent_id: str) -> float:
+            if agent_id in finish:
+                return finish[agent_id]
+            finish[agent_id] = 0.0  # 순환 방지
+            best_dep, best = None, 0.0
+            for dep in dependencies.get(agent_id, []):
+                if dep in durations and longest(dep) > best:
+                    best_dep, best = dep, finish[dep]
+            finish[agent_id] = best + durations.get(agent_id, 0.0)
+            parent[agent_id] = best_dep
+            return finish[agent_id]
+
+        for agent_id in durations:
+            longest(agent_id)
+
+        if finish:
+            tail = max(finish, key=finish.get)
+            path = []
+            while tail is not None:
+                path.append(tail)
+                tail = parent.get(tail)
+            self.critical_path = list(reversed(path))
+            self.critical_path_ms = max(finish.values())
+
+        self.layered_estimate_ms = sum(
+            max((durations.get(a, 0.0) for a in layer), default=0.0) for layer in layers
+        )
+
+    @property
+    def wall_time_ms(self) -> float:
+        """전체 실행 소요 시간 (ms)"""
+        if self.started_at and self.completed_at:
+            return (self.completed_at - self.started_at).total_seconds() * 1000
+        return 0.0
+
     def get_agent_stats(self, agent_id: str) -> AgentExecutionStats:
         if agent_id not in self.agent_stats:
             self.agent_stats[agent_id] = AgentExecutionStats(agent_id=agent_id)
@@ -110,6 +172,12 @@ class ExecutionStats:
             f"⏱️ 총 소요시간: {duration:.2f}초",
         ]
 
+        if self.critical_path:
+            lines.append(
+                f"🧭 Critical Path: {' → '.join(self.critical_path)} "
+                f"({self.critical_path_ms / 1000:.2f}초, 단계별 실행 추정 {self.layered_estimate_ms / 1000:.2f}초)"
+            )
+
         # 실패한 에이전트 상세
         failed = [s for s in self.agent_stats.values() if not s.success]
         if failed:
@@ -152,6 +220,10 @@ class ExecutionStats:
             "failed_agents": self.failed_agents,
             "retried_agents": self.retried_agents,
             "fallback_used_count": self.fallback_used_count,
+            "wall_time_ms": round(self.wall_time_ms, 2),
+            "critical_path": list(self.critical_path),
+            "critical_path_ms": round(self.critical_path_ms, 2),
+            "layered_estimate_ms": round(self.layered_estimate_ms, 2),
             "agent_stats": {k: v.to_dict() for k, v in self.agent_stats.items()},
         }
 
@@ -34,6 +34,9 @@ from agents.writer_helpers import (
     build_refinement_context,
     validate_draft,
     get_specialist_context,  # [NEW] Supervisor 노드 결과 활용
+    get_refine_target_indexes,
+    build_section_refine_instruction,
+    splice_sections,
 )
 
 
@@ -129,13 +132,22 @@ def run(state: PlanCraftState) -> PlanCraftState:
 """
         formatted_prompt = specialist_header + formatted_prompt
 
+    # [NEW] 섹션 단위 재작성 대상 결정 (Refiner/Reviewer가 target_sections 지정 시)
+    refinement_guideline = state.get("refinement_guideline")
+    previous_draft = ensure_dict(state.get("draft") or {})
+    previous_sections = previous_draft.get("sections", []) if refine_count > 0 else []
+    # 모든 섹션이 대상이거나 대상이 해석되지 않으면 기존 전체 재작성과 동일
+    target_indexes = get_refine_target_indexes(state)
+
     # Refinement 컨텍스트 추가
     review_context = build_review_context(state, refine_count)
-    refinement_context = build_refinement_context(refine_count, preset.min_sections)
+    if target_indexes:
+        refinement_context = build_section_refine_instruction(previous_sections, target_indexes)
+    else:
+        refinement_context = build_refinement_context(refine_count, preset.min_sections)
 
     # Refinement Strategy
     strategy_msg = ""
-    refinement_guideline = state.get("refinement_guideline")
     if refine_count > 0 and refinement_guideline:
         direction = refinement_guideline.get("overall_direction", "") if isinstance(refinement_guideline, dict) \
             else getattr(refinement_guideline, "overall_direction", "")
@@ -152,6 +164,12 @@ def run(state: PlanCraftState) -> PlanCraftState:
         {"role": "user", "content": formatted_prompt}
     ]
 
+    if target_indexes:
+        return _run_section_refine(
+            state, messages, preset, previous_draft, target_indexes,
+            specialist_context, refine_count, logger
+        )
+
     # [NEW] ReAct 모드 판단 (Balanced/Quality에서 활성화)
     # 1. 프리셋 설정 확인 (enable_writer_react)
     # 2. state 오버라이드 확인 (UI에서 개별 비활성화 가능)
@@ -244,6 +262,66 @@ def run(state: PlanCraftState) -> PlanCraftState:
         return update_state(state, error=f"Writer 실패: {last_error}")
 
 
+def _run_section_refine(state, messages, preset, previous_draft, target_indexes,
+                        specialist_context, refine_count, logger):
+    """
+    [NEW] 섹션 단위 재작성 (Section-scoped Refinement)
+
+    대상 섹션만 LLM으로 다시 작성한 뒤 이전 초안에 끼워 넣습니다.
+    대상이 아닌 섹션은 그대로 유지되므로 출력 토큰이 대상 섹션 분량으로 줄어듭니다.
+    끼워 넣은 초안도 전체 재작성과 같은 Self-Reflection 검증(validate_draft)을 거칩니다.
+    재작성 결과를 얻지 못하면 이전 초안을 유지합니다.
+    """
+    previous_sections = previous_draft.get("sections", [])
+    target_names = [ensure_dict(previous_sections[i]).get("name", "") for i in target_indexes]
+    logger.info(f"[Writer] ✂️ 섹션 단위 재작성: {len(target_indexes)}/{len(previous_sections)}개 {target_names}")
+
+    writer_llm = get_llm(
+        model_type=preset.model_type,
+        temperature=preset.temperature
+    ).with_structured_output(DraftResult)
+
+    last_draft_dict = None
+    for current_try in range(preset.writer_max_retries):
+        try:
+            draft_result = ensure_dict(writer_llm.invoke(messages))
+            spliced = splice_sections(
+                previous_sections, draft_result.get("sections", []), target_indexes, state.get("rag_context")
+            )
+
+            if not spliced["replaced"]:
+                logger.warning(f"[Writer] 대상 섹션 출력 누락 ({current_try + 1}/{preset.writer_max_retries})")
+                continue
+
+            if spliced["missing"]:
+                logger.warning(f"[Writer] 재작성 결과 없음 (기존 유지): {spliced['missing']}")
+            draft_dict = {**previous_draft, "sections": spliced["sections"]}
+            last_draft_dict = draft_dict
+
+            # Self-Reflection 검증 (전체 재작성과 동일)
+            validation_issues = validate_draft(
+                draft_dict, preset, specialist_context, refine_count, logger
+            )
+            if validation_issues:
+                logger.warning(f"[Writer] 검증 실패: {', '.join(validation_issues)}")
+                visual_feedback = build_visual_feedback(validation_issues, preset)
+                feedback = f"[검증 실패] {', '.join(validation_issues)}. 대상 섹션을 보완해 다시 작성하세요."
+                messages.append({"role": "user", "content": feedback + visual_feedback if visual_feedback else feedback})
+                continue
+
+            logger.info(f"[Writer] ✅ 섹션 교체 완료: {spliced['replaced']}")
+            return update_state(state, draft=draft_dict, current_step="write")
+        except Exception as e:
+            logger.error(f"[Writer Error] 섹션 재작성 실패: {e}")
+
+    if last_draft_dict:
+        logger.warning("[Writer] ⚠️ 부분 결과 사용 (검증 미통과 섹션 재작성)")
+        return update_state(state, draft=last_draft_dict, current_step="write")
+
+    logger.warning("[Writer] ⚠️ 섹션 재작성 실패 - 이전 초안 유지")
+    return update_state(state, draft=previous_draft, current_step="write")
+
+
 def _write_in_chunks(llm, base_messages, structure_obj, logger):
     """
     [Quality Mode 전용] 섹션을 나누어 작성한 후 병합합니다.
@@ -17,6 +17,13 @@ from agents.helpers.executors import (
     execute_specialist_agents  # [DEPRECATED] Supervisor 노드로 이동됨
 )
 from agents.helpers.validator import validate_draft
+from agents.helpers.section_refine import (
+    get_target_sections,
+    resolve_target_indexes,
+    get_refine_target_indexes,
+    build_section_refine_instruction,
+    splice_sections,
+)
 
 
 def get_specialist_context(state: dict, logger) -> str:
@@ -27,9 +27,21 @@ async def lifespan(app: FastAPI):
     setup_logging(level="INFO", json_format=True)
     
     logger.info("[API] FastAPI server starting...")
+
+    # Start workflow workers now so recovered/queued jobs run without waiting for a new request
+    from api.services.job_queue import get_job_queue
+    get_job_queue()
     yield
     logger.info("[API] FastAPI server shutting down...")
 
+    # Close warm MCP sessions (stdio server processes)
+    from tools.mcp_pool import shutdown_mcp_pool
+    shutdown_mcp_pool()
+
+    # Stop workflow workers (queued jobs stay persisted for the next start)
+    from api.services.job_queue import shutdown_job_queue
+    shutdown_job_queue()
+
 
 app = FastAPI(
     title="PlanCraft API",
@@ -106,6 +118,10 @@ def start_api_server(host: str = "127.0.0.1", start_port: int = 8000, max_retrie
         # 3. Port seems free - Attempt to start
         logger.info(f"[API] Attempting to start server on port {port}...")
 
+        # lifespan is off for the embedded server, so start the workflow workers here
+        from api.services.job_queue import get_job_queue
+        get_job_queue()
+
         with _api_lock:
             # uvicorn 버전 호환성: install_signal_handlers는 0.19+ 필요
             config_kwargs = {
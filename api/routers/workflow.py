@@ -2,7 +2,11 @@
 import uuid
 import asyncio
 import logging
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Header, Query, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 
 from api.schemas.workflow import (
     WorkflowRunRequest,
@@ -12,19 +16,51 @@ from api.schemas.workflow import (
     WorkflowStatus,
 )
 from api.services.workflow_service import WorkflowService
+from api.services.event_stream import EventBroker, WorkflowEvent, get_event_broker_registry
+from api.services.job_queue import JobAlreadyPending, JobQueueFull, get_job_queue
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1/workflow", tags=["workflow"])
 
 
+def _enqueue(thread_id: str, kind: str, payload: dict):
+    """
+    Submit a job to the worker pool
+
+    The event stream is opened before the submit so early subscribers see every event.
+    - 409: Another job of the same thread is pending (resume only)
+    - 429: Queue is full (Retry-After = estimated seconds until a worker frees up)
+    """
+    broker = get_event_broker_registry().open(thread_id)
+    queue = get_job_queue()
+    try:
+        return queue.submit(thread_id, kind, payload, exclusive=(kind == "resume"))
+    except JobAlreadyPending:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Cannot resume: thread {thread_id} already has a pending job"
+        )
+    except JobQueueFull as e:
+        logger.warning(f"[API] Job queue full ({e.depth} queued), rejecting {kind}: {thread_id}")
+        # Close the stream only if no earlier job of this thread is still live on it
+        if not queue.has_pending(thread_id):
+            broker.publish("error", {"status": WorkflowStatus.FAILED.value, "error": "Job queue is full"})
+        raise HTTPException(
+            status_code=429,
+            detail=f"Too many queued workflows ({e.depth}). Retry later.",
+            headers={"Retry-After": str(e.retry_after)},
+        )
+
+
 @router.post("/run", response_model=WorkflowRunResponse)
-async def run_workflow(request: WorkflowRunRequest, background_tasks: BackgroundTasks):
+async def run_workflow(request: WorkflowRunRequest):
     """
-    Execute PlanCraft workflow (Async Background)
+    Execute PlanCraft workflow (Job Queue)
 
     - Start new session or reuse existing session
-    - Returns immediately with status 'running'
-    - Client should poll /status/{thread_id} for updates
+    - Returns immediately with status 'running' (job waits for a free worker)
+    - Client should follow /stream/{thread_id} (or poll /status/{thread_id}) for updates
+    - 429: Job queue is full (see Retry-After)
     """
     # Generate thread_id if not provided
     thread_id = request.thread_id or str(uuid.uuid4())
@@ -36,20 +72,16 @@ async def run_workflow(request: WorkflowRunRequest, background_tasks: Background
             detail="thread_id must be 36 characters or less"
         )
 
-    service = WorkflowService()
+    job = _enqueue(thread_id, "run", {
+        "user_input": request.user_input,
+        "file_content": request.file_content,
+        "generation_preset": request.generation_preset,
+        "refine_count": request.refine_count,
+        "previous_plan": request.previous_plan,
+        "budget": request.budget.model_dump() if request.budget else None,
+    })
 
-    # Add sync background task
-    background_tasks.add_task(
-        service.run_background_sync,
-        user_input=request.user_input,
-        thread_id=thread_id,
-        file_content=request.file_content,
-        generation_preset=request.generation_preset,
-        refine_count=request.refine_count,
-        previous_plan=request.previous_plan,
-    )
-
-    logger.info(f"[API] Workflow started: {thread_id}")
+    logger.info(f"[API] Workflow queued: {thread_id} (job {job.id})")
 
     return WorkflowRunResponse(
         thread_id=thread_id,
@@ -60,12 +92,14 @@ async def run_workflow(request: WorkflowRunRequest, background_tasks: Background
 
 
 @router.post("/resume", response_model=WorkflowRunResponse)
-async def resume_workflow(request: WorkflowResumeRequest, background_tasks: BackgroundTasks):
+async def resume_workflow(request: WorkflowResumeRequest):
     """
-    Resume HITL interrupt (Async Background)
+    Resume HITL interrupt (Job Queue)
 
-    - Continue workflow with user response in background
+    - Continue workflow with user response on a worker
     - Returns immediately with status 'running'
+    - 409: Thread is not interrupted or already has a pending job
+    - 429: Job queue is full (see Retry-After)
     """
     if not request.resume_data:
         raise HTTPException(
@@ -94,15 +128,12 @@ async def resume_workflow(request: WorkflowResumeRequest, background_tasks: Back
         logger.error(f"[API] Error verifying thread: {e}")
         raise HTTPException(status_code=500, detail="Error verifying thread state")
 
-    # Add sync background task
-    background_tasks.add_task(
-        service.resume_background_sync,
-        thread_id=request.thread_id,
-        resume_data=request.resume_data,
-        generation_preset=request.generation_preset,
-    )
+    job = _enqueue(request.thread_id, "resume", {
+        "resume_data": request.resume_data,
+        "generation_preset": request.generation_preset,
+    })
 
-    logger.info(f"[API] Workflow resumed: {request.thread_id}")
+    logger.info(f"[API] Workflow resume queued: {request.thread_id} (job {job.id})")
 
     return WorkflowRunResponse(
         thread_id=request.thread_id,
@@ -156,3 +187,109 @@ async def get_workflow_status(thread_id: str):
             status_code=500,
             detail="Failed to retrieve workflow status"
         )
+
+
+def _parse_event_id(value: Optional[str]) -> int:
+    """Parse Last-Event-ID (invalid values restart from the beginning)"""
+    try:
+        return max(int(value), 0) if value else 0
+    except (TypeError, ValueError):
+        return 0
+
+
+async def _snapshot_event(service: WorkflowService, thread_id: str, event_id: int) -> Optional[WorkflowEvent]:
+    """Build a one-off 'status' event from the checkpoint (used when no live events exist)"""
+    status = await service.get_status(thread_id)
+    if not status:
+        return None
+    return WorkflowEvent(event_id, "status", jsonable_encoder(status))
+
+
+async def _event_source(
+    request: Request,
+    broker: EventBroker,
+    service: WorkflowService,
+    last_event_id: int,
+    heartbeat_sec: float,
+):
+    """Replay buffered events after last_event_id, then follow the broker until a terminal event"""
+    yield f"retry: {int(heartbeat_sec * 1000)}\n\n"
+
+    events, gap = broker.events_after(last_event_id)
+    if gap:
+        # Reconnected after the buffer wrapped - resync once from the checkpoint
+        snapshot = await _snapshot_event(service, broker.thread_id, last_event_id)
+        if snapshot:
+            yield snapshot.to_sse()
+
+    while True:
+        for event in events:
+            last_event_id = event.id
+            yield event.to_sse()
+
+        if broker.closed and broker.last_id <= last_event_id:
+            return
+        if await request.is_disconnected():
+            return
+
+        has_new = await broker.wait_async(last_event_id, heartbeat_sec)
+        if not has_new:
+            yield ": keepalive\n\n"
+        events, _ = broker.events_after(last_event_id)
+
+
+@router.get("/stream/{thread_id}")
+async def stream_workflow_events(
+    thread_id: str,
+    request: Request,
+    last_event_id: Optional[str] = Query(default=None, description="Resume after this event id"),
+    last_event_id_header: Optional[str] = Header(default=None, alias="Last-Event-ID"),
+):
+    """
+    Stream workflow progress (Server-Sent Events)
+
+    - Events: node_start, node_end, node_error, agent, interrupt, result, error
+    - Terminal events (interrupt / result / error) end the stream
+    - Reconnect with Last-Event-ID header (or ?last_event_id=) to resume
+    - Thread without live events: single 'status' snapshot from the checkpoint
+    - 404: Thread not found
+    """
+    if not thread_id or len(thread_id) > 36:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid thread_id: must be non-empty and 36 chars or less"
+        )
+
+    from utils.settings import settings
+
+    service = WorkflowService()
+    resume_from = _parse_event_id(last_event_id_header or last_event_id)
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+    broker = get_event_broker_registry().get(thread_id)
+    if broker is None:
+        try:
+            snapshot = await _snapshot_event(service, thread_id, resume_from)
+        except Exception as e:
+            logger.error(f"[API] Error getting status for stream: {e}", exc_info=True)
+            raise HTTPException(status_code=500, detail="Failed to retrieve workflow status")
+        if snapshot is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"No workflow found for thread_id: {thread_id}"
+            )
+
+        async def single_snapshot():
+            yield snapshot.to_sse()
+
+        return StreamingResponse(single_snapshot(), media_type="text/event-stream", headers=headers)
+
+    # No Last-Event-ID: start from the beginning of the current run
+    if resume_from == 0:
+        resume_from = broker.run_start_id
+
+    return StreamingResponse(
+        _event_source(request, broker, service, resume_from, settings.EVENT_STREAM_HEARTBEAT_SEC),
+        media_type="text/event-stream",
+        headers=headers,
+    )
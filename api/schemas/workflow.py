@@ -14,6 +14,12 @@ class WorkflowStatus(str, Enum):
 
 # === Request Schemas ===
 
+class RunBudgetRequest(BaseModel):
+    """Per-run token / cost budget (omitted fields fall back to server defaults, 0 = unlimited)"""
+    max_tokens: Optional[int] = Field(None, ge=0, description="Max LLM tokens (input + output) for this run")
+    max_cost_usd: Optional[float] = Field(None, ge=0, description="Max estimated LLM cost (USD) for this run")
+
+
 class WorkflowRunRequest(BaseModel):
     """POST /api/workflow/run request"""
     user_input: str = Field(..., min_length=1, max_length=10000, description="User input text")
@@ -24,6 +30,9 @@ class WorkflowRunRequest(BaseModel):
     thread_id: Optional[str] = Field(None, description="Session ID (auto-generated if not provided)")
     refine_count: int = Field(default=0, ge=0, description="Refinement iteration count")
     previous_plan: Optional[str] = Field(None, description="Previous plan for refinement mode")
+    budget: Optional[RunBudgetRequest] = Field(
+        None, description="Token / cost budget. Past the soft limit, discussion, reranking and extra refine loops are skipped"
+    )
 
     model_config = {
         "json_schema_extra": {
@@ -93,6 +102,7 @@ class WorkflowRunResponse(BaseModel):
     step_history: List[Dict[str, Any]] = []
     error: Optional[str] = None
     token_usage: Optional[TokenUsage] = None  # [NEW] Token usage tracking
+    budget: Optional[Dict[str, Any]] = None  # [NEW] Budget usage and degradation decisions
 
     model_config = {
         "json_schema_extra": {
@@ -121,3 +131,7 @@ class WorkflowStatusResponse(BaseModel):
     has_pending_interrupt: bool = False
     result: Optional[Dict[str, Any]] = None  # 완료/중단 시 전체 상태 반환
     token_usage: Optional[TokenUsage] = None  # [NEW] Token usage tracking
+    budget: Optional[Dict[str, Any]] = None  # [NEW] Budget usage and degradation decisions
+    # [NEW] Job queue (None if the thread has no queued job)
+    queue_position: Optional[int] = None  # 1-based, only while waiting for a worker
+    queue_wait_ms: Optional[float] = None  # enqueue -> worker start (grows while queued)
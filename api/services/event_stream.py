@@ -0,0 +1,259 @@
+"""Workflow Event Stream - In-process event broker for Server-Sent Events
+
+Each workflow thread gets an EventBroker holding a bounded ring buffer of
+events with monotonically increasing ids. The graph run publishes into it
+through WorkflowEventCallback (node start/end, supervisor custom events) and
+WorkflowService publishes the terminal event (interrupt / result / error).
+The SSE endpoint replays everything after Last-Event-ID and then awaits the
+broker (wait_async), so an idle run costs no checkpoint reads and no
+executor thread per connected client.
+"""
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+logger = logging.getLogger(__name__)
+
+# Terminal event types - the stream ends once one of these is delivered
+TERMINAL_EVENTS = frozenset({"interrupt", "result", "error"})
+
+
+@dataclass
+class WorkflowEvent:
+    """Single stream event"""
+    id: int
+    event: str
+    data: Dict[str, Any]
+    timestamp: float = field(default_factory=time.time)
+
+    def to_sse(self) -> str:
+        """Serialize to the text/event-stream wire format"""
+        payload = json.dumps(
+            {**self.data, "timestamp": self.timestamp},
+            ensure_ascii=False,
+            default=str,
+        )
+        return f"id: {self.id}\nevent: {self.event}\ndata: {payload}\n\n"
+
+
+class EventBroker:
+    """Per-thread event buffer (thread-safe)
+
+    Event ids keep increasing across runs of the same thread (run -> resume),
+    so a client may reconnect with any id it has already seen.
+    """
+
+    def __init__(self, thread_id: str, buffer_size: int = 500):
+        self.thread_id = thread_id
+        self._events: deque = deque(maxlen=buffer_size)
+        self._cond = threading.Condition()
+        self._last_id = 0
+        self._run_start_id = 0
+        self._closed = False
+        self.closed_at: Optional[float] = None
+        # Async subscribers: (event loop, asyncio.Event) woken from publishing threads
+        self._async_waiters: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+
+    @property
+    def last_id(self) -> int:
+        with self._cond:
+            return self._last_id
+
+    @property
+    def run_start_id(self) -> int:
+        """Last event id before the current (or most recent) run started"""
+        with self._cond:
+            return self._run_start_id
+
+    @property
+    def closed(self) -> bool:
+        with self._cond:
+            return self._closed
+
+    def open(self) -> None:
+        """Mark a new run as active (keeps buffered events and ids)"""
+        with self._cond:
+            if self._closed:
+                self._run_start_id = self._last_id
+            self._closed = False
+            self.closed_at = None
+
+    def publish(self, event: str, data: Optional[Dict[str, Any]] = None) -> int:
+        """Append an event and wake up waiting subscribers; returns its id"""
+        with self._cond:
+            self._last_id += 1
+            self._events.append(WorkflowEvent(self._last_id, event, dict(data or {})))
+            if event in TERMINAL_EVENTS:
+                self._closed = True
+                self.closed_at = time.time()
+            self._cond.notify_all()
+            self._wake_async_waiters()
+            return self._last_id
+
+    def _wake_async_waiters(self) -> None:
+        # Called with self._cond held
+        for loop, signal in self._async_waiters:
+            try:
+                loop.call_soon_threadsafe(signal.set)
+            except RuntimeError:
+                pass  # loop already closed - the subscriber is gone
+
+    def events_after(self, last_event_id: int) -> Tuple[List[WorkflowEvent], bool]:
+        """
+        Return buffered events with id > last_event_id.
+
+        Returns:
+            (events, gap): gap is True when older events were already evicted
+        """
+        with self._cond:
+            events = [e for e in self._events if e.id > last_event_id]
+            oldest = self._events[0].id if self._events else self._last_id + 1
+            gap = last_event_id + 1 < oldest and last_event_id < self._last_id
+            return events, gap
+
+    def wait(self, last_event_id: int, timeout: float) -> bool:
+        """Block until an event newer than last_event_id exists or the run is closed"""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: self._last_id > last_event_id or self._closed,
+                timeout=timeout,
+            )
+
+    async def wait_async(self, last_event_id: int, timeout: float) -> bool:
+        """Async wait() for the SSE endpoint - awaits on the loop instead of holding a thread"""
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._cond:
+            if self._last_id > last_event_id or self._closed:
+                return True
+            self._async_waiters.add(waiter)
+        try:
+            await asyncio.wait_for(waiter[1].wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            with self._cond:
+                self._async_waiters.discard(waiter)
+
+
+class EventBrokerRegistry:
+    """thread_id -> EventBroker, with retention of finished runs"""
+
+    def __init__(self, buffer_size: int = 500, retention_sec: float = 600.0):
+        self._buffer_size = buffer_size
+        self._retention_sec = retention_sec
+        self._brokers: Dict[str, EventBroker] = {}
+        self._lock = threading.Lock()
+
+    def open(self, thread_id: str) -> EventBroker:
+        """Get (or create) the broker for a thread and mark a run as active"""
+        with self._lock:
+            self._evict_expired()
+            broker = self._brokers.get(thread_id)
+            if broker is None:
+                broker = EventBroker(thread_id, self._buffer_size)
+                self._brokers[thread_id] = broker
+        broker.open()
+        return broker
+
+    def get(self, thread_id: str) -> Optional[EventBroker]:
+        with self._lock:
+            self._evict_expired()
+            return self._brokers.get(thread_id)
+
+    def discard(self, thread_id: str) -> None:
+        with self._lock:
+            self._brokers.pop(thread_id, None)
+
+    def _evict_expired(self) -> None:
+        now = time.time()
+        expired = [
+            tid for tid, broker in self._brokers.items()
+            if broker.closed_at is not None and now - broker.closed_at > self._retention_sec
+        ]
+        for tid in expired:
+            del self._brokers[tid]
+
+
+_registry: Optional[EventBrokerRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_event_broker_registry() -> EventBrokerRegistry:
+    """Return the process-wide broker registry (singleton)"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                from utils.settings import settings
+                _registry = EventBrokerRegistry(
+                    buffer_size=settings.EVENT_STREAM_BUFFER_SIZE,
+                    retention_sec=settings.EVENT_STREAM_RETENTION_SEC,
+                )
+    return _registry
+
+
+class WorkflowEventCallback(BaseCallbackHandler):
+    """Bridge LangGraph callbacks into an EventBroker
+
+    - node_start / node_end / node_error: graph node runs
+      (chain runs whose name matches metadata["langgraph_node"])
+    - agent: custom events sent with dispatch_custom_event
+    """
+
+    def __init__(self, broker: EventBroker):
+        self.broker = broker
+        self._node_runs: Dict[UUID, Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def on_chain_start(self, serialized, inputs, *, run_id, parent_run_id=None,
+                       tags=None, metadata=None, **kwargs) -> None:
+        node = (metadata or {}).get("langgraph_node")
+        if not node or kwargs.get("name") != node:
+            return
+        with self._lock:
+            self._node_runs[run_id] = (node, time.perf_counter())
+        self.broker.publish("node_start", {"node": node})
+
+    def on_chain_end(self, outputs, *, run_id, **kwargs) -> None:
+        with self._lock:
+            entry = self._node_runs.pop(run_id, None)
+        if entry is None:
+            return
+        node, started = entry
+        data = {"node": node, "duration_ms": round((time.perf_counter() - started) * 1000, 1)}
+        # 노드가 남긴 마지막 step_history 항목 (UI 진행 로그용)
+        if isinstance(outputs, dict):
+            history = outputs.get("step_history")
+            if isinstance(history, list) and history and isinstance(history[-1], dict):
+                data["step"] = history[-1]
+            if outputs.get("current_step"):
+                data["current_step"] = outputs["current_step"]
+        self.broker.publish("node_end", data)
+
+    def on_chain_error(self, error, *, run_id, **kwargs) -> None:
+        with self._lock:
+            entry = self._node_runs.pop(run_id, None)
+        if entry is None:
+            return
+        # interrupt()는 에러가 아님 - 종료 이벤트는 WorkflowService가 발행
+        from langgraph.errors import GraphInterrupt
+        if isinstance(error, GraphInterrupt):
+            return
+        self.broker.publish("node_error", {"node": entry[0], "error": str(error)})
+
+    def on_custom_event(self, name, data, *, run_id, tags=None, metadata=None, **kwargs) -> None:
+        payload = data if isinstance(data, dict) else {"value": data}
+        self.broker.publish("agent", {
+            "name": name,
+            "node": (metadata or {}).get("langgraph_node"),
+            **payload,
+        })
@@ -0,0 +1,346 @@
+"""Workflow Job Queue - Durable local queue with a bounded worker pool
+
+Workflow runs used to be pushed into FastAPI BackgroundTasks, which shares
+the request threadpool, has no admission control and drops pending work on
+restart. Jobs are now persisted in SQLite and executed by a fixed pool of
+worker threads:
+
+- Admission control: submit() raises JobQueueFull once the number of queued
+  jobs reaches max_depth (the router maps it to 429 + Retry-After)
+- Per-thread serialization: at most one job per workflow thread_id runs at a
+  time, and jobs of the same thread run in submission order
+- Durability: queued jobs survive a restart; jobs that were running when the
+  process died are re-queued on start
+- Queue wait time (enqueue -> start) is recorded per job for the status API
+"""
+import json
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class JobAlreadyPending(Exception):
+    """Raised by an exclusive submit when the thread already has a queued/running job"""
+
+
+class JobQueueFull(Exception):
+    """Raised when the queue is at max depth"""
+
+    def __init__(self, depth: int, retry_after: int):
+        super().__init__(f"Job queue is full ({depth} queued)")
+        self.depth = depth
+        self.retry_after = retry_after
+
+
+@dataclass
+class Job:
+    """Single queued workflow execution"""
+    id: int
+    thread_id: str
+    kind: str
+    payload: Dict[str, Any]
+    status: str
+    enqueued_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    attempts: int = 0
+    error: Optional[str] = None
+
+    @property
+    def queue_wait_ms(self) -> Optional[float]:
+        """Time spent waiting for a worker (still growing while queued)"""
+        end = self.started_at if self.started_at is not None else (time.time() if self.status == QUEUED else None)
+        if end is None:
+            return None
+        return round((end - self.enqueued_at) * 1000, 1)
+
+
+_COLUMNS = "id, thread_id, kind, payload, status, enqueued_at, started_at, finished_at, attempts, error"
+
+
+def _row_to_job(row) -> Job:
+    return Job(
+        id=row[0], thread_id=row[1], kind=row[2], payload=json.loads(row[3]), status=row[4],
+        enqueued_at=row[5], started_at=row[6], finished_at=row[7], attempts=row[8], error=row[9],
+    )
+
+
+class JobQueue:
+    """SQLite-backed job queue with a worker pool (thread-safe)
+
+    Args:
+        handler: Called with each Job on a worker thread; raising marks the job failed
+        db_path: SQLite path (":memory:" for tests)
+        workers: Number of worker threads
+        max_depth: Max number of queued (not yet running) jobs
+        retention_sec: Finished jobs older than this are pruned on start
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[Job], None],
+        db_path: str = ":memory:",
+        workers: int = 2,
+        max_depth: int = 20,
+        retention_sec: float = 86400.0,
+    ):
+        self.handler = handler
+        self.db_path = db_path
+        self.workers = max(1, workers)
+        self.max_depth = max_depth
+        self.retention_sec = retention_sec
+
+        self._cond = threading.Condition(threading.RLock())
+        self._active_threads: set = set()
+        self._threads: List[threading.Thread] = []
+        self._started = False
+        self._stopping = False
+        self._stats = {"submitted": 0, "completed": 0, "failed": 0, "rejected": 0, "recovered": 0}
+        self._durations: List[float] = []
+
+        if db_path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT, thread_id TEXT NOT NULL, kind TEXT NOT NULL,"
+            " payload TEXT NOT NULL, status TEXT NOT NULL, enqueued_at REAL NOT NULL,"
+            " started_at REAL, finished_at REAL, attempts INTEGER NOT NULL DEFAULT 0, error TEXT)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status, id)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_thread ON jobs(thread_id, id)")
+        self._conn.commit()
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    def start(self) -> "JobQueue":
+        """Recover interrupted jobs, prune old ones and start the workers (idempotent)"""
+        with self._cond:
+            if self._started:
+                return self
+            self._started = True
+            self._stopping = False
+
+            cur = self._conn.execute(
+                "UPDATE jobs SET status = ?, started_at = NULL WHERE status = ?", (QUEUED, RUNNING)
+            )
+            if cur.rowcount:
+                self._stats["recovered"] += cur.rowcount
+                logger.warning(f"[JobQueue] Re-queued {cur.rowcount} job(s) interrupted by a restart")
+            self._conn.execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND finished_at < ?",
+                (DONE, FAILED, time.time() - self.retention_sec),
+            )
+            self._conn.commit()
+
+            for i in range(self.workers):
+                thread = threading.Thread(target=self._worker_loop, daemon=True, name=f"WorkflowWorker-{i}")
+                thread.start()
+                self._threads.append(thread)
+            self._cond.notify_all()
+        return self
+
+    def shutdown(self, wait: bool = True, timeout: float = 10.0) -> None:
+        """Stop the workers. Queued jobs stay in the database for the next start."""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+            threads, self._threads = self._threads, []
+            self._started = False
+        if wait:
+            deadline = time.monotonic() + timeout
+            for thread in threads:
+                thread.join(max(0.0, deadline - time.monotonic()))
+
+    # =========================================================================
+    # Submit / Query
+    # =========================================================================
+
+    def submit(self, thread_id: str, kind: str, payload: Dict[str, Any], exclusive: bool = False) -> Job:
+        """
+        Enqueue a job
+
+        Args:
+            exclusive: Reject if the thread already has a queued/running job (checked atomically)
+
+        Raises:
+            JobAlreadyPending: exclusive and the thread has a pending job
+            JobQueueFull: queued jobs >= max_depth
+        """
+        now = time.time()
+        with self._cond:
+            if exclusive and self.has_pending(thread_id):
+                raise JobAlreadyPending(thread_id)
+            depth = self._count(QUEUED)
+            if depth >= self.max_depth:
+                self._stats["rejected"] += 1
+                raise JobQueueFull(depth, self._estimate_retry_after(depth))
+            cur = self._conn.execute(
+                "INSERT INTO jobs (thread_id, kind, payload, status, enqueued_at) VALUES (?, ?, ?, ?, ?)",
+                (thread_id, kind, json.dumps(payload, ensure_ascii=False), QUEUED, now),
+            )
+            self._conn.commit()
+            self._stats["submitted"] += 1
+            self._cond.notify_all()
+            return Job(cur.lastrowid, thread_id, kind, payload, QUEUED, now)
+
+    def has_pending(self, thread_id: str) -> bool:
+        """True if the thread has a queued or running job"""
+        with self._cond:
+            row = self._conn.execute(
+                "SELECT 1 FROM jobs WHERE thread_id = ? AND status IN (?, ?) LIMIT 1",
+                (thread_id, QUEUED, RUNNING),
+            ).fetchone()
+            return row is not None
+
+    def latest_job(self, thread_id: str) -> Optional[Job]:
+        """Most recent job for a thread"""
+        with self._cond:
+            row = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM jobs WHERE thread_id = ? ORDER BY id DESC LIMIT 1", (thread_id,)
+            ).fetchone()
+            return _row_to_job(row) if row else None
+
+    def position(self, job_id: int) -> Optional[int]:
+        """1-based position among queued jobs (None if not queued)"""
+        with self._cond:
+            row = self._conn.execute("SELECT status FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if not row or row[0] != QUEUED:
+                return None
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status = ? AND id <= ?", (QUEUED, job_id)
+            ).fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            stats = dict(self._stats)
+            stats.update({
+                "queued": self._count(QUEUED),
+                "running": self._count(RUNNING),
+                "workers": self.workers,
+                "max_depth": self.max_depth,
+            })
+            durations = list(self._durations)
+        stats["avg_run_sec"] = round(sum(durations) / len(durations), 2) if durations else None
+        return stats
+
+    # =========================================================================
+    # Workers
+    # =========================================================================
+
+    def _count(self, status: str) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM jobs WHERE status = ?", (status,)).fetchone()[0]
+
+    def _estimate_retry_after(self, depth: int) -> int:
+        """Seconds until a slot is likely free (average run time x queue depth / workers)"""
+        durations = self._durations or [5.0]
+        avg = sum(durations) / len(durations)
+        return max(1, math.ceil(avg * max(1, depth) / self.workers))
+
+    def _claim(self) -> Optional[Job]:
+        """Oldest queued job whose thread is not running (call with the condition held)"""
+        rows = self._conn.execute(
+            f"SELECT {_COLUMNS} FROM jobs WHERE status = ? ORDER BY id", (QUEUED,)
+        ).fetchall()
+        for row in rows:
+            job = _row_to_job(row)
+            if job.thread_id in self._active_threads:
+                continue
+            job.status = RUNNING
+            job.started_at = time.time()
+            job.attempts += 1
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, started_at = ?, attempts = ? WHERE id = ?",
+                (RUNNING, job.started_at, job.attempts, job.id),
+            )
+            self._conn.commit()
+            self._active_threads.add(job.thread_id)
+            return job
+        return None
+
+    def _finish(self, job: Job, error: Optional[str]) -> None:
+        finished_at = time.time()
+        with self._cond:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, finished_at = ?, error = ? WHERE id = ?",
+                (FAILED if error else DONE, finished_at, error, job.id),
+            )
+            self._conn.commit()
+            self._active_threads.discard(job.thread_id)
+            self._stats["failed" if error else "completed"] += 1
+            self._durations = (self._durations + [finished_at - job.started_at])[-50:]
+            self._cond.notify_all()
+
+    def _worker_loop(self) -> None:
+        while True:
+            with self._cond:
+                job = None
+                while not self._stopping:
+                    job = self._claim()
+                    if job is not None:
+                        break
+                    self._cond.wait(timeout=1.0)
+                if self._stopping and job is None:
+                    return
+
+            logger.info(f"[JobQueue] Job {job.id} ({job.kind}) started: {job.thread_id} "
+                        f"(waited {job.queue_wait_ms}ms)")
+            error = None
+            try:
+                self.handler(job)
+            except Exception as e:
+                error = str(e) or type(e).__name__
+                logger.error(f"[JobQueue] Job {job.id} failed: {error}")
+            self._finish(job, error)
+
+
+_job_queue: Optional[JobQueue] = None
+_job_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> JobQueue:
+    """Return the process-wide job queue, starting its workers on first use (singleton)"""
+    global _job_queue
+    if _job_queue is None:
+        with _job_queue_lock:
+            if _job_queue is None:
+                from utils.settings import settings
+                from api.services.workflow_service import WorkflowService
+
+                _job_queue = JobQueue(
+                    handler=WorkflowService().execute_job,
+                    db_path=settings.JOB_QUEUE_DB_PATH,
+                    workers=settings.JOB_QUEUE_WORKERS,
+                    max_depth=settings.JOB_QUEUE_MAX_DEPTH,
+                    retention_sec=settings.JOB_QUEUE_RETENTION_SEC,
+                ).start()
+    return _job_queue
+
+
+def peek_job_queue() -> Optional[JobQueue]:
+    """Return the job queue if it has been created (never starts workers)"""
+    return _job_queue
+
+
+def shutdown_job_queue(wait: bool = True) -> None:
+    """Stop the workers (pending jobs remain persisted)"""
+    global _job_queue
+    with _job_queue_lock:
+        queue, _job_queue = _job_queue, None
+    if queue is not None:
+        queue.shutdown(wait=wait)
@@ -10,6 +10,11 @@ from api.schemas.workflow import (
     WorkflowStatusResponse,
     TokenUsage,
 )
+from api.services.event_stream import (
+    EventBroker,
+    WorkflowEventCallback,
+    get_event_broker_registry,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -25,31 +30,34 @@ class WorkflowService:
         generation_preset: str = "balanced",
         refine_count: int = 0,
         previous_plan: Optional[str] = None,
+        budget: Optional[Dict[str, Any]] = None,
     ) -> None:
         """
-        Execute workflow in background (Synchronous - for FastAPI BackgroundTasks)
-
-        Note: BackgroundTasks expects sync callables, not coroutines.
+        Execute workflow in background (Synchronous - runs on a job queue worker)
         """
         from graph.workflow import run_plancraft
         from utils.streamlit_callback import TokenTrackingCallback
 
         token_callback = TokenTrackingCallback()
+        broker = get_event_broker_registry().open(thread_id)
 
         try:
             logger.info(f"[Workflow] Starting background execution: {thread_id}")
-            run_plancraft(
+            result = run_plancraft(
                 user_input=user_input,
                 file_content=file_content,
                 generation_preset=generation_preset,
                 thread_id=thread_id,
                 refine_count=refine_count,
                 previous_plan=previous_plan,
-                callbacks=[token_callback],
+                budget=budget,
+                callbacks=[token_callback, WorkflowEventCallback(broker)],
             )
+            self._publish_outcome(broker, thread_id, result)
             logger.info(f"[Workflow] Background execution completed: {thread_id}")
             logger.debug(f"[Workflow] Token usage: {token_callback.get_usage_summary()}")
         except Exception as e:
+            broker.publish("error", {"status": WorkflowStatus.FAILED.value, "error": str(e)})
             logger.error(f"[Workflow] Background execution failed: {thread_id} - {e}", exc_info=True)
             raise
 
@@ -60,27 +68,61 @@ class WorkflowService:
         generation_preset: str = "balanced",
     ) -> None:
         """
-        Resume workflow in background (Synchronous - for FastAPI BackgroundTasks)
+        Resume workflow in background (Synchronous - runs on a job queue worker)
         """
         from graph.workflow import run_plancraft
         from utils.streamlit_callback import TokenTrackingCallback
 
         token_callback = TokenTrackingCallback()
+        broker = get_event_broker_registry().open(thread_id)
 
         try:
             logger.info(f"[Workflow] Resuming background execution: {thread_id}")
-            run_plancraft(
+            result = run_plancraft(
                 user_input="",
                 thread_id=thread_id,
                 resume_command={"resume": resume_data},
                 generation_preset=generation_preset,
-                callbacks=[token_callback],
+                callbacks=[token_callback, WorkflowEventCallback(broker)],
             )
+            self._publish_outcome(broker, thread_id, result)
             logger.info(f"[Workflow] Background resume completed: {thread_id}")
         except Exception as e:
+            broker.publish("error", {"status": WorkflowStatus.FAILED.value, "error": str(e)})
             logger.error(f"[Workflow] Background resume failed: {thread_id} - {e}", exc_info=True)
             raise
 
+    def execute_job(self, job) -> None:
+        """Job queue handler - dispatch a queued job to run / resume"""
+        if job.kind == "resume":
+            self.resume_background_sync(thread_id=job.thread_id, **job.payload)
+        else:
+            self.run_background_sync(thread_id=job.thread_id, **job.payload)
+
+    def _publish_outcome(self, broker: EventBroker, thread_id: str, result: Optional[dict]) -> None:
+        """
+        Publish the terminal stream event for a finished run
+
+        The full result is included so streaming clients need no extra status call.
+        """
+        from fastapi.encoders import jsonable_encoder
+
+        response = self._convert_to_response(thread_id, result)
+        payload = {
+            "status": response.status.value,
+            "result": jsonable_encoder(result or {}),
+        }
+
+        if response.status == WorkflowStatus.INTERRUPTED:
+            broker.publish("interrupt", payload)
+        elif response.status == WorkflowStatus.FAILED:
+            payload["error"] = response.error
+            broker.publish("error", payload)
+        else:
+            # invoke가 반환했으면 실행은 끝난 것 (final_output 없는 응답형 흐름 포함)
+            payload["status"] = WorkflowStatus.COMPLETED.value
+            broker.publish("result", payload)
+
     async def run(
         self,
         user_input: str,
@@ -89,6 +131,7 @@ class WorkflowService:
         thread_id: Optional[str] = None,
         refine_count: int = 0,
         previous_plan: Optional[str] = None,
+        budget: Optional[Dict[str, Any]] = None,
     ) -> WorkflowRunResponse:
         """Execute workflow (Wait for result)"""
         from graph.workflow import run_plancraft
@@ -107,6 +150,7 @@ class WorkflowService:
             thread_id=thread_id,
             refine_count=refine_count,
             previous_plan=previous_plan,
+            budget=budget,
             callbacks=[token_callback],
         )
 
@@ -145,12 +189,19 @@ class WorkflowService:
 
     async def get_status(self, thread_id: str) -> Optional[WorkflowStatusResponse]:
         """Get workflow status with improved error handling"""
-        from graph.workflow import app
+        from graph.workflow import get_app
+        from api.services.job_queue import peek_job_queue, QUEUED, RUNNING
 
         config = {"configurable": {"thread_id": thread_id}}
 
+        # Queued / running job: the checkpoint may not exist yet or still show the old state
+        queue = peek_job_queue()
+        job = queue.latest_job(thread_id) if queue else None
+        if job and job.status not in (QUEUED, RUNNING):
+            job = None
+
         try:
-            snapshot = app.get_state(config)
+            snapshot = get_app().get_state(config)
         except KeyError:
             # Thread not found - expected case
             logger.debug(f"[Workflow] Thread not found: {thread_id}")
@@ -161,6 +212,13 @@ class WorkflowService:
             raise
 
         if not snapshot or not snapshot.values:
+            if job:
+                return WorkflowStatusResponse(
+                    thread_id=thread_id,
+                    status=WorkflowStatus.RUNNING,
+                    queue_position=queue.position(job.id),
+                    queue_wait_ms=job.queue_wait_ms,
+                )
             return None
 
         state = snapshot.values
@@ -195,6 +253,9 @@ class WorkflowService:
 
         has_interrupt = bool(interrupt_value)
         status = self._determine_status(state, has_interrupt)
+        if job:
+            # A pending resume supersedes the interrupted checkpoint
+            status, interrupt_value, has_interrupt = WorkflowStatus.RUNNING, None, False
 
         # Prepare result dict if finished or interrupted
         result_data = None
@@ -216,6 +277,9 @@ class WorkflowService:
             has_pending_interrupt=has_interrupt,
             result=result_data,
             token_usage=token_usage,
+            budget=state.get("budget"),
+            queue_position=queue.position(job.id) if job else None,
+            queue_wait_ms=job.queue_wait_ms if job else None,
         )
 
     def _extract_token_usage(self, usage_data: Optional[Dict]) -> Optional[TokenUsage]:
@@ -264,6 +328,7 @@ class WorkflowService:
             step_history=result.get("step_history", []),
             error=result.get("error"),
             token_usage=token_usage,
+            budget=result.get("budget"),
         )
 
     def _determine_status(self, state: dict, has_interrupt: bool) -> WorkflowStatus:
@@ -0,0 +1,14 @@
+"""
+PlanCraft 성능 벤치마크
+
+외부 API 없이 로컬에서 실행 가능한 측정 스크립트 모음입니다.
+
+사용법:
+    python -m benchmarks.state_update
+    python -m benchmarks.e2e            # 오프라인 End-to-End (가짜 LLM/검색/임베딩)
+    python -m benchmarks.mcp_pool       # MCP 호출 지연 (로컬 stdio 스텁 서버)
+    python -m benchmarks.import_time    # API 엔트리포인트 Cold import 예산 검사 (초과 시 exit 1)
+    python -m benchmarks.job_queue      # 워크플로우 작업 큐 동시 제출 부하 (가짜 LLM)
+    python -m benchmarks.file_logger    # 동시 로그 호출 오버헤드 (동기 기록 vs 큐 기록)
+    python -m benchmarks.rate_limiter   # 배포별 RPM/TPM 한도 조율 (가짜 Azure OpenAI 서버, 429 횟수 비교)
+"""
@@ -0,0 +1,360 @@
+"""
+오프라인 End-to-End 워크플로우 벤치마크
+
+Azure OpenAI / Tavily / 실제 FAISS 빌드 없이 run_plancraft() 전체 그래프를
+프리셋(fast/balanced/quality)별로 실행하고 성능 지표를 JSON으로 출력합니다.
+
+대체되는 외부 의존성 (benchmarks.fakes):
+    - utils.llm.get_llm / get_embeddings → FakeChatModel / FakeEmbeddings
+    - tools.mcp_client.search_sync / fetch_url_sync → 가짜 검색/조회
+    - RAG 인덱스 → 임시 디렉터리에 가짜 임베딩으로 빌드 (update_vectorstore)
+    - Checkpointer → 임시 SQLite 파일 (체크포인트 크기 측정)
+    - utils.time_context.get_naver_time → 고정 시각 (BENCH_NOW)
+
+측정 항목 (프리셋별):
+    - wall_ms: run_plancraft() 전체 소요 시간 (HITL 자동 재개 포함)
+    - nodes: 노드별 호출 수 / 누적·최대 지연 (ms)
+    - peak_rss_kb: 실행 후 프로세스 최대 RSS (ru_maxrss), rss_growth_kb: 실행 중 증가분
+    - checkpoint: 체크포인트 수 / 직렬화 바이트 / pending writes 바이트
+    - fake_calls: LLM/임베딩/검색 호출 수
+
+사용법:
+    python -m benchmarks.e2e
+    python -m benchmarks.e2e --presets fast balanced --llm-latency-ms 200 --output bench.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+from unittest.mock import patch
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from benchmarks.fakes import (
+    FakeCallStats,
+    FakeChatModel,
+    FakeEmbeddings,
+    make_fake_fetch,
+    make_fake_search,
+)
+
+DEFAULT_PRESETS = ("fast", "balanced", "quality")
+DEFAULT_INPUT = "AI 기반 반려동물 건강관리 앱 기획서를 작성해줘. 2040 보호자 대상 구독형 서비스로 모바일 앱 우선 출시."
+MAX_AUTO_RESUMES = 3
+BENCH_NOW = datetime(2026, 1, 5, 9, 0, 0)
+
+# 벤치마크용 RAG 문서 (가짜 임베딩으로 인덱싱)
+BENCH_DOCUMENTS = {
+    "planning_guide.md": (
+        "# 기획서 작성 가이드\n\n## 시장 분석\n\nTAM/SAM/SOM 순으로 시장 규모를 제시한다.\n\n"
+        "## 비즈니스 모델\n\n수익 모델과 가격 정책, BEP 시점을 명시한다.\n\n"
+        "## 리스크\n\n규제, 기술, 시장 리스크와 대응 방안을 정리한다.\n"
+    ),
+    "checklist.md": (
+        "# 기획서 체크리스트\n\n## 필수 섹션\n\n개요, 문제 정의, 타겟, 핵심 기능, 로드맵.\n\n"
+        "## 품질 기준\n\n정량 근거와 출처를 포함한다.\n"
+    ),
+}
+
+
+# =============================================================================
+# 노드 타이밍 콜백
+# =============================================================================
+
+class NodeTimingCallback(BaseCallbackHandler):
+    """LangGraph 노드 실행 시간 수집 (노드 run = 이름이 langgraph_node인 체인)"""
+
+    def __init__(self):
+        self._starts: Dict[Any, tuple] = {}
+        self._lock = threading.Lock()
+        self.order: List[str] = []
+        self.nodes: Dict[str, Dict[str, float]] = {}
+
+    def on_chain_start(self, serialized, inputs, *, run_id, metadata=None, **kwargs) -> None:
+        node = (metadata or {}).get("langgraph_node")
+        if node and kwargs.get("name") == node:
+            with self._lock:
+                self._starts[run_id] = (node, time.perf_counter())
+
+    def _finish(self, run_id) -> None:
+        with self._lock:
+            entry = self._starts.pop(run_id, None)
+            if entry is None:
+                return
+            node, started = entry
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            stats = self.nodes.setdefault(node, {"calls": 0, "total_ms": 0.0, "max_ms": 0.0})
+            stats["calls"] += 1
+            stats["total_ms"] += elapsed_ms
+            stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+            self.order.append(node)
+
+    def on_chain_end(self, outputs, *, run_id, **kwargs) -> None:
+        self._finish(run_id)
+
+    def on_chain_error(self, error, *, run_id, **kwargs) -> None:
+        # interrupt()도 여기로 들어오므로 실행 시간은 그대로 집계
+        self._finish(run_id)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {
+                node: {k: round(v, 2) if isinstance(v, float) else v for k, v in stats.items()}
+                for node, stats in self.nodes.items()
+            }
+
+
+# =============================================================================
+# 오프라인 환경 구성
+# =============================================================================
+
+@contextmanager
+def offline_environment(
+    workdir: str,
+    llm_latency_ms: float = 0.0,
+    embed_latency_ms: float = 0.0,
+    search_latency_ms: float = 0.0,
+    stats: Optional[FakeCallStats] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    외부 의존성을 가짜 구현으로 교체한 실행 환경
+
+    Yields:
+        dict: {"stats": FakeCallStats, "checkpoint_db": Optional[str], "index_path": str}
+    """
+    import utils.llm as llm_module
+    import rag.vectorstore as vectorstore
+    import rag.reranker as reranker
+    import rag.embedding_cache as embedding_cache
+    import tools.search_cache as search_cache
+    import utils.llm_cache as llm_cache
+    import graph.workflow as workflow
+    from utils.checkpointer import get_checkpointer
+
+    stats = stats or FakeCallStats()
+    embeddings = FakeEmbeddings(latency_sec=embed_latency_ms / 1000, stats=stats)
+
+    def fake_chat_factory(**kwargs) -> FakeChatModel:
+        return FakeChatModel(
+            latency_sec=llm_latency_ms / 1000,
+            temperature=kwargs.get("temperature", 0.7),
+            deployment=kwargs.get("azure_deployment") or "fake-gpt",
+            stats=stats,
+        )
+
+    docs_path = os.path.join(workdir, "documents")
+    index_path = os.path.join(workdir, "faiss_index")
+    checkpoint_db = os.path.join(workdir, "checkpoints.db")
+    os.makedirs(docs_path, exist_ok=True)
+    for name, content in BENCH_DOCUMENTS.items():
+        with open(os.path.join(docs_path, name), "w", encoding="utf-8") as f:
+            f.write(content)
+
+    with ExitStack() as stack:
+        # 1. LLM / Embeddings (get_llm, get_embeddings 내부 생성자 교체 + 캐시 초기화)
+        stack.enter_context(patch.object(llm_module, "AzureChatOpenAI", fake_chat_factory))
+        stack.enter_context(patch.object(llm_module, "AzureOpenAIEmbeddings", lambda **kwargs: embeddings))
+        # 응답 캐시는 메모리 전용 (./data/llm_cache.db 히트로 이후 실행의 LLM 호출이 생략되지 않도록)
+        stack.enter_context(patch.object(llm_cache, "_llm_cache_store", llm_cache.LLMCacheStore(":memory:")))
+        stack.enter_context(patch.object(llm_cache, "_llm_cache_views", {}))
+        llm_module._get_cached_llm.cache_clear()
+        llm_module.get_embeddings.cache_clear()
+        stack.callback(llm_module._get_cached_llm.cache_clear)
+        stack.callback(llm_module.get_embeddings.cache_clear)
+
+        # 2. RAG 인덱스 (임시 경로 + 전용 레지스트리)
+        vectorstore.update_vectorstore(docs_path=docs_path, index_path=index_path, embeddings=embeddings)
+        stack.enter_context(patch.object(vectorstore, "DOCS_PATH", docs_path))
+        stack.enter_context(patch.object(vectorstore, "VECTORSTORE_PATH", index_path))
+        stack.enter_context(patch.object(vectorstore, "_registry", vectorstore.VectorStoreRegistry()))
+        stack.enter_context(patch.object(reranker, "_score_cache", reranker.RerankScoreCache(":memory:")))
+        stack.enter_context(patch.object(embedding_cache, "_embedding_cache", embedding_cache.EmbeddingCacheStore(":memory:")))
+
+        # 3. 웹 검색 (캐시는 메모리 전용 - 실행 간 히트로 측정이 왜곡되지 않도록 프리셋마다 초기화)
+        stack.enter_context(patch("tools.web_search_executor.search_sync", make_fake_search(search_latency_ms / 1000, stats)))
+        stack.enter_context(patch("tools.web_search_executor.fetch_url_sync", make_fake_fetch(search_latency_ms / 1000, stats)))
+        stack.enter_context(patch.object(search_cache, "_search_cache", search_cache.SearchCache(db_path=None)))
+
+        # 4. 시간 서버 (네트워크 호출 제거 + 프롬프트 고정)
+        stack.enter_context(patch("utils.time_context.get_naver_time", lambda: BENCH_NOW))
+
+        # 5. Checkpointer (임시 SQLite)
+        checkpointer = get_checkpointer("sqlite", checkpoint_db)
+        if hasattr(checkpointer, "conn"):
+            stack.callback(checkpointer.conn.close)
+        else:
+            checkpoint_db = None  # SqliteSaver 미설치 → MemorySaver (크기 측정 생략)
+        stack.enter_context(patch.object(workflow, "_app", workflow.compile_workflow(checkpointer=checkpointer)))
+
+        yield {"stats": stats, "checkpoint_db": checkpoint_db, "index_path": index_path}
+
+
+# =============================================================================
+# 측정
+# =============================================================================
+
+def _peak_rss_kb() -> int:
+    """프로세스 최대 RSS (KB)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak  # macOS는 bytes 단위
+
+
+def checkpoint_size(db_path: str, thread_id: str) -> Dict[str, int]:
+    """스레드의 체크포인트 수 / 직렬화 바이트 / pending writes 바이트"""
+    with sqlite3.connect(db_path) as conn:
+        count, ckpt_bytes = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(checkpoint) + LENGTH(metadata)), 0) "
+            "FROM checkpoints WHERE thread_id = ?",
+            (thread_id,),
+        ).fetchone()
+        (write_bytes,) = conn.execute(
+            "SELECT COALESCE(SUM(LENGTH(value)), 0) FROM writes WHERE thread_id = ?",
+            (thread_id,),
+        ).fetchone()
+    return {"count": count, "bytes": ckpt_bytes, "write_bytes": write_bytes}
+
+
+def _resume_value(interrupt: Any) -> Dict[str, Any]:
+    """HITL 인터럽트 자동 응답 (첫 번째 옵션 선택, 없으면 기본 텍스트)"""
+    options = interrupt.get("options") if isinstance(interrupt, dict) else None
+    if options:
+        first = options[0] if isinstance(options[0], dict) else {"title": str(options[0])}
+        return {"selected_option": {k: str(v) for k, v in first.items()}}
+    return {"text_input": "기본 설정으로 진행해주세요"}
+
+
+def run_preset(
+    preset: str,
+    env: Dict[str, Any],
+    user_input: str = DEFAULT_INPUT,
+    thread_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """프리셋 1회 실행 및 지표 수집"""
+    from graph.workflow import run_plancraft
+    from tools.search_cache import get_search_cache
+
+    stats: FakeCallStats = env["stats"]
+    thread_id = thread_id or f"bench-{preset}-{int(time.time() * 1000)}"
+    timing = NodeTimingCallback()
+    get_search_cache().clear()
+
+    calls_before = stats.to_dict()
+    rss_before = _peak_rss_kb()
+    start = time.perf_counter()
+
+    result = run_plancraft(
+        user_input=user_input,
+        generation_preset=preset,
+        thread_id=thread_id,
+        callbacks=[timing],
+    )
+    interrupts = 0
+    while result.get("__interrupt__") and interrupts < MAX_AUTO_RESUMES:
+        interrupts += 1
+        result = run_plancraft(
+            user_input="",
+            thread_id=thread_id,
+            resume_command={"resume": _resume_value(result["__interrupt__"])},
+            generation_preset=preset,
+            callbacks=[timing],
+        )
+
+    wall_ms = (time.perf_counter() - start) * 1000
+    peak_rss = _peak_rss_kb()
+    calls_after = stats.to_dict()
+
+    return {
+        "preset": preset,
+        "thread_id": thread_id,
+        "wall_ms": round(wall_ms, 2),
+        "nodes": timing.summary(),
+        "node_order": timing.order,
+        "peak_rss_kb": peak_rss,
+        "rss_growth_kb": peak_rss - rss_before,
+        "checkpoint": checkpoint_size(env["checkpoint_db"], thread_id) if env["checkpoint_db"] else None,
+        "fake_calls": {k: calls_after[k] - calls_before[k] for k in calls_after},
+        "interrupts": interrupts,
+        "completed": bool(result.get("final_output")),
+        "final_output_chars": len(result.get("final_output") or ""),
+        "error": result.get("error"),
+    }
+
+
+def run(
+    presets=DEFAULT_PRESETS,
+    llm_latency_ms: float = 0.0,
+    embed_latency_ms: float = 0.0,
+    search_latency_ms: float = 0.0,
+    user_input: str = DEFAULT_INPUT,
+    repeat: int = 1,
+) -> Dict[str, Any]:
+    """전체 벤치마크 실행 (프리셋 × repeat) 후 결과 dict 반환"""
+    with tempfile.TemporaryDirectory(prefix="plancraft-bench-") as workdir:
+        with offline_environment(workdir, llm_latency_ms, embed_latency_ms, search_latency_ms) as env:
+            runs = [
+                run_preset(preset, env, user_input=user_input)
+                for _ in range(repeat)
+                for preset in presets
+            ]
+
+    return {
+        "benchmark": "e2e_offline",
+        "config": {
+            "presets": list(presets),
+            "repeat": repeat,
+            "llm_latency_ms": llm_latency_ms,
+            "embed_latency_ms": embed_latency_ms,
+            "search_latency_ms": search_latency_ms,
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "runs": runs,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="오프라인 End-to-End 워크플로우 벤치마크")
+    parser.add_argument("--presets", nargs="+", default=list(DEFAULT_PRESETS))
+    parser.add_argument("--llm-latency-ms", type=float, default=0.0)
+    parser.add_argument("--embed-latency-ms", type=float, default=0.0)
+    parser.add_argument("--search-latency-ms", type=float, default=0.0)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--input", default=DEFAULT_INPUT, help="사용자 입력")
+    parser.add_argument("--output", help="결과 JSON 저장 경로 (없으면 stdout)")
+    args = parser.parse_args()
+
+    results = run(
+        presets=args.presets,
+        llm_latency_ms=args.llm_latency_ms,
+        embed_latency_ms=args.embed_latency_ms,
+        search_latency_ms=args.search_latency_ms,
+        user_input=args.input,
+        repeat=args.repeat,
+    )
+
+    payload = json.dumps(results, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(payload)
+        for r in results["runs"]:
+            ckpt_bytes = r["checkpoint"]["bytes"] if r["checkpoint"] else 0
+            print(f"{r['preset']:<10}{r['wall_ms']:>12.1f} ms  nodes={len(r['node_order'])}  "
+                  f"checkpoint={ckpt_bytes:,} B  completed={r['completed']}")
+    else:
+        print(payload)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+"""
+벤치마크/테스트용 가짜 Azure OpenAI 서버
+
+배포별 RPM / TPM 한도를 실제로 강제하는 로컬 HTTP 서버입니다.
+Rate Limiter(utils/rate_limiter.py)의 대기 / 헤더 보정 / 429 처리를 네트워크 없이 검증합니다.
+
+동작:
+    - POST /openai/deployments/{배포}/chat/completions, /embeddings
+    - 배포별 요청 / 토큰 버킷 (초당 분당 한도/60 씩 채움, burst_sec 초 분량까지 몰아 쓰기 허용)
+    - 요청 비용 = 프롬프트 추정 토큰 + max_tokens (Azure 와 같이 응답 전에 예약)
+    - 모든 응답에 x-ratelimit-remaining-requests / -tokens 헤더 (옵션: x-ratelimit-limit-*)
+    - 한도 초과 시 429 + retry-after-ms / retry-after
+
+사용 예시:
+    with FakeAzureOpenAIServer(limits={"gpt-4o": (120, 20000)}) as server:
+        llm = AzureChatOpenAI(azure_endpoint=server.endpoint, api_key="fake",
+                              api_version="2024-08-01-preview", azure_deployment="gpt-4o")
+        llm.invoke("안녕하세요")
+        server.get_stats()["gpt-4o"]["throttled"]
+
+실행:
+    python -m benchmarks.fake_aoai_server --port 8099 --rpm 60 --tpm 10000
+"""
+
+import argparse
+import json
+import math
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+
+from utils.rate_limiter import estimate_request_tokens
+
+
+_PATH = re.compile(r"^/openai/deployments/([^/]+)/(chat/completions|embeddings)$")
+
+
+class _DeploymentQuota:
+    """서버 측 배포 한도 (요청 / 토큰 버킷)"""
+
+    def __init__(self, rpm: float, tpm: float, burst_sec: float):
+        self.limits = {"requests": float(rpm), "tokens": float(tpm)}
+        self.capacity = {kind: limit * burst_sec / 60.0 for kind, limit in self.limits.items()}
+        self.levels = dict(self.capacity)
+        self.updated = time.monotonic()
+        self.served = 0
+        self.throttled = 0
+        self.tokens = 0
+
+    def _refill(self, now: float) -> None:
+        for kind, limit in self.limits.items():
+            self.levels[kind] = min(self.capacity[kind], self.levels[kind] + (now - self.updated) * limit / 60.0)
+        self.updated = now
+
+    def admit(self, cost: int) -> Tuple[bool, float]:
+        """(허용 여부, 거절 시 재시도까지 초) - 호출자가 락 보유"""
+        self._refill(time.monotonic())
+        cost = min(cost, self.capacity["tokens"])
+        if self.levels["requests"] >= 1 and self.levels["tokens"] >= cost:
+            self.levels["requests"] -= 1
+            self.levels["tokens"] -= cost
+            self.served += 1
+            self.tokens += cost
+            return True, 0.0
+        self.throttled += 1
+        wait = max(
+            (1 - self.levels["requests"]) * 60.0 / self.limits["requests"],
+            (cost - self.levels["tokens"]) * 60.0 / self.limits["tokens"],
+        )
+        return False, max(wait, 0.001)
+
+
+class FakeAzureOpenAIServer:
+    """
+    배포별 한도를 강제하는 가짜 Azure OpenAI 엔드포인트
+
+    Args:
+        limits: 배포 이름 -> (rpm, tpm)
+        default: limits 에 없는 배포의 (rpm, tpm)
+        latency: 응답 지연 (초)
+        burst_sec: 한 번에 몰아 쓸 수 있는 한도 (초 분량, Azure 는 1~10초 단위로 평가)
+        send_limit_headers: x-ratelimit-limit-* 헤더 포함 여부
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, Tuple[float, float]]] = None,
+        default: Tuple[float, float] = (60, 60_000),
+        latency: float = 0.0,
+        burst_sec: float = 10.0,
+        send_limit_headers: bool = False,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.limits = dict(limits or {})
+        self.default = default
+        self.latency = latency
+        self.burst_sec = burst_sec
+        self.send_limit_headers = send_limit_headers
+        self._quotas: Dict[str, _DeploymentQuota] = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def endpoint(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeAzureOpenAIServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-aoai", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> "FakeAzureOpenAIServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {
+                name: {"served": q.served, "throttled": q.throttled, "tokens": q.tokens}
+                for name, q in self._quotas.items()
+            }
+
+    # -------------------------------------------------------------------------
+    # 요청 처리
+    # -------------------------------------------------------------------------
+
+    def _quota(self, deployment: str) -> _DeploymentQuota:
+        quota = self._quotas.get(deployment)
+        if quota is None:
+            quota = _DeploymentQuota(*self.limits.get(deployment, self.default), self.burst_sec)
+            self._quotas[deployment] = quota
+        return quota
+
+    def handle(self, path: str, body: Dict[str, Any]) -> Tuple[int, Dict[str, str], Dict[str, Any]]:
+        """(상태 코드, 헤더, JSON 본문)"""
+        match = _PATH.match(path)
+        if not match:
+            return 404, {}, {"error": {"code": "404", "message": "Resource not found"}}
+        deployment, operation = match.group(1), match.group(2)
+        kind = "embeddings" if operation == "embeddings" else "chat"
+        cost = estimate_request_tokens(body, kind)
+
+        with self._lock:
+            quota = self._quota(deployment)
+            admitted, retry_after = quota.admit(cost)
+            headers = {
+                "x-ratelimit-remaining-requests": str(int(quota.levels["requests"])),
+                "x-ratelimit-remaining-tokens": str(int(quota.levels["tokens"])),
+            }
+            if self.send_limit_headers:
+                headers["x-ratelimit-limit-requests"] = str(int(quota.limits["requests"]))
+                headers["x-ratelimit-limit-tokens"] = str(int(quota.limits["tokens"]))
+
+        if not admitted:
+            headers["retry-after-ms"] = str(int(math.ceil(retry_after * 1000)))
+            headers["retry-after"] = str(int(math.ceil(retry_after)))
+            return 429, headers, {"error": {
+                "code": "429",
+                "message": f"Requests to the {deployment} deployment have exceeded the rate limit. "
+                           f"Please retry after {headers['retry-after']} seconds.",
+            }}
+
+        if self.latency:
+            time.sleep(self.latency)
+        if kind == "embeddings":
+            return 200, headers, self._embeddings_response(deployment, body, cost)
+        return 200, headers, self._chat_response(deployment, body, cost)
+
+    @staticmethod
+    def _chat_response(deployment: str, body: Dict[str, Any], cost: int) -> Dict[str, Any]:
+        prompt_tokens = cost - int(body.get("max_completion_tokens") or body.get("max_tokens") or 0)
+        return {
+            "id": f"chatcmpl-{time.time_ns()}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": deployment,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": f"[{deployment}] 응답"},
+                "finish_reason": "stop",
+            }],
+            "usage": {"prompt_tokens": max(prompt_tokens, 1), "completion_tokens": 5,
+                      "total_tokens": max(prompt_tokens, 1) + 5},
+        }
+
+    @staticmethod
+    def _embeddings_response(deployment: str, body: Dict[str, Any], cost: int) -> Dict[str, Any]:
+        inputs = body.get("input", "")
+        if not isinstance(inputs, list):
+            inputs = [inputs]
+        return {
+            "object": "list",
+            "model": deployment,
+            "data": [{"object": "embedding", "index": i, "embedding": [0.1] * 8} for i in range(len(inputs))],
+            "usage": {"prompt_tokens": cost, "total_tokens": cost},
+        }
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                length = int(self.headers.get("content-length") or 0)
+                try:
+                    body = json.loads(self.rfile.read(length) or b"{}")
+                except ValueError:
+                    body = {}
+                status, headers, payload = server.handle(self.path.split("?", 1)[0], body)
+                data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("content-type", "application/json")
+                self.send_header("content-length", str(len(data)))
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fake Azure OpenAI server with rate limits")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--rpm", type=float, default=60)
+    parser.add_argument("--tpm", type=float, default=60_000)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--burst-sec", type=float, default=10.0)
+    args = parser.parse_args()
+
+    fake = FakeAzureOpenAIServer(default=(args.rpm, args.tpm), latency=args.latency,
+                                 burst_sec=args.burst_sec, port=args.port)
+    print(f"Fake Azure OpenAI listening on {fake.endpoint}")
+    try:
+        fake._server.serve_forever()
+    except KeyboardInterrupt:
+        fake._server.server_close()
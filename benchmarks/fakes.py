@@ -0,0 +1,383 @@
+"""
+벤치마크용 결정적(Deterministic) 가짜 외부 의존성
+
+네트워크 없이 전체 그래프를 실행하기 위한 대체 구현입니다.
+- FakeChatModel: 규칙 기반 텍스트 응답 + 스키마 기반 Structured Output
+- FakeEmbeddings: 텍스트 해시 기반 고정 벡터
+- fake_search / fake_fetch: Tavily/Fetch MCP 대체
+
+모든 가짜 구현은 지연 시간(latency)을 설정할 수 있어
+외부 호출 비중이 큰 실제 실행의 시간 분포를 흉내낼 수 있습니다.
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+import typing
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables import RunnableLambda
+from pydantic import BaseModel
+
+
+# =============================================================================
+# 호출 통계
+# =============================================================================
+
+@dataclass
+class FakeCallStats:
+    """가짜 의존성 호출 통계 (Thread-safe)"""
+    llm_calls: int = 0
+    structured_calls: int = 0
+    prompt_chars: int = 0
+    completion_chars: int = 0
+    embed_calls: int = 0
+    embedded_texts: int = 0
+    search_calls: int = 0
+    fetch_calls: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add(self, **counts: int) -> None:
+        with self._lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def to_dict(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "llm_calls": self.llm_calls,
+                "structured_calls": self.structured_calls,
+                "prompt_chars": self.prompt_chars,
+                "completion_chars": self.completion_chars,
+                "embed_calls": self.embed_calls,
+                "embedded_texts": self.embedded_texts,
+                "search_calls": self.search_calls,
+                "fetch_calls": self.fetch_calls,
+            }
+
+
+# =============================================================================
+# Structured Output 응답 생성
+# =============================================================================
+
+_PARAGRAPH = (
+    "반려동물 헬스케어 시장은 TAM 12조 원, SAM 1.8조 원, SOM 900억 원 규모로 추정된다. "
+    "주요 경쟁사 대비 차별점은 AI 기반 이상 징후 감지이며, BEP(손익분기)는 18개월 차로 예상된다. "
+    "핵심 리스크는 규제 변화와 데이터 확보이며 단계별 대응 방안을 마련한다."
+)
+
+_SECTION_BODY = (
+    f"{_PARAGRAPH}\n\n"
+    "```mermaid\nflowchart LR\n  A[사용자] --> B[앱] --> C[AI 분석]\n```\n\n"
+    "| 항목 | 비중 |\n|---|---|\n| 구독 | ▓▓▓▓▓▓░░ 75% |\n| 광고 | ▓▓░░░░░░ 25% |\n"
+)
+
+SECTION_NAMES = [
+    "프로젝트 개요", "문제 정의", "타겟 사용자", "시장 분석", "경쟁사 분석", "핵심 기능",
+    "비즈니스 모델", "기술 아키텍처", "재무 계획", "리스크 관리", "마케팅 전략", "로드맵",
+]
+
+# 스키마 이름별 기본 응답 (워크플로우가 HITL 없이 끝까지 진행되는 값)
+DEFAULT_STRUCTURED_RESPONSES: Dict[str, Dict[str, Any]] = {
+    "AnalysisResult": {
+        "topic": "AI 기반 반려동물 건강관리 앱",
+        "purpose": "반려동물 질병 조기 발견",
+        "target_users": "2040 반려동물 보호자",
+        "key_features": ["건강 기록", "AI 증상 분석", "병원 예약", "사료 추천", "커뮤니티"],
+        "assumptions": ["모바일 앱 우선 출시"],
+        "need_more_info": False,
+        "doc_type": "web_app_plan",
+    },
+    "StructureResult": {
+        "title": "AI 기반 반려동물 건강관리 앱 기획서",
+        "sections": [
+            {"id": i, "name": name, "description": f"{name} 설명", "key_points": [f"{name} 핵심"]}
+            for i, name in enumerate(SECTION_NAMES, start=1)
+        ],
+    },
+    "DraftResult": {
+        "sections": [
+            {"id": i, "name": name, "content": f"## {i}. {name}\n\n{_SECTION_BODY}"}
+            for i, name in enumerate(SECTION_NAMES, start=1)
+        ],
+    },
+    "JudgeResult": {
+        "overall_score": 9,
+        "verdict": "PASS",
+        "strengths": ["시장 분석이 구체적"],
+        "weaknesses": ["마케팅 예산 근거 보완"],
+        "reasoning": "통과 기준을 충족합니다.",
+        "feedback_summary": "전반적으로 완성도가 높습니다.",
+    },
+    "RefinementStrategy": {
+        "overall_direction": "근거 데이터 보강",
+        "key_focus_areas": ["시장 규모", "재무 계획"],
+        "specific_guidelines": ["출처를 명시하세요"],
+    },
+    "RoutingDecision": {
+        "required_analyses": ["market", "bm", "financial", "risk", "tech", "content"],
+        "reasoning": "전체 분석 수행",
+    },
+    "ConsensusResult": {
+        "consensus_reached": True,
+        "confidence": 0.9,
+        "agreed_items": ["재무 근거 보강"],
+        "suggested_next_action": "finalize",
+    },
+}
+
+
+def _default_for(annotation: Any, name: str, field_info: Any = None) -> Any:
+    """타입 어노테이션으로부터 그럴듯한 기본값 생성"""
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+
+    if origin is typing.Union:
+        non_none = [a for a in args if a is not type(None)]
+        return _default_for(non_none[0], name, field_info) if non_none else None
+    if origin is typing.Literal:
+        return args[0]
+    if origin in (list, List, Sequence, tuple, set):
+        item = args[0] if args else str
+        if typing.get_origin(item) is typing.Literal:
+            return list(typing.get_args(item))
+        return [_default_for(item, name) for _ in range(3)]
+    if origin in (dict, Dict):
+        return {}
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return build_structured_response(annotation).model_dump()
+    if annotation is bool:
+        return False
+    if annotation in (int, float):
+        low, high = 1, 10
+        for meta in getattr(field_info, "metadata", []) or []:
+            low = getattr(meta, "ge", None) if getattr(meta, "ge", None) is not None else low
+            high = getattr(meta, "le", None) if getattr(meta, "le", None) is not None else high
+        value = high if high < 1 else min(max(low, 1), high)
+        return annotation(value)
+    return f"벤치마크 {name}"
+
+
+def build_structured_response(
+    schema: Type[BaseModel],
+    overrides: Optional[Dict[str, Dict[str, Any]]] = None
+) -> BaseModel:
+    """
+    스키마 인스턴스 생성
+
+    우선순위: overrides[스키마명] > DEFAULT_STRUCTURED_RESPONSES > 타입 기반 기본값
+    (필수 필드만 채우고, 기본값이 있는 필드는 스키마 기본값을 사용)
+    """
+    name = schema.__name__
+    values: Dict[str, Any] = {}
+    for field_name, field_info in schema.model_fields.items():
+        if field_info.is_required():
+            values[field_name] = _default_for(field_info.annotation, field_name, field_info)
+    values.update(DEFAULT_STRUCTURED_RESPONSES.get(name, {}))
+    values.update((overrides or {}).get(name, {}))
+    return schema.model_validate(values)
+
+
+# =============================================================================
+# Fake Chat Model
+# =============================================================================
+
+# (프롬프트 정규식, 응답) - 먼저 매칭되는 규칙 사용
+DEFAULT_TEXT_RULES: List[Tuple[str, str]] = [
+    # Smart Router LLM 분류
+    (r"분류:\s*$", "planning"),
+    # 웹 검색 쿼리 생성
+    (r"웹 검색 설계자", json.dumps([
+        "반려동물 헬스케어 2026 시장 규모 통계",
+        "반려동물 앱 수익 모델 사례",
+        "반려동물 의료 데이터 규제",
+    ], ensure_ascii=False)),
+]
+
+# 그 외 자유 형식 호출 (전문 에이전트 JSON, Formatter 요약 등)
+DEFAULT_TEXT_RESPONSE = (
+    "분석 결과입니다.\n```json\n"
+    + json.dumps({"summary": _PARAGRAPH, "items": [{"name": "핵심 항목", "value": "검증됨"}]}, ensure_ascii=False)
+    + "\n```"
+)
+
+
+def _messages_text(messages: Any) -> str:
+    """LLM 입력(문자열/메시지/딕셔너리 목록)을 하나의 문자열로 변환"""
+    if isinstance(messages, str):
+        return messages
+    if hasattr(messages, "to_messages"):
+        messages = messages.to_messages()
+    parts = []
+    for msg in messages or []:
+        if isinstance(msg, BaseMessage):
+            parts.append(str(msg.content))
+        elif isinstance(msg, dict):
+            parts.append(str(msg.get("content", "")))
+        elif isinstance(msg, (tuple, list)) and len(msg) == 2:
+            parts.append(str(msg[1]))
+        else:
+            parts.append(str(msg))
+    return "\n".join(parts)
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    결정적 가짜 Chat 모델
+
+    - invoke(): DEFAULT_TEXT_RULES → text_rules 순으로 매칭한 텍스트 응답
+    - with_structured_output(schema): build_structured_response(schema) 반환
+    - latency_sec 만큼 호출마다 대기 (실제 API 지연 모사)
+    """
+
+    latency_sec: float = 0.0
+    temperature: float = 0.7
+    deployment: str = "fake-gpt"
+    text_rules: List[Tuple[str, str]] = []
+    default_text: str = DEFAULT_TEXT_RESPONSE
+    structured_overrides: Dict[str, Dict[str, Any]] = {}
+    stats: Any = None
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-chat"
+
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        # 실제 모델처럼 배포명/temperature를 LLM 캐시 키에 반영
+        return {"deployment": self.deployment, "temperature": self.temperature}
+
+    def _reply_for(self, prompt: str) -> str:
+        for pattern, reply in list(self.text_rules) + DEFAULT_TEXT_RULES:
+            if re.search(pattern, prompt, re.MULTILINE):
+                return reply
+        return self.default_text
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        prompt = _messages_text(messages)
+        reply = self._reply_for(prompt)
+        if self.latency_sec:
+            time.sleep(self.latency_sec)
+        if self.stats is not None:
+            self.stats.add(llm_calls=1, prompt_chars=len(prompt), completion_chars=len(reply))
+
+        # 대략적인 토큰 수 (4자 ≈ 1토큰) - TokenTrackingCallback 집계용
+        input_tokens, output_tokens = len(prompt) // 4 + 1, len(reply) // 4 + 1
+        message = AIMessage(
+            content=reply,
+            usage_metadata={
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens,
+            },
+        )
+        return ChatResult(
+            generations=[ChatGeneration(message=message)],
+            llm_output={"token_usage": {
+                "prompt_tokens": input_tokens,
+                "completion_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens,
+            }, "model_name": self.deployment},
+        )
+
+    def with_structured_output(self, schema, *, include_raw: bool = False, **kwargs):
+        def respond(messages: Any) -> Any:
+            prompt = _messages_text(messages)
+            if self.latency_sec:
+                time.sleep(self.latency_sec)
+            result = build_structured_response(schema, self.structured_overrides)
+            if self.stats is not None:
+                self.stats.add(
+                    llm_calls=1, structured_calls=1,
+                    prompt_chars=len(prompt), completion_chars=len(result.model_dump_json()),
+                )
+            if include_raw:
+                return {"raw": AIMessage(content=result.model_dump_json()), "parsed": result, "parsing_error": None}
+            return result
+
+        return RunnableLambda(respond, name=f"FakeStructured[{schema.__name__}]")
+
+    def bind_tools(self, tools, **kwargs):
+        # 도구 호출 없이 텍스트 응답만 반환
+        return self
+
+
+# =============================================================================
+# Fake Embeddings
+# =============================================================================
+
+class FakeEmbeddings(Embeddings):
+    """텍스트 해시 기반 결정적 임베딩 (동일 텍스트 → 동일 벡터)"""
+
+    def __init__(self, size: int = 64, latency_sec: float = 0.0, stats: Optional[FakeCallStats] = None):
+        self.size = size
+        self.latency_sec = latency_sec
+        self.stats = stats
+        self.model = f"fake-embedding-{size}"
+
+    def _vector(self, text: str) -> List[float]:
+        import numpy as np
+
+        seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "little")
+        vec = np.random.default_rng(seed).standard_normal(self.size)
+        return (vec / np.linalg.norm(vec)).astype(float).tolist()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        if self.latency_sec:
+            time.sleep(self.latency_sec)
+        if self.stats is not None:
+            self.stats.add(embed_calls=1, embedded_texts=len(texts))
+        return [self._vector(t) for t in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+
+# =============================================================================
+# Fake Search / Fetch
+# =============================================================================
+
+def make_fake_search(latency_sec: float = 0.0, stats: Optional[FakeCallStats] = None):
+    """tools.mcp_client.search_sync 대체 함수 생성"""
+
+    def fake_search(query: str, max_results: int = 5, search_depth: str = "basic", **kwargs) -> Dict[str, Any]:
+        if latency_sec:
+            time.sleep(latency_sec)
+        if stats is not None:
+            stats.add(search_calls=1)
+        digest = hashlib.md5(query.encode("utf-8")).hexdigest()[:8]
+        return {
+            "success": True,
+            "source": "fake",
+            "query": query,
+            "results": [
+                {
+                    "title": f"{query} 리포트 {i}",
+                    "url": f"https://example.com/{digest}/{i}",
+                    "snippet": f"{query} 관련 통계: {_PARAGRAPH}",
+                }
+                for i in range(1, min(max_results, 3) + 1)
+            ],
+        }
+
+    return fake_search
+
+
+def make_fake_fetch(latency_sec: float = 0.0, stats: Optional[FakeCallStats] = None):
+    """tools.mcp_client.fetch_url_sync 대체 함수 생성"""
+
+    def fake_fetch(url: str, max_length: int = 5000, **kwargs) -> str:
+        if latency_sec:
+            time.sleep(latency_sec)
+        if stats is not None:
+            stats.add(fetch_calls=1)
+        return f"[{url}]\n{_PARAGRAPH}"[:max_length]
+
+    return fake_fetch
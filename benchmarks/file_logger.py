@@ -0,0 +1,134 @@
+"""
+FileLogger 호출 오버헤드 벤치마크
+
+여러 스레드가 동시에 로그를 남길 때 호출 스레드가 log() 에서 보내는 시간을 측정합니다.
+    - sync: 기존 방식 (호출마다 JSONL / 텍스트 파일을 append 로 열어 직접 기록)
+    - queued: utils.file_logger.FileLogger (큐에 넣고 LogWriter 스레드가 배치 기록)
+
+측정 항목 (모드별):
+    - per_call_us: log() 1회 호출 시간 (p50 / p99 / mean, 마이크로초)
+    - wall_ms: 전체 스레드 로그 호출 종료까지 (queued 는 flush 전까지)
+    - drain_ms: queued 모드에서 flush() 로 디스크 기록이 끝날 때까지 추가 시간
+    - written / dropped: 기록/드롭된 레코드 수
+
+사용법:
+    python -m benchmarks.file_logger
+    python -m benchmarks.file_logger --threads 16 --calls 2000 --queue-size 1000
+"""
+
+import argparse
+import datetime
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List
+
+from utils.file_logger import FileLogger, LogWriter
+
+PAYLOAD = {"agent_id": "market", "output_summary": "시장 분석 결과 " * 10, "duration_ms": 1234}
+
+
+class _SyncFileLogger(FileLogger):
+    """기존 동기 기록 방식 재현 (호출마다 파일 open/append)"""
+
+    def __init__(self, log_dir: str):
+        self._context = {}
+        self._log_file = os.path.join(log_dir, "sync.jsonl")
+        self._text_file = os.path.join(log_dir, "sync.log")
+
+    def log(self, step, data, level="INFO", event_type="workflow", source=None, **extra_context):
+        record = (datetime.datetime.now(), level, event_type, source, step,
+                  self._serialize(data), {**self._context, **extra_context})
+        json_line, text_line = LogWriter._format(record)
+        with open(self._log_file, "a", encoding="utf-8") as f:
+            f.write(json_line)
+        with open(self._text_file, "a", encoding="utf-8") as f:
+            f.write(text_line)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        with open(self._log_file, encoding="utf-8") as f:
+            return {"written": sum(1 for _ in f), "dropped": 0}
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def measure(logger: FileLogger, threads: int, calls: int) -> Dict[str, Any]:
+    """threads 개 스레드가 각자 calls 번 agent_complete 로그 기록"""
+    durations: List[List[float]] = [[] for _ in range(threads)]
+    barrier = threading.Barrier(threads)
+
+    def worker(i: int):
+        barrier.wait()
+        local = durations[i]
+        for n in range(calls):
+            start = time.perf_counter()
+            logger.agent_complete("market", PAYLOAD, duration_ms=n, worker=i)
+            local.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    wall = time.perf_counter() - start
+    logger.flush(timeout=60)
+    drain = time.perf_counter() - start - wall
+
+    all_us = [d * 1e6 for per_thread in durations for d in per_thread]
+    stats = logger.get_stats()
+    return {
+        "per_call_us": {
+            "p50": round(_percentile(all_us, 50), 1),
+            "p99": round(_percentile(all_us, 99), 1),
+            "mean": round(sum(all_us) / len(all_us), 1),
+        },
+        "wall_ms": round(wall * 1000, 1),
+        "drain_ms": round(drain * 1000, 1),
+        "written": stats["written"],
+        "dropped": stats["dropped"],
+    }
+
+
+def run(threads: int = 8, calls: int = 1000, queue_size: int = 10000) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory(prefix="plancraft-log-bench-") as workdir:
+        sync_dir = os.path.join(workdir, "sync")
+        os.makedirs(sync_dir)
+        sync_result = measure(_SyncFileLogger(sync_dir), threads, calls)
+
+        writer = LogWriter(log_dir=os.path.join(workdir, "queued"), queue_size=queue_size)
+        queued = FileLogger(writer=writer)
+        try:
+            queued_result = measure(queued, threads, calls)
+        finally:
+            queued.close()
+
+    return {
+        "benchmark": "file_logger",
+        "config": {"threads": threads, "calls_per_thread": calls, "queue_size": queue_size},
+        "sync": sync_result,
+        "queued": queued_result,
+        "speedup_p50": round(sync_result["per_call_us"]["p50"] / max(queued_result["per_call_us"]["p50"], 0.1), 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FileLogger 호출 오버헤드 벤치마크")
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--calls", type=int, default=1000, help="스레드당 로그 호출 수")
+    parser.add_argument("--queue-size", type=int, default=10000)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.threads, args.calls, args.queue_size), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
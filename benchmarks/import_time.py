@@ -0,0 +1,164 @@
+"""
+Import 시간 예산 검사
+
+새 인터프리터에서 `python -X importtime -c "import <module>"` 을 실행해
+Cold import 시간을 측정하고, 예산을 넘거나 금지된 무거운 모듈이 로드되면 실패합니다.
+    - 총 시간: 대상 모듈의 누적(cumulative) import 시간 (여러 번 측정한 중앙값)
+    - 상위 모듈: 자체(self) 시간이 큰 모듈 목록
+    - 금지 모듈: 대상 import 시 로드되면 안 되는 모듈 (예: 그래프 컴파일, LLM SDK)
+
+사용법:
+    python -m benchmarks.import_time                     # api.main, 기본 예산
+    python -m benchmarks.import_time --budget-ms 800 --runs 5
+    python -m benchmarks.import_time --module graph.workflow --budget-ms 3000 --json
+
+종료 코드:
+    0: 예산 이내, 1: 예산 초과 또는 금지 모듈 로드
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional, Sequence
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 모듈별 Cold import 예산 (ms) - IMPORT_TIME_BUDGET_MS 환경변수로 오버라이드 가능
+IMPORT_BUDGETS_MS = {
+    "api.main": 1500.0,
+}
+DEFAULT_BUDGET_MS = 1500.0
+
+# 모듈별로 import 시점에 로드되면 안 되는 모듈 (첫 요청 시점으로 미뤄야 하는 것들)
+FORBIDDEN_IMPORTS = {
+    "api.main": ("graph.workflow", "langgraph.graph", "langchain_openai"),
+}
+
+
+def parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    """
+    -X importtime 출력 → [{"module", "self_us", "cumulative_us", "depth"}, ...]
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue  # 헤더 행
+        name = parts[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append({"module": name.strip(), "self_us": self_us, "cumulative_us": cumulative_us, "depth": depth})
+    return rows
+
+
+def measure_once(module: str) -> List[Dict[str, Any]]:
+    """새 인터프리터에서 module 을 1회 import 하고 importtime 행 반환"""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [PROJECT_ROOT, env.get("PYTHONPATH")]))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} 실패:\n{proc.stderr[-2000:]}")
+    return parse_importtime(proc.stderr)
+
+
+def profile_import(
+    module: str,
+    runs: int = 3,
+    top: int = 10,
+    forbidden: Sequence[str] = (),
+) -> Dict[str, Any]:
+    """
+    Cold import 시간 측정 (runs회 중앙값)
+
+    Returns:
+        {"module", "total_ms", "runs_ms", "top_self", "forbidden_loaded"}
+    """
+    totals, last_rows = [], []
+    for _ in range(max(1, runs)):
+        rows = measure_once(module)
+        target = [r for r in rows if r["module"] == module]
+        if not target:
+            raise RuntimeError(f"importtime 출력에서 {module} 을 찾지 못했습니다 (이미 로드됨?)")
+        totals.append(target[-1]["cumulative_us"] / 1000)
+        last_rows = rows
+
+    loaded = {r["module"] for r in last_rows}
+    top_self = sorted(last_rows, key=lambda r: r["self_us"], reverse=True)[:top]
+    return {
+        "module": module,
+        "total_ms": round(statistics.median(totals), 1),
+        "runs_ms": [round(t, 1) for t in totals],
+        "top_self": [{"module": r["module"], "self_ms": round(r["self_us"] / 1000, 1)} for r in top_self],
+        "forbidden_loaded": [m for m in forbidden if m in loaded],
+    }
+
+
+def resolve_budget(module: str, budget_ms: Optional[float] = None) -> float:
+    """CLI 인자 > IMPORT_TIME_BUDGET_MS 환경변수 > 모듈별 기본 예산"""
+    if budget_ms is not None:
+        return budget_ms
+    env_budget = os.getenv("IMPORT_TIME_BUDGET_MS")
+    if env_budget:
+        return float(env_budget)
+    return IMPORT_BUDGETS_MS.get(module, DEFAULT_BUDGET_MS)
+
+
+def check_budget(result: Dict[str, Any], budget_ms: float) -> List[str]:
+    """예산 위반 사유 목록 (비어 있으면 통과)"""
+    failures = []
+    if result["total_ms"] > budget_ms:
+        failures.append(f"{result['module']} cold import {result['total_ms']:.0f}ms > 예산 {budget_ms:.0f}ms")
+    for name in result["forbidden_loaded"]:
+        failures.append(f"{result['module']} import 시 금지 모듈 로드: {name}")
+    return failures
+
+
+def _print_report(result: Dict[str, Any], budget_ms: float, failures: List[str]) -> None:
+    print(f"\n=== Import Time: {result['module']} ===")
+    print(f"  total: {result['total_ms']:.1f}ms (budget {budget_ms:.0f}ms, runs {result['runs_ms']})")
+    print("  top self time:")
+    for row in result["top_self"]:
+        print(f"    {row['self_ms']:>8.1f}ms  {row['module']}")
+    if failures:
+        for failure in failures:
+            print(f"  [FAIL] {failure}")
+    else:
+        print("  [OK] within budget")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Cold import 시간 예산 검사")
+    parser.add_argument("--module", default="api.main", help="측정할 모듈 (기본값: api.main)")
+    parser.add_argument("--budget-ms", type=float, default=None, help="예산 (ms)")
+    parser.add_argument("--runs", type=int, default=3, help="측정 횟수 (중앙값 사용)")
+    parser.add_argument("--top", type=int, default=10, help="표시할 상위 모듈 수")
+    parser.add_argument("--json", action="store_true", help="JSON 출력")
+    args = parser.parse_args(argv)
+
+    budget_ms = resolve_budget(args.module, args.budget_ms)
+    result = profile_import(
+        args.module, runs=args.runs, top=args.top,
+        forbidden=FORBIDDEN_IMPORTS.get(args.module, ()),
+    )
+    failures = check_budget(result, budget_ms)
+
+    if args.json:
+        print(json.dumps({**result, "budget_ms": budget_ms, "failures": failures}, ensure_ascii=False, indent=2))
+    else:
+        _print_report(result, budget_ms, failures)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
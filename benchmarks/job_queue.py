@@ -0,0 +1,141 @@
+"""
+워크플로우 작업 큐 부하 시뮬레이션
+
+가짜 LLM/검색/임베딩 환경(benchmarks.e2e.offline_environment)에서
+여러 클라이언트가 동시에 워크플로우 실행을 제출했을 때의 큐 동작을 측정합니다.
+    - accepted / rejected: 큐 깊이 초과로 거절(429)된 제출 수
+    - queue_wait_ms: 제출 → 워커 시작까지 대기 시간 (p50 / p95 / max)
+    - wall_ms: 첫 제출부터 모든 작업 종료까지
+    - max_running: 동시에 실행된 작업 수 최대값 (워커 수를 넘지 않아야 함)
+
+사용법:
+    python -m benchmarks.job_queue
+    python -m benchmarks.job_queue --submits 40 --workers 4 --max-depth 20 --llm-latency-ms 50
+"""
+
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List
+
+from benchmarks.e2e import DEFAULT_INPUT, offline_environment
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return round(ordered[index], 1)
+
+
+def run(
+    submits: int = 20,
+    workers: int = 2,
+    max_depth: int = 20,
+    preset: str = "fast",
+    llm_latency_ms: float = 0.0,
+    timeout_sec: float = 300.0,
+) -> Dict[str, Any]:
+    """동시 제출 부하 실행 후 결과 dict 반환"""
+    from api.services.job_queue import JobQueue, JobQueueFull, DONE, FAILED
+    from api.services.workflow_service import WorkflowService
+
+    service = WorkflowService()
+    running = {"now": 0, "max": 0}
+    lock = threading.Lock()
+
+    def handler(job):
+        with lock:
+            running["now"] += 1
+            running["max"] = max(running["max"], running["now"])
+        try:
+            service.execute_job(job)
+        finally:
+            with lock:
+                running["now"] -= 1
+
+    with tempfile.TemporaryDirectory(prefix="plancraft-queue-bench-") as workdir:
+        with offline_environment(workdir, llm_latency_ms=llm_latency_ms):
+            queue = JobQueue(
+                handler, db_path=os.path.join(workdir, "jobs.db"),
+                workers=workers, max_depth=max_depth,
+            ).start()
+
+            accepted, rejected = [], []
+            barrier = threading.Barrier(submits)
+
+            def submit(i: int):
+                barrier.wait()
+                try:
+                    job = queue.submit(f"load-{i}", "run", {"user_input": DEFAULT_INPUT, "generation_preset": preset})
+                    with lock:
+                        accepted.append(job.thread_id)
+                except JobQueueFull as e:
+                    with lock:
+                        rejected.append(e.retry_after)
+
+            start = time.perf_counter()
+            clients = [threading.Thread(target=submit, args=(i,)) for i in range(submits)]
+            for client in clients:
+                client.start()
+            for client in clients:
+                client.join()
+
+            deadline = time.monotonic() + timeout_sec
+            jobs = []
+            while time.monotonic() < deadline:
+                jobs = [queue.latest_job(tid) for tid in accepted]
+                if all(job.status in (DONE, FAILED) for job in jobs):
+                    break
+                time.sleep(0.05)
+            wall_ms = (time.perf_counter() - start) * 1000
+            stats = queue.stats()
+            queue.shutdown()
+
+    waits = [job.queue_wait_ms for job in jobs if job.queue_wait_ms is not None]
+    return {
+        "benchmark": "job_queue_load",
+        "config": {
+            "submits": submits, "workers": workers, "max_depth": max_depth,
+            "preset": preset, "llm_latency_ms": llm_latency_ms,
+        },
+        "accepted": len(accepted),
+        "rejected": len(rejected),
+        "retry_after_sec": sorted(set(rejected)),
+        "completed": sum(1 for job in jobs if job.status == DONE),
+        "failed": sum(1 for job in jobs if job.status == FAILED),
+        "max_running": running["max"],
+        "queue_wait_ms": {
+            "p50": _percentile(waits, 50),
+            "p95": _percentile(waits, 95),
+            "max": round(max(waits), 1) if waits else 0.0,
+            "mean": round(statistics.mean(waits), 1) if waits else 0.0,
+        },
+        "wall_ms": round(wall_ms, 1),
+        "queue_stats": stats,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="워크플로우 작업 큐 부하 시뮬레이션")
+    parser.add_argument("--submits", type=int, default=20, help="동시 제출 수")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--max-depth", type=int, default=20)
+    parser.add_argument("--preset", default="fast")
+    parser.add_argument("--llm-latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    result = run(
+        submits=args.submits, workers=args.workers, max_depth=args.max_depth,
+        preset=args.preset, llm_latency_ms=args.llm_latency_ms,
+    )
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
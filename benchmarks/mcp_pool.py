@@ -0,0 +1,104 @@
+"""
+MCP 호출 지연 벤치마크
+
+로컬 stdio MCP 스텁 서버(benchmarks/mcp_stub_server.py)로 호출 1회당 지연을 측정합니다.
+    - per_call: 호출마다 세션 생성 + 핸드셰이크 (이전 fetch_url_sync 방식)
+    - pooled: MCPSessionPool 웜 세션 재사용
+
+사용법:
+    python -m benchmarks.mcp_pool
+    python -m benchmarks.mcp_pool --calls 20 --startup-delay 0.5
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from typing import Any, Dict, List
+
+from tools.mcp_pool import MCPSessionPool
+
+STUB_SERVER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mcp_stub_server.py")
+
+
+def stub_server_config(startup_delay: float = 0.0) -> Dict[str, Dict[str, Any]]:
+    """스텁 서버를 fetch/tavily 두 서버로 등록한 연결 설정"""
+    args = [STUB_SERVER_PATH, "--startup-delay", str(startup_delay)]
+    return {
+        name: {"command": sys.executable, "args": args, "transport": "stdio"}
+        for name in ("fetch", "tavily")
+    }
+
+
+def _summary(latencies_ms: List[float]) -> Dict[str, float]:
+    ordered = sorted(latencies_ms)
+    return {
+        "calls": len(ordered),
+        "mean_ms": statistics.fmean(ordered),
+        "p50_ms": ordered[len(ordered) // 2],
+        "max_ms": ordered[-1],
+    }
+
+
+def measure_per_call(config: Dict[str, Dict[str, Any]], calls: int) -> Dict[str, float]:
+    """호출마다 새 세션 (MCPToolkit 매 호출 초기화와 동일한 비용)"""
+    from langchain_mcp_adapters.client import MultiServerMCPClient
+    from langchain_mcp_adapters.tools import load_mcp_tools
+
+    async def _once(url: str):
+        async with MultiServerMCPClient(config).session("fetch") as session:
+            tools = {t.name: t for t in await load_mcp_tools(session)}
+            return await tools["fetch"].ainvoke({"url": url})
+
+    latencies = []
+    for i in range(calls):
+        start = time.perf_counter()
+        asyncio.run(_once(f"https://example.com/{i}"))
+        latencies.append((time.perf_counter() - start) * 1000)
+    return _summary(latencies)
+
+
+def measure_pooled(config: Dict[str, Dict[str, Any]], calls: int) -> Dict[str, float]:
+    """웜 세션 풀 (첫 호출의 기동 비용 포함)"""
+    pool = MCPSessionPool(config)
+    try:
+        latencies = []
+        for i in range(calls):
+            start = time.perf_counter()
+            pool.call_tool("fetch", "fetch", {"url": f"https://example.com/{i}"})
+            latencies.append((time.perf_counter() - start) * 1000)
+        result = _summary(latencies)
+        result["first_ms"] = latencies[0]
+        result["spawns"] = pool.get_stats()["spawns"]
+        return result
+    finally:
+        pool.close()
+
+
+def run(calls: int = 10, startup_delay: float = 0.0) -> Dict[str, Dict[str, float]]:
+    """per_call / pooled 측정 결과 반환"""
+    config = stub_server_config(startup_delay)
+    return {
+        "per_call": measure_per_call(config, calls),
+        "pooled": measure_pooled(config, calls),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MCP 호출 지연 벤치마크")
+    parser.add_argument("--calls", type=int, default=10)
+    parser.add_argument("--startup-delay", type=float, default=0.0, help="스텁 서버 기동 지연 (초)")
+    args = parser.parse_args()
+
+    results = run(args.calls, args.startup_delay)
+    print(f"{'mode':<10}{'calls':>8}{'mean ms':>12}{'p50 ms':>12}{'max ms':>12}")
+    for name, r in results.items():
+        print(f"{name:<10}{r['calls']:>8}{r['mean_ms']:>12.1f}{r['p50_ms']:>12.1f}{r['max_ms']:>12.1f}")
+    speedup = results["per_call"]["p50_ms"] / max(results["pooled"]["p50_ms"], 1e-9)
+    print(f"\np50 speedup: {speedup:.1f}x (pooled spawns: {results['pooled']['spawns']})")
+
+
+if __name__ == "__main__":
+    main()
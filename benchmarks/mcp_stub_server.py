@@ -0,0 +1,58 @@
+"""
+벤치마크/테스트용 초소형 stdio MCP 서버
+
+mcp-server-fetch / tavily-mcp 와 같은 이름의 도구를 제공하여
+MCP 세션 풀의 호출 지연과 재기동 동작을 네트워크 없이 측정합니다.
+
+도구:
+    - fetch(url): 고정 본문 반환 (본문에 서버 PID 포함)
+    - tavily-search(query, max_results): 고정 검색 결과 반환
+    - sleep(seconds): 지정 시간 대기 후 PID 반환 (동시성 측정용)
+
+실행:
+    python benchmarks/mcp_stub_server.py [--startup-delay 0.5]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+
+from mcp.server.fastmcp import FastMCP
+
+
+mcp = FastMCP("plancraft-stub", log_level="WARNING")
+
+
+@mcp.tool()
+def fetch(url: str) -> str:
+    """URL 본문 (고정 응답)"""
+    return f"[stub pid={os.getpid()}] {url} 본문 내용"
+
+
+@mcp.tool(name="tavily-search")
+def tavily_search(query: str, max_results: int = 5) -> str:
+    """웹 검색 (고정 응답)"""
+    results = [
+        {"title": f"{query} 결과 {i}", "url": f"https://example.com/{i}", "content": f"{query} 요약 {i}"}
+        for i in range(1, max_results + 1)
+    ]
+    return json.dumps({"pid": os.getpid(), "results": results}, ensure_ascii=False)
+
+
+@mcp.tool()
+async def sleep(seconds: float) -> str:
+    """지정 시간 대기 후 PID 반환"""
+    await asyncio.sleep(seconds)
+    return str(os.getpid())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="PlanCraft stdio MCP stub server")
+    parser.add_argument("--startup-delay", type=float, default=0.0, help="기동 지연 (uvx/npx 기동 비용 흉내)")
+    args = parser.parse_args()
+
+    if args.startup_delay > 0:
+        time.sleep(args.startup_delay)
+    mcp.run(transport="stdio")
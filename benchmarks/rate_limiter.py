@@ -0,0 +1,117 @@
+"""
+Azure OpenAI Rate Limiter 벤치마크
+
+한도를 강제하는 가짜 Azure OpenAI 서버(benchmarks/fake_aoai_server.py)에
+여러 스레드가 동시에 Chat 호출을 보낼 때를 비교합니다.
+    - unlimited: 기존 방식 (SDK 기본 재시도만, 429 를 받은 뒤 대기)
+    - limited: utils.rate_limiter.RateLimitedTransport (배포별 토큰 버킷으로 호출 전 대기)
+
+측정 항목 (모드별):
+    - wall_ms: 전체 호출 종료까지
+    - succeeded / failed: 성공 / 최종 실패 호출 수
+    - server_429: 서버가 돌려준 429 응답 수 (SDK 재시도 포함)
+    - limiter: limited 모드의 대기 시간 지표 (p50 / p95 / 우선순위별)
+
+사용법:
+    python -m benchmarks.rate_limiter
+    python -m benchmarks.rate_limiter --threads 16 --calls 200 --rpm 1200 --tpm 120000
+"""
+
+import argparse
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict
+
+import httpx
+from langchain_openai import AzureChatOpenAI
+
+from benchmarks.fake_aoai_server import FakeAzureOpenAIServer
+from utils.rate_limiter import RateLimitedTransport, RateLimiterRegistry
+
+DEPLOYMENT = "gpt-4o"
+PROMPT = "시장 분석 요약: " + "경쟁사 가격과 사용자 리뷰를 비교합니다. " * 10
+
+
+def measure(server: FakeAzureOpenAIServer, http_client: httpx.Client, threads: int, calls: int,
+            max_retries: int) -> Dict[str, Any]:
+    """threads 개 스레드로 calls 번 Chat 호출"""
+    llm = AzureChatOpenAI(
+        azure_endpoint=server.endpoint,
+        api_key="fake",
+        api_version="2024-08-01-preview",
+        azure_deployment=DEPLOYMENT,
+        max_tokens=200,
+        max_retries=max_retries,
+        http_client=http_client,
+    )
+
+    def call(_):
+        try:
+            llm.invoke(PROMPT)
+            return True
+        except Exception:
+            return False
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        outcomes = list(executor.map(call, range(calls)))
+    wall = time.perf_counter() - start
+
+    stats = server.get_stats().get(DEPLOYMENT, {})
+    return {
+        "wall_ms": round(wall * 1000, 1),
+        "succeeded": sum(outcomes),
+        "failed": len(outcomes) - sum(outcomes),
+        "server_429": stats.get("throttled", 0),
+    }
+
+
+def run(threads: int = 8, calls: int = 100, rpm: float = 600, tpm: float = 240_000,
+        burst_sec: float = 2.0, max_retries: int = 2) -> Dict[str, Any]:
+    limits = {DEPLOYMENT: (rpm, tpm)}
+
+    with FakeAzureOpenAIServer(limits=limits, burst_sec=burst_sec) as server:
+        with httpx.Client() as client:
+            unlimited = measure(server, client, threads, calls, max_retries)
+
+    registry = RateLimiterRegistry({
+        "default": {"rpm": rpm, "tpm": tpm, "burst_sec": burst_sec},
+        "default_completion_tokens": 1000,
+        "deployments": {},
+    })
+    with FakeAzureOpenAIServer(limits=limits, burst_sec=burst_sec) as server:
+        with httpx.Client(transport=RateLimitedTransport(registry)) as client:
+            limited = measure(server, client, threads, calls, max_retries)
+    limiter_stats = registry.get_stats().get(DEPLOYMENT, {})
+    limited["limiter"] = {
+        "wait_ms": limiter_stats.get("wait_ms"),
+        "waited_calls": limiter_stats.get("waited_calls"),
+        "by_priority": limiter_stats.get("by_priority"),
+    }
+
+    return {
+        "benchmark": "rate_limiter",
+        "config": {"threads": threads, "calls": calls, "rpm": rpm, "tpm": tpm,
+                   "burst_sec": burst_sec, "sdk_max_retries": max_retries},
+        "unlimited": unlimited,
+        "limited": limited,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Azure OpenAI Rate Limiter 벤치마크 (가짜 서버)")
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--calls", type=int, default=100)
+    parser.add_argument("--rpm", type=float, default=600)
+    parser.add_argument("--tpm", type=float, default=240_000)
+    parser.add_argument("--burst-sec", type=float, default=2.0)
+    parser.add_argument("--max-retries", type=int, default=2, help="OpenAI SDK 내부 재시도 횟수")
+    args = parser.parse_args()
+
+    result = run(args.threads, args.calls, args.rpm, args.tpm, args.burst_sec, args.max_retries)
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+State 업데이트 Micro-benchmark
+
+실제 워크플로우 후반부와 비슷한 크기의 상태(초안, RAG/웹 컨텍스트, 전문가 분석,
+Step History)에서 노드 1회 분량의 상태 갱신 비용을 측정합니다.
+
+노드 1회 = update_state() + update_step_history()
+    - legacy: 호출마다 전체 상태 deepcopy (이전 구현)
+    - current: 변경된 키만 복사 (Structural Sharing)
+
+사용법:
+    python -m benchmarks.state_update
+    python -m benchmarks.state_update --iterations 500
+"""
+
+import argparse
+import copy
+import time
+import tracemalloc
+from typing import Any, Callable, Dict
+
+from graph.state import create_initial_state, update_state
+from graph.nodes.common import update_step_history
+
+
+def legacy_update_state(base_state: Dict[str, Any], **updates) -> Dict[str, Any]:
+    """이전 구현: 전체 상태 deepcopy 후 업데이트"""
+    new_state = copy.deepcopy(dict(base_state))
+    new_state.update(updates)
+    return new_state
+
+
+def legacy_node_step(state: Dict[str, Any]) -> Dict[str, Any]:
+    """이전 구현 기준 노드 1회 (update_state + step history 추가 = deepcopy 2회)"""
+    new_state = legacy_update_state(state, current_step="review", review={"overall_score": 8})
+    history = (new_state.get("step_history") or []) + [{"step": "review", "status": "SUCCESS"}]
+    return legacy_update_state(new_state, step_history=history, step_status="SUCCESS")
+
+
+def current_node_step(state: Dict[str, Any]) -> Dict[str, Any]:
+    """현재 구현 기준 노드 1회"""
+    new_state = update_state(state, current_step="review", review={"overall_score": 8})
+    return update_step_history(new_state, "review", "SUCCESS", "벤치마크")
+
+
+def build_large_state(sections: int = 12, history: int = 25) -> Dict[str, Any]:
+    """워크플로우 후반부와 비슷한 크기의 상태 생성"""
+    state = create_initial_state("AI 기반 반려동물 건강관리 플랫폼 기획서 작성")
+    paragraph = "시장 분석 결과 반려동물 헬스케어 시장은 연평균 12% 성장하고 있다. " * 40
+
+    draft_sections = [
+        {"id": i, "name": f"섹션 {i}", "content": f"## 섹션 {i}\n\n{paragraph}"}
+        for i in range(1, sections + 1)
+    ]
+    specialist = {
+        key: {
+            "summary": paragraph[:800],
+            "items": [{"name": f"항목 {j}", "detail": paragraph[:200], "score": j} for j in range(15)],
+        }
+        for key in ("market_analysis", "business_model", "financial_plan",
+                    "risk_analysis", "tech_analysis", "content_strategy")
+    }
+    return update_state(
+        state,
+        analysis={"topic": "반려동물 헬스케어", "key_features": [f"기능 {i}" for i in range(10)]},
+        structure={"title": "기획서", "sections": [{"id": s["id"], "name": s["name"]} for s in draft_sections]},
+        draft={"sections": draft_sections},
+        rag_context=paragraph * 5,
+        web_context=paragraph * 5,
+        web_sources=[{"title": f"출처 {i}", "url": f"https://example.com/{i}"} for i in range(10)],
+        specialist_analysis=specialist,
+        step_history=[
+            {"step": f"step_{i}", "status": "SUCCESS", "summary": "완료", "execution_time": "0.10s"}
+            for i in range(history)
+        ],
+    )
+
+
+def measure(step: Callable[[Dict[str, Any]], Dict[str, Any]], state: Dict[str, Any],
+            iterations: int) -> Dict[str, float]:
+    """노드 1회당 소요 시간 / 할당 블록 수 / 할당 바이트 측정"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        step(state)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = step(state)  # 결과를 유지해야 실제 할당이 집계됨
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    diff = [d for d in after.compare_to(before, "lineno") if d.count_diff > 0]
+    del result
+    return {
+        "us_per_node": elapsed / iterations * 1e6,
+        "alloc_blocks_per_node": sum(d.count_diff for d in diff),
+        "alloc_bytes_per_node": sum(d.size_diff for d in diff if d.size_diff > 0),
+    }
+
+
+def run(iterations: int = 200) -> Dict[str, Dict[str, float]]:
+    """legacy / current 측정 결과 반환"""
+    state = build_large_state()
+    return {
+        "legacy": measure(legacy_node_step, state, iterations),
+        "current": measure(current_node_step, state, iterations),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="State 업데이트 Micro-benchmark")
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    results = run(args.iterations)
+    print(f"{'impl':<10}{'us/node':>12}{'alloc blocks':>16}{'alloc bytes':>16}")
+    for name, r in results.items():
+        print(f"{name:<10}{r['us_per_node']:>12.1f}{r['alloc_blocks_per_node']:>16,}{r['alloc_bytes_per_node']:>16,}")
+    speedup = results["legacy"]["us_per_node"] / max(results["current"]["us_per_node"], 1e-9)
+    print(f"\nspeedup: {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@
 """
 import time
 from datetime import datetime
-from graph.state import PlanCraftState, update_state
+from graph.state import PlanCraftState, shallow_update_state
 from utils.file_logger import get_file_logger
 
 def update_step_history(state: PlanCraftState, step_name: str, status: str, 
@@ -40,10 +40,11 @@ def update_step_history(state: PlanCraftState, step_name: str, status: str,
     }
     
     # State 업데이트 (불변성 유지)
+    # 새 리스트 + 새 항목만 추가하므로 복사 없이 갱신 (기존 항목은 공유/불변)
     current_history = state.get("step_history", []) or []
     new_history = current_history + [history_item]
     
-    return update_state(
+    return shallow_update_state(
         state, 
         current_step=step_name,
         step_status=status,
@@ -1,11 +1,52 @@
 """
 Fetch Web Context Node
 """
+import hashlib
+
 from graph.state import PlanCraftState, update_state
 from graph.nodes.common import update_step_history
 from tools.web_search_executor import execute_web_search
-from utils.tracing import trace_node
+from tools.http_transport import remaining_time, request_deadline
+from utils.tracing import current_span, trace_node
 from utils.error_handler import handle_node_error
+from utils.singleflight import SingleFlightCancelled, get_singleflight, make_flight_key
+
+
+def _shared_web_search(search_input: str, rag_context, preset_key: str, preset) -> dict:
+    """
+    [NEW] 동시 실행 간 웹 검색 공유 (Single-flight)
+
+    같은 주제 / 프리셋 / RAG 컨텍스트 / 시간 구간의 검색이 진행 중이면 새로 검색하지 않고 그 결과를 기다립니다.
+    (검색 쿼리 생성에 rag_context 가 쓰이므로 컨텍스트가 다르면 공유하지 않음)
+    이 실행의 마감 시간이 먼저 끝나면 이 실행만 빈 부분 결과로 진행하고 공유 검색은 계속됩니다.
+    """
+    from utils.settings import settings
+
+    def search():
+        return execute_web_search(
+            search_input,
+            rag_context,
+            max_queries=preset.web_search_max_queries,
+            search_depth=preset.web_search_depth
+        )
+
+    if not settings.SINGLEFLIGHT_ENABLED:
+        return search()
+
+    rag_hash = hashlib.sha256(str(rag_context or "").encode("utf-8")).hexdigest()[:16]
+    key = make_flight_key(search_input, preset_key, preset.web_search_max_queries, preset.web_search_depth, rag_hash)
+    try:
+        result, shared = get_singleflight("web_search").do(key, search, timeout=remaining_time())
+    except SingleFlightCancelled:
+        return {"context": None, "urls": [], "sources": [], "error": None,
+                "partial": True, "timed_out": [search_input]}
+
+    node_span = current_span()
+    if node_span is not None:
+        node_span.set(singleflight="shared" if shared else "leader")
+    result["shared"] = shared
+    return result
+
 
 @trace_node("context", tags=["web", "search", "tavily"])
 @handle_node_error
@@ -70,12 +111,14 @@ def fetch_web_context(state: PlanCraftState) -> PlanCraftState:
     # [NEW] 프리셋 기반 파라미터 전달
     logger.info(f"[FetchWeb] Search Start: Preset={preset_key}, max_queries={preset.web_search_max_queries}, depth={preset.web_search_depth}")
     
-    result = execute_web_search(
-        search_input,
-        rag_context,
-        max_queries=preset.web_search_max_queries,
-        search_depth=preset.web_search_depth
-    )
+    # [NEW] 노드 전체 마감 시간을 하위 HTTP/MCP 호출에 전파
+    # [NEW] 동시 실행의 같은 검색은 Single-flight 로 1회만 수행
+    from utils.settings import settings
+    with request_deadline(settings.WEB_SEARCH_DEADLINE_SEC):
+        result = _shared_web_search(search_input, rag_context, preset_key, preset)
+
+    if result.get("shared"):
+        logger.info("[FetchWeb] 진행 중인 동일 검색 결과 공유 (Single-flight)")
 
     # [OBSERVABILITY] 웹 검색 결과 상세 로깅
     result_context_len = len(result.get('context') or '')
@@ -88,6 +131,17 @@ def fetch_web_context(state: PlanCraftState) -> PlanCraftState:
     else:
         logger.info(f"[FetchWeb] Search Success: {result_urls} URLs, {result_sources} Sources, {result_context_len} chars")
 
+    if result.get("partial"):
+        logger.warning(f"[FetchWeb] 마감 시간 초과 - 부분 결과 사용 (미완료: {result.get('timed_out')})")
+
+    cache_stats = result.get("cache_stats") or {}
+    if cache_stats:
+        logger.debug(
+            f"[FetchWeb] Search Cache: hits={cache_stats.get('hits')} "
+            f"(disk={cache_stats.get('disk_hits')}), misses={cache_stats.get('misses')}, "
+            f"coalesced={cache_stats.get('coalesced')}, hit_rate={cache_stats.get('hit_rate')}"
+        )
+
     # 2. 상태 업데이트
     existing_context = state.get("web_context")
     existing_urls = state.get("web_urls") or []
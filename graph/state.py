@@ -138,6 +138,7 @@ class PlanCraftOutput(TypedDict, total=False):
     # [NEW] 토큰 사용량 및 비용 추적
     token_usage: Optional[dict]  # {input_tokens, output_tokens, total_tokens}
     estimated_cost: Optional[float]  # 예상 비용 (USD)
+    budget: Optional[dict]  # [NEW] 실행 예산 요약 {limits, spent, level, decisions} (utils/budget.py)
 
 
 
@@ -231,6 +232,7 @@ class PlanCraftState(TypedDict, total=False):
     refinement_guideline: Optional[dict]  # Refiner가 생성한 전략 (기존)
 
     # Metadata & Operations
+    budget: Optional[dict]  # [NEW] 실행 예산 사용량 / 축소 결정 (Resume 시 복원)
     current_step: str
     step_status: Literal["RUNNING", "SUCCESS", "FAILED"]
     last_error: Optional[str]
@@ -357,22 +359,50 @@ def create_initial_state(
     }
 
 
+# 복사가 필요 없는 불변 스칼라 타입
+_ATOMIC_TYPES = (str, bytes, int, float, bool, type(None))
+
+
+def _detach(value: Any) -> Any:
+    """호출자 소유의 가변 객체와 공유되지 않도록 값을 분리합니다. (스칼라는 그대로)"""
+    if isinstance(value, _ATOMIC_TYPES):
+        return value
+    return copy.deepcopy(value)
+
+
 def update_state(base_state: PlanCraftState, **updates) -> PlanCraftState:
     """
     State 업데이트 헬퍼 (Pydantic의 model_copy 대체)
 
-    deepcopy를 사용하여 중첩 객체의 불변성을 보장합니다.
-    이를 통해 여러 에이전트가 동시에 상태를 수정해도 부작용이 없습니다.
+    [REFACTOR] Structural Sharing:
+    - 변경된 키의 값만 깊은 복사하여, 반환된 상태가 호출자 소유의
+      가변 객체(updates로 넘긴 dict/list 등)를 참조하지 않도록 보장합니다.
+    - 변경되지 않은 키의 중첩 값(draft, rag_context, specialist_analysis 등)은
+      이전 상태와 공유하며 불변으로 취급합니다. 노드는 상태를 제자리에서 수정하지 말고
+      항상 update_state로 새 값을 넘겨야 합니다.
 
     Usage:
         new_state = update_state(state, current_step="analyze", error=None)
 
     Note:
-        - 중첩 객체(analysis, structure, draft, review 등)도 안전하게 복사됨
-        - 성능이 중요한 경우 shallow_update_state() 사용 고려
+        - 최상위 dict는 항상 새로 생성되므로 원본 상태의 키는 바뀌지 않음
+        - 값을 새로 만들어 넘기고 이후 수정하지 않는 경우 shallow_update_state() 사용 가능
+    """
+    # 최상위만 얕은 복사 (변경되지 않은 값은 공유)
+    new_state = dict(base_state)
+    for key, value in updates.items():
+        new_state[key] = _detach(value)
+    return new_state
+
+
+def shallow_update_state(base_state: PlanCraftState, **updates) -> PlanCraftState:
+    """
+    복사 없이 State를 업데이트합니다. (내부 최적화용)
+
+    updates의 값을 그대로 사용하므로, 호출자가 방금 생성했고
+    이후 수정하지 않는 값에만 사용해야 합니다. (예: step_history 추가)
     """
-    # 기존 상태를 깊은 복사하여 불변성 보장
-    new_state = copy.deepcopy(dict(base_state))
+    new_state = dict(base_state)
     new_state.update(updates)
     return new_state
 
@@ -465,6 +465,7 @@ def run_context_subgraph(state: PlanCraftState) -> PlanCraftState:
     from graph.workflow import retrieve_context, fetch_web_context
     from graph.state import update_state
     from concurrent.futures import ThreadPoolExecutor, as_completed
+    import contextvars
     import time
 
     user_input = state.get("user_input", "")
@@ -497,8 +498,9 @@ def run_context_subgraph(state: PlanCraftState) -> PlanCraftState:
     
     try:
         with ThreadPoolExecutor(max_workers=2) as executor:
-            rag_future = executor.submit(run_rag)
-            web_future = executor.submit(run_web)
+            # 노드 Span 이 이어지도록 컨텍스트 복사 후 제출
+            rag_future = executor.submit(contextvars.copy_context().run, run_rag)
+            web_future = executor.submit(contextvars.copy_context().run, run_web)
             
             # 결과 수집
             rag_result = rag_future.result(timeout=30)
@@ -73,6 +73,7 @@ Best Practice 적용:
     print(result["final_output"])
 """
 
+import threading
 from enum import Enum
 from typing import Literal, Union
 from langgraph.graph import StateGraph, END
@@ -146,6 +147,8 @@ class RouteKey(str, Enum):
 from agents import analyzer, structurer, writer, reviewer, refiner, formatter
 from utils.config import Config
 from utils.tracing import trace_node
+from utils.budget import budget_allows, budget_cap
+from utils.singleflight import get_singleflight, make_flight_key
 from utils.error_handler import handle_node_error
 from utils.decorators import require_state_keys
 from utils.file_logger import get_file_logger
@@ -172,7 +175,7 @@ from graph.nodes.supervisor_node import run_supervisor_node  # [NEW] Supervisor
 # =============================================================================
 # LangSmith 트레이싱 활성화 (Observability)
 # =============================================================================
-Config.setup_langsmith()
+# [UPDATE] import 시점이 아닌 첫 get_app() 호출 시 활성화 (아래 "전역 앱 인스턴스" 참조)
 
 
 # =============================================================================
@@ -364,17 +367,31 @@ def retrieve_context(state: PlanCraftState) -> PlanCraftState:
     preset = get_preset(preset_key)
 
     # Retriever 초기화 (프리셋 기반 고급 기능 활성화)
-    retriever = Retriever(
-        k=3,
-        use_reranker=getattr(preset, 'use_reranker', False),
-        use_multi_query=getattr(preset, 'use_multi_query', False),
-        use_query_expansion=getattr(preset, 'use_query_expansion', False),
-        use_context_reorder=getattr(preset, 'use_context_reorder', False)
-    )
+    # [NEW] 실행 예산 임계치 초과 시 Reranker / Multi-Query / Query Expansion 생략
+    use_reranker = getattr(preset, 'use_reranker', False) and budget_allows("reranker", node="context")
+    use_multi_query = getattr(preset, 'use_multi_query', False) and budget_allows("multi_query", node="context")
+    use_query_expansion = getattr(preset, 'use_query_expansion', False) and budget_allows("query_expansion", node="context")
+    use_context_reorder = getattr(preset, 'use_context_reorder', False)
 
     # 사용자 입력으로 관련 문서 검색
     user_input = state["user_input"]
-    context = retriever.get_formatted_context(user_input)
+
+    def retrieve() -> str:
+        retriever = Retriever(
+            k=3,
+            use_reranker=use_reranker,
+            use_multi_query=use_multi_query,
+            use_query_expansion=use_query_expansion,
+            use_context_reorder=use_context_reorder
+        )
+        return retriever.get_formatted_context(user_input)
+
+    # [NEW] 동시 실행의 같은 주제 / 프리셋 / 기능 조합 검색은 Single-flight 로 1회만 수행 (결과 공유)
+    if settings.SINGLEFLIGHT_ENABLED:
+        key = make_flight_key(user_input, preset_key, use_reranker, use_multi_query, use_query_expansion, use_context_reorder)
+        context, _ = get_singleflight("rag_retrieve").do(key, retrieve)
+    else:
+        context = retrieve()
 
     new_state = update_state(state, rag_context=context, current_step="retrieve")
 
@@ -385,11 +402,11 @@ def retrieve_context(state: PlanCraftState) -> PlanCraftState:
 
     # 활성화된 기능 라벨 생성
     features = []
-    if getattr(preset, 'use_multi_query', False):
+    if use_multi_query:
         features.append("MultiQ")
-    if getattr(preset, 'use_reranker', False):
+    if use_reranker:
         features.append("Rerank")
-    if getattr(preset, 'use_context_reorder', False):
+    if use_context_reorder:
         features.append("Reorder")
     feature_label = f" ({', '.join(features)})" if features else ""
     summary = f"검색된 문서: {doc_count}건{feature_label}"
@@ -679,6 +696,11 @@ def create_workflow() -> StateGraph:
             logger.info(f"[ROUTING] 중간 품질 ({score}점), Discussion 스킵 → Refine")
             return RouteKey.SKIP_TO_REFINE
 
+        # [NEW] 실행 예산 임계치 초과: Discussion 생략
+        if not budget_allows("discussion", node="review"):
+            logger.info(f"[ROUTING] 예산 임계치 초과 ({score}점), Discussion 생략 → Refine")
+            return RouteKey.SKIP_TO_REFINE
+
         # 낮은 점수: Discussion 필요
         logger.info(f"[ROUTING] 개선 필요 ({score}점), Discussion 진행")
         return RouteKey.DISCUSS
@@ -729,7 +751,8 @@ def create_workflow() -> StateGraph:
         # [REFACTOR] 품질 프리셋 기반 MAX_REFINE_LOOPS 동적 적용
         preset_key = state.get("generation_preset", "balanced")
         preset = get_preset(preset_key)
-        max_refine_loops = preset.max_refine_loops
+        # [NEW] 실행 예산 임계치 초과 시 루프 상한 축소 (soft: 1회, exceeded: 0회)
+        max_refine_loops = budget_cap("max_refine_loops", preset.max_refine_loops, node="refine")
 
         # [NEW] Graceful End-of-Loop: 남은 스텝이 부족하면 안전하게 종료
         if remaining_steps <= settings.MIN_REMAINING_STEPS:
@@ -861,8 +884,35 @@ def compile_workflow(use_subgraphs: bool = False, checkpointer = None):
     return create_workflow().compile(**compile_options)
 
 
-# 전역 앱 인스턴스
-app = compile_workflow()
+# =============================================================================
+# [UPDATE] 전역 앱 인스턴스 (Lazy Compile)
+# =============================================================================
+# import 시점 컴파일은 FastAPI 시작, Streamlit init_resources, 그래프를 참조하는
+# 모든 테스트 모듈의 임계 경로에 놓이므로 첫 사용 시점으로 미룹니다.
+# 기존 `from graph.workflow import app` 은 모듈 __getattr__ 로 계속 동작합니다.
+
+_app = None
+_app_lock = threading.Lock()
+
+
+def get_app():
+    """
+    컴파일된 전역 워크플로우 반환 (첫 호출 시 1회 컴파일, Thread-safe)
+    """
+    global _app
+    if _app is None:
+        with _app_lock:
+            if _app is None:
+                Config.setup_langsmith()
+                _app = compile_workflow()
+    return _app
+
+
+def __getattr__(name: str):
+    # 하위 호환: graph.workflow.app → get_app()
+    if name == "app":
+        return get_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # =============================================================================
@@ -878,7 +928,8 @@ def run_plancraft(
     thread_id: str = "default_thread",
     resume_command: dict = None,  # [NEW] 재개를 위한 커맨드 데이터
     generation_preset: str = None,  # [NEW] 생성 모드 프리셋 (fast/balanced/quality)
-    is_template_execution: bool = False  # [NEW] 템플릿 실행 여부 (2-Tier Gate)
+    is_template_execution: bool = False,  # [NEW] 템플릿 실행 여부 (2-Tier Gate)
+    budget: dict = None  # [NEW] 실행 예산 {max_tokens, max_cost_usd} (미지정 시 settings 기본값)
 ) -> dict:
     """
     PlanCraft 워크플로우 실행 엔트리포인트
@@ -893,6 +944,7 @@ def run_plancraft(
         resume_command: 인터럽트 후 재개를 위한 데이터 (Command resume)
         generation_preset: 생성 모드 프리셋 ("fast", "balanced", "quality")
         is_template_execution: 템플릿 실행 여부 (True: AutoPlan 기본, False: NeedInfo 기본)
+        budget: 요청별 예산 한도 (Resume 시 미지정이면 체크포인트의 예산/사용량을 이어서 사용)
     """
     from graph.state import create_initial_state
     from langgraph.types import Command
@@ -916,9 +968,13 @@ def run_plancraft(
         }
 
     # 워크플로우 실행설정
+    # [NEW] SpanCallbackHandler: 노드/에이전트 내부 LLM 호출을 로컬 trace 의 llm Span 으로 기록
+    from utils.tracing import SpanCallbackHandler, span
+    from utils.budget import BudgetCallbackHandler, budget_scope
+    from utils.rate_limiter import INTERACTIVE, NORMAL, llm_priority
     config = {"configurable": {"thread_id": thread_id}}
-    if callbacks:
-        config["callbacks"] = callbacks
+    budget_controller = _create_budget_controller(config, budget, resume=bool(resume_command))
+    config["callbacks"] = list(callbacks or []) + [SpanCallbackHandler(), BudgetCallbackHandler(budget_controller)]
 
     # [UPDATE] 실행 로직 분기 (일반 실행 vs Resume 실행)
     if resume_command:
@@ -944,7 +1000,11 @@ def run_plancraft(
     # [FIX] invoke 모드로 변경 - interrupt 발생 시 즉시 반환됨
     # stream 모드는 interrupt 시 종료되지 않는 문제가 있음
     try:
-        final_state = app.invoke(input_data, config=config)
+        # [NEW] HITL 재개는 사용자가 기다리는 호출이므로 Rate Limiter 대기열에서 우선
+        with span("plancraft", kind="run", thread_id=thread_id, resume=bool(resume_command),
+                  preset=generation_preset or DEFAULT_PRESET), budget_scope(budget_controller), \
+                llm_priority(INTERACTIVE if resume_command else NORMAL):
+            final_state = get_app().invoke(input_data, config=config)
     except Exception as e:
         # invoke 실패 시 에러 상태 반환
         from utils.file_logger import get_file_logger
@@ -956,7 +1016,7 @@ def run_plancraft(
         timeline_callback.finish()
 
     # [NEW] 인터럽트 상태 및 최종 상태 확인
-    snapshot = app.get_state(config)
+    snapshot = get_app().get_state(config)
 
     # [DEBUG] Interrupt 상태 로깅
     from utils.file_logger import get_file_logger
@@ -1005,17 +1065,79 @@ def run_plancraft(
         result["__interrupt__"] = interrupt_payload
 
     # [NEW] 토큰 사용량 추적 (콜백에서 수집)
+    state_updates = {}
     if callbacks:
         for cb in callbacks:
             if hasattr(cb, "get_usage_summary"):
                 usage = cb.get_usage_summary()
                 if usage.get("total_tokens", 0) > 0:
                     result["token_usage"] = usage
-                    # Checkpointer에도 저장 (polling 시 조회 가능하도록)
-                    try:
-                        app.update_state(config, {"token_usage": usage})
-                    except Exception:
-                        pass  # 저장 실패해도 result에는 포함됨
+                    state_updates["token_usage"] = usage
                 break
 
+    # [NEW] 실행 예산 사용량 / 축소 결정 기록 (Resume 시 이어서 집계)
+    budget_summary = budget_controller.summary()
+    result["budget"] = budget_summary
+
+    # [FIX] HITL 인터럽트로 멈춘 경우 체크포인트를 갱신하지 않음
+    # update_state 는 __interrupt__ 기록이 없는 새 체크포인트를 만들어 스레드가 입력 대기로 보이지 않게 됨
+    # → 예산은 Resume 실행이 이어받도록 인터럽트 예산 저장소에 보관 (재시작 / 다른 워커에서도 유지)
+    if snapshot.next or "__interrupt__" in result:
+        _store_interrupted_budget(thread_id, budget_summary)
+        return result
+    if budget_summary["spent"]["llm_calls"] or budget_summary["decisions"]:
+        state_updates["budget"] = budget_summary
+
+    # Checkpointer에도 저장 (polling 시 조회 가능하도록)
+    if state_updates:
+        try:
+            get_app().update_state(config, state_updates)
+        except Exception:
+            pass  # 저장 실패해도 result에는 포함됨
+
     return result
+
+
+# [FIX] 인터럽트로 멈춘 실행의 예산 집계는 체크포인터와 같은 저장소에 보관 (utils/budget_store.py)
+def _store_interrupted_budget(thread_id: str, summary: dict) -> None:
+    from utils.budget_store import get_budget_store
+
+    try:
+        get_budget_store().put(thread_id, summary)
+    except Exception as e:
+        from utils.file_logger import get_file_logger
+        get_file_logger().warning(f"[Workflow] 인터럽트 예산 저장 실패: {e}")
+
+
+def _pop_interrupted_budget(thread_id: str) -> dict:
+    from utils.budget_store import get_budget_store
+
+    try:
+        return get_budget_store().pop(thread_id)
+    except Exception as e:
+        from utils.file_logger import get_file_logger
+        get_file_logger().warning(f"[Workflow] 인터럽트 예산 조회 실패: {e}")
+        return None
+
+
+def _create_budget_controller(config: dict, budget: dict = None, resume: bool = False):
+    """
+    [NEW] 실행 1회의 BudgetController 생성
+
+    Resume 실행은 인터럽트 시점에 보관한 예산(없으면 체크포인트의 state["budget"])에서
+    사용량 / 결정 이력을 복원하여 인터럽트 전후를 하나의 예산으로 집계합니다.
+    """
+    from utils.budget import BudgetController, RunBudget
+
+    run_budget = RunBudget.from_settings(budget) if budget else None
+    if resume:
+        thread_id = config.get("configurable", {}).get("thread_id")
+        previous = _pop_interrupted_budget(thread_id) if thread_id else None
+        if previous is None:
+            try:
+                previous = (get_app().get_state(config).values or {}).get("budget")
+            except Exception:
+                previous = None
+        if previous:
+            return BudgetController.from_summary(previous, budget=run_budget)
+    return BudgetController(run_budget or RunBudget.from_settings())
@@ -1,11 +1,12 @@
 """
 PlanCraft Agent - Refiner 프롬프트
 
-Version: 1.1.0
+Version: 1.2.0
 Last Updated: 2025-01-06
 Author: PlanCraft Team
 
 Changelog:
+- v1.2.0: target_sections 출력 (섹션 단위 재작성)
 - v1.1.0 (2025-01-06): 전략적 개선 방향 제시 강화, target_sections 연동
 - v1.0.0 (2024-12-27): 초기 버전
 
@@ -47,4 +48,6 @@ REFINER_USER_PROMPT = """
 4. Writer가 추가로 검색해보면 좋을 키워드는 무엇입니까?
 
 위 내용을 바탕으로 구조화된 개선 전략(RefinementStrategy)을 출력하세요.
+다시 작성해야 하는 섹션은 target_sections에 초안의 섹션 이름 그대로 적으세요.
+(Writer는 target_sections에 적힌 섹션만 다시 작성하고 나머지는 그대로 유지합니다. 전체 재작성이 필요하면 비워두세요.)
 """
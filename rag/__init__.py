@@ -1,7 +1,12 @@
 # RAG 모듈
 from rag.embedder import Embedder
 from rag.retriever import Retriever, create_advanced_retriever
-from rag.vectorstore import init_vectorstore, load_vectorstore
+from rag.vectorstore import (
+    init_vectorstore,
+    load_vectorstore,
+    get_vectorstore_registry,
+    get_vectorstore_stats,
+)
 from rag.reranker import rerank_documents
 from rag.query_transform import (
     QueryTransformer,
@@ -16,6 +21,8 @@ __all__ = [
     "create_advanced_retriever",
     "init_vectorstore",
     "load_vectorstore",
+    "get_vectorstore_registry",
+    "get_vectorstore_stats",
     # Advanced RAG
     "rerank_documents",
     "QueryTransformer",
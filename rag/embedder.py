@@ -9,3 +9,9 @@ class Embedder:
 
     def embed_documents(self, texts: list[str]):
         return self.embeddings.embed_documents(texts)
+
+    def get_cache_stats(self) -> dict:
+        """임베딩 캐시 히트/미스 통계 (캐시 미사용 시 enabled=False)"""
+        if hasattr(self.embeddings, "get_stats"):
+            return self.embeddings.get_stats()
+        return {"enabled": False}
@@ -0,0 +1,300 @@
+"""
+PlanCraft Agent - 임베딩 벡터 캐시
+
+검색, Multi-Query 확장, 예시 선택이 같은 쿼리를 반복해서 임베딩하는 비용을 줄입니다.
+utils/llm.py:get_embeddings()가 반환하는 모델을 CachedEmbeddings로 감쌉니다.
+쿼리(embed_query / embed_queries)만 캐시하고, 인덱스 빌드용 embed_documents 는 그대로 통과시킵니다.
+(문서 청크가 LRU 를 채워 실제 쿼리 벡터를 밀어내거나 float16 으로 반올림되어 인덱스에 들어가지 않도록)
+
+구성:
+    - Key: sha256(모델 이름 + 텍스트)
+    - 디스크: SQLite에 float16/float32 바이트 배열로 저장 (최대 항목 수 초과 시 LRU 제거)
+    - 메모리: 조회된 벡터만 지연 로드, 바이트 상한을 넘으면 LRU 제거
+    - 미스 쿼리는 모아서 embed_documents 1회로 요청 (embed_queries)
+
+사용 예시:
+    from rag.embedding_cache import CachedEmbeddings, EmbeddingCacheStore
+
+    embeddings = CachedEmbeddings(AzureOpenAIEmbeddings(...), EmbeddingCacheStore(":memory:"))
+    embeddings.embed_query("기획서 작성 가이드")   # 미스 → 모델 호출
+    embeddings.embed_query("기획서 작성 가이드")   # 히트
+    embeddings.get_stats()
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+# 캐시 설정 (환경변수로 오버라이드 가능)
+DEFAULT_EMBED_CACHE_PATH = os.getenv("EMBED_CACHE_PATH", "./data/embedding_cache.db")
+DEFAULT_EMBED_CACHE_MAX_ENTRIES = int(os.getenv("EMBED_CACHE_MAX_ENTRIES", "20000"))
+DEFAULT_EMBED_CACHE_MEMORY_MB = float(os.getenv("EMBED_CACHE_MEMORY_MB", "64"))
+DEFAULT_EMBED_CACHE_DTYPE = os.getenv("EMBED_CACHE_DTYPE", "float16")
+
+_DTYPES = {"float16": np.float16, "float32": np.float32}
+
+
+# =============================================================================
+# 저장소 (SQLite + 메모리 LRU)
+# =============================================================================
+
+class EmbeddingCacheStore:
+    """
+    임베딩 벡터 저장소 (Thread-safe)
+
+    Args:
+        db_path: SQLite 경로 (":memory:"이면 프로세스 메모리에만 저장)
+        max_entries: 디스크 최대 항목 수
+        memory_limit_bytes: 메모리 LRU 상한 (바이트)
+        dtype: 저장 정밀도 ("float16" | "float32")
+    """
+
+    def __init__(
+        self,
+        db_path: str = DEFAULT_EMBED_CACHE_PATH,
+        max_entries: int = DEFAULT_EMBED_CACHE_MAX_ENTRIES,
+        memory_limit_bytes: int = int(DEFAULT_EMBED_CACHE_MEMORY_MB * 1024 * 1024),
+        dtype: str = DEFAULT_EMBED_CACHE_DTYPE,
+    ):
+        if dtype not in _DTYPES:
+            raise ValueError(f"지원하지 않는 dtype: {dtype} (float16 | float32)")
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.memory_limit_bytes = memory_limit_bytes
+        self.dtype = dtype
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._memory_bytes = 0
+        self._stats = {"hits": 0, "memory_hits": 0, "misses": 0, "writes": 0, "model_calls": 0}
+
+        if db_path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            " key TEXT PRIMARY KEY, dtype TEXT NOT NULL, vector BLOB NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_embeddings_last_used ON embeddings(last_used)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(text: str, model_name: str) -> str:
+        """캐시 키 생성 (텍스트는 그대로 사용 - 임베딩은 공백/대소문자에 민감)"""
+        return hashlib.sha256(f"{model_name}\x00{text}".encode("utf-8")).hexdigest()
+
+    def encode(self, vector: Sequence[float]) -> np.ndarray:
+        """저장 정밀도로 변환 (미스 결과도 이 값을 반환해 히트/미스 결과를 일치시킴)"""
+        return np.asarray(vector, dtype=_DTYPES[self.dtype])
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, np.ndarray]:
+        """메모리 → 디스크 순으로 조회 (디스크 히트는 메모리에 적재)"""
+        unique_keys = list(dict.fromkeys(keys))
+        found: Dict[str, np.ndarray] = {}
+        with self._lock:
+            for key in unique_keys:
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    found[key] = vector
+            self._stats["memory_hits"] += len(found)
+
+            missing = [k for k in unique_keys if k not in found]
+            disk_hits = []
+            # SQLite 바인딩 변수 제한(999)을 고려하여 나눠서 조회
+            for i in range(0, len(missing), 500):
+                chunk = missing[i:i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, dtype, vector FROM embeddings WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+                for key, dtype, blob in rows:
+                    vector = np.frombuffer(blob, dtype=_DTYPES.get(dtype, np.float32))
+                    found[key] = vector
+                    disk_hits.append(key)
+                    self._remember(key, vector)
+
+            if disk_hits:
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE embeddings SET last_used = ? WHERE key = ?",
+                    [(now, k) for k in disk_hits]
+                )
+                self._conn.commit()
+
+            self._stats["hits"] += sum(1 for k in unique_keys if k in found)
+            self._stats["misses"] += sum(1 for k in unique_keys if k not in found)
+        return found
+
+    def put_many(self, vectors: Dict[str, np.ndarray]) -> None:
+        """벡터 저장 후 최대 항목 수 초과분 제거"""
+        if not vectors:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, dtype, vector, last_used) VALUES (?, ?, ?, ?)",
+                [(k, self.dtype, v.tobytes(), now) for k, v in vectors.items()]
+            )
+            count = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+            if count > self.max_entries:
+                self._conn.execute(
+                    "DELETE FROM embeddings WHERE key IN ("
+                    " SELECT key FROM embeddings ORDER BY last_used ASC LIMIT ?)",
+                    (count - self.max_entries,)
+                )
+            self._conn.commit()
+            for key, vector in vectors.items():
+                self._remember(key, vector)
+            self._stats["writes"] += len(vectors)
+
+    def record_model_call(self) -> None:
+        with self._lock:
+            self._stats["model_calls"] += 1
+
+    def _remember(self, key: str, vector: np.ndarray) -> None:
+        """메모리 LRU 적재 (lock 보유 상태에서 호출)"""
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= previous.nbytes
+        if vector.nbytes > self.memory_limit_bytes:
+            return
+        self._memory[key] = vector
+        self._memory_bytes += vector.nbytes
+        while self._memory_bytes > self.memory_limit_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted.nbytes
+
+    def clear(self) -> None:
+        """캐시 전체 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM embeddings")
+            self._conn.commit()
+            self._memory.clear()
+            self._memory_bytes = 0
+            for key in self._stats:
+                self._stats[key] = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+            stats = dict(self._stats)
+            stats.update({
+                "entries": entries,
+                "max_entries": self.max_entries,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "dtype": self.dtype,
+            })
+        total = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = f"{(stats['hits'] / total * 100) if total else 0:.1f}%"
+        return stats
+
+
+# =============================================================================
+# Embeddings 래퍼
+# =============================================================================
+
+class CachedEmbeddings(Embeddings):
+    """
+    캐시를 거쳐 임베딩하는 래퍼
+
+    - embed_query / embed_queries(쿼리 배치)만 캐시 사용 (OpenAI 계열은 쿼리/문서 결과가 동일)
+    - 배치 내 미스 쿼리는 중복 제거 후 embed_documents 1회로 요청
+    - embed_documents(인덱스 빌드)는 캐시를 거치지 않고 원래 정밀도로 반환
+    - 그 외 속성(deployment, model 등)은 원래 모델에 위임
+    """
+
+    def __init__(self, embeddings: Embeddings, store: EmbeddingCacheStore):
+        self.embeddings = embeddings
+        self.store = store
+        # 인덱스 Manifest 와 같은 식별자를 캐시 키에 사용 (vectorstore 가 utils.llm 을 import 하므로 지연 import)
+        from rag.vectorstore import _embedding_model_name
+        self.model_name = _embedding_model_name(embeddings)
+
+    def __getattr__(self, name: str) -> Any:
+        # __init__ 이전(역직렬화 등)에는 위임 대상이 없으므로 재귀 방지
+        if name == "embeddings":
+            raise AttributeError(name)
+        return getattr(self.embeddings, name)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """문서(인덱스 빌드) 임베딩 - 캐시 미사용"""
+        return self.embeddings.embed_documents(texts)
+
+    def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        """여러 쿼리를 캐시를 거쳐 임베딩 (미스만 1회 배치 요청)"""
+        if not texts:
+            return []
+        keys = [self.store.make_key(text, self.model_name) for text in texts]
+        found = self.store.get_many(keys)
+
+        pending: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in found:
+                pending.setdefault(key, text)
+
+        if pending:
+            self.store.record_model_call()
+            vectors = self.embeddings.embed_documents(list(pending.values()))
+            fresh = {key: self.store.encode(vector) for key, vector in zip(pending, vectors)}
+            self.store.put_many(fresh)
+            found.update(fresh)
+
+        return [found[key].astype(np.float32).tolist() for key in keys]
+
+    def embed_query(self, text: str) -> List[float]:
+        key = self.store.make_key(text, self.model_name)
+        found = self.store.get_many([key])
+        if key not in found:
+            self.store.record_model_call()
+            vector = self.store.encode(self.embeddings.embed_query(text))
+            self.store.put_many({key: vector})
+            found[key] = vector
+        return found[key].astype(np.float32).tolist()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 (hits, misses, model_calls, hit_rate ...)"""
+        return self.store.stats()
+
+
+# =============================================================================
+# 전역 인스턴스
+# =============================================================================
+
+_embedding_cache: Optional[EmbeddingCacheStore] = None
+_embedding_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> Optional[EmbeddingCacheStore]:
+    """
+    전역 임베딩 캐시 반환 (싱글톤)
+
+    EMBED_CACHE_ENABLED=false 이거나 DB를 열 수 없으면 None
+    """
+    global _embedding_cache
+    if os.getenv("EMBED_CACHE_ENABLED", "true").lower() == "false":
+        return None
+    if _embedding_cache is None:
+        with _embedding_cache_lock:
+            if _embedding_cache is None:
+                try:
+                    _embedding_cache = EmbeddingCacheStore()
+                except sqlite3.Error as e:
+                    print(f"[WARN] Embedding cache disabled: {e}")
+                    return None
+    return _embedding_cache
+
+
+def get_embedding_cache_stats() -> Dict[str, Any]:
+    """임베딩 캐시 통계 반환"""
+    cache = get_embedding_cache()
+    return cache.stats() if cache else {"enabled": False}
@@ -92,7 +92,8 @@ class QueryTransformer:
             try:
                 from utils.llm import get_llm
                 # 비용 절감을 위해 mini 모델 사용
-                self._llm = get_llm(model_type="gpt-4o-mini", temperature=0.3)
+                # 같은 질의의 재작성 결과는 재사용 (응답 캐시)
+                self._llm = get_llm(model_type="gpt-4o-mini", temperature=0.3, cache=True)
             except Exception as e:
                 print(f"[QueryTransformer] LLM 로드 실패: {e}")
                 self.use_llm = False
@@ -8,6 +8,7 @@ Cross-Encoder를 사용하여 검색 결과의 순위를 재조정합니다.
     - Cross-Encoder 기반 Reranking
     - 상위 k개 문서 재정렬
     - Lazy Loading (첫 호출 시 모델 로드)
+    - 디스크 기반 점수 캐시 (동일 쿼리/청크 재계산 방지)
 
 사용 예시:
     from rag.reranker import rerank_documents
@@ -16,7 +17,12 @@ Cross-Encoder를 사용하여 검색 결과의 순위를 재조정합니다.
     reranked = rerank_documents(query, docs, top_k=3)
 """
 
-from typing import Any, List, Optional, Tuple
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from functools import lru_cache
 
 # =============================================================================
@@ -27,6 +33,199 @@ from functools import lru_cache
 # - ms-marco-MiniLM-L-12-v2: 더 정확하지만 느림
 DEFAULT_MODEL = "cross-encoder/ms-marco-MiniLM-L-6-v2"
 
+# 점수 캐시 설정 (환경변수로 오버라이드 가능)
+DEFAULT_SCORE_CACHE_PATH = os.getenv("RERANK_CACHE_PATH", "./data/rerank_scores.db")
+DEFAULT_SCORE_CACHE_MAX_ENTRIES = int(os.getenv("RERANK_CACHE_MAX_ENTRIES", "50000"))
+
+
+# =============================================================================
+# [NEW] Cross-Encoder 점수 캐시 (SQLite)
+# =============================================================================
+# 비슷한 기획 주제에서는 같은 청크가 반복해서 검색되므로,
+# (정규화 쿼리, 청크 해시, 모델) 단위로 점수를 디스크에 저장하여 재사용합니다.
+
+class RerankScoreCache:
+    """
+    Cross-Encoder 점수 캐시 (SQLite, Thread-safe)
+
+    - Key: sha256(모델 이름 + 정규화된 쿼리 + 청크 내용 해시)
+    - 최대 항목 수를 넘으면 가장 오래 사용되지 않은 항목부터 제거 (LRU)
+    - db_path=":memory:"이면 프로세스 메모리에만 저장
+
+    Example:
+        >>> cache = RerankScoreCache("./data/rerank_scores.db")
+        >>> key = cache.make_key("기획서", "청크 내용", DEFAULT_MODEL)
+        >>> cache.put_many({key: 0.87})
+        >>> cache.get_many([key])
+        {'...': 0.87}
+    """
+
+    def __init__(
+        self,
+        db_path: str = DEFAULT_SCORE_CACHE_PATH,
+        max_entries: int = DEFAULT_SCORE_CACHE_MAX_ENTRIES
+    ):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        if db_path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS rerank_scores ("
+            " key TEXT PRIMARY KEY, score REAL NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_rerank_last_used ON rerank_scores(last_used)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(query: str, content: str, model_name: str) -> str:
+        """캐시 키 생성 (쿼리는 소문자 + 공백 정규화)"""
+        normalized_query = " ".join(query.lower().split())
+        content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        raw = f"{model_name}\x00{normalized_query}\x00{content_hash}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, float]:
+        """캐시된 점수 조회 (히트 항목의 사용 시각 갱신)"""
+        if not keys:
+            return {}
+        unique_keys = list(dict.fromkeys(keys))
+        found: Dict[str, float] = {}
+        with self._lock:
+            # SQLite 바인딩 변수 제한(999)을 고려하여 나눠서 조회
+            for i in range(0, len(unique_keys), 500):
+                chunk = unique_keys[i:i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, score FROM rerank_scores WHERE key IN ({placeholders})",
+                    chunk
+                ).fetchall()
+                found.update(rows)
+            if found:
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE rerank_scores SET last_used = ? WHERE key = ?",
+                    [(now, k) for k in found]
+                )
+                self._conn.commit()
+            self.hits += sum(1 for k in keys if k in found)
+            self.misses += sum(1 for k in keys if k not in found)
+        return found
+
+    def put_many(self, scores: Dict[str, float]) -> None:
+        """점수 저장 후 최대 항목 수 초과분 제거"""
+        if not scores:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO rerank_scores (key, score, last_used) VALUES (?, ?, ?)",
+                [(k, float(v), now) for k, v in scores.items()]
+            )
+            count = self._conn.execute("SELECT COUNT(*) FROM rerank_scores").fetchone()[0]
+            if count > self.max_entries:
+                self._conn.execute(
+                    "DELETE FROM rerank_scores WHERE key IN ("
+                    " SELECT key FROM rerank_scores ORDER BY last_used ASC LIMIT ?)",
+                    (count - self.max_entries,)
+                )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """캐시 전체 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM rerank_scores")
+            self._conn.commit()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM rerank_scores").fetchone()[0]
+        total = self.hits + self.misses
+        return {
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": f"{(self.hits / total * 100) if total else 0:.1f}%",
+        }
+
+
+_score_cache: Optional[RerankScoreCache] = None
+_score_cache_lock = threading.Lock()
+
+
+def get_rerank_score_cache() -> Optional[RerankScoreCache]:
+    """
+    전역 점수 캐시 반환 (싱글톤)
+
+    RERANK_CACHE_ENABLED=false이거나 DB를 열 수 없으면 None (캐시 없이 동작)
+    """
+    global _score_cache
+    if os.getenv("RERANK_CACHE_ENABLED", "true").lower() == "false":
+        return None
+    if _score_cache is None:
+        with _score_cache_lock:
+            if _score_cache is None:
+                try:
+                    _score_cache = RerankScoreCache()
+                except sqlite3.Error as e:
+                    print(f"[WARN] Rerank score cache disabled: {e}")
+                    return None
+    return _score_cache
+
+
+def get_rerank_cache_stats() -> Dict[str, Any]:
+    """점수 캐시 통계 반환"""
+    cache = get_rerank_score_cache()
+    return cache.stats() if cache else {"enabled": False}
+
+
+def _score_pairs(model, model_name: str, query: str, contents: List[str]) -> List[float]:
+    """
+    (query, content) 쌍의 점수를 계산합니다. 캐시 미스만 모델에 배치로 전달합니다.
+
+    Raises:
+        Exception: model.predict 실패 시 (호출자에서 Fallback 처리)
+    """
+    cache = get_rerank_score_cache()
+    if cache is None:
+        return [float(s) for s in model.predict([(query, c) for c in contents])]
+
+    keys = [cache.make_key(query, c, model_name) for c in contents]
+    try:
+        cached = cache.get_many(keys)
+    except sqlite3.Error as e:
+        print(f"[WARN] Rerank score cache lookup failed: {e}")
+        cached = {}
+
+    # 같은 청크가 여러 번 들어와도 모델에는 1번만 전달
+    miss_index: Dict[str, int] = {}
+    for i, key in enumerate(keys):
+        if key not in cached and key not in miss_index:
+            miss_index[key] = i
+
+    if miss_index:
+        miss_keys = list(miss_index)
+        predicted = model.predict([(query, contents[miss_index[k]]) for k in miss_keys])
+        new_scores = {k: float(s) for k, s in zip(miss_keys, predicted)}
+        cached.update(new_scores)
+        try:
+            cache.put_many(new_scores)
+        except sqlite3.Error as e:
+            print(f"[WARN] Rerank score cache write failed: {e}")
+
+    return [cached[k] for k in keys]
+
 
 @lru_cache(maxsize=1)
 def _get_cross_encoder(model_name: str = DEFAULT_MODEL):
@@ -94,7 +293,7 @@ def rerank_documents(
         return documents[:top_k]
 
     # Query-Document 쌍 생성
-    pairs = []
+    contents = []
     for doc in documents:
         # 헤더 메타데이터가 있으면 본문 앞에 추가하여 문맥 보강
         content = doc.page_content
@@ -107,11 +306,11 @@ def rerank_documents(
             header_text = " > ".join(headers)
             content = f"[{header_text}]\n{content}"
             
-        pairs.append((query, content))
+        contents.append(content)
 
-    # 점수 계산
+    # 점수 계산 (캐시 미스만 모델 호출)
     try:
-        scores = model.predict(pairs)
+        scores = _score_pairs(model, model_name, query, contents)
     except Exception as e:
         print(f"[WARN] Reranking failed: {e}")
         return documents[:top_k]
@@ -156,10 +355,10 @@ def rerank_with_scores(
         # Fallback: 기본 점수 0.5 부여
         return [(0.5, doc) for doc in documents]
 
-    pairs = [(query, doc.page_content) for doc in documents]
+    contents = [doc.page_content for doc in documents]
 
     try:
-        scores = model.predict(pairs)
+        scores = _score_pairs(model, model_name, query, contents)
     except Exception as e:
         print(f"[WARN] Reranking failed: {e}")
         return [(0.5, doc) for doc in documents]
@@ -28,8 +28,35 @@ LangGraph 워크플로우의 retrieve 노드에서 사용됩니다.
     docs = retriever.get_relevant_documents("기획서 작성법")
 """
 
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 from rag.vectorstore import load_vectorstore
+from utils.settings import settings
+from utils.tracing import span, traced
+
+
+# =============================================================================
+# [NEW] Multi-Query 검색용 공유 스레드 풀
+# =============================================================================
+# FAISS 검색은 GIL을 해제하므로 스레드로 병렬 실행할 수 있습니다.
+# 호출마다 풀을 만들지 않도록 프로세스 단위로 1개만 유지합니다.
+_search_executor: Optional[ThreadPoolExecutor] = None
+_search_executor_lock = threading.Lock()
+
+
+def _get_search_executor() -> ThreadPoolExecutor:
+    """Multi-Query 검색용 스레드 풀 반환 (싱글톤, 최대 RAG_MAX_PARALLEL_QUERIES)"""
+    global _search_executor
+    if _search_executor is None:
+        with _search_executor_lock:
+            if _search_executor is None:
+                _search_executor = ThreadPoolExecutor(
+                    max_workers=max(1, settings.RAG_MAX_PARALLEL_QUERIES),
+                    thread_name_prefix="rag-search"
+                )
+    return _search_executor
 
 
 class Retriever:
@@ -91,6 +118,7 @@ class Retriever:
         self.fetch_k_multiplier = fetch_k_multiplier
         self.multi_query_n = multi_query_n
 
+    @traced("retrieve", kind="retrieval")
     def get_relevant_documents(self, query: str) -> list:
         """
         쿼리와 관련된 문서를 검색합니다.
@@ -147,7 +175,7 @@ class Retriever:
         여러 변형 쿼리로 검색 후 결과를 통합합니다.
 
         1. 원본 + 변형 쿼리 생성
-        2. 각 쿼리로 검색
+        2. 쿼리 임베딩 1회 배치 후 각 쿼리 병렬 검색
         3. 중복 제거 후 통합
         4. Reranking으로 최종 정렬
         """
@@ -157,17 +185,15 @@ class Retriever:
         queries = generate_multi_queries(query, n=self.multi_query_n, use_llm=False)
         print(f"[Retriever] Multi-Query: {queries}")
 
-        # 2. 각 쿼리로 검색
+        # 2. 각 쿼리로 검색 (병렬)
         all_docs = []
         seen_contents = set()
 
-        for q in queries:
-            docs = self._single_query_retrieve(q, k_override=self.k * 2)
+        for docs in self._search_queries(queries, k=self.k * 2):
             for doc in docs:
-                # 중복 제거 (content 기반)
-                content_hash = hash(doc.page_content[:200])
-                if content_hash not in seen_contents:
-                    seen_contents.add(content_hash)
+                # 중복 제거 (전체 content 기준 정확 비교)
+                if doc.page_content not in seen_contents:
+                    seen_contents.add(doc.page_content)
                     all_docs.append(doc)
 
         # 3. Reranking으로 최종 정렬
@@ -177,6 +203,62 @@ class Retriever:
 
         return all_docs
 
+    def _embed_queries(self, queries: List[str]) -> Optional[List[List[float]]]:
+        """
+        변형 쿼리들을 embed_documents 1회 호출로 임베딩합니다.
+        (캐시 래퍼는 embed_queries 로 쿼리 캐시를 거쳐 미스만 요청)
+
+        Returns:
+            쿼리별 벡터 리스트 (벡터 검색을 지원하지 않으면 None)
+        """
+        embeddings = getattr(self.vectorstore, "embeddings", None)
+        if embeddings is None or not hasattr(
+            self.vectorstore, "max_marginal_relevance_search_by_vector"
+        ):
+            return None
+        from rag.embedding_cache import CachedEmbeddings
+
+        embed = embeddings.embed_queries if isinstance(embeddings, CachedEmbeddings) else embeddings.embed_documents
+        try:
+            vectors = embed(queries)
+        except Exception as e:
+            print(f"[Retriever] Batch query embedding 실패: {e}")
+            return None
+        if not isinstance(vectors, list) or len(vectors) != len(queries):
+            return None
+        return vectors
+
+    def _search_queries(self, queries: List[str], k: int) -> List[list]:
+        """
+        여러 쿼리를 공유 인덱스에 대해 병렬로 검색합니다.
+
+        쿼리 임베딩은 1회 배치 요청으로 처리하고, MMR 검색은
+        RAG_MAX_PARALLEL_QUERIES 크기의 공유 스레드 풀에서 실행합니다.
+        결과 순서는 입력 쿼리 순서와 같습니다.
+        """
+        if not queries:
+            return []
+
+        vectors = self._embed_queries(queries)
+
+        def search(i: int) -> list:
+            with span("mmr_search", kind="retrieval", query_index=i):
+                if vectors is None:
+                    return self._single_query_retrieve(queries[i], k_override=k)
+                return self.vectorstore.max_marginal_relevance_search_by_vector(
+                    vectors[i],
+                    k=k,
+                    fetch_k=k * self.fetch_k_multiplier,
+                    lambda_mult=0.6
+                )
+
+        if len(queries) == 1:
+            return [search(0)]
+        # 풀 스레드에서도 retrieve Span 의 자식으로 기록되도록 컨텍스트 복사 후 제출
+        executor = _get_search_executor()
+        futures = [executor.submit(contextvars.copy_context().run, search, i) for i in range(len(queries))]
+        return [f.result() for f in futures]
+
     def _single_query_retrieve(self, query: str, k_override: int = None) -> list:
         """
         단일 쿼리로 검색
@@ -3,9 +3,14 @@ PlanCraft Agent - RAG Citation Validator
 """
 
 import re
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from langchain_core.messages import SystemMessage, HumanMessage
 from utils.llm import get_llm
+from utils.schemas import CitationCheckResult
+
+# 한 번의 LLM 호출로 검증할 최대 인용 수 / 출처별 원문 길이
+MAX_CONTENT_CHECKS = 10
+MAX_PASSAGE_CHARS = 1500
 
 class CitationValidator:
     """
@@ -15,6 +20,7 @@ class CitationValidator:
     1. 형식 검증: [Source N] 형식이 올바른지 확인
     2. 존재 검증: 인용된 Source ID가 실제 Context에 존재하는지 확인
     3. 내용 검증 (LLM): 인용된 문장이 실제 원문 내용을 담고 있는지 확인 (Hallucination Check)
+       - [UPDATE] 인용 문장 전체를 한 번의 구조화 호출로 일괄 검증 (인용 수와 무관하게 LLM 1회)
     """
     
     def __init__(self, model_type: str = "gpt-4o-mini"):
@@ -30,27 +36,33 @@ class CitationValidator:
             check_content: LLM 기반 내용 일치 여부 확인 (비용 발생)
             
         Returns:
-            Dict: 검증 결과 {valid: bool, issues: List[str], score: float}
+            Dict: 검증 결과
+                - valid / issues / score / citation_count
+                - invalid_citations: 존재하지 않는 출처 ID 목록
+                - content_issues: 원문과 일치하지 않는 인용 목록 (LLM 판정)
+                - missing_citations: 컨텍스트가 있는데 인용이 하나도 없는지 여부
         """
         issues = []
         valid_sources = self._extract_valid_source_ids(context)
         citations = self._extract_citations(text)
         
         # 1. 존재 검증
-        invalid_citations = [c for c in citations if c not in valid_sources]
+        invalid_citations = list(dict.fromkeys(c for c in citations if c not in valid_sources))
         if invalid_citations:
             issues.append(f"존재하지 않는 출처 인용: {', '.join(invalid_citations)}")
             
         # 인용이 아예 없으면 경고 (RAG 모드인데 인용이 없는 경우)
-        if not citations and context:
+        missing_citations = not citations and bool(context and context.strip())
+        if missing_citations:
             issues.append("RAG 컨텍스트가 제공되었으나 인용([Source N])이 포함되지 않았습니다.")
 
-        # 2. 내용 검증 (LLM)
+        # 2. 내용 검증 (LLM, 존재하는 출처를 인용한 문장 전체를 1회 호출로 일괄 검증)
         citation_score = 1.0
-        if check_content and citations and not invalid_citations:
-            # 주요 인용구 3개만 샘플링하여 검증 (속도/비용 최적화)
-            sampled_citations = citations[:3]
-            content_issues = self._verify_content_match(text, context, sampled_citations)
+        content_issues: List[str] = []
+        if check_content:
+            claims = self._collect_claims(text, valid_sources)
+            if claims:
+                content_issues = self._verify_content_match(claims, context)
             if content_issues:
                 issues.extend(content_issues)
                 citation_score = 0.7  # 감점
@@ -62,7 +74,10 @@ class CitationValidator:
             "valid": len(issues) == 0,
             "issues": issues,
             "score": round(citation_score, 2),
-            "citation_count": len(citations)
+            "citation_count": len(citations),
+            "invalid_citations": invalid_citations,
+            "content_issues": content_issues,
+            "missing_citations": missing_citations,
         }
 
     def _extract_citations(self, text: str) -> List[str]:
@@ -87,43 +102,78 @@ class CitationValidator:
             
         return list(set(clean_matches))
 
-    def _verify_content_match(self, text: str, context: str, citations: List[str]) -> List[str]:
-        """LLM을 사용하여 인용 내용이 원문과 일치하는지 검증"""
-        # 전체 텍스트를 다 보내면 너무 길므로, 인용구가 포함된 문장을 추출해야 함
-        # 여기서는 단순화를 위해 검증 프롬프트로 처리
-        
+    def _collect_claims(self, text: str, valid_sources: List[str]) -> List[Tuple[str, str]]:
+        """
+        존재하는 출처를 인용한 문장을 (Source ID, 문장) 쌍으로 추출
+
+        같은 쌍은 한 번만, 최대 MAX_CONTENT_CHECKS 개까지 수집합니다.
+        """
+        claims: List[Tuple[str, str]] = []
+        seen = set()
+        for sentence in re.split(r"(?<=[.!?。])\s+|\n+", text):
+            sentence = sentence.strip()
+            for source_id in self._extract_citations(sentence):
+                key = (source_id, sentence)
+                if source_id not in valid_sources or key in seen:
+                    continue
+                seen.add(key)
+                claims.append(key)
+                if len(claims) >= MAX_CONTENT_CHECKS:
+                    return claims
+        return claims
+
+    def _source_passages(self, context: str) -> Dict[str, str]:
+        """Context를 [Source N] 마커 기준으로 나눠 Source ID별 원문으로 변환"""
+        passages: Dict[str, str] = {}
+        markers = list(re.finditer(r"\[(Source\s+\d+)(?:[^\]]*)\]", context))
+        for i, marker in enumerate(markers):
+            end = markers[i + 1].start() if i + 1 < len(markers) else len(context)
+            source_id = " ".join(marker.group(1).split())
+            passages[source_id] = (passages.get(source_id, "") + context[marker.end():end]).strip()
+        return passages
+
+    def _verify_content_match(self, claims: List[Tuple[str, str]], context: str) -> List[str]:
+        """LLM을 사용하여 인용 문장들이 원문과 일치하는지 한 번의 호출로 검증"""
+        passages = self._source_passages(context)
+        cited_sources = list(dict.fromkeys(source_id for source_id, _ in claims))
+
         system_prompt = """당신은 팩트 체크 전문가입니다.
-주어진 '문서 내용'이 '원본 출처'의 내용을 정확하게 인용하고 있는지 검증하세요.
+번호가 붙은 각 '검증 대상 인용'이 해당 '원본 출처'의 내용을 정확하게 인용하고 있는지 검증하세요.
 형식적 일치가 아닌, 의미적 일치를 확인해야 합니다.
 
 검증 기준:
 1. 인용된 주장이 원본 출처에 실제로 존재하는가?
 2. 원본의 의미를 왜곡하지 않았는가?
 
-위반 사항이 있으면 구체적으로 지적하고, 없으면 "문제 없음"이라고 답하세요.
+모든 인용 번호에 대해 supported 여부를 판정하고, 불일치하면 reason에 이유를 1문장으로 적으세요.
 """
+        sources_text = "\n\n".join(
+            f"[{source_id}]\n{passages.get(source_id, '')[:MAX_PASSAGE_CHARS]}" for source_id in cited_sources
+        )
+        claims_text = "\n".join(
+            f"{i}. ({source_id}) {sentence[:300]}" for i, (source_id, sentence) in enumerate(claims, 1)
+        )
         user_prompt = f"""
 ## 원본 출처 (Context)
-{context}
-
-## 검증할 문서 내용 (Excerpt)
-{text[:2000]}... (일부 발췌)
+{sources_text}
 
 ## 검증 대상 인용
-{', '.join(citations)}
-
-위 인용들이 원본 출처에 기반한 사실인지 확인해줘.
+{claims_text}
 """
         try:
-            response = self.llm.invoke([
+            checker = self.llm.with_structured_output(CitationCheckResult)
+            result = checker.invoke([
                 SystemMessage(content=system_prompt),
                 HumanMessage(content=user_prompt)
             ])
-            result = response.content
-            
-            if "문제 없음" in result:
-                return []
-            else:
-                return [f"인용 내용 불일치 가능성: {result[:50]}..."]
         except Exception:
             return []  # 검증 실패 시 패스
+
+        issues = []
+        for check in result.checks:
+            if check.supported or not 1 <= check.index <= len(claims):
+                continue
+            source_id, sentence = claims[check.index - 1]
+            reason = f" - {check.reason}" if check.reason else ""
+            issues.append(f"인용 내용 불일치 가능성 ({source_id}): {sentence[:50]}{reason}")
+        return issues
@@ -8,6 +8,7 @@ FAISS를 사용하여 문서를 벡터화하고 저장/검색하는 기능을 
     - 문서 로딩 및 청크 분할
     - FAISS 벡터스토어 생성
     - 벡터스토어 저장/로드
+    - 프로세스 단위 인덱스 레지스트리 (1회 로드 + 파일 변경 시 Hot Reload)
 
 파일 구조:
     rag/
@@ -17,6 +18,7 @@ FAISS를 사용하여 문서를 벡터화하고 저장/검색하는 기능을 
     │   ├── 체크리스트.md
     │   └── 좋은예시.md
     ├── faiss_index/         # 생성된 벡터 인덱스 (자동 생성)
+    │   └── manifest.json    # 청크 Manifest (문서 경로, 청크 해시, 벡터 ID)
     └── vectorstore.py       # (이 파일)
 
 사용 예시:
@@ -25,12 +27,21 @@ FAISS를 사용하여 문서를 벡터화하고 저장/검색하는 기능을 
     # 초기화 (최초 1회)
     init_vectorstore()
     
-    # 로드 (검색 시)
+    # 로드 (검색 시) - 레지스트리에 캐시된 읽기 전용 핸들 반환
     vs = load_vectorstore()
     results = vs.similarity_search("기획서 작성법", k=3)
 """
 
+import hashlib
+import json
 import os
+import threading
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from langchain_core.documents import Document
 from langchain_community.vectorstores import FAISS
 from langchain_community.document_loaders import DirectoryLoader, TextLoader
 from langchain_text_splitters import RecursiveCharacterTextSplitter
@@ -43,42 +54,35 @@ from utils.llm import get_embeddings
 VECTORSTORE_PATH = os.path.join(os.path.dirname(__file__), "faiss_index")
 # 원본 문서 경로
 DOCS_PATH = os.path.join(os.path.dirname(__file__), "documents")
+# 인덱스를 구성하는 파일 (FAISS.save_local 기본 파일명)
+INDEX_FILES = ("index.faiss", "index.pkl")
 
 
-def init_vectorstore() -> FAISS:
+def _load_and_split_documents(docs_path: str) -> Optional[List[Document]]:
     """
-    문서를 로드하고 FAISS 벡터스토어를 초기화합니다.
-    
-    documents/ 폴더의 마크다운 파일들을 읽어서
-    청크로 분할하고 임베딩하여 FAISS 인덱스를 생성합니다.
-    생성된 인덱스는 faiss_index/ 폴더에 저장됩니다.
-    
+    문서 폴더의 마크다운 파일을 로드하여 청크로 분할합니다.
+
+    Args:
+        docs_path: 원본 문서 폴더 경로
+
     Returns:
-        FAISS: 생성된 벡터스토어 인스턴스
-    
-    Example:
-        >>> vs = init_vectorstore()
-        >>> print("벡터스토어 초기화 완료")
-    
-    Note:
-        - 최초 실행 시 또는 문서 업데이트 시 호출합니다.
-        - Azure OpenAI Embedding API를 호출하므로 API 키가 필요합니다.
+        List[Document]: 분할된 청크 목록 (폴더가 없으면 None)
     """
     # =========================================================================
     # 1. 문서 폴더 확인
     # =========================================================================
-    if not os.path.exists(DOCS_PATH):
-        print(f"[WARN] Document folder not found: {DOCS_PATH}")
+    if not os.path.exists(docs_path):
+        print(f"[WARN] Document folder not found: {docs_path}")
         return None
 
-    print(f"[INFO] Loading documents from: {DOCS_PATH}")
+    print(f"[INFO] Loading documents from: {docs_path}")
     
     # =========================================================================
     # 2. 문서 로딩
     # =========================================================================
     # 마크다운 파일만 로드 (UTF-8 인코딩)
     loader = DirectoryLoader(
-        DOCS_PATH, 
+        docs_path, 
         glob="**/*.md", 
         loader_cls=TextLoader, 
         loader_kwargs={"encoding": "utf-8"}
@@ -127,33 +131,503 @@ def init_vectorstore() -> FAISS:
     # 헤더로 1차 분할된 문서들을 다시 잘게 쪼갭니다.
     docs = text_splitter.split_documents(md_header_splits)
     print(f"    > Final chunks created: {len(docs)}")
+    return docs
+
+
+def init_vectorstore() -> FAISS:
+    """
+    문서를 로드하고 FAISS 벡터스토어를 초기화합니다.
+    
+    documents/ 폴더의 마크다운 파일들을 읽어서
+    청크로 분할하고 임베딩하여 FAISS 인덱스를 생성합니다.
+    생성된 인덱스는 faiss_index/ 폴더에 저장됩니다.
+    
+    Returns:
+        FAISS: 생성된 벡터스토어 인스턴스
+    
+    Example:
+        >>> vs = init_vectorstore()
+        >>> print("벡터스토어 초기화 완료")
+    
+    Note:
+        - 최초 실행 시 또는 임베딩 모델 변경 시 호출합니다.
+        - 문서만 수정된 경우 update_vectorstore()로 변경된 청크만 반영할 수 있습니다.
+        - Azure OpenAI Embedding API를 호출하므로 API 키가 필요합니다.
+    """
+    vectorstore, _ = _sync_index(DOCS_PATH, VECTORSTORE_PATH, full_rebuild=True)
+    if vectorstore is not None:
+        print("[OK] Vectorstore initialization complete!")
+    return vectorstore
+
+
+# =============================================================================
+# [NEW] 증분 인덱스 빌드 (Chunk Manifest)
+# =============================================================================
+# 인덱스 옆에 manifest.json을 저장하여 (문서 경로, 청크 해시, 벡터 ID)를 기록합니다.
+# 재빌드 시 추가/수정된 청크만 임베딩하고, 삭제된 청크의 벡터는 인덱스에서 제거합니다.
+
+MANIFEST_FILE = "manifest.json"
+MANIFEST_VERSION = 1
+
+
+def _chunk_hash(doc: Document) -> str:
+    """청크 내용 + 헤더 메타데이터 기반 SHA-256 해시"""
+    headers = {k: v for k, v in doc.metadata.items() if k.startswith("Header")}
+    payload = json.dumps(
+        {"content": doc.page_content, "headers": headers},
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _relative_source(source: str, docs_path: str) -> str:
+    """문서 경로를 docs_path 기준 상대 경로로 정규화"""
+    if not source:
+        return ""
+    try:
+        rel = os.path.relpath(os.path.abspath(source), os.path.abspath(docs_path))
+    except ValueError:
+        rel = source
+    return rel.replace(os.sep, "/")
+
+
+def _embedding_model_name(embeddings: Any) -> str:
+    """임베딩 모델 식별자 (모델이 바뀌면 전체 재빌드)"""
+    for attr in ("deployment", "model_name", "model"):
+        value = getattr(embeddings, attr, None)
+        if isinstance(value, str) and value:
+            return value
+    return type(embeddings).__name__
+
+
+def load_manifest(index_path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """인덱스 옆에 저장된 청크 Manifest를 로드합니다. (없거나 손상 시 None)"""
+    path = os.path.join(index_path or VECTORSTORE_PATH, MANIFEST_FILE)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("version") != MANIFEST_VERSION:
+        return None
+    return manifest
+
+
+def _save_manifest(index_path: str, manifest: Dict[str, Any]) -> None:
+    """Manifest 저장 (임시 파일 기록 후 교체)"""
+    path = os.path.join(index_path, MANIFEST_FILE)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _manifest_from_docstore(store: FAISS, docs_path: str) -> List[Dict[str, str]]:
+    """
+    Manifest가 없는 기존 인덱스의 docstore에서 Manifest 항목을 복원합니다.
+
+    이전 버전에서 만든 인덱스도 전체 재임베딩 없이 증분 빌드로 전환할 수 있습니다.
+    """
+    entries = []
+    for vector_id in store.index_to_docstore_id.values():
+        doc = store.docstore.search(vector_id)
+        if not isinstance(doc, Document):
+            continue
+        entries.append({
+            "source": _relative_source(doc.metadata.get("source", ""), docs_path),
+            "chunk_hash": _chunk_hash(doc),
+            "vector_id": vector_id,
+        })
+    return entries
+
+
+def _sync_index(
+    docs_path: str,
+    index_path: str,
+    embeddings: Any = None,
+    full_rebuild: bool = False,
+) -> Tuple[Optional[FAISS], Dict[str, Any]]:
+    """
+    문서 폴더와 인덱스를 동기화합니다. (init/update 공통 구현)
+
+    Returns:
+        (vectorstore, stats): 인덱스를 로드/수정하지 않은 경우 vectorstore는 None
+    """
+    stats = {"full_rebuild": full_rebuild, "added": 0, "removed": 0, "unchanged": 0}
+
+    docs = _load_and_split_documents(docs_path)
+    if docs is None:
+        return None, stats
+
+    embeddings = embeddings or get_embeddings()
+    model_name = _embedding_model_name(embeddings)
+
+    desired = [
+        (_relative_source(doc.metadata.get("source", ""), docs_path), _chunk_hash(doc), doc)
+        for doc in docs
+    ]
 
     # =========================================================================
-    # 4. 임베딩 및 벡터스토어 생성
+    # 1. 기존 Manifest 확인 (변경이 없으면 인덱스를 로드하지 않음)
     # =========================================================================
-    print("  - Creating embeddings...")
-    embeddings = get_embeddings()
-    vectorstore = FAISS.from_documents(docs, embeddings)
+    index_exists = all(os.path.exists(os.path.join(index_path, f)) for f in INDEX_FILES)
+    manifest = load_manifest(index_path) if index_exists and not full_rebuild else None
+
+    if manifest is not None and manifest.get("embedding_model") != model_name:
+        print(f"[RAG] Embedding model changed ({manifest.get('embedding_model')} -> {model_name}). Full rebuild.")
+        manifest = None
+        full_rebuild = True
+
+    if manifest is not None:
+        previous = sorted((e["source"], e["chunk_hash"]) for e in manifest.get("chunks", []))
+        if previous == sorted((src, h) for src, h, _ in desired):
+            stats["unchanged"] = len(desired)
+            return None, stats
 
     # =========================================================================
-    # 5. 저장
+    # 2. 기존 인덱스 로드 (수정용 사본 - 레지스트리 공유 핸들과 별개)
     # =========================================================================
-    vectorstore.save_local(VECTORSTORE_PATH)
-    print(f"  - Vectorstore saved: {VECTORSTORE_PATH}")
-    print("[OK] Vectorstore initialization complete!")
-    
-    return vectorstore
+    store = None
+    entries: List[Dict[str, str]] = []
+    if index_exists and not full_rebuild:
+        try:
+            store = FAISS.load_local(index_path, embeddings, allow_dangerous_deserialization=True)
+            entries = manifest["chunks"] if manifest else _manifest_from_docstore(store, docs_path)
+        except Exception as e:
+            print(f"[WARN] Failed to load existing index, rebuilding from scratch: {e}")
+            store = None
+    stats["full_rebuild"] = store is None
+
+    # =========================================================================
+    # 3. Diff 계산: (source, chunk_hash) 기준 매칭
+    # =========================================================================
+    index_ids = set(store.index_to_docstore_id.values()) if store is not None else set()
+    available: Dict[Tuple[str, str], List[str]] = defaultdict(list)
+    for entry in entries:
+        if entry["vector_id"] in index_ids:
+            available[(entry["source"], entry["chunk_hash"])].append(entry["vector_id"])
+
+    manifest_chunks: List[Dict[str, str]] = []
+    kept_ids = set()
+    to_add: List[Tuple[str, str, Document]] = []
+    for source, chunk_hash, doc in desired:
+        candidates = available.get((source, chunk_hash))
+        if candidates:
+            vector_id = candidates.pop()
+            kept_ids.add(vector_id)
+            manifest_chunks.append({"source": source, "chunk_hash": chunk_hash, "vector_id": vector_id})
+        else:
+            to_add.append((source, chunk_hash, doc))
+
+    # Manifest에 없는 고아 벡터까지 함께 정리
+    to_delete = sorted(index_ids - kept_ids)
+
+    # =========================================================================
+    # 4. 인덱스 반영 (삭제 → 추가)
+    # =========================================================================
+    if store is not None and to_delete:
+        store.delete(to_delete)
+
+    if to_add:
+        new_ids = [str(uuid.uuid4()) for _ in to_add]
+        new_docs = [doc for _, _, doc in to_add]
+        print(f"  - Creating embeddings for {len(new_docs)} chunk(s)...")
+        if store is None:
+            store = FAISS.from_documents(new_docs, embeddings, ids=new_ids)
+        else:
+            store.add_documents(new_docs, ids=new_ids)
+        for (source, chunk_hash, _), vector_id in zip(to_add, new_ids):
+            manifest_chunks.append({"source": source, "chunk_hash": chunk_hash, "vector_id": vector_id})
+
+    if store is None:
+        print("[WARN] No documents to index.")
+        return None, stats
 
+    stats.update(added=len(to_add), removed=len(to_delete), unchanged=len(kept_ids))
 
-def load_vectorstore() -> FAISS:
+    # =========================================================================
+    # 5. 저장 (인덱스 → Manifest 순서, 레지스트리는 파일 변경을 감지하여 Hot Reload)
+    # =========================================================================
+    store.save_local(index_path)
+    _save_manifest(index_path, {
+        "version": MANIFEST_VERSION,
+        "embedding_model": model_name,
+        "updated_at": time.time(),
+        "chunks": manifest_chunks,
+    })
+    print(f"  - Vectorstore saved: {index_path}")
+    return store, stats
+
+
+def update_vectorstore(
+    docs_path: Optional[str] = None,
+    index_path: Optional[str] = None,
+    embeddings: Any = None,
+) -> Dict[str, Any]:
+    """
+    변경된 문서만 반영하여 인덱스를 증분 갱신합니다.
+
+    Manifest와 현재 청크 해시를 비교하여 추가/수정된 청크만 임베딩하고,
+    삭제된 청크의 벡터는 인덱스에서 제거합니다.
+    Manifest가 없는 기존 인덱스는 docstore에서 Manifest를 복원합니다.
+
+    Args:
+        docs_path: 원본 문서 폴더 (기본값: DOCS_PATH)
+        index_path: 인덱스 폴더 (기본값: VECTORSTORE_PATH)
+        embeddings: 임베딩 모델 (기본값: get_embeddings())
+
+    Returns:
+        Dict: {"full_rebuild", "added", "removed", "unchanged"}
+
+    Example:
+        >>> stats = update_vectorstore()
+        >>> print(stats["added"], stats["removed"])
+    """
+    _, stats = _sync_index(
+        docs_path or DOCS_PATH,
+        index_path or VECTORSTORE_PATH,
+        embeddings=embeddings,
+    )
+    return stats
+
+
+# =============================================================================
+# [NEW] 프로세스 단위 벡터스토어 레지스트리
+# =============================================================================
+# Retriever는 노드/툴 호출마다 새로 생성되므로, 매번 FAISS.load_local()을 호출하면
+# 인덱스 역직렬화 비용과 메모리가 요청 수만큼 늘어납니다.
+# 레지스트리는 경로별로 인덱스를 1회만 로드하고 읽기 전용 핸들을 공유합니다.
+
+# 공유 핸들에서 호출을 막는 변경(mutation) 메서드
+_MUTATING_METHODS = frozenset([
+    "add_texts", "aadd_texts", "add_documents", "aadd_documents",
+    "add_embeddings", "delete", "adelete", "merge_from", "save_local",
+])
+
+
+class ReadOnlyVectorStore:
+    """
+    여러 Retriever가 공유하는 읽기 전용 벡터스토어 핸들
+
+    검색 관련 속성/메서드는 원본 FAISS 인스턴스로 위임하고,
+    인덱스를 변경하는 메서드는 PermissionError를 발생시킵니다.
+    인덱스 갱신은 디스크에 저장한 뒤 레지스트리의 Hot Reload로 반영합니다.
+    """
+
+    __slots__ = ("_store",)
+
+    def __init__(self, store: FAISS):
+        object.__setattr__(self, "_store", store)
+
+    def __getattr__(self, name: str) -> Any:
+        if name in _MUTATING_METHODS:
+            raise PermissionError(
+                f"Shared vectorstore handle is read-only: '{name}' is not allowed"
+            )
+        return getattr(self._store, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise PermissionError("Shared vectorstore handle is read-only")
+
+    def __repr__(self) -> str:
+        return f"ReadOnlyVectorStore({self._store!r})"
+
+
+@dataclass
+class _RegistryEntry:
+    """레지스트리에 등록된 인덱스 1개"""
+    handle: ReadOnlyVectorStore
+    signature: Tuple
+    loaded_at: float
+    resident_bytes: int
+    vector_count: int
+    dimension: int
+
+
+def _index_signature(path: str) -> Tuple:
+    """
+    인덱스 파일의 (이름, mtime_ns, size) 시그니처를 반환합니다.
+
+    stat 호출만 사용하므로 매 조회마다 호출해도 비용이 거의 없습니다.
+
+    Raises:
+        FileNotFoundError: 인덱스 파일이 없는 경우
+    """
+    signature = []
+    for name in INDEX_FILES:
+        st = os.stat(os.path.join(path, name))
+        signature.append((name, st.st_mtime_ns, st.st_size))
+    return tuple(signature)
+
+
+def _estimate_resident_bytes(store: FAISS, path: str) -> Tuple[int, int, int]:
+    """
+    로드된 인덱스의 상주 메모리를 추정합니다.
+
+    벡터 데이터(ntotal * d * float32)에 docstore 직렬화 크기(index.pkl)를 더합니다.
+
+    Returns:
+        (resident_bytes, vector_count, dimension)
+    """
+    index = getattr(store, "index", None)
+    ntotal = int(getattr(index, "ntotal", 0) or 0)
+    dimension = int(getattr(index, "d", 0) or 0)
+    try:
+        docstore_bytes = os.path.getsize(os.path.join(path, "index.pkl"))
+    except OSError:
+        docstore_bytes = 0
+    return ntotal * dimension * 4 + docstore_bytes, ntotal, dimension
+
+
+def _load_faiss_index(path: str) -> FAISS:
+    """디스크에서 FAISS 인덱스를 로드합니다. (레지스트리 기본 로더)"""
+    # allow_dangerous_deserialization: pickle 역직렬화 허용 (신뢰된 데이터만)
+    return FAISS.load_local(
+        path,
+        get_embeddings(),
+        allow_dangerous_deserialization=True
+    )
+
+
+class VectorStoreRegistry:
+    """
+    프로세스 단위 FAISS 인덱스 레지스트리 (Thread-safe)
+
+    - 경로별로 인덱스를 1회만 로드하고 읽기 전용 핸들을 공유합니다.
+    - 조회 시 인덱스 파일 시그니처(mtime/size)를 비교하여 변경되면 다시 로드합니다.
+    - 새 인덱스는 로드가 끝난 뒤 원자적으로 교체되므로, 기존 핸들을 쥐고 있는
+      요청은 중단 없이 이전 인덱스로 검색을 마칩니다.
+    - 재로드가 실패하면 (저장 도중 등) 기존 인덱스를 계속 사용합니다.
+
+    Example:
+        >>> registry = get_vectorstore_registry()
+        >>> vs = registry.get(VECTORSTORE_PATH)
+        >>> registry.stats()["load_count"]
+        1
+    """
+
+    def __init__(self, loader: Optional[Callable[[str], FAISS]] = None):
+        self._loader = loader or _load_faiss_index
+        self._entries: Dict[str, _RegistryEntry] = {}
+        self._lock = threading.Lock()
+        self._load_count = 0
+        self._reload_count = 0
+        self._reload_failures = 0
+
+    def get(self, path: str = VECTORSTORE_PATH) -> ReadOnlyVectorStore:
+        """
+        경로의 인덱스 핸들을 반환합니다. (필요 시 로드/재로드)
+
+        Raises:
+            FileNotFoundError: 인덱스 파일이 없고 캐시된 인덱스도 없는 경우
+        """
+        key = os.path.abspath(path)
+        entry = self._entries.get(key)
+
+        try:
+            signature = _index_signature(key)
+        except FileNotFoundError:
+            # 저장 도중 파일이 잠시 사라진 경우 기존 인덱스 유지
+            if entry is not None:
+                return entry.handle
+            raise
+
+        # Fast path: 변경 없음 (Lock 없이 조회)
+        if entry is not None and entry.signature == signature:
+            return entry.handle
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.signature == signature:
+                return entry.handle
+
+            try:
+                store = self._loader(key)
+            except Exception as e:
+                if entry is None:
+                    raise
+                self._reload_failures += 1
+                print(f"[WARN] Vectorstore reload failed, keeping previous index: {e}")
+                return entry.handle
+
+            resident_bytes, vector_count, dimension = _estimate_resident_bytes(store, key)
+            new_entry = _RegistryEntry(
+                handle=ReadOnlyVectorStore(store),
+                signature=signature,
+                loaded_at=time.time(),
+                resident_bytes=resident_bytes,
+                vector_count=vector_count,
+                dimension=dimension,
+            )
+            # 원자적 교체 (dict 할당)
+            self._entries[key] = new_entry
+            self._load_count += 1
+            if entry is not None:
+                self._reload_count += 1
+                print(f"[RAG] Vectorstore hot-reloaded: {key}")
+            return new_entry.handle
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """캐시된 인덱스를 제거합니다. (path=None이면 전체)"""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(os.path.abspath(path), None)
+
+    def stats(self) -> Dict[str, Any]:
+        """로드 횟수와 상주 메모리 통계를 반환합니다."""
+        entries = dict(self._entries)
+        return {
+            "load_count": self._load_count,
+            "reload_count": self._reload_count,
+            "reload_failures": self._reload_failures,
+            "resident_bytes": sum(e.resident_bytes for e in entries.values()),
+            "indexes": {
+                path: {
+                    "loaded_at": e.loaded_at,
+                    "resident_bytes": e.resident_bytes,
+                    "vector_count": e.vector_count,
+                    "dimension": e.dimension,
+                }
+                for path, e in entries.items()
+            },
+        }
+
+
+_registry: Optional[VectorStoreRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_vectorstore_registry() -> VectorStoreRegistry:
+    """전역 벡터스토어 레지스트리 반환 (싱글톤)"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = VectorStoreRegistry()
+    return _registry
+
+
+def get_vectorstore_stats() -> Dict[str, Any]:
+    """벡터스토어 레지스트리 통계 반환"""
+    return get_vectorstore_registry().stats()
+
+
+def load_vectorstore() -> ReadOnlyVectorStore:
     """
     저장된 FAISS 벡터스토어를 로드합니다.
     
     faiss_index/ 폴더에서 저장된 인덱스를 불러옵니다.
     인덱스가 없으면 자동으로 init_vectorstore()를 호출합니다.
+
+    [NEW] 프로세스 레지스트리를 통해 인덱스는 1회만 로드되며,
+    이후 호출은 공유된 읽기 전용 핸들을 반환합니다.
+    인덱스 파일이 변경되면 다음 호출 시 자동으로 다시 로드됩니다.
     
     Returns:
-        FAISS: 로드된 벡터스토어 인스턴스 (또는 None)
+        ReadOnlyVectorStore: 공유 벡터스토어 핸들 (또는 None)
     
     Example:
         >>> vs = load_vectorstore()
@@ -164,43 +638,57 @@ def load_vectorstore() -> FAISS:
     # =========================================================================
     # 1. 저장된 인덱스 확인
     # =========================================================================
+    registry = get_vectorstore_registry()
     if not os.path.exists(VECTORSTORE_PATH):
         print("[WARN] Vectorstore not found. Initializing...")
-        return init_vectorstore()
+        if init_vectorstore() is None:
+            return None
+        return registry.get(VECTORSTORE_PATH)
     
     # =========================================================================
-    # 2. 인덱스 로드
+    # 2. 인덱스 로드 (레지스트리 캐시)
     # =========================================================================
-    embeddings = get_embeddings()
     try:
-        # allow_dangerous_deserialization: pickle 역직렬화 허용 (신뢰된 데이터만)
-        return FAISS.load_local(
-            VECTORSTORE_PATH, 
-            embeddings, 
-            allow_dangerous_deserialization=True
-        )
+        return registry.get(VECTORSTORE_PATH)
     except Exception as e:
         print(f"[WARN] Failed to load vectorstore: {e}")
         print("  -> Reinitializing...")
-        return init_vectorstore()
+        if init_vectorstore() is None:
+            return None
+        return registry.get(VECTORSTORE_PATH)
 
 
 
 
 def rebuild_index_if_needed():
     """
-    필요한 경우에만 인덱스를 재빌드합니다. (파일 없음 또는 로드 실패 시)
+    필요한 경우에만 인덱스를 재빌드합니다. (파일 없음, 로드 실패, 문서 변경 시)
     백그라운드 초기화 용도.
+
+    [NEW] 문서가 변경된 경우 Manifest 기반으로 변경된 청크만 다시 임베딩합니다.
     """
     if not os.path.exists(VECTORSTORE_PATH):
         print("[RAG] Index not found. Building new index...")
         init_vectorstore()
         return
 
-    # 파일은 있는데 로드가 안 되는 경우 체크
     try:
-        embeddings = get_embeddings()
-        FAISS.load_local(VECTORSTORE_PATH, embeddings, allow_dangerous_deserialization=True)
+        stats = update_vectorstore()
+    except Exception as e:
+        print(f"[RAG] Incremental update failed ({e}). Rebuilding...")
+        init_vectorstore()
+        return
+
+    if stats["added"] or stats["removed"]:
+        print(
+            f"[RAG] Index updated: +{stats['added']} / -{stats['removed']} chunks "
+            f"(unchanged {stats['unchanged']}, full_rebuild={stats['full_rebuild']})"
+        )
+        return
+
+    # 파일은 있는데 로드가 안 되는 경우 체크 (성공 시 레지스트리에 적재됨)
+    try:
+        get_vectorstore_registry().get(VECTORSTORE_PATH)
         print("[RAG] Existing index is valid.")
     except Exception:
         print("[RAG] Index corrupted or mismatch. Rebuilding...")
@@ -215,11 +703,17 @@ if __name__ == "__main__":
     직접 실행 시 벡터스토어를 초기화합니다.
     
     사용법:
-        python -m rag.vectorstore
+        python -m rag.vectorstore            # 변경된 문서만 증분 반영
+        python -m rag.vectorstore --rebuild  # 전체 재빌드
         또는
         python rag/vectorstore.py
     """
+    import sys
+
     print("=" * 50)
     print("PlanCraft RAG 벡터스토어 초기화")
     print("=" * 50)
-    init_vectorstore()
+    if "--rebuild" in sys.argv or not os.path.exists(VECTORSTORE_PATH):
+        init_vectorstore()
+    else:
+        print(update_vectorstore())
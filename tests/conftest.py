@@ -41,6 +41,71 @@ def clear_lru_cache():
         pass
 
 
+@pytest.fixture(autouse=True)
+def isolate_rerank_score_cache(monkeypatch):
+    """
+    Reranker 점수 캐시를 테스트마다 메모리 DB로 격리.
+
+    디스크 캐시가 테스트 간에 공유되면 model.predict 호출 여부가 달라짐.
+    """
+    try:
+        import rag.reranker as reranker
+    except ImportError:
+        yield
+        return
+    monkeypatch.setattr(reranker, "_score_cache", reranker.RerankScoreCache(":memory:"))
+    yield
+
+
+@pytest.fixture(autouse=True)
+def isolate_llm_cache(monkeypatch):
+    """
+    LLM 응답 캐시를 테스트마다 메모리 DB로 격리.
+
+    디스크 캐시가 남아 있으면 모의 LLM 호출 여부가 테스트 순서에 따라 달라짐.
+    """
+    import utils.llm_cache as llm_cache
+    monkeypatch.setattr(llm_cache, "_llm_cache_store", llm_cache.LLMCacheStore(":memory:"))
+    monkeypatch.setattr(llm_cache, "_llm_cache_views", {})
+    yield
+
+
+@pytest.fixture(autouse=True)
+def isolate_search_cache(monkeypatch):
+    """
+    웹 검색 캐시를 테스트마다 메모리 전용 인스턴스로 격리.
+
+    전역 캐시가 ./data/search_cache.db 에 기록되면 이후 실행 결과가 이전 실행과 순서에 의존함.
+    """
+    import tools.search_cache as search_cache
+    monkeypatch.setattr(search_cache, "_search_cache", search_cache.SearchCache(db_path=None))
+    yield
+
+
+@pytest.fixture(autouse=True)
+def isolate_embedding_cache(monkeypatch):
+    """임베딩 벡터 캐시를 테스트마다 메모리 DB로 격리."""
+    import rag.embedding_cache as embedding_cache
+    monkeypatch.setattr(embedding_cache, "_embedding_cache", embedding_cache.EmbeddingCacheStore(":memory:"))
+    yield
+
+
+@pytest.fixture(autouse=True)
+def isolate_budget_store(monkeypatch):
+    """인터럽트 예산 저장소를 테스트마다 메모리 DB로 격리."""
+    import utils.budget_store as budget_store
+    monkeypatch.setattr(budget_store, "_budget_store", budget_store.InterruptedBudgetStore(":memory:"))
+    yield
+
+
+@pytest.fixture(autouse=True)
+def isolate_tracer(monkeypatch):
+    """Span 수집기를 테스트마다 새로 생성 (logs/traces/traces.jsonl 내보내기 비활성화)."""
+    import utils.tracing as tracing
+    monkeypatch.setattr(tracing, "_tracer", tracing.Tracer(export_path=None))
+    yield
+
+
 @pytest.fixture
 def mock_llm():
     """
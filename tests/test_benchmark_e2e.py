@@ -0,0 +1,110 @@
+"""
+오프라인 E2E 벤치마크 하네스 테스트
+
+benchmarks.e2e / benchmarks.fakes 가 네트워크 없이 전체 그래프를 끝까지 실행하고
+머신 판독 가능한 지표를 남기는지 검증합니다.
+- 가짜 Structured Output 이 워크플로우 스키마를 모두 만족
+- fast 프리셋 1회 실행: 완료, 노드별 지연, 체크포인트 바이트, 호출 수
+- 환경 종료 후 패치 원복
+
+실행:
+    pytest tests/test_benchmark_e2e.py -v
+"""
+
+import json
+
+import pytest
+
+from benchmarks.fakes import (
+    FakeCallStats,
+    FakeChatModel,
+    FakeEmbeddings,
+    build_structured_response,
+)
+
+
+class TestFakes:
+    """가짜 의존성"""
+
+    @pytest.mark.parametrize("schema_path", [
+        "utils.schemas.AnalysisResult",
+        "utils.schemas.StructureResult",
+        "utils.schemas.DraftResult",
+        "utils.schemas.JudgeResult",
+        "utils.schemas.RefinementStrategy",
+        "utils.schemas.ConsensusResult",
+        "agents.supervisor_types.RoutingDecision",
+    ])
+    def test_structured_response_validates(self, schema_path):
+        import importlib
+
+        module_name, cls_name = schema_path.rsplit(".", 1)
+        schema = getattr(importlib.import_module(module_name), cls_name)
+
+        assert isinstance(build_structured_response(schema), schema)
+
+    def test_structured_overrides(self):
+        from utils.schemas import JudgeResult
+
+        llm = FakeChatModel(structured_overrides={"JudgeResult": {"overall_score": 4, "verdict": "FAIL"}})
+        result = llm.with_structured_output(JudgeResult).invoke("심사해줘")
+
+        assert result.overall_score == 4
+        assert result.verdict == "FAIL"
+
+    def test_text_rules_and_stats(self):
+        stats = FakeCallStats()
+        llm = FakeChatModel(stats=stats, text_rules=[(r"요약", "요약 결과")])
+
+        assert llm.invoke("입력: \"안녕\"\n분류:").content == "planning"
+        assert llm.invoke("요약해줘").content == "요약 결과"
+        queries = json.loads(llm.invoke([{"role": "system", "content": "웹 검색 설계자"}]).content)
+        assert len(queries) == 3
+        assert stats.to_dict()["llm_calls"] == 3
+
+    def test_embeddings_deterministic(self):
+        emb = FakeEmbeddings(size=16)
+
+        assert emb.embed_query("기획서") == emb.embed_query("기획서")
+        assert emb.embed_query("기획서") != emb.embed_query("체크리스트")
+        assert len(emb.embed_documents(["a", "b"])[1]) == 16
+
+
+class TestOfflineRun:
+    """전체 그래프 오프라인 실행"""
+
+    def test_fast_preset_end_to_end(self):
+        from benchmarks.e2e import run
+
+        results = run(presets=("fast",))
+        json.dumps(results)  # 머신 판독 가능 (JSON 직렬화)
+
+        r = results["runs"][0]
+        assert r["completed"] is True
+        assert r["error"] is None
+        assert {"analyze", "write", "review", "format"} <= set(r["nodes"])
+        assert all(n["calls"] >= 1 and n["total_ms"] >= 0 for n in r["nodes"].values())
+        assert r["checkpoint"]["count"] > 0
+        assert r["checkpoint"]["bytes"] > 0
+        assert r["fake_calls"]["llm_calls"] > 0
+        assert r["peak_rss_kb"] > 0
+
+    def test_patches_restored(self, tmp_path):
+        import graph.workflow as workflow
+        import utils.llm as llm_module
+        from benchmarks.e2e import offline_environment
+
+        original_app = workflow.app
+        original_chat = llm_module.AzureChatOpenAI
+
+        import utils.llm_cache as llm_cache
+
+        original_store = llm_cache._llm_cache_store
+        with offline_environment(str(tmp_path)):
+            assert workflow.app is not original_app
+            assert isinstance(llm_module.get_llm(temperature=0.1), FakeChatModel)
+            assert llm_cache.get_llm_cache_store() is not original_store  # 디스크 캐시 미사용
+
+        assert workflow.app is original_app
+        assert llm_cache._llm_cache_store is original_store
+        assert llm_module.AzureChatOpenAI is original_chat
@@ -0,0 +1,360 @@
+"""
+실행 예산 (Token / Cost Budget) 테스트
+
+utils/budget.py 와 워크플로우 연동을 검증합니다.
+- 단가표: 버전 / 모델 접두사 매칭 / 캐시 입력 단가 / 로드 실패 시 내장 단가
+- 사용량 누적 (여러 스레드) 및 soft / exceeded 단계 판정
+- 축소 결정 기록 (기능별 1회) 및 Resume 복원
+- 인터럽트 예산 저장소: 재시작 후 Resume 에서 복원 / 버려진 스레드 만료
+- LangChain 콜백: 실제 호출 / 응답 캐시 히트 구분
+- 오프라인 전체 실행: 예산 초과 시 토론 생략 + 개선 루프 중단이 최종 상태에 기록
+
+실행:
+    pytest tests/test_budget.py -v
+"""
+
+import contextvars
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from benchmarks.fakes import FakeChatModel
+from utils.budget import (
+    EXCEEDED,
+    OK,
+    SOFT,
+    BudgetCallbackHandler,
+    BudgetController,
+    PricingTable,
+    RunBudget,
+    budget_allows,
+    budget_cap,
+    budget_scope,
+    load_pricing_table,
+)
+
+PRICING = PricingTable.from_dict({
+    "version": "test-1",
+    "default_model": "gpt-4o",
+    "currency_rates": {"KRW": 1000},
+    "models": {
+        "gpt-4o": {"input_per_1m": 2.0, "cached_input_per_1m": 1.0, "output_per_1m": 10.0},
+        "gpt-4o-mini": {"input_per_1m": 0.2, "output_per_1m": 1.0},
+    },
+})
+
+
+def _controller(**limits) -> BudgetController:
+    return BudgetController(RunBudget(**limits), pricing=PRICING)
+
+
+class TestPricingTable:
+    """단가표"""
+
+    def test_model_lookup(self):
+        assert PRICING.price_for("gpt-4o-mini-2024-07-18").input_per_1m == 0.2  # 가장 긴 접두사
+        assert PRICING.price_for("GPT-4o-2024-08-06").input_per_1m == 2.0
+        assert PRICING.price_for("unknown").input_per_1m == 2.0  # default_model
+        assert PRICING.price_for(None).input_per_1m == 2.0
+
+    def test_cost_with_cached_input(self):
+        assert PRICING.cost("gpt-4o", 1_000_000, 100_000) == pytest.approx(3.0)
+        assert PRICING.cost("gpt-4o", 1_000_000, 0, cached_input_tokens=500_000) == pytest.approx(1.5)
+        assert PRICING.cost("gpt-4o-mini", 1_000_000, 0, cached_input_tokens=500_000) == pytest.approx(0.2)
+        assert PRICING.convert(0.5, "KRW") == 500
+
+    def test_load_from_yaml(self, tmp_path):
+        path = tmp_path / "pricing.yaml"
+        path.write_text(
+            'version: "2030-01"\ndefault_model: m\nmodels:\n  m: {input_per_1m: 1, output_per_1m: 2}\n',
+            encoding="utf-8",
+        )
+
+        table = load_pricing_table(str(path))
+
+        assert table.version == "2030-01"
+        assert table.cost("m", 1_000_000, 1_000_000) == pytest.approx(3.0)
+
+    def test_invalid_file_falls_back_to_builtin(self, tmp_path):
+        path = tmp_path / "pricing.yaml"
+        path.write_text("default_model: missing\nmodels: {}\n", encoding="utf-8")
+
+        assert load_pricing_table(str(path)).version == "builtin"
+
+    def test_repo_pricing_table(self):
+        table = load_pricing_table()
+
+        assert table.version != "builtin"
+        assert table.price_for("gpt-4o-mini").output_per_1m < table.price_for("gpt-4o").output_per_1m
+
+
+class TestBudgetController:
+    """사용량 누적 / 단계 / 축소 결정"""
+
+    def test_levels(self):
+        controller = _controller(max_tokens=1000)
+        assert controller.level == OK
+
+        controller.record("gpt-4o", 700, 100)
+        assert controller.level == SOFT
+
+        controller.record("gpt-4o", 200, 0)
+        assert controller.level == EXCEEDED
+
+    def test_cost_limit(self):
+        controller = _controller(max_cost_usd=0.01)
+        controller.record("gpt-4o-mini", 10_000, 1_000)  # $0.003
+        assert controller.level == OK
+
+        controller.record("gpt-4o", 1_000, 1_000)  # $0.012
+        assert controller.level == EXCEEDED
+        assert set(controller.summary()["spent"]["by_model"]) == {"gpt-4o-mini", "gpt-4o"}
+
+    def test_unlimited_budget_never_degrades(self):
+        controller = _controller(max_tokens=0, max_cost_usd=None)
+        controller.record("gpt-4o", 10**9, 10**9)
+
+        assert not controller.budget.enabled
+        assert controller.allows("discussion")
+        assert controller.cap("max_refine_loops", 3) == 3
+
+    def test_decisions_recorded_once_per_level(self):
+        controller = _controller(max_tokens=100)
+        controller.record("gpt-4o", 85, 0)
+
+        assert controller.allows("discussion", node="review") is False
+        assert controller.allows("discussion", node="review") is False
+        assert controller.cap("max_refine_loops", 3, node="refine") == 1
+        assert controller.cap("max_refine_loops", 1, node="refine") == 1
+
+        controller.record("gpt-4o", 50, 0)
+        assert controller.cap("max_refine_loops", 3, node="refine") == 0
+
+        decisions = [(d["feature"], d["level"]) for d in controller.decisions]
+        assert decisions == [("discussion", SOFT), ("max_refine_loops", SOFT), ("max_refine_loops", EXCEEDED)]
+        assert controller.decisions[1]["original"] == 3 and controller.decisions[1]["value"] == 1
+
+    def test_concurrent_record(self):
+        controller = _controller(max_tokens=10**9)
+
+        def worker():
+            for _ in range(500):
+                controller.record("gpt-4o", 3, 2)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert controller.total_tokens == 8 * 500 * 5
+        assert controller.llm_calls == 4000
+
+    def test_summary_round_trip(self):
+        controller = _controller(max_tokens=100)
+        controller.record("gpt-4o", 90, 0)
+        controller.allows("discussion", node="review")
+        summary = json.loads(json.dumps(controller.summary()))
+
+        restored = BudgetController.from_summary(summary)
+
+        assert restored.total_tokens == 90
+        assert restored.budget.max_tokens == 100
+        assert restored.level == SOFT
+        assert restored.allows("discussion") is False
+        assert len(restored.decisions) == 1  # 같은 단계 결정은 다시 기록하지 않음
+
+    def test_from_settings_overrides(self):
+        with patch("utils.settings.settings.BUDGET_MAX_TOKENS_PER_RUN", 5000):
+            budget = RunBudget.from_settings({"max_cost_usd": 0.5, "max_tokens": None})
+
+        assert budget.max_tokens == 5000
+        assert budget.max_cost_usd == 0.5
+
+
+class TestBudgetContext:
+    """컨텍스트 / 콜백"""
+
+    def test_helpers_without_budget(self):
+        assert budget_allows("discussion") is True
+        assert budget_cap("max_refine_loops", 3) == 3
+
+    def test_scope_propagates_to_threads(self):
+        controller = _controller(max_tokens=10)
+        controller.record("gpt-4o", 10, 0)
+
+        with budget_scope(controller):
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                future = executor.submit(contextvars.copy_context().run, budget_allows, "reranker", "context")
+                assert future.result() is False
+
+        assert budget_allows("reranker") is True
+        assert controller.decisions[0]["node"] == "context"
+
+    def test_callback_records_usage_by_model(self):
+        controller = _controller(max_tokens=10**6)
+        handler = BudgetCallbackHandler(controller)
+
+        FakeChatModel(deployment="gpt-4o-mini").invoke("기획서 요약", config={"callbacks": [handler]})
+        FakeChatModel(deployment="gpt-4o").invoke("기획서 요약", config={"callbacks": [handler]})
+
+        by_model = controller.summary()["spent"]["by_model"]
+        assert set(by_model) == {"gpt-4o-mini", "gpt-4o"}
+        assert by_model["gpt-4o-mini"]["cost_usd"] < by_model["gpt-4o"]["cost_usd"]
+        assert controller.llm_calls == 2
+
+    def test_cache_hit_counts_as_saved(self):
+        from utils.llm_cache import LLMCacheStore, LLMResponseCache
+
+        controller = _controller(max_tokens=10**6)
+        handler = BudgetCallbackHandler(controller)
+        model = FakeChatModel(cache=LLMResponseCache(LLMCacheStore()))
+
+        model.invoke("검색 쿼리 생성", config={"callbacks": [handler]})
+        spent = controller.total_tokens
+        model.invoke("검색 쿼리 생성", config={"callbacks": [handler]})
+
+        assert controller.total_tokens == spent
+        assert controller.saved_tokens == spent
+
+    def test_token_tracking_uses_pricing_table(self):
+        from utils.streamlit_callback import TokenTrackingCallback
+
+        mini, full = TokenTrackingCallback(), TokenTrackingCallback()
+        FakeChatModel(deployment="gpt-4o-mini").invoke("x" * 4000, config={"callbacks": [mini]})
+        FakeChatModel(deployment="gpt-4o").invoke("x" * 4000, config={"callbacks": [full]})
+
+        assert 0 < mini.get_usage_summary()["estimated_cost_usd"] < full.get_usage_summary()["estimated_cost_usd"]
+        assert full.get_usage_summary()["pricing_version"]
+
+
+class TestWorkflowBudget:
+    """워크플로우 연동"""
+
+    def test_resume_restores_budget_from_checkpoint(self):
+        from types import SimpleNamespace
+
+        from graph.workflow import _create_budget_controller
+
+        previous = _controller(max_tokens=100)
+        previous.record("gpt-4o", 90, 0)
+        app = SimpleNamespace(get_state=lambda config: SimpleNamespace(values={"budget": previous.summary()}))
+
+        with patch("graph.workflow.get_app", return_value=app):
+            resumed = _create_budget_controller({}, resume=True)
+            fresh = _create_budget_controller({}, budget={"max_tokens": 100})
+
+        assert resumed.total_tokens == 90 and resumed.level == SOFT
+        assert fresh.total_tokens == 0 and fresh.budget.max_tokens == 100
+
+    def test_interrupt_keeps_checkpoint_waiting_and_resume_continues_budget(self, tmp_path):
+        import benchmarks.fakes as fakes
+        from benchmarks.e2e import _resume_value, offline_environment
+        from graph.workflow import get_app, run_plancraft
+        from utils.budget_store import get_budget_store
+
+        original = fakes.build_structured_response
+        asked = []
+
+        def ask_once(schema, overrides=None):
+            if schema.__name__ == "AnalysisResult" and not asked:
+                asked.append(1)
+                overrides = {"AnalysisResult": {"missing_slots": ["target", "output_type"]}, **(overrides or {})}
+            return original(schema, overrides)
+
+        config = {"configurable": {"thread_id": "budget-hitl"}}
+        with offline_environment(str(tmp_path)) as env, \
+                patch("benchmarks.fakes.build_structured_response", ask_once):
+            paused = run_plancraft(user_input="반려동물 앱", thread_id="budget-hitl", generation_preset="fast")
+            snapshot = get_app().get_state(config)
+            stored = get_budget_store().pop("budget-hitl")
+
+            before_pause = _controller(max_tokens=10_000)
+            before_pause.record("gpt-4o", 700, 0)
+            get_budget_store().put("budget-hitl", before_pause.summary())
+            resumed = run_plancraft(user_input="", thread_id="budget-hitl", generation_preset="fast",
+                                    resume_command={"resume": _resume_value(paused["__interrupt__"])})
+            final = get_app().get_state(config).values["budget"]
+
+        assert snapshot.next and any(task.interrupts for task in snapshot.tasks)  # 입력 대기 유지
+        assert "budget" not in (snapshot.values or {})
+        assert stored == paused["budget"]
+        assert resumed["final_output"]
+        assert resumed["budget"]["spent"]["input_tokens"] >= 700 and final == resumed["budget"]
+        assert get_budget_store().pop("budget-hitl") is None
+
+    def test_interrupted_budget_survives_restart(self, tmp_path):
+        """인터럽트 예산은 체크포인트 DB 에 보관 → 새 프로세스(새 연결)의 Resume 이 이어서 집계"""
+        from utils.budget_store import InterruptedBudgetStore
+
+        paused = _controller(max_tokens=100)
+        paused.record("gpt-4o", 90, 0)
+        db_path = str(tmp_path / "checkpoints.db")
+        InterruptedBudgetStore(db_path).put("t1", paused.summary())
+
+        restarted = InterruptedBudgetStore(db_path)
+        resumed = BudgetController.from_summary(restarted.pop("t1"))
+
+        assert resumed.total_tokens == 90 and resumed.level == SOFT
+        assert restarted.pop("t1") is None  # Resume 1회만 이어받음
+
+    def test_interrupted_budget_store_expires_abandoned_threads(self):
+        from utils.budget_store import InterruptedBudgetStore
+
+        now = [1000.0]
+        store = InterruptedBudgetStore(":memory:", ttl_sec=60, clock=lambda: now[0])
+        store.put("abandoned", {"spent": {}})
+        now[0] += 120
+        store.put("active", {"spent": {}})
+
+        assert store.pop("abandoned") is None
+        assert store.pop("active") == {"spent": {}}
+
+    def test_run_request_passes_budget_to_job(self):
+        from fastapi.testclient import TestClient
+
+        from api.main import app
+
+        submitted = {}
+
+        class _Queue:
+            def submit(self, thread_id, kind, payload, exclusive=False):
+                submitted.update(payload)
+                return SimpleJob()
+
+        class SimpleJob:
+            id = "job-1"
+
+        with patch("api.routers.workflow.get_job_queue", return_value=_Queue()):
+            response = TestClient(app).post("/api/v1/workflow/run", json={
+                "user_input": "기획서", "thread_id": "t1", "budget": {"max_cost_usd": 0.2},
+            })
+
+        assert response.status_code == 200
+        assert submitted["budget"] == {"max_tokens": None, "max_cost_usd": 0.2}
+
+    def test_offline_run_degrades_and_records_decisions(self, tmp_path):
+        import benchmarks.fakes as fakes
+        from benchmarks.e2e import offline_environment, run_preset
+        from graph.workflow import get_app
+
+        original = fakes.build_structured_response
+
+        def revise_verdict(schema, overrides=None):
+            overrides = {"JudgeResult": {"overall_score": 6, "verdict": "REVISE"}, **(overrides or {})}
+            return original(schema, overrides)
+
+        with offline_environment(str(tmp_path)) as env, \
+                patch("benchmarks.fakes.build_structured_response", revise_verdict), \
+                patch("utils.settings.settings.BUDGET_MAX_TOKENS_PER_RUN", 1000):
+            result = run_preset("quality", env, thread_id="budget-run")
+            budget = get_app().get_state({"configurable": {"thread_id": "budget-run"}}).values["budget"]
+
+        assert result["completed"] is True
+        assert "discussion" not in result["node_order"]
+        assert result["node_order"].count("refine") == 1
+        assert budget["level"] == EXCEEDED
+        assert {d["feature"] for d in budget["decisions"]} == {"discussion", "max_refine_loops"}
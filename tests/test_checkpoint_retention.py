@@ -0,0 +1,248 @@
+"""
+체크포인트 보관(Retention) / 압축 테스트
+
+실제 SqliteSaver 에 작은 그래프를 실행해 utils/checkpoint_retention.py 를 검증합니다.
+- 스레드별 최근 N개만 유지, HITL 인터럽트 체크포인트는 보존
+- 비활성 스레드 TTL 삭제 (응답 대기 스레드는 별도 TTL)
+- 삭제 후 VACUUM 으로 파일 크기 감소 (bytes_reclaimed)
+- cleanup_old_checkpoints / get_checkpoint_stats 하위 호환
+
+실행:
+    pytest tests/test_checkpoint_retention.py -v
+"""
+
+import sqlite3
+import time
+from typing import TypedDict
+
+import pytest
+from langgraph.graph import END, START, StateGraph
+from langgraph.types import Command, interrupt
+
+from utils.checkpoint_retention import (
+    CheckpointRetentionService,
+    RetentionPolicy,
+    SqliteRetentionBackend,
+    checkpoint_time,
+    plan_retention,
+)
+from utils.checkpointer import cleanup_old_checkpoints, get_checkpoint_stats, get_checkpointer
+
+
+class _State(TypedDict, total=False):
+    count: int
+    payload: str
+    answer: str
+
+
+def _build_graph(checkpointer):
+    def step(state):
+        return {"count": state.get("count", 0) + 1, "payload": "x" * 20000}
+
+    def ask(state):
+        return {"answer": interrupt({"question": "계속할까요?"})}
+
+    def route(state):
+        return "ask" if state["count"] >= 3 else "step"
+
+    graph = StateGraph(_State)
+    graph.add_node("step", step)
+    graph.add_node("ask", ask)
+    graph.add_edge(START, "step")
+    graph.add_conditional_edges("step", route, {"step": "step", "ask": "ask"})
+    graph.add_edge("ask", END)
+    return graph.compile(checkpointer=checkpointer)
+
+
+@pytest.fixture
+def db(tmp_path):
+    path = str(tmp_path / "checkpoints.db")
+    saver = get_checkpointer("sqlite", path)
+    yield path, _build_graph(saver)
+    saver.conn.close()
+
+
+def _run(app, thread_id: str, resume: bool = True):
+    config = {"configurable": {"thread_id": thread_id}}
+    app.invoke({"count": 0}, config)  # ask 노드에서 인터럽트
+    if resume:
+        app.invoke(Command(resume="yes"), config)
+    return config
+
+
+def _count(path: str, thread_id: str) -> int:
+    with sqlite3.connect(path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM checkpoints WHERE thread_id = ?", (thread_id,)).fetchone()[0]
+
+
+class TestPlanRetention:
+    """삭제 대상 계산"""
+
+    IDS = ["1f0c0000-0000-6000-8000-00000000000%d" % i for i in range(6)]
+
+    def test_keep_last_preserves_interrupts(self):
+        rows = [("t1", "", cid) for cid in self.IDS]
+        interrupts = {("t1", "", self.IDS[1])}
+
+        plan = plan_retention(rows, interrupts, RetentionPolicy(keep_last=2, thread_ttl_sec=None))
+
+        assert sorted(k[2] for k in plan.delete) == [self.IDS[0], self.IDS[2], self.IDS[3]]
+        assert plan.preserved_interrupts == 1
+
+    def test_waiting_thread_uses_interrupt_ttl(self):
+        rows = [("waiting", "", self.IDS[0]), ("idle", "", self.IDS[1])]
+        interrupts = {("waiting", "", self.IDS[0])}
+        policy = RetentionPolicy(thread_ttl_sec=60, interrupt_ttl_sec=None)
+
+        plan = plan_retention(rows, interrupts, policy, now=checkpoint_time(self.IDS[1]) + 3600)
+
+        assert plan.dropped_threads == ["idle"]
+
+    def test_update_checkpoint_does_not_hide_interrupt(self):
+        rows = [("waiting", "", self.IDS[0]), ("waiting", "", self.IDS[1]), ("resumed", "", self.IDS[2])]
+        rows += [("resumed", "", self.IDS[3])]
+        interrupts = {("waiting", "", self.IDS[0]), ("resumed", "", self.IDS[2])}
+        updates = {("waiting", "", self.IDS[1])}  # 인터럽트 뒤 update_state, resumed 는 노드 실행
+        policy = RetentionPolicy(thread_ttl_sec=60, interrupt_ttl_sec=None)
+
+        plan = plan_retention(rows, interrupts, policy, now=checkpoint_time(self.IDS[3]) + 3600, updates=updates)
+
+        assert plan.dropped_threads == ["resumed"]
+
+    def test_checkpoint_time_from_real_id(self):
+        from langgraph.checkpoint.base.id import uuid6
+
+        assert abs(checkpoint_time(str(uuid6())) - time.time()) < 5
+        assert checkpoint_time("not-a-uuid") is None
+
+
+class TestRetentionService:
+    """실제 SqliteSaver 데이터에 정책 적용"""
+
+    def test_keep_last_keeps_thread_resumable(self, db):
+        path, app = db
+        config = _run(app, "t1", resume=False)
+        before = _count(path, "t1")
+
+        service = CheckpointRetentionService(SqliteRetentionBackend(path), RetentionPolicy(keep_last=2))
+        result = service.run_once()
+
+        assert result["checkpoints_deleted"] == before - _count(path, "t1")
+        assert _count(path, "t1") <= 3  # 최근 2개 + 인터럽트 지점
+        assert app.get_state(config).next == ("ask",)
+        assert app.invoke(Command(resume="yes"), config)["answer"] == "yes"
+
+    def test_interrupt_checkpoint_preserved_after_resume(self, db):
+        path, app = db
+        config = _run(app, "t1")
+        interrupt_cfg = next(s.config for s in app.get_state_history(config) if s.next == ("ask",))
+
+        CheckpointRetentionService(SqliteRetentionBackend(path), RetentionPolicy(keep_last=1)).run_once()
+
+        assert _count(path, "t1") == 2  # 최신 + 인터럽트 지점
+        assert app.get_state(interrupt_cfg).next == ("ask",)
+
+    def test_thread_ttl_drops_idle_threads_only(self, db):
+        path, app = db
+        _run(app, "done")
+        _run(app, "waiting", resume=False)
+
+        policy = RetentionPolicy(thread_ttl_sec=60, interrupt_ttl_sec=None)
+        result = CheckpointRetentionService(SqliteRetentionBackend(path), policy).run_once(now=time.time() + 3600)
+
+        assert result["threads_dropped"] == 1
+        assert _count(path, "done") == 0
+        assert _count(path, "waiting") > 0
+        with sqlite3.connect(path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM writes WHERE thread_id = 'done'").fetchone()[0] == 0
+
+    def test_waiting_thread_kept_after_update_state(self, db):
+        path, app = db
+        config = _run(app, "waiting", resume=False)
+        app.update_state(config, {"payload": "note"})
+
+        policy = RetentionPolicy(thread_ttl_sec=60, interrupt_ttl_sec=None)
+        result = CheckpointRetentionService(SqliteRetentionBackend(path), policy).run_once(now=time.time() + 3600)
+
+        assert result["threads_dropped"] == 0
+        assert app.invoke(Command(resume="yes"), config)["answer"] == "yes"
+
+    def test_vacuum_reclaims_space(self, db):
+        path, app = db
+        for i in range(5):
+            _run(app, f"t{i}")
+        service = CheckpointRetentionService(SqliteRetentionBackend(path), RetentionPolicy(keep_last=1))
+
+        result = service.run_once()
+
+        assert result["vacuum"] in ("incremental", "full")
+        assert result["bytes_reclaimed"] > 0
+        assert service.stats()["totals"]["bytes_reclaimed"] == result["bytes_reclaimed"]
+        with sqlite3.connect(path) as conn:
+            assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+
+    def test_background_loop_runs(self, db):
+        path, app = db
+        _run(app, "t1")
+        service = CheckpointRetentionService(SqliteRetentionBackend(path), RetentionPolicy(keep_last=1))
+
+        service.start(interval_sec=60, initial_delay_sec=0.01)
+        deadline = time.monotonic() + 5
+        while service.last_run is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        service.stop()
+
+        assert service.totals["runs"] >= 1
+
+
+class TestCheckpointerHelpers:
+    """checkpointer.py 공개 함수"""
+
+    def test_cleanup_old_checkpoints(self, db):
+        path, app = db
+        _run(app, "t1")
+        total = _count(path, "t1")
+
+        assert cleanup_old_checkpoints(days=7, sqlite_path=path, keep_last=1) == total - 2
+        assert cleanup_old_checkpoints(days=0, sqlite_path=path) == 2
+
+    def test_get_checkpoint_stats(self, db):
+        path, app = db
+        _run(app, "t1")
+
+        stats = get_checkpoint_stats(path)
+
+        assert stats["total_count"] == _count(path, "t1")
+        assert stats["thread_count"] == 1
+        assert stats["oldest_date"] <= stats["newest_date"]
+        assert stats["db_size_mb"] >= 0
+
+    def test_default_path_used_when_type_unset(self, db, monkeypatch):
+        path, app = db
+        _run(app, "t1")
+        monkeypatch.delenv("CHECKPOINTER_TYPE", raising=False)
+        monkeypatch.setenv("SQLITE_CHECKPOINT_PATH", path)
+
+        assert get_checkpoint_stats()["total_count"] == _count(path, "t1")
+        assert cleanup_old_checkpoints(days=0) > 0
+
+    def test_postgres_connection_closed_without_service(self, monkeypatch):
+        import sys
+        from unittest.mock import MagicMock
+
+        conn = MagicMock(spec=["execute", "__enter__", "__exit__"])  # 풀이 아닌 단일 연결
+        conn.__enter__.return_value = conn
+        conn.execute.return_value.fetchone.return_value = (0, 0, None, None)
+        psycopg = MagicMock()
+        psycopg.connect.return_value = conn
+        monkeypatch.setitem(sys.modules, "psycopg", psycopg)
+        monkeypatch.setenv("DB_CONNECTION_STRING", "postgresql://fake")
+
+        stats = get_checkpoint_stats(checkpointer_type="postgres")
+
+        assert stats["backend"] == "postgres"
+        conn.__exit__.assert_called_once()
+
+    def test_missing_db(self, tmp_path):
+        assert cleanup_old_checkpoints(sqlite_path=str(tmp_path / "none.db")) == 0
+        assert get_checkpoint_stats(str(tmp_path / "none.db"))["error"] == "DB not found"
@@ -0,0 +1,172 @@
+"""
+임베딩 벡터 캐시 테스트
+
+결정적 가짜 임베딩(benchmarks.fakes.FakeEmbeddings)으로 rag/embedding_cache.py 를 검증합니다.
+- 반복 쿼리 캐시 히트 (모델 호출 생략)
+- 미스 항목만 모아서 1회 배치 요청, 인덱스 빌드(embed_documents)는 캐시 미사용
+- float16 저장 / 디스크 영속화 / 지연 로드
+- 메모리 바이트 상한, 디스크 최대 항목 수
+- Embedder 통계 노출, get_embeddings() 래핑
+
+실행:
+    pytest tests/test_embedding_cache.py -v
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from benchmarks.fakes import FakeCallStats, FakeEmbeddings
+from rag.embedding_cache import CachedEmbeddings, EmbeddingCacheStore
+
+
+class _RecordingEmbeddings(FakeEmbeddings):
+    """모델에 전달된 배치를 기록하는 가짜 임베딩"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.batches = []
+
+    def embed_documents(self, texts):
+        self.batches.append(list(texts))
+        return super().embed_documents(texts)
+
+
+@pytest.fixture
+def model():
+    return _RecordingEmbeddings(size=32, stats=FakeCallStats())
+
+
+class TestCacheHit:
+    """반복 쿼리 / 배치 미스 처리"""
+
+    def test_repeated_query_skips_model(self, model):
+        cached = CachedEmbeddings(model, EmbeddingCacheStore(":memory:"))
+
+        first = cached.embed_query("반려동물 헬스케어")
+        second = cached.embed_query("반려동물 헬스케어")
+
+        assert first == second
+        assert model.stats.embed_calls == 1
+        stats = cached.get_stats()
+        assert stats["hits"] == 1 and stats["misses"] == 1 and stats["model_calls"] == 1
+
+    def test_only_misses_sent_in_one_batch(self, model):
+        cached = CachedEmbeddings(model, EmbeddingCacheStore(":memory:"))
+        cached.embed_queries(["시장 규모", "경쟁사"])
+
+        vectors = cached.embed_queries(["경쟁사", "수익 모델", "시장 규모", "수익 모델", "리스크"])
+
+        assert model.batches[-1] == ["수익 모델", "리스크"]
+        assert len(model.batches) == 2
+        assert vectors[1] == vectors[3]
+
+    def test_query_and_batch_share_entries(self, model):
+        cached = CachedEmbeddings(model, EmbeddingCacheStore(":memory:"))
+
+        vector = cached.embed_queries(["시장 규모"])[0]
+
+        assert cached.embed_query("시장 규모") == vector
+        assert model.stats.embed_calls == 1
+
+    def test_documents_bypass_cache(self, model):
+        store = EmbeddingCacheStore(":memory:", dtype="float16")
+        cached = CachedEmbeddings(model, store)
+
+        vectors = cached.embed_documents(["청크 A", "청크 B"])
+
+        assert vectors == model.embed_documents(["청크 A", "청크 B"])  # 인덱스 벡터는 원래 정밀도
+        assert store.stats()["entries"] == 0 and store.stats()["model_calls"] == 0
+
+    def test_key_includes_model_name(self, model):
+        store = EmbeddingCacheStore(":memory:")
+        CachedEmbeddings(model, store).embed_query("시장 규모")
+
+        other = _RecordingEmbeddings(size=16)
+        assert len(CachedEmbeddings(other, store).embed_query("시장 규모")) == 16
+
+
+class TestStorage:
+    """저장 정밀도 / 영속화 / 크기 제한"""
+
+    def test_float16_roundtrip_is_stable(self, model):
+        cached = CachedEmbeddings(model, EmbeddingCacheStore(":memory:", dtype="float16"))
+
+        miss = cached.embed_query("기획서")
+        hit = cached.embed_query("기획서")
+        exact = model.embed_query("기획서")
+
+        assert miss == hit  # 히트/미스 결과 동일
+        assert np.allclose(miss, exact, atol=1e-3)
+
+    def test_persistence_loads_lazily(self, model, tmp_path):
+        path = str(tmp_path / "embeddings.db")
+        CachedEmbeddings(model, EmbeddingCacheStore(path)).embed_queries(["A", "B", "C"])
+
+        store = EmbeddingCacheStore(path)
+        assert store.stats()["memory_entries"] == 0  # 열 때 전체를 읽지 않음
+
+        reopened = CachedEmbeddings(model, store)
+        reopened.embed_query("B")
+
+        assert len(model.batches) == 1
+        assert store.stats()["memory_entries"] == 1
+        assert store.stats()["entries"] == 3
+
+    def test_memory_limit_bytes(self, model):
+        # float32 32차원 = 128 bytes → 2개까지 메모리 유지
+        store = EmbeddingCacheStore(":memory:", memory_limit_bytes=256, dtype="float32")
+        cached = CachedEmbeddings(model, store)
+
+        cached.embed_queries(["A", "B", "C"])
+        stats = store.stats()
+
+        assert stats["memory_entries"] == 2
+        assert stats["memory_bytes"] <= 256
+        assert stats["entries"] == 3  # 디스크에는 모두 남음
+        cached.embed_query("A")  # 메모리에서 빠졌어도 디스크 히트
+        assert len(model.batches) == 1
+
+    def test_max_entries(self, model):
+        store = EmbeddingCacheStore(":memory:", max_entries=2)
+        CachedEmbeddings(model, store).embed_queries(["A", "B", "C"])
+
+        assert store.stats()["entries"] == 2
+
+    def test_invalid_dtype(self):
+        with pytest.raises(ValueError):
+            EmbeddingCacheStore(":memory:", dtype="int8")
+
+
+class TestIntegration:
+    """get_embeddings() / Embedder"""
+
+    def test_get_embeddings_wraps_and_embedder_reports_stats(self, model):
+        from utils import llm
+        from rag.embedder import Embedder
+
+        llm.get_embeddings.cache_clear()
+        try:
+            with patch.object(llm, "AzureOpenAIEmbeddings", lambda **kwargs: model):
+                embedder = Embedder()
+                embedder.embed_query("AI 트렌드")
+                embedder.embed_query("AI 트렌드")
+
+            assert isinstance(embedder.embeddings, CachedEmbeddings)
+            assert embedder.embeddings.model == model.model  # 속성 위임
+            stats = embedder.get_cache_stats()
+            assert stats["hits"] == 1 and stats["misses"] == 1
+        finally:
+            llm.get_embeddings.cache_clear()
+
+    def test_disabled_by_env(self, model, monkeypatch):
+        from utils import llm
+
+        monkeypatch.setenv("EMBED_CACHE_ENABLED", "false")
+        llm.get_embeddings.cache_clear()
+        try:
+            with patch.object(llm, "AzureOpenAIEmbeddings", lambda **kwargs: model):
+                assert llm.get_embeddings() is model
+        finally:
+            llm.get_embeddings.cache_clear()
@@ -0,0 +1,136 @@
+"""
+Few-shot 예시 인덱스 테스트
+
+가짜 임베딩(benchmarks.fakes.FakeEmbeddings)과 임시 예시 폴더로 utils/example_selector.py 를 검증합니다.
+- 1회 빌드 후 선택 시 예시 재임베딩 없음
+- 새 프로세스(새 인스턴스)는 manifest 일치 시 디스크 인덱스 로드
+- 예시 파일 변경 시에만 재빌드
+- 선택 지연 시간 / 생략한 임베딩 수 통계
+
+실행:
+    pytest tests/test_example_index.py -v
+"""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from benchmarks.fakes import FakeCallStats, FakeEmbeddings
+from utils import example_selector
+from utils.example_selector import ExampleIndex, MANIFEST_FILE
+
+EXAMPLES = {
+    "lunch_app.md": "# 점심 메뉴 추천 앱\n\n## 개요\n직장인 점심 메뉴 추천",
+    "pet_health.md": "# 반려동물 헬스케어 플랫폼\n\n## 개요\n반려동물 건강 기록",
+    "study_group.md": "# 스터디 그룹 매칭 서비스\n\n## 개요\n학습 목표 기반 매칭",
+}
+
+
+@pytest.fixture
+def examples_dir(tmp_path):
+    path = tmp_path / "examples"
+    path.mkdir()
+    for name, content in EXAMPLES.items():
+        (path / name).write_text(content, encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def embeddings():
+    return FakeEmbeddings(size=32, stats=FakeCallStats())
+
+
+def _index(examples_dir, tmp_path, embeddings) -> ExampleIndex:
+    return ExampleIndex(str(examples_dir), str(tmp_path / "example_index"), embeddings)
+
+
+class TestExampleIndex:
+    """빌드 / 로드 / 선택"""
+
+    def test_selects_most_similar_example(self, examples_dir, tmp_path, embeddings):
+        index = _index(examples_dir, tmp_path, embeddings)
+
+        selected = index.select("반려동물 헬스케어 플랫폼", k=1)
+
+        assert selected == [{"input": "반려동물 헬스케어 플랫폼", "output": EXAMPLES["pet_health.md"]}]
+
+    def test_repeated_selection_does_not_reembed_examples(self, examples_dir, tmp_path, embeddings):
+        index = _index(examples_dir, tmp_path, embeddings)
+
+        for query in ("점심 추천", "스터디 매칭", "반려동물"):
+            index.select(query, k=2)
+
+        assert embeddings.stats.embedded_texts == len(EXAMPLES) + 3  # 예시 1회 + 쿼리 3회
+        stats = index.stats()
+        assert stats["builds"] == 1
+        assert stats["selections"] == 3
+        assert stats["embeddings_avoided"] == 2 * len(EXAMPLES)
+        assert stats["last_selection_ms"] > 0
+
+    def test_new_instance_loads_persisted_index(self, examples_dir, tmp_path, embeddings):
+        _index(examples_dir, tmp_path, embeddings).refresh()
+        manifest = json.loads((tmp_path / "example_index" / MANIFEST_FILE).read_text(encoding="utf-8"))
+        assert set(manifest["files"]) == set(EXAMPLES)
+
+        embedded_before = embeddings.stats.embedded_texts
+        reloaded = _index(examples_dir, tmp_path, embeddings)
+        reloaded.select("점심 추천", k=1)
+
+        assert embeddings.stats.embedded_texts == embedded_before + 1  # 쿼리만
+        assert reloaded.stats()["loads"] == 1
+        assert reloaded.stats()["builds"] == 0
+
+    def test_rebuilds_only_when_files_change(self, examples_dir, tmp_path, embeddings):
+        index = _index(examples_dir, tmp_path, embeddings)
+        index.refresh()
+
+        assert index.refresh() == 0
+
+        (examples_dir / "new_service.md").write_text("# 중고 거래 플랫폼\n\n본문", encoding="utf-8")
+        assert index.refresh() == len(EXAMPLES) + 1
+        assert index.select("중고 거래", k=1)[0]["input"] == "중고 거래 플랫폼"
+        assert index.stats()["builds"] == 2
+
+    def test_touched_but_unchanged_files_reuse_index(self, examples_dir, tmp_path, embeddings):
+        index = _index(examples_dir, tmp_path, embeddings)
+        index.refresh()
+
+        path = examples_dir / "lunch_app.md"
+        os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 10**9))
+
+        assert index.refresh() == 0  # 내용 해시 동일 → 디스크 인덱스 로드
+        assert index.stats()["loads"] == 1
+
+    def test_model_change_triggers_rebuild(self, examples_dir, tmp_path, embeddings):
+        _index(examples_dir, tmp_path, embeddings).refresh()
+
+        other = FakeEmbeddings(size=16)
+        assert _index(examples_dir, tmp_path, other).refresh() == len(EXAMPLES)
+
+
+class TestGetRelevantExamples:
+    """모듈 함수 / Fallback"""
+
+    def test_uses_shared_index(self, examples_dir, tmp_path, embeddings):
+        index = _index(examples_dir, tmp_path, embeddings)
+        with patch.object(example_selector, "_example_index", index):
+            example_selector.get_relevant_examples("점심", k=1)
+            example_selector.get_relevant_examples("스터디", k=1)
+
+            assert example_selector.get_example_selector_stats()["selections"] == 2
+
+    def test_fallback_on_failure(self, examples_dir, tmp_path, embeddings):
+        index = _index(examples_dir, tmp_path, embeddings)
+        with patch.object(example_selector, "_example_index", index), \
+             patch.object(index, "select", side_effect=RuntimeError("boom")):
+            selected = example_selector.get_relevant_examples("점심", k=2, max_length=5)
+
+        assert len(selected) == 2
+        assert all(len(ex["output"]) <= 5 for ex in selected)
+
+    def test_missing_directory(self, tmp_path, embeddings):
+        index = ExampleIndex(str(tmp_path / "none"), str(tmp_path / "idx"), embeddings)
+
+        assert index.select("점심") == []
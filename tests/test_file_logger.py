@@ -0,0 +1,199 @@
+"""
+FileLogger 비동기 기록 테스트
+
+utils/file_logger.py 의 LogWriter (큐 + 기록 스레드)를 검증합니다.
+- 여러 스레드의 로그가 유실 없이 배치 기록 (flush)
+- 큐가 가득 차면 드롭 카운터 증가 + log_dropped 경고 기록
+- 크기 / 시간 기준 파일 교체, 보관 기간 / 총 크기 기준 정리
+- 정리 대상은 execution_* 파일로 한정 (traces.jsonl 등 보존)
+- close() 시 남은 로그 기록
+
+실행:
+    pytest tests/test_file_logger.py -v
+"""
+
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from utils.file_logger import FileLogger, LogWriter
+
+
+def _read_jsonl(log_dir):
+    entries = []
+    for name in sorted(os.listdir(log_dir)):
+        if name.endswith(".jsonl"):
+            with open(os.path.join(log_dir, name), encoding="utf-8") as f:
+                entries.extend(json.loads(line) for line in f)
+    return entries
+
+
+@pytest.fixture
+def make_logger(tmp_path):
+    loggers = []
+
+    def factory(**kwargs):
+        logger = FileLogger(writer=LogWriter(log_dir=str(tmp_path), **kwargs))
+        loggers.append(logger)
+        return logger
+
+    yield factory
+    for logger in loggers:
+        logger.close()
+
+
+class TestLogWriter:
+    """큐 기반 기록"""
+
+    def test_concurrent_logs_all_written(self, make_logger, tmp_path):
+        logger = make_logger()
+
+        def worker(i):
+            for n in range(200):
+                logger.info(f"worker {i} line {n}", worker=i)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert logger.flush()
+        entries = _read_jsonl(tmp_path)
+        assert len(entries) == 1600
+        assert logger.get_stats()["batches"] < 1600  # 배치 기록
+        with open(logger.text_log_file, encoding="utf-8") as f:
+            assert sum(1 for _ in f) == 1600
+
+    def test_entry_format_unchanged(self, make_logger, tmp_path):
+        logger = make_logger()
+        logger.set_context(thread_id="t1")
+        logger.error("실패", exception=ValueError("boom"), source="node")
+        logger.info("=== 배너 ===\n본문")
+        logger.flush()
+
+        entry = _read_jsonl(tmp_path)[0]
+        assert entry["level"] == "ERROR"
+        assert entry["context"] == {"thread_id": "t1"}
+        assert entry["data"]["exception_type"] == "ValueError"
+        with open(logger.text_log_file, encoding="utf-8") as f:
+            text = f.read()
+        assert "[ERROR] [error] 실패" in text
+        assert "=== 배너 ===\n본문\n" in text
+
+    def test_full_queue_drops_and_reports(self, make_logger, tmp_path):
+        logger = make_logger(queue_size=5)
+        gate = threading.Event()
+        original = logger._writer._write_batch
+        logger._writer._write_batch = lambda batch: (gate.wait(5), original(batch))
+
+        for n in range(50):
+            logger.info(f"line {n}")
+        dropped = logger.get_stats()["dropped"]
+        gate.set()
+        logger.flush()
+
+        assert dropped > 0
+        entries = _read_jsonl(tmp_path)
+        report = [e for e in entries if e["step"] == "log_dropped"]
+        assert report and report[0]["data"]["dropped"] == dropped
+        assert len(entries) == 50 - dropped + 1
+
+    def test_unserializable_record_does_not_drop_batch(self, make_logger, tmp_path):
+        logger = make_logger()
+        logger.info("first")
+        logger.info("second", handle=object())
+        logger.info("third")
+        logger.flush()
+
+        entries = _read_jsonl(tmp_path)
+        assert [e["data"] for e in entries] == ["first", "second", "third"]
+        assert logger.get_stats()["written"] == 3 and logger.get_stats()["write_errors"] == 0
+
+    def test_format_failure_skips_only_that_record(self, make_logger, tmp_path):
+        logger = make_logger(flush_interval_sec=10)
+        original = LogWriter._format
+
+        def flaky_format(record):
+            if record[5] == "bad":
+                raise ValueError("cannot format")
+            return original(record)
+
+        logger._writer._format = flaky_format
+        for message in ("first", "bad", "third"):
+            logger.info(message)
+        logger.flush()
+
+        assert [e["data"] for e in _read_jsonl(tmp_path)] == ["first", "third"]
+        stats = logger.get_stats()
+        assert (stats["written"], stats["format_errors"], stats["write_errors"]) == (2, 1, 0)
+
+    def test_close_writes_pending_records(self, make_logger, tmp_path):
+        logger = make_logger(flush_interval_sec=10)
+        for n in range(10):
+            logger.debug(f"line {n}")
+
+        logger.close()
+
+        assert len(_read_jsonl(tmp_path)) == 10
+        assert logger._writer.submit(("late",)) is False
+
+
+class TestRotation:
+    """파일 교체 / 정리"""
+
+    def test_size_based_rotation(self, make_logger, tmp_path):
+        logger = make_logger(max_file_bytes=2000, batch_size=5)
+        first = logger.log_file
+        for n in range(60):
+            logger.info("x" * 100)
+            if n % 5 == 4:
+                logger.flush()
+
+        assert logger.log_file != first
+        assert logger.get_stats()["rotations"] >= 2
+        assert len(_read_jsonl(tmp_path)) == 60
+
+    def test_time_based_rotation(self, make_logger):
+        logger = make_logger(rotate_interval_sec=0.05)
+        first = logger.log_file
+        logger.info("a")
+        logger.flush()
+        time.sleep(0.06)
+        logger.info("b")
+        logger.flush()
+
+        assert logger.log_file != first
+
+    def test_cleanup_by_age_and_total_size(self, tmp_path):
+        old = tmp_path / "execution_20200101_000000.jsonl"
+        old.write_text("{}\n")
+        os.utime(old, (time.time() - 30 * 86400,) * 2)
+        for i in range(3):
+            path = tmp_path / f"execution_2026010{i}_000000.log"
+            path.write_text("x" * 1000)
+            os.utime(path, (time.time() - 100 + i,) * 2)
+        (tmp_path / "notes.txt").write_text("keep")
+
+        writer = LogWriter(log_dir=str(tmp_path), retention_sec=7 * 86400, max_total_bytes=2500)
+        writer.close()
+
+        remaining = sorted(os.listdir(tmp_path))
+        assert old.name not in remaining
+        assert "execution_20260100_000000.log" not in remaining  # 총 크기 초과 → 가장 오래된 파일부터
+        assert "execution_20260102_000000.log" in remaining
+        assert "notes.txt" in remaining
+
+    def test_cleanup_keeps_non_execution_files(self, tmp_path):
+        """traces.jsonl 처럼 LogWriter 가 만들지 않은 파일은 오래되어도 삭제하지 않음"""
+        traces = tmp_path / "traces.jsonl"
+        traces.write_text("{}\n")
+        os.utime(traces, (time.time() - 30 * 86400,) * 2)
+
+        writer = LogWriter(log_dir=str(tmp_path), retention_sec=7 * 86400, max_total_bytes=1)
+        writer.close()
+
+        assert traces.exists()
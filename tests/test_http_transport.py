@@ -0,0 +1,262 @@
+"""
+공유 HTTP Transport 테스트
+
+연결 수를 세는 로컬 HTTP 서버로 tools/http_transport.py 를 검증합니다.
+- Keep-alive 연결 재사용 (요청 N회 → 연결 1개)
+- 호스트별 최대 연결 수 제한
+- 429 Retry-After 준수 (초 / HTTP-date)
+- 호출 노드 마감 시간(deadline) 전파 (작업 스레드 포함)
+- SearchClient / MCPToolkit Fallback 의 Transport 사용
+
+실행:
+    pytest tests/test_http_transport.py -v
+"""
+
+import json
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from tools.http_transport import (
+    DeadlineExceeded,
+    HttpTransport,
+    parse_retry_after,
+    remaining_time,
+    request_deadline,
+)
+
+
+class _CountingServer(ThreadingHTTPServer):
+    """열린 연결 수와 최대 동시 처리 수를 기록하는 HTTP 서버"""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.connections = 0
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+        self.responses = []  # 순서대로 소비할 (status, headers) 목록
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, *args):
+        pass
+
+    def _handle(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+
+        with self.server.lock:
+            self.server.active += 1
+            self.server.max_active = max(self.server.max_active, self.server.active)
+            status, headers = self.server.responses.pop(0) if self.server.responses else (200, {})
+        try:
+            if self.path.startswith("/slow"):
+                time.sleep(0.2 if self.path == "/slow" else 2.0)
+            body = json.dumps({"path": self.path, "answer": "요약", "results": [
+                {"title": "결과", "url": "https://example.com/report", "content": "시장 규모"}
+            ]}).encode()
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with self.server.lock:
+                self.server.active -= 1
+
+    do_GET = _handle
+    do_POST = _handle
+
+
+@pytest.fixture
+def server():
+    server = _CountingServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def transport():
+    transport = HttpTransport(pool_maxsize=2, max_retries=2)
+    yield transport
+    transport.close()
+
+
+class TestConnectionPooling:
+    """Keep-alive 연결 재사용"""
+
+    def test_sequential_requests_reuse_one_connection(self, server, transport):
+        for i in range(10):
+            assert transport.get(f"{server.url}/item/{i}").status_code == 200
+
+        assert server.connections == 1
+        assert transport.get_stats()["requests"] == 10
+
+    def test_bare_requests_open_connection_per_call(self, server):
+        for i in range(5):
+            requests.get(f"{server.url}/item/{i}", timeout=5)
+
+        assert server.connections == 5
+
+    def test_per_host_connection_limit(self, server, transport):
+        threads = [threading.Thread(target=transport.get, args=(f"{server.url}/slow",)) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert server.max_active <= 2
+        assert server.connections <= 2
+
+
+class TestRetryAfter:
+    """429 Retry-After"""
+
+    def test_retries_after_429(self, server, transport):
+        server.responses = [(429, {"Retry-After": "0"}), (429, {"Retry-After": "0"})]
+
+        resp = transport.get(f"{server.url}/search")
+
+        assert resp.status_code == 200
+        assert transport.get_stats()["retries"] == 2
+
+    def test_waits_retry_after_seconds(self, server, transport):
+        server.responses = [(429, {"Retry-After": "1"})]
+
+        start = time.perf_counter()
+        assert transport.get(f"{server.url}/search").status_code == 200
+        assert time.perf_counter() - start >= 0.9
+
+    def test_retry_after_beyond_limit_returns_429(self, server):
+        transport = HttpTransport(max_retry_after=5)
+        server.responses = [(429, {"Retry-After": "120"})]
+
+        start = time.perf_counter()
+        resp = transport.get(f"{server.url}/search")
+
+        assert resp.status_code == 429
+        assert time.perf_counter() - start < 1.0
+
+    def test_parse_retry_after(self):
+        assert parse_retry_after("3") == 3.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+        assert 8 <= parse_retry_after(formatdate(time.time() + 10, usegmt=True)) <= 10
+        assert parse_retry_after(formatdate(time.time() - 10, usegmt=True)) == 0.0
+
+
+class TestDeadline:
+    """마감 시간 전파"""
+
+    def test_nested_deadline_takes_earliest(self):
+        assert remaining_time() is None
+        with request_deadline(10):
+            with request_deadline(60):
+                assert remaining_time() <= 10
+            with request_deadline(1):
+                assert remaining_time() <= 1
+        assert remaining_time() is None
+
+    def test_timeout_clamped_to_deadline(self, server, transport):
+        start = time.perf_counter()
+        with request_deadline(0.3):
+            with pytest.raises(requests.Timeout):
+                transport.get(f"{server.url}/slow-long", timeout=10)
+
+        assert time.perf_counter() - start < 1.5
+
+    def test_expired_deadline_raises_before_request(self, server, transport):
+        with request_deadline(0):
+            with pytest.raises(DeadlineExceeded):
+                transport.get(f"{server.url}/item")
+
+        assert server.connections == 0
+
+    def test_retry_after_longer_than_deadline_not_waited(self, server, transport):
+        server.responses = [(429, {"Retry-After": "5"})]
+
+        start = time.perf_counter()
+        with request_deadline(2):
+            resp = transport.get(f"{server.url}/search")
+
+        assert resp.status_code == 429
+        assert time.perf_counter() - start < 1.0
+
+    def test_deadline_reaches_search_worker_threads(self):
+        from tools import web_search_executor
+        from tools.search_cache import SearchCache
+
+        seen = []
+        decision = {"should_search": True, "search_query": ["시장 규모", "경쟁사"], "reason": "test"}
+
+        def fake_search_sync(q, search_depth="basic"):
+            seen.append(remaining_time())
+            return {"success": True, "results": []}
+
+        with patch.object(web_search_executor, "should_search_web", return_value=decision), \
+             patch.object(web_search_executor, "search_sync", side_effect=fake_search_sync), \
+             patch.object(web_search_executor, "get_search_cache", return_value=SearchCache()):
+            with request_deadline(30):
+                web_search_executor.execute_web_search("반려동물 플랫폼")
+
+        assert len(seen) == 2
+        assert all(r is not None and 0 < r <= 30 for r in seen)
+
+
+class TestClientsUseTransport:
+    """검색/페치 클라이언트 연결 재사용"""
+
+    def test_search_client_reuses_connection(self, server, transport):
+        from tools.search_client import SearchClient
+
+        client = SearchClient()
+        client.api_key = "test-key"
+        client.base_url = f"{server.url}/search"
+        with patch("tools.search_client.get_http_transport", return_value=transport):
+            outputs = [client.search("시장 규모") for _ in range(3)]
+
+        assert all("시장 규모" in out for out in outputs)
+        assert server.connections == 1
+
+    def test_fallback_search_and_fetch_reuse_connection(self, server, transport):
+        from tools import mcp_client
+        from tools.mcp_client import MCPToolkit
+
+        toolkit = MCPToolkit(use_mcp=False)
+        with patch("tools.http_transport.get_http_transport", return_value=transport), \
+             patch.object(mcp_client, "TAVILY_SEARCH_URL", f"{server.url}/search"), \
+             patch.object(mcp_client, "_is_safe_url", return_value=True), \
+             patch("utils.config.Config.TAVILY_API_KEY", "test-key"):
+            result = toolkit._fallback_search("AI 트렌드", max_results=2)
+            content = toolkit._fallback_fetch(f"{server.url}/page")
+
+        assert result["success"] is True
+        assert result["source"] == "tavily-api"
+        assert result["results"][0]["url"] == "https://example.com/report"
+        assert "/page" in content
+        assert server.connections == 1
@@ -0,0 +1,242 @@
+"""
+워크플로우 작업 큐 테스트
+
+api/services/job_queue.py 와 /run, /resume, /status 엔드포인트 연동을 검증합니다.
+- 워커 수 이상으로 동시 실행되지 않음
+- 같은 thread_id 작업은 직렬 실행 (제출 순서 유지)
+- 큐 깊이 초과 시 JobQueueFull → 429 + Retry-After
+- 재시작 후 대기/중단된 작업 복구 (SQLite)
+- 상태 응답에 queue_wait_ms / queue_position 포함
+
+실행:
+    pytest tests/test_job_queue.py -v
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.services import event_stream, job_queue
+from api.services.event_stream import EventBrokerRegistry
+from api.services.job_queue import DONE, FAILED, QUEUED, JobAlreadyPending, JobQueue, JobQueueFull
+
+
+def _wait_until(predicate, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class _Recorder:
+    """실행 순서 / 동시 실행 수를 기록하는 핸들러 (gate 가 열릴 때까지 대기)"""
+
+    def __init__(self, hold: bool = False):
+        self.gate = threading.Event()
+        if not hold:
+            self.gate.set()
+        self.lock = threading.Lock()
+        self.order = []
+        self.running = 0
+        self.max_running = 0
+        self.active_threads = set()
+        self.overlap = False
+
+    def __call__(self, job):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            self.overlap |= job.thread_id in self.active_threads
+            self.active_threads.add(job.thread_id)
+        self.gate.wait(5)
+        time.sleep(0.01)
+        with self.lock:
+            self.order.append((job.thread_id, job.payload.get("n")))
+            self.running -= 1
+            self.active_threads.discard(job.thread_id)
+        if job.payload.get("fail"):
+            raise RuntimeError("boom")
+
+
+@pytest.fixture
+def make_queue(tmp_path):
+    queues = []
+
+    def factory(handler, **kwargs):
+        kwargs.setdefault("db_path", str(tmp_path / "jobs.db"))
+        queue = JobQueue(handler, **kwargs)
+        queues.append(queue)
+        return queue
+
+    yield factory
+    for queue in queues:
+        queue.shutdown(timeout=2)
+
+
+class TestJobQueue:
+    """워커 풀 / 직렬화 / 입장 제어"""
+
+    def test_worker_pool_bounds_concurrency(self, make_queue):
+        handler = _Recorder()
+        queue = make_queue(handler, workers=3, max_depth=50).start()
+
+        jobs = [queue.submit(f"t{i}", "run", {"n": i}) for i in range(12)]
+
+        assert _wait_until(lambda: len(handler.order) == 12)
+        assert 1 < handler.max_running <= 3
+        assert all(queue.latest_job(job.thread_id).status == DONE for job in jobs)
+
+    def test_same_thread_jobs_are_serialized_in_order(self, make_queue):
+        handler = _Recorder()
+        queue = make_queue(handler, workers=4, max_depth=50).start()
+
+        for n in range(6):
+            queue.submit("same", "resume", {"n": n})
+            queue.submit(f"other-{n}", "run", {"n": n})
+
+        assert _wait_until(lambda: len(handler.order) == 12)
+        assert not handler.overlap
+        assert [n for tid, n in handler.order if tid == "same"] == list(range(6))
+
+    def test_full_queue_raises_with_retry_after(self, make_queue):
+        handler = _Recorder(hold=True)
+        queue = make_queue(handler, workers=1, max_depth=2).start()
+        queue.submit("t0", "run", {})
+        assert _wait_until(lambda: handler.running == 1)
+        queue.submit("t1", "run", {})
+        queue.submit("t2", "run", {})
+
+        with pytest.raises(JobQueueFull) as exc:
+            queue.submit("t3", "run", {})
+
+        assert exc.value.retry_after >= 1
+        assert queue.stats()["rejected"] == 1
+        handler.gate.set()
+
+    def test_exclusive_submit_rejects_pending_thread(self, make_queue):
+        queue = make_queue(_Recorder(hold=True), workers=1)
+        queue.submit("t1", "resume", {}, exclusive=True)
+
+        with pytest.raises(JobAlreadyPending):
+            queue.submit("t1", "resume", {}, exclusive=True)
+        queue.submit("t2", "resume", {}, exclusive=True)
+
+    def test_handler_error_marks_job_failed(self, make_queue):
+        queue = make_queue(_Recorder(), workers=1).start()
+
+        job = queue.submit("t1", "run", {"fail": True})
+
+        assert _wait_until(lambda: queue.latest_job("t1").status == FAILED)
+        assert queue.latest_job("t1").error == "boom"
+        assert queue.stats()["failed"] == 1
+        assert job.id == queue.latest_job("t1").id
+
+    def test_queued_and_interrupted_jobs_survive_restart(self, make_queue, tmp_path):
+        first = make_queue(_Recorder(hold=True), workers=1)
+        first.submit("t1", "run", {"n": 1})
+        first.submit("t2", "run", {"n": 2})
+        # Simulate a crash mid-run: t1 claimed but never finished
+        with first._cond:
+            assert first._claim().thread_id == "t1"
+
+        handler = _Recorder()
+        second = make_queue(handler, workers=1).start()
+
+        assert _wait_until(lambda: len(handler.order) == 2)
+        assert handler.order == [("t1", 1), ("t2", 2)]
+        assert second.stats()["recovered"] == 1
+        assert second.latest_job("t1").attempts == 2
+
+    def test_queue_wait_and_position(self, make_queue):
+        handler = _Recorder(hold=True)
+        queue = make_queue(handler, workers=1, max_depth=10).start()
+        queue.submit("t0", "run", {})
+        assert _wait_until(lambda: handler.running == 1)
+        waiting = [queue.submit(f"t{i}", "run", {}) for i in (1, 2)]
+        time.sleep(0.05)
+
+        assert [queue.position(job.id) for job in waiting] == [1, 2]
+        job = queue.latest_job("t2")
+        assert job.status == QUEUED and job.queue_wait_ms >= 50
+
+        handler.gate.set()
+        assert _wait_until(lambda: queue.latest_job("t2").status == DONE)
+        assert queue.position(waiting[1].id) is None
+        assert queue.latest_job("t2").queue_wait_ms >= 50
+
+
+class TestWorkflowEndpoints:
+    """/run, /resume, /status 연동"""
+
+    @pytest.fixture
+    def queue(self, make_queue, monkeypatch):
+        monkeypatch.setattr(event_stream, "_registry", EventBrokerRegistry(buffer_size=50, retention_sec=60))
+        queue = make_queue(_Recorder(hold=True), workers=1, max_depth=1).start()
+        monkeypatch.setattr(job_queue, "_job_queue", queue)
+        yield queue
+        queue.handler.gate.set()
+
+    @pytest.fixture
+    def client(self, queue):
+        from api.main import app
+        return TestClient(app)
+
+    def _empty_app(self):
+        app = SimpleNamespace(get_state=lambda config: SimpleNamespace(values={}, tasks=(), next=()))
+        return patch("graph.workflow.get_app", return_value=app)
+
+    def test_run_returns_429_when_queue_full(self, client, queue):
+        for i in range(2):
+            assert client.post("/api/v1/workflow/run", json={"user_input": "기획서", "thread_id": f"t{i}"}).status_code == 200
+        assert _wait_until(lambda: queue.handler.running == 1)
+
+        response = client.post("/api/v1/workflow/run", json={"user_input": "기획서", "thread_id": "t9"})
+
+        assert response.status_code == 429
+        assert int(response.headers["Retry-After"]) >= 1
+        assert event_stream.get_event_broker_registry().get("t9").closed
+
+    def test_429_keeps_running_thread_stream_open(self, client, queue):
+        for i in range(2):
+            assert client.post("/api/v1/workflow/run", json={"user_input": "기획서", "thread_id": f"t{i}"}).status_code == 200
+        assert _wait_until(lambda: queue.handler.running == 1)
+
+        response = client.post("/api/v1/workflow/run", json={"user_input": "기획서", "thread_id": "t0"})
+
+        assert response.status_code == 429
+        assert not event_stream.get_event_broker_registry().get("t0").closed  # 실행 중인 t0 스트림 유지
+
+    def test_status_reports_queue_wait_before_first_checkpoint(self, client, queue):
+        client.post("/api/v1/workflow/run", json={"user_input": "기획서", "thread_id": "t0"})
+        assert _wait_until(lambda: queue.handler.running == 1)
+        client.post("/api/v1/workflow/run", json={"user_input": "기획서", "thread_id": "t1"})
+
+        with self._empty_app():
+            body = client.get("/api/v1/workflow/status/t1").json()
+
+        assert body["status"] == "running"
+        assert body["queue_position"] == 1
+        assert body["queue_wait_ms"] >= 0
+
+    def test_workers_start_with_app(self):
+        from api.main import app
+
+        with patch("api.services.job_queue.get_job_queue") as get_queue, \
+                patch("api.services.job_queue.shutdown_job_queue"), \
+                patch("utils.logging_config.setup_logging"), \
+                patch("tools.mcp_pool.shutdown_mcp_pool"):
+            with TestClient(app):
+                get_queue.assert_called_once()  # 첫 요청 전에 복구된 작업 실행 시작
+
+    def test_pending_resume_is_rejected(self, client, queue):
+        queue.submit("t1", "resume", {"resume_data": {"text_input": "a"}})
+
+        response = client.post("/api/v1/workflow/resume", json={"thread_id": "t1", "resume_data": {"text_input": "b"}})
+
+        assert response.status_code == 409
@@ -0,0 +1,121 @@
+"""
+Lazy 그래프 컴파일 / Import 시간 예산 테스트
+
+- graph.workflow import 시 컴파일/LangSmith 설정이 일어나지 않음
+- get_app() 첫 호출 시 1회만 컴파일 (동시 호출 포함)
+- 하위 호환: graph.workflow.app
+- benchmarks/import_time.py 예산 검사 / 금지 모듈 검사
+
+실행:
+    pytest tests/test_lazy_workflow.py -v
+"""
+
+import subprocess
+import sys
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+import graph.workflow as workflow
+from benchmarks import import_time
+
+
+@pytest.fixture
+def fresh_app():
+    """전역 앱을 비운 상태로 테스트 후 원래 값 복원"""
+    with patch.object(workflow, "_app", None):
+        yield
+
+
+class TestLazyCompile:
+    """첫 사용 시점 컴파일"""
+
+    def test_import_does_not_compile(self):
+        code = (
+            "from unittest.mock import patch\n"
+            "with patch('utils.config.Config.setup_langsmith') as setup:\n"
+            "    import graph.workflow as w\n"
+            "    assert w._app is None\n"
+            "    assert not setup.called\n"
+        )
+        proc = subprocess.run([sys.executable, "-c", code], cwd=import_time.PROJECT_ROOT,
+                              capture_output=True, text=True)
+
+        assert proc.returncode == 0, proc.stderr[-2000:]
+
+    def test_concurrent_first_use_compiles_once(self, fresh_app):
+        calls = []
+
+        def slow_compile(*args, **kwargs):
+            calls.append(1)
+            time.sleep(0.1)
+            return object()
+
+        results = []
+        with patch.object(workflow, "compile_workflow", side_effect=slow_compile), \
+             patch.object(workflow.Config, "setup_langsmith") as setup:
+            threads = [threading.Thread(target=lambda: results.append(workflow.get_app())) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert len(calls) == 1
+        assert setup.call_count == 1
+        assert len(set(map(id, results))) == 1
+
+    def test_module_attribute_compat(self, fresh_app):
+        sentinel = object()
+        with patch.object(workflow, "compile_workflow", return_value=sentinel):
+            from graph.workflow import app
+
+        assert app is sentinel
+        assert workflow.app is workflow.get_app()
+        with pytest.raises(AttributeError):
+            workflow.no_such_attribute
+
+
+class TestImportBudget:
+    """Import 시간 예산 검사"""
+
+    SAMPLE = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   json.decoder\n"
+        "import time:       300 |        420 | json\n"
+        "import time:      5000 |      90000 | api.main\n"
+    )
+
+    def test_parse_importtime(self):
+        rows = import_time.parse_importtime(self.SAMPLE)
+
+        assert [r["module"] for r in rows] == ["json.decoder", "json", "api.main"]
+        assert rows[0]["depth"] == 1
+        assert rows[2]["cumulative_us"] == 90000
+
+    def test_check_budget(self):
+        result = {"module": "api.main", "total_ms": 900.0, "forbidden_loaded": ["graph.workflow"]}
+
+        assert import_time.check_budget({**result, "forbidden_loaded": []}, 1000) == []
+        failures = import_time.check_budget(result, 500)
+        assert len(failures) == 2
+
+    def test_resolve_budget(self, monkeypatch):
+        monkeypatch.delenv("IMPORT_TIME_BUDGET_MS", raising=False)
+        assert import_time.resolve_budget("api.main") == import_time.IMPORT_BUDGETS_MS["api.main"]
+        assert import_time.resolve_budget("api.main", 200) == 200
+        monkeypatch.setenv("IMPORT_TIME_BUDGET_MS", "321")
+        assert import_time.resolve_budget("api.main") == 321
+
+    def test_api_entry_point_stays_light(self):
+        result = import_time.profile_import(
+            "api.main", runs=1, forbidden=import_time.FORBIDDEN_IMPORTS["api.main"]
+        )
+
+        assert result["total_ms"] > 0
+        assert result["forbidden_loaded"] == []
+
+    def test_command_fails_over_budget(self, capsys):
+        assert import_time.main(["--module", "json", "--budget-ms", "0.001", "--runs", "1"]) == 1
+        assert "[FAIL]" in capsys.readouterr().out
@@ -0,0 +1,170 @@
+"""
+LLM 응답 캐시 테스트
+
+결정적 가짜 모델(benchmarks.fakes.FakeChatModel)로 utils/llm_cache.py 를 검증합니다.
+- 동일 입력 재호출 시 캐시 히트 (모델 호출 생략)
+- 캐시 키: temperature / Structured Output 스키마 반영
+- TTL 만료 / 최대 항목 수 제한 / SQLite 영속화
+- 절감 토큰 기록 (TokenTrackingCallback 보고)
+- get_llm() 호출 지점별 캐시 정책
+
+실행:
+    pytest tests/test_llm_cache.py -v
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from benchmarks.fakes import FakeCallStats, FakeChatModel
+from utils.llm_cache import LLMCacheStore, LLMResponseCache
+from utils.streamlit_callback import TokenTrackingCallback
+
+PROMPT = [("system", "검색 쿼리를 생성하세요."), ("user", "반려동물 헬스케어 앱")]
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _model(store: LLMCacheStore, ttl=None, **kwargs) -> FakeChatModel:
+    return FakeChatModel(stats=FakeCallStats(), cache=LLMResponseCache(store, ttl), **kwargs)
+
+
+class TestCacheHit:
+    """캐시 히트 / 키 구성"""
+
+    def test_second_call_served_from_cache(self):
+        store = LLMCacheStore()
+        model = _model(store)
+
+        first = model.invoke(PROMPT)
+        second = model.invoke(PROMPT)
+
+        assert second.content == first.content
+        assert model.stats.llm_calls == 1
+        assert store.stats()["hits"] == 1
+
+    def test_key_includes_temperature(self):
+        store = LLMCacheStore()
+        cold, warm = _model(store, temperature=0.0), _model(store, temperature=0.3)
+
+        cold.invoke(PROMPT)
+        warm.invoke(PROMPT)
+
+        assert warm.stats.llm_calls == 1
+        assert len(store) == 2
+
+    def test_key_includes_structured_output_schema(self):
+        store = LLMCacheStore()
+        model = _model(store)
+        tool_a = {"type": "function", "function": {"name": "QueryA", "parameters": {"type": "object"}}}
+        tool_b = {"type": "function", "function": {"name": "QueryB", "parameters": {"type": "object"}}}
+
+        model.bind(tools=[tool_a]).invoke(PROMPT)
+        model.bind(tools=[tool_b]).invoke(PROMPT)
+        model.bind(tools=[tool_a]).invoke(PROMPT)
+
+        assert model.stats.llm_calls == 2
+        assert len(store) == 2
+
+
+class TestLimits:
+    """TTL / 최대 항목 수 / 영속화"""
+
+    def test_ttl_expiry(self):
+        clock = _Clock()
+        store = LLMCacheStore(clock=clock)
+        model = _model(store, ttl=60)
+
+        model.invoke(PROMPT)
+        clock.now += 30
+        model.invoke(PROMPT)
+        clock.now += 61
+        model.invoke(PROMPT)
+
+        assert model.stats.llm_calls == 2
+
+    def test_max_entries_evicts_least_recently_used(self):
+        clock = _Clock()
+        store = LLMCacheStore(max_entries=2, clock=clock)
+        model = _model(store)
+
+        for topic in ("A", "B"):
+            model.invoke(f"주제 {topic}")
+            clock.now += 1
+        model.invoke("주제 A")  # A 사용 → B가 가장 오래됨
+        clock.now += 1
+        model.invoke("주제 C")
+
+        assert len(store) == 2
+        assert store.stats()["evictions"] == 1
+        model.invoke("주제 A")
+        assert model.stats.llm_calls == 3
+
+    def test_sqlite_persistence(self, tmp_path):
+        path = str(tmp_path / "llm_cache.db")
+        _model(LLMCacheStore(path)).invoke(PROMPT)
+
+        reopened = _model(LLMCacheStore(path))
+        reopened.invoke(PROMPT)
+
+        assert reopened.stats.llm_calls == 0
+
+
+class TestSavedTokens:
+    """절감 토큰 기록"""
+
+    def test_saved_tokens_reported(self):
+        store = LLMCacheStore()
+        model = _model(store)
+        tracker = TokenTrackingCallback()
+
+        model.invoke(PROMPT, config={"callbacks": [tracker]})
+        spent = tracker.get_usage_summary()
+        model.invoke(PROMPT, config={"callbacks": [tracker]})
+        summary = tracker.get_usage_summary()
+
+        assert summary["input_tokens"] == spent["input_tokens"]  # 실제 사용량 증가 없음
+        assert summary["cached_calls"] == 1
+        assert summary["saved_input_tokens"] == spent["input_tokens"]
+        assert summary["saved_output_tokens"] == spent["output_tokens"]
+        assert summary["estimated_cost_usd"] == spent["estimated_cost_usd"]
+        assert store.stats()["saved_input_tokens"] == spent["input_tokens"]
+
+
+class TestGetLLMPolicy:
+    """get_llm() 호출 지점별 캐시 정책"""
+
+    @pytest.fixture
+    def captured(self):
+        from utils import llm
+
+        calls = []
+        llm._get_cached_llm.cache_clear()
+        with patch.object(llm, "AzureChatOpenAI", side_effect=lambda **kw: calls.append(kw) or kw):
+            yield calls
+        llm._get_cached_llm.cache_clear()
+
+    def test_default_policy_by_temperature(self, captured):
+        from utils.llm import get_llm
+
+        assert isinstance(get_llm(temperature=0).get("cache"), LLMResponseCache)
+        assert "cache" not in get_llm(temperature=0.7)
+
+    def test_explicit_policy(self, captured):
+        from utils.llm import get_llm
+
+        assert get_llm(temperature=0.3, cache=True)["cache"].ttl is not None
+        assert get_llm(temperature=0.3, cache=60)["cache"].ttl == 60
+        assert "cache" not in get_llm(temperature=0, cache=False)
+
+    def test_disabled_by_setting(self, captured):
+        from utils.llm import get_llm
+
+        with patch("utils.settings.settings.LLM_CACHE_ENABLED", False):
+            assert "cache" not in get_llm(temperature=0, cache=True)
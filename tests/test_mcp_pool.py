@@ -0,0 +1,197 @@
+"""
+MCP 세션 풀 테스트
+
+로컬 stdio MCP 스텁 서버(benchmarks/mcp_stub_server.py)로 MCPSessionPool을 검증합니다.
+- 웜 세션 재사용 (호출마다 서버를 새로 띄우지 않음)
+- 크래시된 서버 자동 재기동 (호출 시 / 헬스 체크 시)
+- 서버별 동시 호출 수 제한
+- 종료 처리
+- fetch_url_sync / search_sync 의 풀 사용
+
+실행:
+    pytest tests/test_mcp_pool.py -v
+"""
+
+import os
+import re
+import signal
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("langchain_mcp_adapters")
+pytest.importorskip("mcp.server.fastmcp")
+
+from benchmarks.mcp_pool import stub_server_config
+from tools.mcp_pool import MCPSessionPool
+
+
+def _pid(result) -> int:
+    return int(re.search(r"(?:pid=)?(\d+)", str(result)).group(1))
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    # 좀비 프로세스는 종료된 것으로 간주
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().split()[2] != "Z"
+    except OSError:
+        return True
+
+
+def _wait_until(predicate, timeout: float = 10.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+@pytest.fixture
+def pool():
+    pool = MCPSessionPool(stub_server_config(), call_timeout=10.0, startup_timeout=30.0, health_interval=60.0)
+    yield pool
+    pool.close()
+
+
+class TestSessionReuse:
+    """웜 세션 재사용"""
+
+    def test_calls_share_one_server_process(self, pool):
+        first = pool.call_tool("fetch", "fetch", {"url": "https://example.com/a"})
+        start = time.perf_counter()
+        second = pool.call_tool("fetch", "fetch", {"url": "https://example.com/b"})
+        warm_ms = (time.perf_counter() - start) * 1000
+
+        assert _pid(first) == _pid(second)
+        assert "https://example.com/b" in str(second)
+        assert pool.get_stats()["spawns"] == 1
+        assert warm_ms < 500
+
+    def test_partial_tool_name_match(self, pool):
+        result = pool.call_tool("tavily", "search", {"query": "AI 트렌드", "max_results": 2})
+
+        assert "AI 트렌드 결과 2" in str(result)
+
+    def test_unknown_server_and_tool(self, pool):
+        with pytest.raises(KeyError):
+            pool.call_tool("missing", "fetch", {})
+        with pytest.raises(KeyError):
+            pool.call_tool("fetch", "no-such-tool", {})
+
+
+class TestRespawn:
+    """크래시된 서버 재기동"""
+
+    def test_call_after_crash_respawns(self, pool):
+        old_pid = _pid(pool.call_tool("fetch", "fetch", {"url": "https://example.com"}))
+        os.kill(old_pid, signal.SIGKILL)
+
+        new_pid = _pid(pool.call_tool("fetch", "fetch", {"url": "https://example.com"}))
+
+        assert new_pid != old_pid
+        assert pool.get_stats()["respawns"] == 1
+
+    def test_health_check_respawns_warm_server(self):
+        pool = MCPSessionPool(stub_server_config(), call_timeout=5.0, health_interval=0.2)
+        try:
+            old_pid = _pid(pool.call_tool("fetch", "sleep", {"seconds": 0}))
+            os.kill(old_pid, signal.SIGKILL)
+
+            assert _wait_until(lambda: pool.get_stats()["respawns"] >= 1
+                               and pool.get_stats()["servers"]["fetch"]["ready"])
+            assert pool.get_stats()["health_failures"] >= 1
+        finally:
+            pool.close()
+
+    def test_startup_failure_raises(self):
+        config = {"fetch": {"command": "/nonexistent/mcp-server", "args": [], "transport": "stdio"}}
+        pool = MCPSessionPool(config, startup_timeout=10.0)
+        try:
+            with pytest.raises(Exception):
+                pool.call_tool("fetch", "fetch", {"url": "https://example.com"})
+            assert pool.get_stats()["servers"]["fetch"]["failures"] == 1
+        finally:
+            pool.close()
+
+
+class TestConcurrencyAndShutdown:
+    """동시성 제한 / 종료"""
+
+    def test_concurrency_bounded_per_server(self):
+        pool = MCPSessionPool(stub_server_config(), max_concurrency=2, call_timeout=10.0)
+        try:
+            pool.warmup("fetch")
+            threads = [
+                threading.Thread(target=pool.call_tool, args=("fetch", "sleep", {"seconds": 0.3}))
+                for _ in range(4)
+            ]
+            start = time.perf_counter()
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            elapsed = time.perf_counter() - start
+
+            assert elapsed >= 0.55  # 2개씩 2번
+        finally:
+            pool.close()
+
+    def test_close_terminates_servers(self):
+        pool = MCPSessionPool(stub_server_config())
+        pid = _pid(pool.call_tool("fetch", "fetch", {"url": "https://example.com"}))
+
+        pool.close()
+        pool.close()  # 멱등
+
+        assert _wait_until(lambda: not _pid_alive(pid))
+        with pytest.raises(RuntimeError):
+            pool.call_tool("fetch", "fetch", {"url": "https://example.com"})
+
+
+class TestSyncWrappers:
+    """fetch_url_sync / search_sync"""
+
+    def test_fetch_and_search_use_pool(self, pool):
+        from tools import mcp_client
+
+        with patch("shutil.which", return_value="/usr/bin/stub"), \
+             patch("utils.config.Config.MCP_ENABLED", True), \
+             patch("tools.mcp_pool.get_mcp_pool", return_value=pool):
+            first = mcp_client.fetch_url_sync("https://example.com/x", max_length=20)
+            mcp_client.fetch_url_sync("https://example.com/y")
+            search = mcp_client.search_sync("AI", max_results=2)
+
+        assert len(first) == 20
+        assert search["success"] is True
+        assert search["source"] == "tavily-mcp"
+        assert pool.get_stats()["spawns"] == 2  # fetch/tavily 서버 각 1회
+
+    def test_search_failure_reports_mcp_error(self, pool):
+        from tools import mcp_client
+
+        with patch("shutil.which", return_value="/usr/bin/stub"), \
+             patch("utils.config.Config.MCP_ENABLED", True), \
+             patch("tools.mcp_pool.get_mcp_pool", return_value=pool), \
+             patch.object(pool, "call_tool", side_effect=RuntimeError("server died")), \
+             patch.object(mcp_client.MCPToolkit, "_fallback_search") as fallback:
+            search = mcp_client.search_sync("AI", max_results=2)
+
+        fallback.assert_not_called()
+        assert search["success"] is False and search["source"] == "mcp-error"
+        assert search["results"] == [] and "server died" in search["error"]
+
+    def test_pool_disabled_without_mcp(self):
+        from tools import mcp_pool
+
+        with patch("utils.config.Config.MCP_ENABLED", False), \
+             patch.object(mcp_pool, "_mcp_pool", None), \
+             patch.object(mcp_pool, "_mcp_pool_checked", False):
+            assert mcp_pool.get_mcp_pool() is None
@@ -0,0 +1,192 @@
+"""
+병렬 URL 조회 테스트
+
+느리게 응답하는 로컬 HTTP 서버로 execute_web_search 의 URL 조회를 검증합니다.
+- URL 조회와 검색 쿼리 동시 실행
+- 공유 마감 시간 도달 시 부분 결과 반환
+- 호스트별 동시 요청 수 제한
+- 스트리밍 크기 제한 / 본문 추출 예산
+
+실행:
+    pytest tests/test_parallel_url_ingestion.py -v
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from tools import web_search_executor
+from tools.mcp_client import MCPToolkit, html_to_text
+from tools.search_cache import SearchCache
+
+
+class _SlowServer(ThreadingHTTPServer):
+    """경로별로 지연/크기를 조절하는 HTTP 서버 (최대 동시 처리 수 기록)"""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def url(self, path: str) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}{path}"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """
+    /fast/<name>        즉시 응답
+    /slow/<sec>/<name>  sec초 후 응답
+    /huge               본문 5MB (Content-Length 없음, 스트리밍)
+    /binary             application/octet-stream
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.active += 1
+            self.server.max_active = max(self.server.max_active, self.server.active)
+        try:
+            parts = self.path.strip("/").split("/")
+            if parts[0] == "slow":
+                time.sleep(float(parts[1]))
+            if parts[0] == "huge":
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                chunk = ("<p>" + "가" * 1000 + "</p>").encode()
+                try:
+                    for _ in range(2000):
+                        self.wfile.write(chunk)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+                return
+
+            content_type = "application/octet-stream" if parts[0] == "binary" else "text/html"
+            body = f"<html><script>var x;</script><body><h1>{parts[-1]}</h1><p>시장 규모 본문</p></body></html>".encode()
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with self.server.lock:
+                self.server.active -= 1
+
+
+@pytest.fixture
+def server():
+    server = _SlowServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def offline_fetch():
+    """MCP 비활성 + 로컬 서버 허용 (SSRF 검사 우회)"""
+    with patch("utils.config.Config.MCP_ENABLED", False), \
+         patch("tools.mcp_client._is_safe_url", return_value=True):
+        yield
+
+
+def _no_search():
+    return patch.object(web_search_executor, "should_search_web",
+                        return_value={"should_search": False, "search_query": [], "reason": "test"})
+
+
+class TestParallelFetch:
+    """URL 동시 조회 + 마감 시간"""
+
+    def test_slow_site_does_not_block_others(self, server, offline_fetch):
+        urls = [server.url("/slow/1.0/a"), server.url("/fast/b"), server.url("/fast/c")]
+
+        start = time.perf_counter()
+        with _no_search():
+            result = web_search_executor.execute_web_search(" ".join(urls), deadline_sec=5)
+        elapsed = time.perf_counter() - start
+
+        assert result["urls"] == urls  # 입력 순서 유지
+        assert result["partial"] is False
+        assert elapsed < 1.8  # 순차 실행이면 1.0 + α, 병렬이면 가장 느린 1개 수준
+
+    def test_deadline_returns_partial_results(self, server, offline_fetch):
+        slow, fast = server.url("/slow/3/a"), server.url("/fast/b")
+
+        start = time.perf_counter()
+        with _no_search():
+            result = web_search_executor.execute_web_search(f"{slow} {fast}", deadline_sec=0.5)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 1.5
+        assert result["partial"] is True
+        assert result["timed_out"] == [slow]
+        assert result["urls"] == [fast]
+        assert "시장 규모 본문" in result["context"]
+
+    def test_urls_and_queries_run_together(self, server, offline_fetch):
+        decision = {"should_search": True, "search_query": ["시장 규모"], "reason": "test"}
+
+        def slow_search(q, search_depth="basic"):
+            time.sleep(0.8)
+            return {"success": True, "results": [{"title": "리포트", "url": "https://example.com/r", "snippet": "요약"}]}
+
+        start = time.perf_counter()
+        with patch.object(web_search_executor, "should_search_web", return_value=decision), \
+             patch.object(web_search_executor, "search_sync", side_effect=slow_search), \
+             patch.object(web_search_executor, "get_search_cache", return_value=SearchCache()):
+            result = web_search_executor.execute_web_search(server.url("/slow/0.8/a"), deadline_sec=5)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 1.4
+        assert server.url("/slow/0.8/a") in result["urls"]
+        assert any(s["url"] == "https://example.com/r" for s in result["sources"])
+
+    def test_per_host_limit(self, server, offline_fetch):
+        urls = [server.url(f"/slow/0.3/{name}") for name in ("a", "b", "c")]
+
+        with _no_search(), \
+             patch("utils.settings.settings.WEB_FETCH_PER_HOST_LIMIT", 1), \
+             patch.object(web_search_executor, "_host_semaphores", {}):
+            result = web_search_executor.execute_web_search(" ".join(urls), deadline_sec=5)
+
+        assert server.max_active == 1
+        assert len(result["urls"]) == 3
+
+
+class TestFetchLimits:
+    """스트리밍 크기 제한 / 본문 추출 예산"""
+
+    def test_streaming_size_limit(self, server, offline_fetch):
+        with patch("utils.settings.settings.WEB_FETCH_MAX_BYTES", 50_000):
+            start = time.perf_counter()
+            content = MCPToolkit(use_mcp=False)._fallback_fetch(server.url("/huge"), max_length=100_000)
+
+        assert content.startswith("가")
+        assert len(content.encode()) <= 50_000
+        assert time.perf_counter() - start < 2.0
+
+    def test_binary_content_skipped(self, server, offline_fetch):
+        content = MCPToolkit(use_mcp=False)._fallback_fetch(server.url("/binary"))
+
+        assert content.startswith("[웹 조회 실패")
+
+    def test_html_to_text_budget(self):
+        html = "<p>앞부분</p>" + "<div>" + "나" * 1000 + "</div>" * 1 + "<p>뒷부분</p>"
+
+        assert "뒷부분" in html_to_text(html, max_length=5000)
+        assert "뒷부분" not in html_to_text(html, max_length=5000, budget_chars=200)
+        assert html_to_text("<script>x</script><p>본문</p>") == "본문"
+        assert len(html_to_text(html, max_length=50)) == 50
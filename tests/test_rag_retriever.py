@@ -186,3 +186,72 @@ class TestIntegration:
         results = retriever.get_relevant_documents("")
 
         assert isinstance(results, list)
+
+
+class TestMultiQueryConcurrency:
+    """Multi-Query 병렬 검색 검증"""
+
+    class _SlowStore:
+        """검색마다 지연이 있는 가짜 벡터스토어"""
+
+        def __init__(self, docs, delay=0.2):
+            self.docs = docs
+            self.delay = delay
+            self.embeddings = MagicMock()
+            self.embeddings.embed_documents.side_effect = lambda qs: [[float(i)] for i, _ in enumerate(qs)]
+
+        def max_marginal_relevance_search_by_vector(self, embedding, k, fetch_k, lambda_mult):
+            import time
+            time.sleep(self.delay)
+            return list(self.docs)
+
+    def _doc(self, content):
+        doc = MagicMock()
+        doc.page_content = content
+        doc.metadata = {}
+        return doc
+
+    @patch('rag.retriever.load_vectorstore')
+    def test_queries_embedded_in_single_batch(self, mock_load):
+        """변형 쿼리 임베딩은 embed_documents 1회"""
+        from rag.retriever import Retriever
+
+        store = self._SlowStore([self._doc("a")], delay=0)
+        mock_load.return_value = store
+
+        retriever = Retriever(k=3, use_multi_query=True, multi_query_n=3)
+        retriever.get_relevant_documents("기획서 작성법")
+
+        assert store.embeddings.embed_documents.call_count == 1
+        assert store.embeddings.embed_query.call_count == 0
+
+    @patch('rag.retriever.load_vectorstore')
+    def test_searches_run_concurrently(self, mock_load):
+        """쿼리 N개 검색 지연 ≈ 단일 쿼리 지연"""
+        import time
+        from rag.retriever import Retriever
+
+        delay = 0.2
+        mock_load.return_value = self._SlowStore([self._doc("a")], delay=delay)
+        retriever = Retriever(k=3, use_multi_query=True, multi_query_n=3)
+
+        start = time.perf_counter()
+        results = retriever._search_queries(["q1", "q2", "q3"], k=6)
+        elapsed = time.perf_counter() - start
+
+        assert len(results) == 3
+        assert elapsed < delay * 2
+
+    @patch('rag.retriever.load_vectorstore')
+    def test_dedup_is_exact(self, mock_load):
+        """앞 200자가 같아도 내용이 다르면 별개 문서로 유지"""
+        from rag.retriever import Retriever
+
+        prefix = "가" * 200
+        docs = [self._doc(prefix + "A"), self._doc(prefix + "B"), self._doc(prefix + "A")]
+        mock_load.return_value = self._SlowStore(docs, delay=0)
+
+        retriever = Retriever(k=10, use_multi_query=True, multi_query_n=3)
+        results = retriever._multi_query_retrieve("기획서")
+
+        assert [d.page_content[-1] for d in results] == ["A", "B"]
@@ -0,0 +1,323 @@
+"""
+Azure OpenAI Rate Limiter 테스트
+
+utils/rate_limiter.py 의 배포별 토큰 버킷을 검증합니다.
+- 토큰 추정 (한글/영문, max_tokens 예약, 임베딩) / 요청 경로 → 배포 이름
+- 버킷 대기, 우선순위 순서 (INTERACTIVE > BACKGROUND), 대기 시간 초과 시 대기열 정리 / SDK 재시도 없음
+- 응답 헤더 보정 (remaining / limit) 및 429 Retry-After 일시 정지
+- 한도를 강제하는 가짜 Azure OpenAI 서버 + 실제 AzureChatOpenAI: 동시 호출 시 429 제거
+- 설정: 한도가 명시된 배포만 제한, AOAI_DEPLOY_* 키 치환
+- get_llm 공유 HTTP 클라이언트 연결, with_retry 의 Retry-After 준수
+
+실행:
+    pytest tests/test_rate_limiter.py -v
+"""
+
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from benchmarks.fake_aoai_server import FakeAzureOpenAIServer
+from utils.rate_limiter import (
+    BACKGROUND,
+    INTERACTIVE,
+    DeploymentLimiter,
+    RateLimitedTransport,
+    RateLimiterRegistry,
+    RateLimitWaitTimeout,
+    current_priority,
+    estimate_request_tokens,
+    estimate_text_tokens,
+    llm_priority,
+    load_rate_limit_config,
+    parse_llm_request,
+)
+
+
+def _registry(rpm, tpm, burst_sec=60.0, **deployments):
+    return RateLimiterRegistry({
+        "default": {"rpm": rpm, "tpm": tpm, "burst_sec": burst_sec},
+        "default_completion_tokens": 100,
+        "deployments": deployments,
+    })
+
+
+def _chat_model(server, http_client, max_retries=0):
+    from langchain_openai import AzureChatOpenAI
+
+    return AzureChatOpenAI(
+        azure_endpoint=server.endpoint,
+        api_key="fake",
+        api_version="2024-08-01-preview",
+        azure_deployment="gpt-4o",
+        max_tokens=50,
+        max_retries=max_retries,
+        http_client=http_client,
+    )
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not met"
+        time.sleep(0.005)
+
+
+class TestEstimation:
+    """토큰 추정 / 요청 해석"""
+
+    def test_text_tokens(self):
+        assert estimate_text_tokens("") == 0
+        assert estimate_text_tokens("a" * 400) == 100
+        assert estimate_text_tokens("가" * 150) == 100  # 한글은 문자당 토큰이 더 많음
+
+    def test_request_tokens(self):
+        body = {"messages": [{"role": "user", "content": "a" * 400}], "max_tokens": 50}
+
+        assert estimate_request_tokens(body) == 4 + 100 + 50
+        assert estimate_request_tokens({"messages": []}, default_completion_tokens=300) == 300
+        assert estimate_request_tokens(b'{"input": ["aaaa", "bbbbbbbb"]}', "embeddings") == 3
+        assert estimate_request_tokens(b"not json") > 0
+
+    def test_parse_request_path(self):
+        assert parse_llm_request("/openai/deployments/gpt-4o/chat/completions") == ("gpt-4o", "chat")
+        assert parse_llm_request("/openai/deployments/emb/embeddings") == ("emb", "embeddings")
+        assert parse_llm_request("/openai/v1/chat/completions", {"model": "mini"}) == ("mini", "chat")
+        assert parse_llm_request("/openai/models") == (None, None)
+
+    def test_repo_config(self):
+        config = load_rate_limit_config()
+
+        assert config["default"]["burst_sec"] > 0
+        assert "rpm" not in config["default"]  # 한도를 추측하지 않음
+        assert load_rate_limit_config("/nonexistent.yaml")["deployments"] == {}
+
+    def test_config_keys_resolve_deploy_names(self, tmp_path, monkeypatch):
+        from utils.config import Config
+
+        monkeypatch.setattr(Config, "AOAI_DEPLOY_GPT4O", "prod-4o")
+        path = tmp_path / "limits.yaml"
+        path.write_text("deployments:\n  AOAI_DEPLOY_GPT4O: {rpm: 6, tpm: 1000}\n  custom: {rpm: 1, tpm: 10}\n",
+                        encoding="utf-8")
+
+        assert set(load_rate_limit_config(str(path))["deployments"]) == {"prod-4o", "custom"}
+
+    def test_unconfigured_deployment_not_limited(self):
+        registry = RateLimiterRegistry({"default": {"burst_sec": 1.0}, "deployments": {"gpt-4o": {"rpm": 6, "tpm": 1000}}})
+        calls = []
+        transport = RateLimitedTransport(registry, httpx.MockTransport(lambda r: calls.append(r) or httpx.Response(200)))
+
+        with httpx.Client(transport=transport) as client:
+            client.post("http://aoai/openai/deployments/other/chat/completions", json={"messages": []})
+
+        assert registry.get("other") is None and len(calls) == 1
+        assert registry.get("gpt-4o").rpm == 6 and "other" not in registry.get_stats()
+
+
+class TestDeploymentLimiter:
+    """버킷 / 대기열"""
+
+    def test_waits_for_refill(self):
+        limiter = DeploymentLimiter("gpt-4o", rpm=600, tpm=10**6, burst_sec=0.1)  # 0.1초마다 1건
+
+        assert limiter.acquire(10) < 0.01
+        waited = limiter.acquire(10)
+
+        assert 0.05 < waited < 0.5
+        stats = limiter.get_stats()
+        assert stats["calls"] == 2 and stats["waited_calls"] == 1
+        assert stats["wait_ms"]["max"] >= 50
+
+    def test_interactive_served_before_background(self):
+        limiter = DeploymentLimiter("gpt-4o", rpm=600, tpm=10**6, burst_sec=0.1)
+        limiter.observe(429, {"retry-after-ms": "200"})
+        order = []
+
+        def call(name, priority):
+            limiter.acquire(10, priority)
+            order.append(name)
+
+        threads = [threading.Thread(target=call, args=(f"bg{i}", BACKGROUND)) for i in range(3)]
+        for i, t in enumerate(threads):
+            t.start()
+            _wait_for(lambda: limiter.get_stats()["queue_depth"] == i + 1)
+        interactive = threading.Thread(target=call, args=("hitl", INTERACTIVE))
+        interactive.start()
+        for t in threads + [interactive]:
+            t.join()
+
+        assert order == ["hitl", "bg0", "bg1", "bg2"]
+        by_priority = limiter.get_stats()["by_priority"]
+        assert by_priority["interactive"]["mean_wait_ms"] < by_priority["background"]["mean_wait_ms"]
+
+    def test_timeout_leaves_queue(self):
+        limiter = DeploymentLimiter("gpt-4o", rpm=60, tpm=1000)
+        limiter.acquire(1000)
+
+        with pytest.raises(RateLimitWaitTimeout):
+            limiter.acquire(500, timeout=0.05)
+
+        stats = limiter.get_stats()
+        assert stats["queue_depth"] == 0 and stats["timeouts"] == 1
+
+    def test_headers_adjust_bucket(self):
+        limiter = DeploymentLimiter("gpt-4o", rpm=600, tpm=100_000)
+        limiter.acquire(100)
+        limiter.observe(200, {"x-ratelimit-remaining-tokens": "0",
+                              "x-ratelimit-limit-requests": "120", "x-ratelimit-limit-tokens": "6000"}, 100)
+
+        stats = limiter.get_stats()
+        assert (stats["rpm"], stats["tpm"]) == (120, 6000)
+        assert stats["available_tokens"] < 50
+        assert stats["header_updates"] == 1 and stats["inflight"] == 0
+
+    def test_429_pauses_deployment(self):
+        limiter = DeploymentLimiter("gpt-4o", rpm=6000, tpm=10**6)
+        limiter.observe(429, {"retry-after-ms": "150"})
+
+        assert limiter.pause_remaining() > 0.1
+        assert limiter.acquire(10) >= 0.1
+        assert limiter.get_stats()["throttled_429"] == 1
+
+    def test_priority_context(self):
+        assert current_priority() == 1
+        with llm_priority(INTERACTIVE):
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                assert executor.submit(contextvars.copy_context().run, current_priority).result() == INTERACTIVE
+            with llm_priority(99):
+                assert current_priority() == BACKGROUND
+        assert current_priority() == 1
+
+
+class TestFakeServer:
+    """가짜 Azure OpenAI 서버 + 실제 AzureChatOpenAI"""
+
+    LIMITS = {"gpt-4o": (600, 200_000)}
+
+    def _burst(self, llm, calls=24, threads=8):
+        def call(_):
+            try:
+                return llm.invoke("시장 분석 요약").content
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            return list(executor.map(call, range(calls)))
+
+    def test_unlimited_burst_gets_429(self):
+        with FakeAzureOpenAIServer(limits=self.LIMITS, burst_sec=1.0) as server, httpx.Client() as client:
+            results = self._burst(_chat_model(server, client))
+
+        assert server.get_stats()["gpt-4o"]["throttled"] > 0
+        assert any(isinstance(r, Exception) for r in results)
+
+    def test_limited_burst_has_no_429(self):
+        registry = _registry(600, 200_000, burst_sec=1.0)
+        with FakeAzureOpenAIServer(limits=self.LIMITS, burst_sec=1.0) as server, \
+                httpx.Client(transport=RateLimitedTransport(registry)) as client:
+            results = self._burst(_chat_model(server, client))
+
+        assert all(r == "[gpt-4o] 응답" for r in results)
+        served = server.get_stats()["gpt-4o"]
+        assert (served["served"], served["throttled"]) == (24, 0)
+        stats = registry.get_stats()["gpt-4o"]
+        assert stats["waited_calls"] > 0 and stats["header_updates"] == 24
+
+    def test_learns_limits_from_headers(self):
+        registry = _registry(6000, 10**6, burst_sec=1.0)  # 실제 한도보다 크게 설정된 경우
+        with FakeAzureOpenAIServer(limits=self.LIMITS, burst_sec=1.0, send_limit_headers=True) as server, \
+                httpx.Client(transport=RateLimitedTransport(registry)) as client:
+            llm = _chat_model(server, client)
+            llm.invoke("첫 호출")
+            results = self._burst(llm, calls=16)
+
+        assert registry.get_stats()["gpt-4o"]["rpm"] == 600
+        assert all(isinstance(r, str) for r in results)
+        assert server.get_stats()["gpt-4o"]["throttled"] <= 1
+
+    def test_sdk_retry_waits_in_limiter_after_429(self):
+        registry = _registry(6000, 10**6)
+        with FakeAzureOpenAIServer(limits={"gpt-4o": (60, 10**6)}, burst_sec=1.0) as server, \
+                httpx.Client(transport=RateLimitedTransport(registry)) as client:
+            llm = _chat_model(server, client, max_retries=2)
+            llm.invoke("첫 호출")
+            assert llm.invoke("두 번째 호출").content  # 429 → Limiter 일시 정지 → SDK 재시도 성공
+
+        assert registry.get_stats()["gpt-4o"]["throttled_429"] >= 1
+        assert server.get_stats()["gpt-4o"]["served"] == 2
+
+    def test_wait_timeout_not_retried_by_sdk(self):
+        import openai
+
+        registry = _registry(60, 100)
+        registry.max_wait = 0.05
+        with FakeAzureOpenAIServer(limits={"gpt-4o": (6000, 10**6)}) as server, \
+                httpx.Client(transport=RateLimitedTransport(registry)) as client:
+            llm = _chat_model(server, client, max_retries=3)
+            llm.invoke("첫 호출")  # 토큰 버킷 소진
+            with pytest.raises(openai.RateLimitError) as exc_info:
+                llm.invoke("두 번째 호출")
+
+        assert exc_info.value.code == "rate_limit_wait_timeout"
+        assert registry.get_stats()["gpt-4o"]["timeouts"] == 1  # SDK 재시도로 다시 대기하지 않음
+        assert server.get_stats()["gpt-4o"]["served"] == 1
+
+
+class TestIntegration:
+    """LLM 클라이언트 연결 / Retry"""
+
+    def test_get_llm_uses_shared_client(self):
+        from utils import llm
+        from utils.rate_limiter import get_rate_limited_http_client
+
+        calls = []
+        llm._get_cached_llm.cache_clear()
+        try:
+            with patch.object(llm, "AzureChatOpenAI", side_effect=lambda **kw: calls.append(kw) or kw):
+                with patch("utils.settings.settings.LLM_RATE_LIMIT_ENABLED", True):
+                    enabled = llm.get_llm(temperature=0.7)
+                    shared = get_rate_limited_http_client()
+                llm._get_cached_llm.cache_clear()
+                with patch("utils.settings.settings.LLM_RATE_LIMIT_ENABLED", False):
+                    disabled = llm.get_llm(temperature=0.7)
+        finally:
+            llm._get_cached_llm.cache_clear()
+
+        assert enabled["http_client"] is shared
+        assert isinstance(enabled["http_client"]._transport, RateLimitedTransport)
+        assert "http_client" not in disabled
+
+    def test_with_retry_honors_retry_after(self):
+        from utils.retry import RetryConfig, with_retry
+
+        response = httpx.Response(429, headers={"retry-after-ms": "250"},
+                                  request=httpx.Request("POST", "http://aoai/x"))
+        attempts = []
+
+        @with_retry(RetryConfig(max_attempts=2, initial_wait=30.0), on_retry=lambda *a: None)
+        def call():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise httpx.HTTPStatusError("429 Too Many Requests", request=response.request, response=response)
+            return "ok"
+
+        with patch("utils.retry.time.sleep") as sleep:
+            assert call() == "ok"
+
+        sleep.assert_called_once_with(0.25)
+
+    def test_with_retry_skips_should_not_retry(self):
+        from utils.retry import is_retriable_error
+
+        request = httpx.Request("POST", "http://aoai/x")
+        final = httpx.Response(429, headers={"x-should-retry": "false"}, request=request)
+        error = httpx.HTTPStatusError("429 Too Many Requests", request=request, response=final)
+
+        assert not is_retriable_error(error)
+        assert is_retriable_error(httpx.HTTPStatusError("429 Too Many Requests", request=request,
+                                                        response=httpx.Response(429, request=request)))
@@ -0,0 +1,141 @@
+"""
+Reranker 점수 캐시 테스트
+
+Cross-Encoder 점수 캐시 동작을 검증합니다.
+- 캐시 미스만 모델에 배치 전달
+- 쿼리 정규화 / 모델 이름별 분리
+- 최대 항목 수 초과 시 LRU 제거
+- 반복 쿼리 워크로드의 CPU 시간 비교
+
+실행:
+    pytest tests/test_rerank_cache.py -v
+"""
+
+import hashlib
+import time
+import pytest
+from unittest.mock import MagicMock, patch
+
+
+class _CpuBoundModel:
+    """쌍마다 CPU를 소모하는 가짜 Cross-Encoder"""
+
+    def __init__(self, rounds=3000):
+        self.rounds = rounds
+        self.predicted_pairs = 0
+        self.calls = 0
+
+    def predict(self, pairs):
+        self.calls += 1
+        self.predicted_pairs += len(pairs)
+        scores = []
+        for query, content in pairs:
+            digest = f"{query}|{content}".encode("utf-8")
+            for _ in range(self.rounds):
+                digest = hashlib.sha256(digest).digest()
+            scores.append(digest[0] / 255.0)
+        return scores
+
+
+def _doc(content, metadata=None):
+    doc = MagicMock()
+    doc.page_content = content
+    doc.metadata = dict(metadata or {})
+    return doc
+
+
+class TestRerankScoreCache:
+    """RerankScoreCache 단위 테스트"""
+
+    def test_query_normalization(self):
+        """대소문자/공백 차이는 같은 키"""
+        from rag.reranker import RerankScoreCache
+
+        a = RerankScoreCache.make_key("  SaaS   기획서 ", "chunk", "m")
+        b = RerankScoreCache.make_key("saas 기획서", "chunk", "m")
+        c = RerankScoreCache.make_key("saas 기획서", "chunk", "other-model")
+        assert a == b
+        assert a != c
+
+    def test_persists_across_instances(self, tmp_path):
+        """같은 DB 파일을 여는 새 인스턴스(재시작)에서도 히트"""
+        from rag.reranker import RerankScoreCache
+
+        db = str(tmp_path / "scores.db")
+        key = RerankScoreCache.make_key("q", "c", "m")
+        RerankScoreCache(db).put_many({key: 0.42})
+
+        assert RerankScoreCache(db).get_many([key]) == {key: 0.42}
+
+    def test_size_bounded_eviction(self):
+        """최대 항목 수 초과 시 가장 오래 사용되지 않은 항목 제거"""
+        from rag.reranker import RerankScoreCache
+
+        cache = RerankScoreCache(":memory:", max_entries=3)
+        cache.put_many({"a": 1.0})
+        cache.put_many({"b": 2.0})
+        cache.put_many({"c": 3.0})
+        cache.get_many(["a"])  # a 사용 시각 갱신
+        cache.put_many({"d": 4.0})
+
+        remaining = cache.get_many(["a", "b", "c", "d"])
+        assert set(remaining) == {"a", "c", "d"}
+        assert cache.stats()["entries"] == 3
+
+
+class TestRerankWithCache:
+    """rerank_documents / rerank_with_scores 캐시 연동"""
+
+    def test_only_misses_are_predicted(self):
+        """두 번째 호출에서는 새 청크만 모델에 전달"""
+        from rag.reranker import rerank_documents
+
+        model = _CpuBoundModel(rounds=1)
+        docs = [_doc(f"chunk {i}") for i in range(4)]
+        with patch("rag.reranker._get_cross_encoder", return_value=model):
+            rerank_documents("기획서 작성법", docs, top_k=2)
+            rerank_documents("기획서 작성법", docs + [_doc("chunk new")], top_k=2)
+
+        assert model.calls == 2
+        assert model.predicted_pairs == 5
+
+    def test_cached_scores_match_model_scores(self):
+        """캐시 히트 결과와 모델 계산 결과의 순위가 동일"""
+        from rag.reranker import rerank_with_scores
+
+        model = _CpuBoundModel(rounds=1)
+        docs = [_doc(f"chunk {i}") for i in range(5)]
+        with patch("rag.reranker._get_cross_encoder", return_value=model):
+            first = rerank_with_scores("query", docs)
+            second = rerank_with_scores("query", docs)
+
+        assert [d.page_content for _, d in first] == [d.page_content for _, d in second]
+        assert [s for s, _ in first] == pytest.approx([s for s, _ in second])
+        assert model.calls == 1
+
+    def test_hit_rate_and_cpu_time_on_repeated_queries(self):
+        """반복 쿼리 워크로드: 히트율 상승 + CPU 시간 감소"""
+        from rag.reranker import rerank_documents, get_rerank_cache_stats
+
+        docs = [_doc(f"섹션 {i} 작성 원칙", {"Header 1": "가이드"}) for i in range(8)]
+        queries = ["SaaS 기획서 시장 분석", "saas 기획서  시장 분석", "SaaS 기획서 시장 분석"]
+
+        def run(model):
+            start = time.process_time()
+            with patch("rag.reranker._get_cross_encoder", return_value=model):
+                for q in queries:
+                    rerank_documents(q, docs, top_k=3)
+            return time.process_time() - start
+
+        uncached_model = _CpuBoundModel()
+        with patch("rag.reranker.get_rerank_score_cache", return_value=None):
+            uncached_cpu = run(uncached_model)
+
+        cached_model = _CpuBoundModel()
+        cached_cpu = run(cached_model)
+
+        stats = get_rerank_cache_stats()
+        assert uncached_model.predicted_pairs == 24
+        assert cached_model.predicted_pairs == 8
+        assert stats["hits"] == 16 and stats["misses"] == 8
+        assert cached_cpu < uncached_cpu
@@ -0,0 +1,152 @@
+"""
+Reviewer 인용 검증 동시 실행 테스트
+
+agents/reviewer.py 와 rag/validator.py 를 검증합니다.
+- 인용 검증과 Reviewer LLM 호출이 동시에 실행됨 (전체 시간 < 두 지연의 합)
+- 인용 내용 검증은 인용 수와 무관하게 LLM 1회 호출로 일괄 처리
+- 검증 결과 병합 규칙 (위조 인용 / 원문 불일치 / 인용 누락)
+- 구간별 시간 기록 (review["timings_ms"]), Validator 실패 시에도 심사 진행
+
+실행:
+    pytest tests/test_reviewer_concurrency.py -v
+"""
+
+import time
+from unittest.mock import MagicMock, patch
+
+from graph.state import create_initial_state, update_state
+from rag.validator import CitationValidator
+from utils.schemas import CitationCheck, CitationCheckResult, JudgeResult
+
+
+CONTEXT = "[Source 1]\n반려동물 시장은 연 10% 성장합니다.\n[Source 2 > 규제]\n의료 데이터는 동의가 필요합니다."
+
+
+def _judge(score=9, verdict="PASS"):
+    return JudgeResult(overall_score=score, verdict=verdict, feedback_summary="ok")
+
+
+def _state(content):
+    state = create_initial_state("AI 반려동물 앱")
+    return update_state(
+        state,
+        draft={"sections": [{"id": 1, "name": "시장", "content": content}]},
+        rag_context=CONTEXT,
+        generation_preset="balanced",
+    )
+
+
+def _reviewer_llm(result, delay=0.0):
+    def invoke(messages):
+        time.sleep(delay)
+        return result
+
+    llm = MagicMock()
+    llm.with_structured_output.return_value.invoke.side_effect = invoke
+    return llm
+
+
+def _citation_result(**overrides):
+    result = {"valid": True, "issues": [], "score": 1.0, "citation_count": 1,
+              "invalid_citations": [], "content_issues": [], "missing_citations": False}
+    result.update(overrides)
+    return result
+
+
+def _run(content, citation_result=None, judge=None, review_delay=0.0, validate_delay=0.0, validate_error=None):
+    def validate(text, context, check_content=True):
+        time.sleep(validate_delay)
+        if validate_error:
+            raise validate_error
+        return citation_result or _citation_result()
+
+    from agents.reviewer import run
+
+    with patch("agents.reviewer.get_llm", return_value=_reviewer_llm(judge or _judge(), review_delay)), \
+            patch("rag.validator.get_llm"), \
+            patch.object(CitationValidator, "validate", side_effect=validate):
+        return run(_state(content))
+
+
+class TestBatchedContentCheck:
+    """인용 내용 일괄 검증"""
+
+    def _validator(self, checks):
+        validator = CitationValidator.__new__(CitationValidator)
+        validator.llm = MagicMock()
+        checker = validator.llm.with_structured_output.return_value
+        checker.invoke.return_value = CitationCheckResult(checks=checks)
+        return validator, checker
+
+    def test_all_citations_checked_in_one_call(self):
+        validator, checker = self._validator([
+            CitationCheck(index=1, supported=True),
+            CitationCheck(index=2, supported=False, reason="원문에 없는 수치"),
+            CitationCheck(index=3, supported=True),
+        ])
+        text = ("시장은 연 10% 성장합니다 [Source 1]. 동의가 필요합니다 [Source 2]. "
+                "시장 규모는 50조입니다 [Source 1].\n위조 인용 [Source 9].")
+
+        result = validator.validate(text, CONTEXT)
+
+        assert checker.invoke.call_count == 1
+        prompt = checker.invoke.call_args[0][0][1].content
+        assert "1. (Source 1)" in prompt and "3. (Source 1)" in prompt and "Source 9" not in prompt
+        assert "의료 데이터는 동의가 필요합니다." in prompt  # 인용된 출처 원문만 포함
+        assert result["invalid_citations"] == ["Source 9"]
+        assert len(result["content_issues"]) == 1 and "원문에 없는 수치" in result["content_issues"][0]
+        assert result["valid"] is False and result["missing_citations"] is False
+
+    def test_no_llm_call_without_citations(self):
+        validator, checker = self._validator([])
+
+        result = validator.validate("인용 없는 본문입니다.", CONTEXT)
+
+        checker.invoke.assert_not_called()
+        assert result["missing_citations"] is True and result["content_issues"] == []
+
+
+class TestConcurrentReview:
+    """동시 실행 / 병합 / 시간 기록"""
+
+    def test_halves_run_concurrently(self):
+        start = time.perf_counter()
+        result = _run("본문 [Source 1].", review_delay=0.3, validate_delay=0.3)
+        elapsed = time.perf_counter() - start
+
+        timings = result["review"]["timings_ms"]
+        assert elapsed < 0.5  # 순차 실행이면 0.6초 이상
+        assert timings["citation_validation"] >= 300 and timings["review_llm"] >= 300
+        assert timings["total"] < timings["citation_validation"] + timings["review_llm"]
+
+    def test_invalid_citation_becomes_critical_issue(self):
+        citation = _citation_result(valid=False, invalid_citations=["Source 9"], issues=["존재하지 않는 출처 인용: Source 9"])
+
+        review = _run("본문 [Source 9].", citation)["review"]
+
+        assert review["verdict"] == "REVISE" and review["overall_score"] == 5
+        assert any("Source 9" in issue for issue in review["critical_issues"])
+        assert review["action_items"] and review["citation_check"] == citation
+
+    def test_content_issue_becomes_weakness(self):
+        citation = _citation_result(valid=False, content_issues=["인용 내용 불일치 가능성 (Source 1): ..."])
+
+        review = _run("본문 [Source 1].", citation, judge=_judge(10, "PASS"))["review"]
+
+        assert review["verdict"] == "REVISE" and review["overall_score"] == 8
+        assert review["critical_issues"] == []
+        assert any("Source 1" in w for w in review["weaknesses"])
+
+    def test_missing_citations_keep_score(self):
+        review = _run("인용 없는 본문.", _citation_result(valid=False, missing_citations=True))["review"]
+
+        assert (review["verdict"], review["overall_score"]) == ("PASS", 9)
+        assert any("인용" in w for w in review["weaknesses"])
+
+    def test_validator_failure_does_not_block_review(self):
+        result = _run("본문 [Source 1].", validate_error=RuntimeError("boom"))
+        review = result["review"]
+
+        assert (review["verdict"], review["overall_score"]) == ("PASS", 9)
+        assert "citation_check" not in review and "citation_validation" in review["timings_ms"]
+        assert not result.get("error")
@@ -0,0 +1,225 @@
+"""
+웹 검색 캐시 테스트
+
+SearchCache의 2단계(메모리 + SQLite) 캐시 동작을 가짜 Tavily 엔드포인트로 검증합니다.
+- 재시작/다른 워커에서 SQLite 계층 히트
+- 쿼리 유형별 TTL 만료
+- 동시 동일 쿼리 미스 병합 (Single-flight)
+- execute_web_search 결과에 캐시 통계 포함
+
+실행:
+    pytest tests/test_search_cache.py -v
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+import requests
+
+
+class _FakeTavilyHandler(BaseHTTPRequestHandler):
+    """POST /search 요청을 세고 고정 결과를 반환하는 가짜 Tavily"""
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        with self.server.lock:
+            self.server.hits += 1
+        time.sleep(self.server.delay)
+        body = json.dumps({
+            "results": [{
+                "title": f"결과: {payload.get('query')}",
+                "url": "https://example.com/report",
+                "content": "시장 규모 리포트",
+            }]
+        }).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fake_tavily():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeTavilyHandler)
+    server.hits = 0
+    server.delay = 0.0
+    server.lock = threading.Lock()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _search_fn(server, query):
+    """가짜 Tavily 호출 → search_sync 형식 결과"""
+    def fetch():
+        url = f"http://127.0.0.1:{server.server_address[1]}/search"
+        data = requests.post(url, json={"query": query}, timeout=5).json()
+        results = [
+            {"title": r["title"], "url": r["url"], "snippet": r["content"]}
+            for r in data["results"]
+        ]
+        return {"success": True, "query": query, "results": results, "source": "tavily"}
+    return fetch
+
+
+class TestQueryClassification:
+    """쿼리 유형 분류 / TTL"""
+
+    def test_classify_query(self):
+        from tools.search_cache import classify_query
+
+        assert classify_query("AI 헬스케어 최신 동향") == "news"
+        assert classify_query("2025 피트니스 앱 시장 규모") == "news"
+        assert classify_query("린 캔버스 개념") == "evergreen"
+        assert classify_query("피트니스 앱 경쟁사") == "general"
+
+    def test_news_expires_before_evergreen(self):
+        """뉴스 쿼리는 evergreen보다 먼저 만료"""
+        from tools.search_cache import SearchCache
+
+        now = [1000.0]
+        cache = SearchCache(ttl_by_class={"news": 60, "evergreen": 3600}, clock=lambda: now[0])
+        cache.set("AI 최신 뉴스", {"success": True})
+        cache.set("린 캔버스 개념", {"success": True})
+
+        now[0] += 120
+        assert cache.get("AI 최신 뉴스") is None
+        assert cache.get("린 캔버스 개념") is not None
+        assert cache.stats()["expired"] == 1
+
+
+class TestPersistentTier:
+    """SQLite 계층"""
+
+    def test_second_worker_hits_disk(self, tmp_path, fake_tavily):
+        """다른 프로세스(새 인스턴스)는 SQLite에서 히트"""
+        from tools.search_cache import SearchCache
+
+        db = str(tmp_path / "search_cache.db")
+        query = "피트니스 앱 경쟁사"
+        worker_a = SearchCache(db_path=db)
+        worker_b = SearchCache(db_path=db)
+
+        result_a, source_a = worker_a.get_or_fetch(query, _search_fn(fake_tavily, query))
+        result_b, source_b = worker_b.get_or_fetch(query, _search_fn(fake_tavily, query))
+
+        assert (source_a, source_b) == ("fetched", "disk")
+        assert result_b == result_a
+        assert fake_tavily.hits == 1
+        assert worker_b.stats()["disk_hits"] == 1
+
+    def test_expired_disk_entry_is_refetched(self, tmp_path, fake_tavily):
+        """TTL이 지난 디스크 항목은 다시 검색"""
+        from tools.search_cache import SearchCache
+
+        db = str(tmp_path / "search_cache.db")
+        now = [1000.0]
+        query = "AI 최신 동향"
+        SearchCache(db_path=db, clock=lambda: now[0]).get_or_fetch(query, _search_fn(fake_tavily, query))
+
+        now[0] += 7 * 3600  # news TTL(6h) 경과
+        _, source = SearchCache(db_path=db, clock=lambda: now[0]).get_or_fetch(
+            query, _search_fn(fake_tavily, query)
+        )
+
+        assert source == "fetched"
+        assert fake_tavily.hits == 2
+
+    def test_failed_result_not_cached(self, tmp_path):
+        """success=False 결과는 저장하지 않음"""
+        from tools.search_cache import SearchCache
+
+        cache = SearchCache(db_path=str(tmp_path / "c.db"))
+        cache.get_or_fetch("q", lambda: {"success": False, "error": "timeout"})
+
+        assert cache.get("q") is None
+
+
+class TestSingleFlight:
+    """동시 동일 쿼리 미스 병합"""
+
+    def test_concurrent_misses_issue_one_request(self, fake_tavily):
+        from tools.search_cache import SearchCache
+
+        fake_tavily.delay = 0.3
+        cache = SearchCache()
+        query = "반려동물 플랫폼 시장"
+        sources = []
+
+        def worker():
+            _, source = cache.get_or_fetch(query, _search_fn(fake_tavily, query))
+            sources.append(source)
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert fake_tavily.hits == 1
+        assert sorted(sources) == ["coalesced"] * 4 + ["fetched"]
+        assert cache.stats()["coalesced"] == 4
+
+    def test_leader_error_propagates_to_waiters(self):
+        from tools.search_cache import SearchCache
+
+        cache = SearchCache()
+        started = threading.Event()
+        errors = []
+
+        def failing_fetch():
+            started.set()
+            time.sleep(0.2)
+            raise ConnectionError("tavily down")
+
+        def worker():
+            try:
+                cache.get_or_fetch("q", failing_fetch)
+            except ConnectionError as e:
+                errors.append(e)
+
+        leader = threading.Thread(target=worker)
+        leader.start()
+        started.wait()
+        follower = threading.Thread(target=worker)
+        follower.start()
+        leader.join()
+        follower.join()
+
+        assert len(errors) == 2
+
+
+class TestExecutorIntegration:
+    """execute_web_search 캐시 통계 노출"""
+
+    def test_execute_web_search_reports_cache_stats(self, fake_tavily):
+        from tools import web_search_executor
+        from tools.search_cache import SearchCache
+
+        cache = SearchCache()
+        decision = {"should_search": True, "search_query": ["시장 규모", "시장 규모"], "reason": "test"}
+
+        def fake_search_sync(q, search_depth="basic"):
+            return _search_fn(fake_tavily, q)()
+
+        with patch.object(web_search_executor, "should_search_web", return_value=decision), \
+             patch.object(web_search_executor, "search_sync", side_effect=fake_search_sync), \
+             patch.object(web_search_executor, "get_search_cache", return_value=cache), \
+             patch.object(web_search_executor, "get_cache_stats", side_effect=cache.stats):
+            result = web_search_executor.execute_web_search("반려동물 플랫폼")
+
+        assert result["error"] is None
+        assert result["urls"] == ["https://example.com/report"]
+        assert fake_tavily.hits == 1
+        assert result["cache_stats"]["misses"] >= 1
@@ -0,0 +1,246 @@
+"""
+섹션 단위 재작성(Section-scoped Refinement) 테스트
+
+Refiner가 target_sections를 지정하면 Writer가 해당 섹션만 다시 작성하여
+이전 초안에 끼워 넣는지 검증합니다.
+- 대상 섹션 해석 (ID / 이름 / 부분 일치)
+- Splice: 비대상 섹션 byte 단위 유지, 순서 유지, 컨텍스트에 있는 출처의 인용만 보존
+- 개선 라운드 출력 토큰 감소 (출력 토큰을 세는 가짜 LLM), 끼워 넣은 초안 Self-Reflection 검증
+- Structurer: 섹션 단위 라운드에서 기존 구조 유지
+
+실행:
+    pytest tests/test_section_refinement.py -v
+"""
+
+import re
+from unittest.mock import MagicMock, patch
+
+from agents.helpers.section_refine import (
+    get_target_sections,
+    resolve_target_indexes,
+    splice_sections,
+)
+from utils.schemas import DraftResult
+
+
+SECTION_NAMES = ["개요", "문제 정의", "시장 분석", "핵심 기능", "비즈니스 모델", "리스크", "로드맵"]
+
+
+RAG_CONTEXT = "\n".join(f"[Source {i + 1} > {name}]\n{name} 참고 문서" for i, name in enumerate(SECTION_NAMES))
+
+
+def _section_body(name: str, version: int) -> str:
+    return f"{name} 본문 v{version}. " + "상세 설명 문장입니다. " * 40 + f"[Source {SECTION_NAMES.index(name) + 1}]"
+
+
+class _TokenCountingLLM:
+    """
+    출력 토큰(공백 단위)을 라운드별로 세는 가짜 Structured LLM
+
+    섹션 재작성 프롬프트에 "[섹션 N] 이름" 표기가 있으면 해당 섹션만,
+    없으면 전체 섹션을 출력합니다.
+    """
+
+    def __init__(self):
+        self.round = 0
+        self.output_tokens = []
+
+    def with_structured_output(self, schema):
+        return self
+
+    def invoke(self, messages):
+        self.round += 1
+        prompt = messages[-1]["content"]
+        targets = re.findall(r"### \[섹션 (\d+)\] (.+)", prompt)
+        if not targets:
+            targets = [(str(i + 1), name) for i, name in enumerate(SECTION_NAMES)]
+
+        sections = [
+            {"id": int(sec_id), "name": name.strip(), "content": f"{name.strip()} 개선본 r{self.round}. " + "보강된 내용입니다. " * 40}
+            for sec_id, name in targets
+        ]
+        self.output_tokens.append(sum(len(s["content"].split()) for s in sections))
+        return DraftResult(sections=sections)
+
+
+def _previous_draft():
+    return {
+        "sections": [
+            {"id": i + 1, "name": name, "content": _section_body(name, 1)}
+            for i, name in enumerate(SECTION_NAMES)
+        ]
+    }
+
+
+def _refine_state(draft, targets):
+    return {
+        "user_input": "반려동물 헬스케어 앱",
+        "generation_preset": "fast",
+        "analysis": {"topic": "반려동물 헬스케어", "doc_type": "web_app_plan"},
+        "structure": {"title": "기획서", "sections": [{"id": i + 1, "name": n} for i, n in enumerate(SECTION_NAMES)]},
+        "draft": draft,
+        "rag_context": RAG_CONTEXT,
+        "refine_count": 1,
+        "review": {"verdict": "REVISE", "overall_score": 6, "target_sections": []},
+        "refinement_guideline": {
+            "overall_direction": "시장 근거 보강",
+            "specific_guidelines": ["TAM/SAM/SOM 수치 추가"],
+            "target_sections": targets,
+        },
+    }
+
+
+class TestTargetResolution:
+    """대상 섹션 해석"""
+
+    def test_strategy_targets_take_precedence(self):
+        assert get_target_sections({"target_sections": ["시장 분석"]}, {"target_sections": ["리스크"]}) == ["시장 분석"]
+        assert get_target_sections({"target_sections": []}, {"target_sections": ["리스크"]}) == ["리스크"]
+        assert get_target_sections(None, None) == []
+
+    def test_resolve_by_id_name_and_partial(self):
+        sections = _previous_draft()["sections"]
+
+        assert resolve_target_indexes(sections, ["3"]) == [2]
+        assert resolve_target_indexes(sections, ["6. 리스크", "핵심기능"]) == [3, 5]
+        assert resolve_target_indexes(sections, ["비즈니스"]) == [4]
+        assert resolve_target_indexes(sections, ["존재하지 않는 섹션"]) == []
+
+
+class TestSpliceSections:
+    """이전 초안에 재작성 섹션 끼워 넣기"""
+
+    def test_untouched_sections_kept_identical(self):
+        previous = _previous_draft()["sections"]
+        regenerated = [{"id": 3, "name": "시장 분석", "content": "새 시장 분석 [Source 3]"}]
+
+        result = splice_sections(previous, regenerated, [2])
+
+        assert result["replaced"] == ["시장 분석"]
+        assert [s["name"] for s in result["sections"]] == SECTION_NAMES
+        for i, sec in enumerate(result["sections"]):
+            if i != 2:
+                assert sec is previous[i]
+        assert result["sections"][2]["content"] == "새 시장 분석 [Source 3]"
+
+    def test_dropped_citations_restored(self):
+        previous = _previous_draft()["sections"]
+        regenerated = [{"id": 3, "name": "시장 분석", "content": "인용 없는 새 본문"}]
+
+        content = splice_sections(previous, regenerated, [2], RAG_CONTEXT)["sections"][2]["content"]
+
+        assert content.startswith("인용 없는 새 본문")
+        assert "[Source 3]" in content
+
+    def test_removed_invalid_citation_not_restored(self):
+        previous = _previous_draft()["sections"]
+        previous[2] = {**previous[2], "content": previous[2]["content"] + " [Source 9]"}
+        regenerated = [{"id": 3, "name": "시장 분석", "content": "위조 인용을 삭제한 새 본문"}]
+
+        content = splice_sections(previous, regenerated, [2], RAG_CONTEXT)["sections"][2]["content"]
+
+        assert "[Source 3]" in content and "[Source 9]" not in content  # 컨텍스트에 없는 출처
+        assert splice_sections(previous, regenerated, [2])["sections"][2]["content"] == "위조 인용을 삭제한 새 본문"
+
+    def test_missing_output_keeps_previous(self):
+        previous = _previous_draft()["sections"]
+
+        result = splice_sections(previous, [], [1, 2])
+
+        assert result["replaced"] == []
+        assert result["missing"] == ["문제 정의", "시장 분석"]
+        assert result["sections"] == previous
+
+
+class TestWriterSectionRefine:
+    """Writer 섹션 단위 재작성 경로"""
+
+    def test_refine_round_emits_fewer_tokens(self):
+        from agents import writer
+
+        llm = _TokenCountingLLM()
+        with patch.object(writer, "get_llm", return_value=llm):
+            first = writer.run({**_refine_state(None, []), "refine_count": 0, "review": None})
+            draft = first["draft"]
+            refined = writer.run(_refine_state(draft, ["시장 분석", "리스크"]))
+
+        full_tokens, refine_tokens = llm.output_tokens[0], llm.output_tokens[-1]
+        assert refine_tokens * 3 < full_tokens
+
+        sections = refined["draft"]["sections"]
+        assert [s["name"] for s in sections] == SECTION_NAMES
+        for i, sec in enumerate(sections):
+            if SECTION_NAMES[i] in ("시장 분석", "리스크"):
+                assert "개선본" in sec["content"] and sec["content"] != draft["sections"][i]["content"]
+            else:
+                assert sec["content"] == draft["sections"][i]["content"]
+
+    def test_citations_preserved_and_untouched_sections_identical(self):
+        from agents import writer
+
+        previous = _previous_draft()
+        with patch.object(writer, "get_llm", return_value=_TokenCountingLLM()):
+            refined = writer.run(_refine_state(previous, ["3"]))
+
+        sections = refined["draft"]["sections"]
+        assert "[Source 3]" in sections[2]["content"]
+        for i in (0, 1, 3, 4, 5, 6):
+            assert sections[i]["content"].encode() == previous["sections"][i]["content"].encode()
+
+    def test_spliced_draft_validated_and_retried(self):
+        from agents import writer
+
+        llm = _TokenCountingLLM()
+        with patch.object(writer, "get_llm", return_value=llm), \
+                patch.object(writer, "validate_draft", side_effect=[["Mermaid 다이어그램 누락"], []]) as validate:
+            refined = writer.run({**_refine_state(_previous_draft(), ["시장 분석"]), "generation_preset": "balanced"})
+
+        assert validate.call_count == 2 and llm.round == 2
+        checked = validate.call_args_list[0][0][0]
+        assert [s["name"] for s in checked["sections"]] == SECTION_NAMES  # 끼워 넣은 전체 초안 검증
+        assert "개선본 r2" in refined["draft"]["sections"][2]["content"]
+
+    def test_no_targets_falls_back_to_full_rewrite(self):
+        from agents import writer
+
+        llm = _TokenCountingLLM()
+        with patch.object(writer, "get_llm", return_value=llm):
+            refined = writer.run(_refine_state(_previous_draft(), []))
+
+        assert all("개선본" in s["content"] for s in refined["draft"]["sections"])
+
+
+class TestStructurerKeepsStructure:
+    """섹션 단위 라운드의 Structurer"""
+
+    def test_previous_structure_kept_without_llm_call(self):
+        from agents import structurer
+
+        state = _refine_state(_previous_draft(), ["시장 분석"])
+        with patch.object(structurer, "get_llm") as mock_get_llm:
+            result = structurer.run(state)
+
+        mock_get_llm.assert_not_called()
+        assert result["structure"] == state["structure"]
+
+    def test_unresolved_targets_redesign(self):
+        from agents import structurer
+
+        state = _refine_state(_previous_draft(), ["존재하지 않는 섹션"])
+        mock_llm = MagicMock()
+        mock_llm.with_structured_output.return_value.invoke.side_effect = RuntimeError("no llm")
+        with patch.object(structurer, "get_llm", return_value=mock_llm):
+            structurer.run(state)
+
+        mock_llm.with_structured_output.assert_called_once()  # Writer 가 전체 재작성하는 라운드
+
+    def test_full_rewrite_round_redesigns(self):
+        from agents import structurer
+
+        state = _refine_state(_previous_draft(), [])
+        mock_llm = MagicMock()
+        mock_llm.with_structured_output.return_value.invoke.side_effect = RuntimeError("no llm")
+        with patch.object(structurer, "get_llm", return_value=mock_llm):
+            structurer.run(state)
+
+        mock_llm.with_structured_output.assert_called_once()
@@ -0,0 +1,293 @@
+"""
+실행 간 Single-flight 테스트
+
+utils/singleflight.py 와 컨텍스트 수집 노드 연동을 검증합니다.
+- 동시 호출 1회 실행 + 호출자별 결과 사본 (공유 원본 불변)
+- 키 정규화 (대소문자/공백/문장부호) 및 시간 구간
+- 실행별 취소: 한 실행이 빠져도 공유 작업은 계속, 모두 빠지면 시작 전 작업 취소
+- 공유 작업 예외 전달, Python 3.10 대기 시간 초과 처리
+- 웹 검색 공유 키: RAG 컨텍스트가 다르면 공유하지 않음
+- 오프라인 동시 실행: 가짜 검색 백엔드 호출 수가 단일 실행과 같음
+
+실행:
+    pytest tests/test_singleflight.py -v
+"""
+
+import glob
+import os
+import shutil
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from utils.singleflight import (
+    SingleFlight,
+    SingleFlightCancelled,
+    make_flight_key,
+    normalize_topic,
+)
+
+
+SINGLEFLIGHT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "utils", "singleflight.py")
+
+
+def _find_python310():
+    """Python 3.10 인터프리터 경로 (PATH / pyenv, 실제 실행되는 것만)"""
+    candidates = [shutil.which("python3.10")] + sorted(glob.glob(os.path.expanduser("~/.pyenv/versions/3.10*/bin/python")))
+    for candidate in filter(None, candidates):
+        try:
+            proc = subprocess.run([candidate, "-c", "import sys; print(sys.version_info[:2] == (3, 10))"],
+                                  capture_output=True, text=True, timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            continue
+        if proc.returncode == 0 and proc.stdout.strip() == "True":
+            return candidate
+    return None
+
+
+def _slow(result, gate=None, delay=0.0, counter=None):
+    def fn():
+        if counter is not None:
+            counter.append(1)
+        if gate is not None:
+            gate.wait(5)
+        if delay:
+            time.sleep(delay)
+        return result
+    return fn
+
+
+def _start(target, *args):
+    thread = threading.Thread(target=target, args=args)
+    thread.start()
+    return thread
+
+
+def _wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not met"
+        time.sleep(0.005)
+
+
+class TestKeys:
+    """키 생성"""
+
+    def test_normalized_topic(self):
+        assert normalize_topic("  AI  반려동물 앱!  ") == "ai 반려동물 앱"
+        assert make_flight_key("AI 반려동물 앱", "fast", bucket_sec=300, now=10) == \
+            make_flight_key(" ai   반려동물 앱.", "fast", bucket_sec=300, now=20)
+
+    def test_preset_and_bucket_separate_keys(self):
+        base = make_flight_key("주제", "fast", bucket_sec=300, now=10)
+
+        assert make_flight_key("주제", "quality", bucket_sec=300, now=10) != base
+        assert make_flight_key("주제", "fast", bucket_sec=300, now=310) != base
+
+
+class TestSingleFlight:
+    """공유 / 취소"""
+
+    def test_concurrent_calls_share_one_execution(self):
+        group = SingleFlight("test")
+        gate, calls, results = threading.Event(), [], []
+        fn = _slow({"urls": ["https://a"]}, gate=gate, counter=calls)
+
+        threads = [_start(lambda: results.append(group.do("k", fn))) for _ in range(5)]
+        _wait_until(lambda: group.get_stats()["shared"] == 4)
+        gate.set()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert sorted(shared for _, shared in results) == [False, True, True, True, True]
+        results[0][0]["urls"].append("mutated")
+        assert all(r["urls"] == ["https://a"] for r, _ in results[1:])  # 호출자별 사본
+        assert group.in_flight() == 0
+
+    def test_completed_flight_is_not_cached(self):
+        group = SingleFlight("test")
+        calls = []
+
+        group.do("k", _slow(1, counter=calls))
+        group.do("k", _slow(1, counter=calls))
+
+        assert len(calls) == 2
+
+    def test_timed_out_waiter_does_not_stop_shared_work(self):
+        group = SingleFlight("test")
+        gate = threading.Event()
+        calls, outcome = [], {}
+        fn = _slow("shared", gate=gate, counter=calls)
+
+        def leader():
+            try:
+                group.do("k", fn, timeout=0.3)
+            except SingleFlightCancelled:
+                outcome["leader"] = "cancelled"
+
+        t1 = _start(leader)
+        _wait_until(lambda: group.in_flight() == 1)
+        t2 = _start(lambda: outcome.setdefault("follower", group.do("k", fn)))
+        _wait_until(lambda: group.get_stats()["shared"] == 1)
+
+        t1.join()
+        gate.set()
+        t2.join()
+
+        assert outcome == {"leader": "cancelled", "follower": ("shared", True)}
+        assert len(calls) == 1
+        assert group.get_stats()["cancelled_waiters"] == 1 and group.get_stats()["abandoned"] == 0
+
+    def test_abandoned_flight_cancelled_before_start(self):
+        busy = ThreadPoolExecutor(max_workers=1)
+        gate = threading.Event()
+        busy.submit(gate.wait, 5)  # 풀을 점유해 공유 작업이 시작되지 못하게 함
+        group = SingleFlight("test", executor=busy)
+        calls = []
+
+        with pytest.raises(SingleFlightCancelled):
+            group.do("k", _slow(1, counter=calls), timeout=0.05)
+        gate.set()
+        busy.shutdown(wait=True)
+
+        assert calls == []
+        assert group.get_stats()["abandoned"] == 1 and group.in_flight() == 0
+
+    def test_shared_timeout_error_not_treated_as_wait_timeout(self):
+        group = SingleFlight("test")
+
+        def fn():
+            raise TimeoutError("upstream timeout")
+
+        with pytest.raises(TimeoutError, match="upstream timeout") as exc_info:
+            group.do("k", fn, timeout=1.0)
+
+        assert not isinstance(exc_info.value, SingleFlightCancelled)
+
+    def test_wait_timeout_on_python310(self):
+        python = _find_python310()
+        if python is None:
+            pytest.skip("Python 3.10 인터프리터 없음")
+        # utils 패키지(.env / pydantic 의존) 대신 모듈 파일만 로드하고, 설정을 읽는 공유 풀 대신 전용 풀 사용
+        code = (
+            "import importlib.util, threading\n"
+            "from concurrent.futures import ThreadPoolExecutor\n"
+            f"spec = importlib.util.spec_from_file_location('sf', {SINGLEFLIGHT_PATH!r})\n"
+            "sf = importlib.util.module_from_spec(spec); spec.loader.exec_module(sf)\n"
+            "gate = threading.Event()\n"
+            "try:\n"
+            "    sf.SingleFlight('t', executor=ThreadPoolExecutor(1)).do('k', lambda: gate.wait(5), timeout=0.05)\n"
+            "except sf.SingleFlightCancelled:\n"
+            "    print('cancelled')\n"
+            "gate.set()\n"
+        )
+        proc = subprocess.run([python, "-c", code], capture_output=True, text=True, timeout=30)
+
+        assert proc.returncode == 0, proc.stderr
+        assert proc.stdout.strip() == "cancelled"
+
+    def test_error_propagates_to_all_waiters(self):
+        group = SingleFlight("test")
+        gate, errors = threading.Event(), []
+
+        def fail():
+            gate.wait(5)
+            raise RuntimeError("search down")
+
+        def call():
+            try:
+                group.do("k", fail)
+            except RuntimeError as e:
+                errors.append(str(e))
+
+        threads = [_start(call) for _ in range(3)]
+        _wait_until(lambda: group.get_stats()["shared"] == 2)
+        gate.set()
+        for t in threads:
+            t.join()
+
+        assert errors == ["search down"] * 3
+
+
+class TestWebSearchKey:
+    """fetch_web 공유 키"""
+
+    def test_different_rag_context_not_shared(self):
+        import graph.nodes.fetch_web as fetch_web
+        from utils.settings import get_preset
+
+        gate, calls = threading.Event(), []
+
+        def search(search_input, rag_context, **kwargs):
+            calls.append(rag_context)
+            gate.wait(5)
+            return {"context": rag_context, "urls": [], "sources": [], "error": None}
+
+        preset = get_preset("balanced")
+        with patch.object(fetch_web, "execute_web_search", search), \
+                patch("utils.settings.settings.SINGLEFLIGHT_ENABLED", True):
+            threads = [_start(fetch_web._shared_web_search, "반려동물 앱", ctx, "balanced", preset)
+                       for ctx in ("RAG 문서 A", "RAG 문서 B")]
+            _wait_until(lambda: len(calls) == 2, timeout=2.0)  # 공유되면 1회만 호출
+            gate.set()
+            for t in threads:
+                t.join()
+
+        assert sorted(calls) == ["RAG 문서 A", "RAG 문서 B"]
+
+
+class TestConcurrentRuns:
+    """오프라인 동시 실행 (가짜 검색 백엔드 호출 수)"""
+
+    def _run_concurrently(self, env, count, prefix):
+        from benchmarks.e2e import run_preset
+
+        barrier = threading.Barrier(count)
+        results = []
+
+        def run(i):
+            barrier.wait(5)
+            results.append(run_preset("balanced", env, thread_id=f"{prefix}-{i}"))
+
+        threads = [_start(run, i) for i in range(count)]
+        for t in threads:
+            t.join()
+        return results
+
+    def test_concurrent_runs_share_context_gathering(self, tmp_path):
+        from benchmarks.e2e import offline_environment
+        import graph.nodes.fetch_web as fetch_web
+        import rag.retriever as retriever
+
+        web_calls, rag_calls = [], []
+        original_search = fetch_web.execute_web_search
+        original_retrieve = retriever.Retriever.get_formatted_context
+
+        def counted_search(*args, **kwargs):
+            web_calls.append(1)
+            return original_search(*args, **kwargs)
+
+        def counted_retrieve(self, *args, **kwargs):
+            rag_calls.append(1)
+            return original_retrieve(self, *args, **kwargs)
+
+        with offline_environment(str(tmp_path), embed_latency_ms=200, search_latency_ms=300) as env, \
+                patch.object(fetch_web, "execute_web_search", counted_search), \
+                patch.object(retriever.Retriever, "get_formatted_context", counted_retrieve):
+            single = self._run_concurrently(env, 1, "solo")
+            solo_searches = env["stats"].search_calls
+
+            web_calls.clear()
+            rag_calls.clear()
+            concurrent = self._run_concurrently(env, 3, "shared")
+            shared_searches = env["stats"].search_calls - solo_searches
+
+        assert single[0]["completed"] and all(r["completed"] for r in concurrent)
+        assert len(web_calls) == 1
+        assert len(rag_calls) == 1
+        assert shared_searches == solo_searches
@@ -0,0 +1,73 @@
+"""
+State 업데이트 (Structural Sharing) 테스트
+
+update_state의 복사 범위와 불변성 보장을 검증합니다.
+- 변경된 키만 복사, 변경되지 않은 값은 공유
+- 반환 상태가 호출자 소유 가변 객체를 참조하지 않음
+- 대형 상태 기준 할당량이 전체 deepcopy보다 적음
+
+실행:
+    pytest tests/test_state_update.py -v
+"""
+
+import pytest
+
+from graph.state import create_initial_state, update_state, shallow_update_state
+
+
+class TestStructuralSharing:
+    """update_state 복사 범위"""
+
+    def test_unchanged_values_are_shared(self):
+        state = update_state(create_initial_state("입력"), draft={"sections": [{"id": 1}]})
+
+        new_state = update_state(state, current_step="review")
+
+        assert new_state is not state
+        assert new_state["draft"] is state["draft"]
+        assert state["current_step"] != "review"
+
+    def test_updated_values_do_not_alias_caller_data(self):
+        caller_owned = {"sections": [{"id": 1, "content": "원본"}]}
+
+        new_state = update_state(create_initial_state("입력"), draft=caller_owned)
+        caller_owned["sections"][0]["content"] = "호출자가 수정"
+        caller_owned["sections"].append({"id": 2})
+
+        assert new_state["draft"] == {"sections": [{"id": 1, "content": "원본"}]}
+
+    def test_base_state_keys_untouched(self):
+        base = create_initial_state("입력")
+        base_keys = dict(base)
+
+        update_state(base, analysis={"topic": "A"}, custom_field=1)
+
+        assert dict(base) == base_keys
+
+    def test_shallow_update_uses_values_as_is(self):
+        history = [{"step": "analyze"}]
+        new_state = shallow_update_state(create_initial_state("입력"), step_history=history)
+        assert new_state["step_history"] is history
+
+    def test_step_history_append_keeps_previous_state(self):
+        from graph.nodes.common import update_step_history
+
+        state = create_initial_state("입력")
+        first = update_step_history(state, "analyze", "SUCCESS")
+        second = update_step_history(first, "structure", "SUCCESS")
+
+        assert [h["step"] for h in first["step_history"]] == ["analyze"]
+        assert [h["step"] for h in second["step_history"]] == ["analyze", "structure"]
+        assert second["step_history"][0] is first["step_history"][0]
+
+
+class TestStateUpdateBenchmark:
+    """Micro-benchmark: 노드 1회당 할당량"""
+
+    def test_node_allocations_lower_than_full_deepcopy(self):
+        from benchmarks.state_update import run
+
+        results = run(iterations=5)
+
+        assert results["current"]["alloc_blocks_per_node"] < results["legacy"]["alloc_blocks_per_node"] / 5
+        assert results["current"]["alloc_bytes_per_node"] < results["legacy"]["alloc_bytes_per_node"]
@@ -0,0 +1,211 @@
+"""
+Supervisor 의존성 기반 스케줄링 테스트
+
+지연 시간이 다른 Stub 에이전트로 스케줄러 동작을 검증합니다.
+- depends_on 결과가 준비되는 즉시 에이전트 시작 (단계 배리어 없음)
+- Critical Path / 단계별 실행 추정 시간 기록
+- 재시도 / Fallback / 타임아웃 처리 유지 (공유 풀 큐 대기 시간 포함)
+
+실행:
+    pytest tests/test_supervisor_scheduling.py -v
+"""
+
+import threading
+import time
+import pytest
+from unittest.mock import MagicMock
+
+
+class StubAgent:
+    """지정된 시간만큼 대기 후 결과를 반환하는 Stub 에이전트"""
+
+    def __init__(self, agent_id, delay, log, fail_times=0, error=None):
+        self.agent_id = agent_id
+        self.delay = delay
+        self.log = log
+        self.fail_times = fail_times
+        self.error = error or ConnectionError("connection reset")
+        self.calls = 0
+        self.received = []
+
+    def run(self, **kwargs):
+        self.calls += 1
+        self.received.append(kwargs)
+        self.log.append(("start", self.agent_id, time.monotonic()))
+        time.sleep(self.delay)
+        if self.calls <= self.fail_times:
+            raise self.error
+        self.log.append(("end", self.agent_id, time.monotonic()))
+        return {"agent": self.agent_id, "competitors": [f"{self.agent_id}-competitor"]}
+
+    def format_as_markdown(self, result):
+        return str(result)
+
+
+@pytest.fixture
+def supervisor():
+    from agents.supervisor import NativeSupervisor
+    return NativeSupervisor(llm=MagicMock())
+
+
+def _plan(agent_ids):
+    from agents.agent_config import resolve_execution_plan_dag
+    return resolve_execution_plan_dag(agent_ids, "scheduling test")
+
+
+def _install(supervisor, delays, log, **overrides):
+    supervisor.agents = {
+        agent_id: overrides.get(agent_id) or StubAgent(agent_id, delay, log)
+        for agent_id, delay in delays.items()
+    }
+
+
+def _first(log, kind, agent_id):
+    return next(t for k, a, t in log if k == kind and a == agent_id)
+
+
+class TestDependencyDrivenScheduling:
+    """단계 배리어 제거 검증"""
+
+    def test_fast_chain_does_not_wait_for_slow_peer(self, supervisor):
+        """bm은 market만 끝나면 시작 (같은 단계의 느린 tech를 기다리지 않음)"""
+        log = []
+        delays = {"market": 0.1, "tech": 0.6, "bm": 0.1, "financial": 0.1, "risk": 0.1}
+        _install(supervisor, delays, log)
+        plan = _plan(list(delays))
+        results = {}
+
+        start = time.monotonic()
+        supervisor._execute_plan(plan, results, {"service_overview": "AI 앱"})
+        wall = time.monotonic() - start
+
+        assert _first(log, "start", "bm") < _first(log, "end", "tech")
+        assert _first(log, "start", "bm") >= _first(log, "end", "market")
+        assert _first(log, "start", "financial") >= _first(log, "end", "bm")
+
+        stats = results["_execution_stats"]
+        assert stats["successful_agents"] == 5
+        # 레이어 방식: 0.6 + 0.1 + 0.1 = 0.8초 / 의존성 방식: max(0.6, 0.3) = 0.6초
+        assert stats["layered_estimate_ms"] >= 750
+        assert wall < stats["layered_estimate_ms"] / 1000 - 0.1
+        assert stats["critical_path"] == ["tech"]
+
+    def test_critical_path_follows_dependency_chain(self, supervisor):
+        """느린 체인이 있으면 Critical Path는 의존성 체인"""
+        log = []
+        delays = {"market": 0.2, "tech": 0.05, "bm": 0.2, "risk": 0.05}
+        _install(supervisor, delays, log)
+        results = {}
+
+        supervisor._execute_plan(_plan(list(delays)), results, {"service_overview": "서비스"})
+
+        stats = results["_execution_stats"]
+        assert stats["critical_path"] == ["market", "bm", "risk"]
+        assert stats["critical_path_ms"] >= 400
+
+    def test_dependent_receives_upstream_result(self, supervisor):
+        """의존 에이전트는 선행 결과가 반영된 컨텍스트를 받음"""
+        log = []
+        _install(supervisor, {"market": 0.01, "bm": 0.01}, log)
+        results = {}
+
+        supervisor._execute_plan(_plan(["market", "bm"]), results, {"service_overview": "서비스"})
+
+        bm_ctx = supervisor.agents["bm"].received[0]
+        assert bm_ctx["competitors"] == ["market-competitor"]
+
+    def test_events_emitted(self, supervisor):
+        """step_start / agent_start / agent_success 이벤트 유지"""
+        log, events = [], []
+        _install(supervisor, {"market": 0.01, "bm": 0.01}, log)
+        lock = threading.Lock()
+
+        def on_event(e):
+            with lock:
+                events.append(e["type"])
+
+        supervisor._execute_plan(
+            _plan(["market", "bm"]), {}, {"service_overview": "서비스", "on_event": on_event}
+        )
+
+        assert events.count("step_start") == 2
+        assert events.count("agent_start") == 2
+        assert events.count("agent_success") == 2
+
+
+class TestFailureSemantics:
+    """재시도 / Fallback / 타임아웃"""
+
+    def test_network_error_is_retried_once(self, supervisor):
+        log, events = [], []
+        flaky = StubAgent("market", 0.01, log, fail_times=1)
+        _install(supervisor, {"market": 0.01, "bm": 0.01}, log, market=flaky)
+        results = {}
+
+        supervisor._execute_plan(
+            _plan(["market", "bm"]), results,
+            {"service_overview": "서비스", "on_event": lambda e: events.append(e["type"])}
+        )
+
+        assert flaky.calls == 2
+        assert "agent_retry_success" in events
+        assert results["market_analysis"]["agent"] == "market"
+        assert results["_execution_stats"]["agent_stats"]["market"]["retry_count"] == 1
+        # 재시도 성공 후에야 bm 시작
+        assert supervisor.agents["bm"].received[0]["competitors"] == ["market-competitor"]
+
+    def test_validation_error_uses_fallback(self, supervisor):
+        log = []
+        broken = StubAgent("bm", 0.01, log, fail_times=5, error=ValueError("bad schema"))
+        _install(supervisor, {"market": 0.01, "bm": 0.01, "risk": 0.01}, log, bm=broken)
+        results = {}
+
+        supervisor._execute_plan(_plan(["market", "bm", "risk"]), results, {"service_overview": "서비스"})
+
+        assert broken.calls == 1
+        assert results["business_model"]["fallback_used"] is True
+        assert results["risk_analysis"]["agent"] == "risk"
+        assert results["_execution_stats"]["failed_agents"] == 1
+
+    def test_timeout_falls_back_without_blocking_dependents(self, supervisor, monkeypatch):
+        from utils.settings import settings
+
+        monkeypatch.setattr(settings, "AGENT_TIMEOUT_SEC", 0.3)
+        log = []
+        _install(supervisor, {"market": 1.0, "bm": 0.01}, log)
+        results = {}
+
+        start = time.monotonic()
+        supervisor._execute_plan(_plan(["market", "bm"]), results, {"service_overview": "서비스"})
+        wall = time.monotonic() - start
+
+        assert wall < 0.9
+        assert results["market_analysis"]["error_category"] == "TIMEOUT_ERROR"
+        assert results["business_model"]["agent"] == "bm"
+
+    def test_queued_agent_times_out_when_pool_is_busy(self, supervisor, monkeypatch):
+        from concurrent.futures import ThreadPoolExecutor
+        from agents import supervisor as supervisor_module
+        from utils.settings import settings
+
+        monkeypatch.setattr(settings, "AGENT_TIMEOUT_SEC", 0.3)
+        busy = ThreadPoolExecutor(max_workers=1)
+        gate = threading.Event()
+        busy.submit(gate.wait, 5)  # 다른 실행의 멈춘 에이전트가 슬롯 점유
+        monkeypatch.setattr(supervisor_module, "_agent_executor", busy)
+        log = []
+        _install(supervisor, {"market": 0.01}, log)
+        results = {}
+
+        start = time.monotonic()
+        try:
+            supervisor._execute_plan(_plan(["market"]), results, {"service_overview": "서비스"})
+        finally:
+            gate.set()
+            busy.shutdown(wait=True)
+        wall = time.monotonic() - start
+
+        assert wall < 0.9
+        assert supervisor.agents["market"].calls == 0  # 대기 취소 (시작되지 않음)
+        assert results["market_analysis"]["error_category"] == "TIMEOUT_ERROR"
+        assert "대기 시간 초과" in results["market_analysis"]["error"]
@@ -0,0 +1,247 @@
+"""
+실행 Span 트레이서 테스트
+
+utils/tracing.py 의 컨텍스트 로컬 Span 수집기를 검증합니다.
+- Span 중첩 (parent_id) / 동시 실행 간 격리 (os.environ 미사용)
+- copy_context 로 스레드 풀 작업에 부모 Span 전파
+- 링 버퍼 크기 제한 / JSONL 내보내기 + load_traces (기본 경로: logs/traces/)
+- 워터폴 / folded stacks 출력
+- SpanCallbackHandler: LLM 호출 → llm Span
+- 오프라인 전체 실행: run → node → agent → llm 계층
+
+실행:
+    pytest tests/test_tracing.py -v
+"""
+
+import contextvars
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from utils import tracing
+from utils.tracing import (
+    SpanCallbackHandler,
+    Tracer,
+    current_span,
+    format_waterfall,
+    get_tracer,
+    load_traces,
+    span,
+    to_folded_stacks,
+    trace_node,
+    traced,
+)
+
+
+class TestSpanContext:
+    """Span 계층 / 컨텍스트 전파"""
+
+    def test_nested_spans_share_trace(self):
+        with span("plancraft", kind="run", thread_id="t1") as root:
+            with span("analyze", kind="node") as node:
+                assert current_span() is node
+            assert current_span() is root
+        assert current_span() is None
+
+        spans = get_tracer().get_trace(root.trace_id)
+        assert [s.name for s in spans] == ["plancraft", "analyze"]
+        assert spans[1].parent_id == root.span_id
+        assert all(s.end is not None for s in spans)
+
+    def test_error_marks_span(self):
+        with pytest.raises(ValueError):
+            with span("plancraft", kind="run") as root:
+                with span("write", kind="node"):
+                    raise ValueError("boom")
+
+        spans = get_tracer().get_trace(root.trace_id)
+        assert [s.status for s in spans] == ["error", "error"]
+        assert spans[1].error == "ValueError: boom"
+
+    def test_concurrent_runs_are_isolated(self):
+        barrier = threading.Barrier(4)
+        roots = {}
+        env_before = dict(os.environ)
+
+        def run(i):
+            with span("plancraft", kind="run", thread_id=f"t{i}") as root:
+                roots[i] = root
+                barrier.wait(5)
+                with span("analyze", kind="node", thread_id=f"t{i}"):
+                    time.sleep(0.01)
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        for i, root in roots.items():
+            spans = get_tracer().get_trace(root.trace_id)
+            assert len(spans) == 2
+            assert spans[1].attributes["thread_id"] == f"t{i}"
+            assert get_tracer().find_traces(f"t{i}")[0]["trace_id"] == root.trace_id
+        assert dict(os.environ) == env_before
+
+    def test_copy_context_propagates_to_pool(self):
+        @traced("retrieve", kind="retrieval")
+        def retrieve(n):
+            return n
+
+        with span("run_specialists", kind="node") as parent:
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                futures = [executor.submit(contextvars.copy_context().run, retrieve, n) for n in range(3)]
+                assert [f.result() for f in futures] == [0, 1, 2]
+
+        children = [s for s in get_tracer().get_trace(parent.trace_id) if s.kind == "retrieval"]
+        assert len(children) == 3
+        assert {s.parent_id for s in children} == {parent.span_id}
+
+
+class TestTracer:
+    """버퍼 / 내보내기"""
+
+    def test_ring_buffer_evicts_oldest(self):
+        tracer = Tracer(max_traces=2, export_path=None)
+        roots = []
+        for _ in range(3):
+            root = tracer.start_span("plancraft", "run")
+            tracer.end_span(root)
+            roots.append(root)
+
+        assert tracer.get_trace(roots[0].trace_id) == []
+        assert [t["trace_id"] for t in tracer.find_traces()] == [roots[2].trace_id, roots[1].trace_id]
+
+    def test_span_limit_counts_drops(self):
+        tracer = Tracer(max_spans_per_trace=2, export_path=None)
+        root = tracer.start_span("plancraft", "run")
+        for _ in range(3):
+            tracer.end_span(tracer.start_span("llm", "llm", parent=root))
+
+        assert tracer.dropped_spans == 1
+
+    def test_export_and_load(self, tmp_path, monkeypatch):
+        path = str(tmp_path / "traces.jsonl")
+        monkeypatch.setattr(tracing, "_tracer", Tracer(export_path=path))
+
+        with span("plancraft", kind="run", thread_id="t1") as root:
+            with span("analyze", kind="node"):
+                pass
+
+        loaded = load_traces(path)
+        assert list(loaded) == [root.trace_id]
+        assert {s.name for s in loaded[root.trace_id]} == {"plancraft", "analyze"}
+
+    def test_export_rotates(self, tmp_path):
+        path = str(tmp_path / "traces.jsonl")
+        tracer = Tracer(export_path=path, export_max_bytes=1)
+        for _ in range(2):
+            tracer.end_span(tracer.start_span("plancraft", "run"))
+
+        assert os.path.exists(str(tmp_path / "traces.1.jsonl"))
+        assert len(load_traces(path)) == 1
+
+    def test_default_export_path_outside_log_cleanup(self, monkeypatch):
+        """기본 내보내기 경로는 logs/traces/ 하위 (실행 로그 정리 대상 디렉토리와 분리)"""
+        from utils.file_logger import LOG_DIR
+        from utils.settings import settings
+
+        monkeypatch.setattr(settings, "TRACE_EXPORT_ENABLED", True)
+        monkeypatch.setattr(settings, "TRACE_EXPORT_PATH", "")
+        monkeypatch.setattr(tracing, "_tracer", None)
+
+        export_dir = os.path.dirname(get_tracer().export_path)
+        assert os.path.abspath(export_dir) == os.path.abspath(os.path.join(LOG_DIR, "traces"))
+
+
+class TestOutputFormats:
+    """워터폴 / 플레임 그래프"""
+
+    def _spans(self):
+        tracer = get_tracer()
+        root = tracer.start_span("plancraft", "run")
+        node = tracer.start_span("analyze", "node", parent=root)
+        llm = tracer.start_span("gpt-4o", "llm", parent=node)
+        llm.start, node.start, root.start = 1.1, 1.0, 1.0
+        for s, end in ((llm, 1.5), (node, 1.6), (root, 2.0)):
+            tracer.end_span(s)
+            s.end = end
+        return [root, node, llm]
+
+    def test_waterfall(self):
+        text = format_waterfall(self._spans(), width=10)
+        lines = text.splitlines()
+
+        assert "total 1000.0" in lines[0]
+        assert lines[1].split()[:3] == ["0.0", "1000.0", "run:plancraft"]
+        assert "    llm:gpt-4o" in lines[3]
+        assert "|##########|" in lines[1]
+
+    def test_folded_stacks_self_time(self):
+        stacks = dict(line.rsplit(" ", 1) for line in to_folded_stacks(self._spans()).splitlines())
+
+        assert stacks["run:plancraft"] == "400000"
+        assert stacks["run:plancraft;node:analyze"] == "200000"
+        assert stacks["run:plancraft;node:analyze;llm:gpt-4o"] == "400000"
+
+    def test_cli(self, tmp_path, monkeypatch, capsys):
+        path = str(tmp_path / "traces.jsonl")
+        monkeypatch.setattr(tracing, "_tracer", Tracer(export_path=path))
+        with span("plancraft", kind="run", thread_id="t1"):
+            pass
+
+        assert tracing.main(["--file", path, "--thread", "t1"]) == 0
+        assert "run:plancraft" in capsys.readouterr().out
+        assert tracing.main(["--file", str(tmp_path / "none.jsonl")]) == 1
+
+
+class TestIntegration:
+    """LangChain 콜백 / 노드 데코레이터 / 전체 실행"""
+
+    def test_callback_creates_llm_span(self):
+        from benchmarks.fakes import FakeChatModel
+
+        llm = FakeChatModel()
+        with span("write", kind="node") as node:
+            llm.invoke("기획서 초안", config={"callbacks": [SpanCallbackHandler()]})
+        llm.invoke("부모 Span 없음", config={"callbacks": [SpanCallbackHandler()]})
+
+        spans = get_tracer().get_trace(node.trace_id)
+        assert [s.kind for s in spans] == ["node", "llm"]
+        assert spans[1].parent_id == node.span_id
+        assert spans[1].attributes["cached"] is False
+        assert len(get_tracer().find_traces()) == 1
+
+    def test_trace_node_records_metadata(self):
+        @trace_node("analyze")
+        def node(state):
+            return {"ok": True}
+
+        with span("plancraft", kind="run") as root:
+            node({"thread_id": "t1", "generation_preset": "fast"})
+
+        node_span = get_tracer().get_trace(root.trace_id)[1]
+        assert node_span.kind == "node" and node_span.name == "analyze"
+        assert node_span.attributes["run_name"]
+        assert node_span.attributes["thread_id"] == "t1"
+
+    def test_offline_run_builds_span_tree(self, tmp_path):
+        from benchmarks.e2e import offline_environment, run_preset
+
+        with offline_environment(str(tmp_path)) as env:
+            result = run_preset("fast", env, thread_id="trace-e2e")
+        assert result["completed"] is True
+
+        summary = get_tracer().find_traces("trace-e2e")[0]
+        spans = get_tracer().get_trace(summary["trace_id"])
+        by_id = {s.span_id: s for s in spans}
+        kinds = {s.kind for s in spans}
+
+        assert spans[0].kind == "run" and spans[0].parent_id is None
+        assert {"node", "llm"} <= kinds
+        assert all(s.parent_id in by_id for s in spans[1:])
+        assert all(by_id[s.parent_id].kind in ("node", "agent") for s in spans if s.kind == "llm")
+        assert "node:write" in to_folded_stacks(spans)
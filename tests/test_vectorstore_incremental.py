@@ -0,0 +1,166 @@
+"""
+RAG 인덱스 증분 빌드 테스트
+
+청크 Manifest 기반 증분 재빌드를 검증합니다.
+- 최초 빌드 시 Manifest 생성
+- 문서 1개 수정 시 변경된 청크만 임베딩
+- 삭제된 문서의 벡터 제거
+- 임베딩 모델 변경 시 전체 재빌드
+
+실행:
+    pytest tests/test_vectorstore_incremental.py -v
+"""
+
+import hashlib
+import pytest
+
+try:
+    import faiss  # noqa: F401
+    from langchain_core.embeddings import Embeddings
+    HAS_RAG_DEPS = True
+except ImportError:
+    HAS_RAG_DEPS = False
+    Embeddings = object
+
+pytestmark = pytest.mark.skipif(
+    not HAS_RAG_DEPS,
+    reason="faiss / langchain_core not installed"
+)
+
+
+class CountingEmbeddings(Embeddings):
+    """호출 횟수를 세는 결정론적 가짜 임베딩 모델"""
+
+    def __init__(self, model="fake-embed-v1", dim=16):
+        self.model = model
+        self.dim = dim
+        self.embedded_texts = 0
+
+    def _vector(self, text):
+        digest = hashlib.sha256(text.encode("utf-8")).digest()
+        return [b / 255.0 for b in digest[:self.dim]]
+
+    def embed_documents(self, texts):
+        self.embedded_texts += len(texts)
+        return [self._vector(t) for t in texts]
+
+    def embed_query(self, text):
+        return self._vector(text)
+
+
+def _write_docs(docs_dir, count=4):
+    docs_dir.mkdir(parents=True, exist_ok=True)
+    for i in range(count):
+        sections = "\n\n".join(
+            f"## 섹션 {j}\n\n문서 {i}의 섹션 {j} 내용입니다. " * 3 for j in range(3)
+        )
+        (docs_dir / f"doc_{i}.md").write_text(f"# 문서 {i}\n\n{sections}", encoding="utf-8")
+
+
+class TestIncrementalRebuild:
+    """update_vectorstore 증분 빌드 테스트"""
+
+    def test_initial_build_writes_manifest(self, tmp_path):
+        """최초 빌드 시 모든 청크 임베딩 + Manifest 저장"""
+        from rag.vectorstore import update_vectorstore, load_manifest
+
+        docs_dir, index_dir = tmp_path / "docs", tmp_path / "index"
+        _write_docs(docs_dir)
+        embeddings = CountingEmbeddings()
+
+        stats = update_vectorstore(str(docs_dir), str(index_dir), embeddings)
+
+        manifest = load_manifest(str(index_dir))
+        assert stats["full_rebuild"] is True
+        assert stats["added"] == embeddings.embedded_texts == 12
+        assert len(manifest["chunks"]) == 12
+        assert manifest["embedding_model"] == "fake-embed-v1"
+        assert {c["source"] for c in manifest["chunks"]} == {f"doc_{i}.md" for i in range(4)}
+
+    def test_unchanged_corpus_embeds_nothing(self, tmp_path):
+        """문서 변경이 없으면 임베딩 호출 없음"""
+        from rag.vectorstore import update_vectorstore
+
+        docs_dir, index_dir = tmp_path / "docs", tmp_path / "index"
+        _write_docs(docs_dir)
+        update_vectorstore(str(docs_dir), str(index_dir), CountingEmbeddings())
+
+        embeddings = CountingEmbeddings()
+        stats = update_vectorstore(str(docs_dir), str(index_dir), embeddings)
+
+        assert embeddings.embedded_texts == 0
+        assert stats["added"] == stats["removed"] == 0
+        assert stats["unchanged"] == 12
+
+    def test_editing_one_file_embeds_only_changed_chunks(self, tmp_path):
+        """문서 1개의 섹션 1개 수정 → 해당 청크만 재임베딩"""
+        from langchain_community.vectorstores import FAISS
+        from rag.vectorstore import update_vectorstore
+
+        docs_dir, index_dir = tmp_path / "docs", tmp_path / "index"
+        _write_docs(docs_dir)
+        update_vectorstore(str(docs_dir), str(index_dir), CountingEmbeddings())
+
+        target = docs_dir / "doc_2.md"
+        target.write_text(
+            target.read_text(encoding="utf-8").replace("문서 2의 섹션 1", "수정된 섹션"),
+            encoding="utf-8",
+        )
+        embeddings = CountingEmbeddings()
+        stats = update_vectorstore(str(docs_dir), str(index_dir), embeddings)
+
+        assert embeddings.embedded_texts == 1
+        assert stats["added"] == 1 and stats["removed"] == 1
+        assert stats["full_rebuild"] is False
+
+        store = FAISS.load_local(str(index_dir), embeddings, allow_dangerous_deserialization=True)
+        contents = [d.page_content for d in store.docstore._dict.values()]
+        assert store.index.ntotal == 12
+        assert any("수정된 섹션" in c for c in contents)
+
+    def test_removed_file_deletes_vectors(self, tmp_path):
+        """문서 삭제 시 해당 벡터 제거 (임베딩 호출 없음)"""
+        from rag.vectorstore import update_vectorstore, load_manifest
+
+        docs_dir, index_dir = tmp_path / "docs", tmp_path / "index"
+        _write_docs(docs_dir)
+        update_vectorstore(str(docs_dir), str(index_dir), CountingEmbeddings())
+
+        (docs_dir / "doc_0.md").unlink()
+        embeddings = CountingEmbeddings()
+        stats = update_vectorstore(str(docs_dir), str(index_dir), embeddings)
+
+        assert embeddings.embedded_texts == 0
+        assert stats["removed"] == 3
+        assert all(c["source"] != "doc_0.md" for c in load_manifest(str(index_dir))["chunks"])
+
+    def test_embedding_model_change_forces_full_rebuild(self, tmp_path):
+        """임베딩 모델이 바뀌면 전체 재임베딩"""
+        from rag.vectorstore import update_vectorstore
+
+        docs_dir, index_dir = tmp_path / "docs", tmp_path / "index"
+        _write_docs(docs_dir)
+        update_vectorstore(str(docs_dir), str(index_dir), CountingEmbeddings())
+
+        embeddings = CountingEmbeddings(model="fake-embed-v2")
+        stats = update_vectorstore(str(docs_dir), str(index_dir), embeddings)
+
+        assert stats["full_rebuild"] is True
+        assert embeddings.embedded_texts == 12
+
+    def test_legacy_index_without_manifest_is_adopted(self, tmp_path):
+        """Manifest 없는 기존 인덱스는 재임베딩 없이 Manifest 복원"""
+        import os
+        from rag.vectorstore import update_vectorstore, load_manifest, MANIFEST_FILE
+
+        docs_dir, index_dir = tmp_path / "docs", tmp_path / "index"
+        _write_docs(docs_dir)
+        update_vectorstore(str(docs_dir), str(index_dir), CountingEmbeddings())
+        os.remove(index_dir / MANIFEST_FILE)
+
+        embeddings = CountingEmbeddings()
+        stats = update_vectorstore(str(docs_dir), str(index_dir), embeddings)
+
+        assert embeddings.embedded_texts == 0
+        assert stats["unchanged"] == 12
+        assert load_manifest(str(index_dir)) is not None
@@ -0,0 +1,135 @@
+"""
+벡터스토어 레지스트리 테스트
+
+프로세스 단위 FAISS 인덱스 캐시 동작을 검증합니다.
+- Retriever를 여러 번 생성해도 인덱스는 1회만 로드
+- 인덱스 파일 변경 시 Hot Reload
+- 공유 핸들의 읽기 전용 보장
+
+실행:
+    pytest tests/test_vectorstore_registry.py -v
+"""
+
+import os
+import pytest
+from unittest.mock import MagicMock, patch
+
+try:
+    import langchain_community
+    HAS_RAG_DEPS = True
+except ImportError:
+    HAS_RAG_DEPS = False
+
+pytestmark = pytest.mark.skipif(
+    not HAS_RAG_DEPS,
+    reason="langchain_community not installed"
+)
+
+
+def _write_index(path, payload=b"v1"):
+    """테스트용 인덱스 파일 생성 (내용은 로더가 해석하지 않음)"""
+    os.makedirs(path, exist_ok=True)
+    for name in ("index.faiss", "index.pkl"):
+        with open(os.path.join(path, name), "wb") as f:
+            f.write(payload)
+
+
+def _fake_store(ntotal=10, d=8):
+    store = MagicMock()
+    store.index.ntotal = ntotal
+    store.index.d = d
+    return store
+
+
+class TestVectorStoreRegistry:
+    """VectorStoreRegistry 단위 테스트"""
+
+    def test_loads_once_for_repeated_get(self, tmp_path):
+        """동일 경로 반복 조회 시 1회만 로드"""
+        from rag.vectorstore import VectorStoreRegistry
+
+        index_dir = str(tmp_path / "idx")
+        _write_index(index_dir)
+        loader = MagicMock(side_effect=lambda p: _fake_store())
+        registry = VectorStoreRegistry(loader=loader)
+
+        handles = [registry.get(index_dir) for _ in range(5)]
+
+        assert loader.call_count == 1
+        assert all(h is handles[0] for h in handles)
+        stats = registry.stats()
+        assert stats["load_count"] == 1
+        # 10 vectors * 8 dim * 4 bytes + index.pkl 크기(2 bytes)
+        assert stats["resident_bytes"] == 10 * 8 * 4 + 2
+
+    def test_hot_reload_on_file_change(self, tmp_path):
+        """인덱스 파일이 바뀌면 새 인덱스로 교체"""
+        from rag.vectorstore import VectorStoreRegistry
+
+        index_dir = str(tmp_path / "idx")
+        _write_index(index_dir)
+        stores = [_fake_store(ntotal=1), _fake_store(ntotal=2)]
+        registry = VectorStoreRegistry(loader=MagicMock(side_effect=stores))
+
+        old = registry.get(index_dir)
+        _write_index(index_dir, payload=b"version-2")
+        new = registry.get(index_dir)
+
+        assert new is not old
+        assert new.index.ntotal == 2
+        # 기존 핸들은 교체 후에도 그대로 동작
+        assert old.index.ntotal == 1
+        assert registry.stats()["reload_count"] == 1
+
+    def test_failed_reload_keeps_previous_index(self, tmp_path):
+        """재로드 실패 시 기존 인덱스 유지"""
+        from rag.vectorstore import VectorStoreRegistry
+
+        index_dir = str(tmp_path / "idx")
+        _write_index(index_dir)
+        loader = MagicMock(side_effect=[_fake_store(), RuntimeError("partial write")])
+        registry = VectorStoreRegistry(loader=loader)
+
+        first = registry.get(index_dir)
+        _write_index(index_dir, payload=b"broken")
+
+        assert registry.get(index_dir) is first
+        assert registry.stats()["reload_failures"] == 1
+
+    def test_handle_is_read_only(self, tmp_path):
+        """공유 핸들에서 변경 메서드 호출 차단"""
+        from rag.vectorstore import VectorStoreRegistry
+
+        index_dir = str(tmp_path / "idx")
+        _write_index(index_dir)
+        registry = VectorStoreRegistry(loader=lambda p: _fake_store())
+        handle = registry.get(index_dir)
+
+        handle.similarity_search("query", k=3)  # 검색은 허용
+        with pytest.raises(PermissionError):
+            handle.add_documents([])
+        with pytest.raises(PermissionError):
+            handle.save_local(index_dir)
+
+
+class TestRetrieverSharesIndex:
+    """Retriever 생성 시 인덱스 공유 검증"""
+
+    def test_many_retrievers_single_load(self, tmp_path):
+        """Retriever N개 생성 → FAISS.load_local 1회"""
+        from rag.retriever import Retriever
+        from rag.vectorstore import VectorStoreRegistry
+
+        index_dir = str(tmp_path / "faiss_index")
+        _write_index(index_dir)
+        registry = VectorStoreRegistry()
+
+        with patch("rag.vectorstore.VECTORSTORE_PATH", index_dir), \
+             patch("rag.vectorstore.get_vectorstore_registry", return_value=registry), \
+             patch("rag.vectorstore.get_embeddings", return_value=MagicMock()), \
+             patch("rag.vectorstore.FAISS.load_local", return_value=_fake_store()) as mock_load:
+            retrievers = [Retriever(k=3) for _ in range(8)]
+
+        assert mock_load.call_count == 1
+        assert len({id(r.vectorstore) for r in retrievers}) == 1
+        assert registry.stats()["load_count"] == 1
@@ -0,0 +1,245 @@
+"""
+워크플로우 SSE 스트림 테스트
+
+GET /api/v1/workflow/stream/{thread_id} 와 이벤트 브로커 동작을 검증합니다.
+- 노드 시작/종료 및 커스텀 이벤트 → 브로커 발행 (WorkflowEventCallback)
+- 종료 이벤트(interrupt/result/error)까지 스트리밍 후 종료
+- Last-Event-ID 기반 재연결 시 이어 받기
+- 라이브 이벤트가 없는 스레드는 체크포인트 스냅샷 1회
+- UI SSE 파서 (iter_sse_events)
+
+실행:
+    pytest tests/test_workflow_stream.py -v
+"""
+
+import asyncio
+import threading
+import time
+from typing import TypedDict
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.services import event_stream
+from api.services.event_stream import (
+    EventBroker,
+    EventBrokerRegistry,
+    WorkflowEventCallback,
+)
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """테스트마다 새 브로커 레지스트리 사용"""
+    fresh = EventBrokerRegistry(buffer_size=50, retention_sec=60)
+    monkeypatch.setattr(event_stream, "_registry", fresh)
+    return fresh
+
+
+@pytest.fixture
+def client(registry):
+    from api.main import app
+    return TestClient(app)
+
+
+def _parse(body: str):
+    from ui.workflow_runner import iter_sse_events
+    return list(iter_sse_events(body.splitlines()))
+
+
+class TestEventBroker:
+    """브로커 버퍼/재개 동작"""
+
+    def test_events_after_returns_newer_events(self):
+        broker = EventBroker("t1")
+        broker.publish("node_start", {"node": "analyze"})
+        broker.publish("node_end", {"node": "analyze"})
+
+        events, gap = broker.events_after(1)
+
+        assert [e.id for e in events] == [2]
+        assert gap is False
+
+    def test_gap_detected_when_buffer_wrapped(self):
+        broker = EventBroker("t1", buffer_size=3)
+        for i in range(6):
+            broker.publish("agent", {"i": i})
+
+        events, gap = broker.events_after(1)
+
+        assert gap is True
+        assert [e.id for e in events] == [4, 5, 6]
+
+    def test_terminal_event_closes_and_reopen_keeps_ids(self):
+        broker = EventBroker("t1")
+        broker.publish("node_start", {"node": "analyze"})
+        broker.publish("interrupt", {"status": "interrupted"})
+        assert broker.closed
+
+        broker.open()  # resume
+        assert not broker.closed
+        assert broker.run_start_id == 2
+        assert broker.publish("node_start", {"node": "structure"}) == 3
+
+    def test_wait_wakes_on_publish(self):
+        broker = EventBroker("t1")
+        threading.Timer(0.05, broker.publish, args=("node_start", {})).start()
+
+        start = time.perf_counter()
+        assert broker.wait(0, timeout=2.0) is True
+        assert time.perf_counter() - start < 1.0
+
+
+    def test_wait_async_wakes_on_publish_without_executor_threads(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        broker = EventBroker("t1")
+
+        async def scenario():
+            loop = asyncio.get_running_loop()
+            loop.set_default_executor(ThreadPoolExecutor(max_workers=1))
+            waiters = [asyncio.ensure_future(broker.wait_async(0, 5.0)) for _ in range(64)]
+            await asyncio.sleep(0.05)
+            # 대기 중인 구독자가 기본 실행기 스레드를 점유하지 않음
+            assert await asyncio.wait_for(asyncio.to_thread(lambda: "free"), 1.0) == "free"
+            threading.Timer(0.05, broker.publish, args=("node_start", {})).start()
+            return await asyncio.wait_for(asyncio.gather(*waiters), 2.0)
+
+        assert asyncio.run(scenario()) == [True] * 64
+        assert not broker._async_waiters
+        assert asyncio.run(broker.wait_async(1, 0.05)) is False  # 새 이벤트 없음 → heartbeat
+
+class TestWorkflowEventCallback:
+    """LangGraph 콜백 → 브로커 이벤트 브릿지"""
+
+    def test_node_and_custom_events_published(self):
+        from langchain_core.callbacks.manager import dispatch_custom_event
+        from langgraph.graph import END, START, StateGraph
+
+        class _State(TypedDict, total=False):
+            x: int
+            step_history: list
+
+        def analyze(state):
+            dispatch_custom_event("supervisor_agent_complete", {"agent_id": "market", "success": True})
+            return {"x": 1, "step_history": [{"step": "analyze", "status": "SUCCESS"}]}
+
+        graph = StateGraph(_State)
+        graph.add_node("analyze", analyze)
+        graph.add_edge(START, "analyze")
+        graph.add_edge("analyze", END)
+
+        broker = EventBroker("t1")
+        graph.compile().invoke({"x": 0}, config={"callbacks": [WorkflowEventCallback(broker)]})
+
+        events, _ = broker.events_after(0)
+        assert [e.event for e in events] == ["node_start", "agent", "node_end"]
+        assert events[1].data["agent_id"] == "market"
+        assert events[1].data["node"] == "analyze"
+        assert events[2].data["step"]["step"] == "analyze"
+        assert events[2].data["duration_ms"] >= 0
+
+
+class TestStreamEndpoint:
+    """SSE 엔드포인트"""
+
+    def test_streams_until_terminal_event(self, client, registry):
+        broker = registry.open("thread-a")
+        broker.publish("node_start", {"node": "analyze"})
+        broker.publish("node_end", {"node": "analyze", "step": {"step": "analyze"}})
+        broker.publish("result", {"status": "completed", "result": {"final_output": "# 기획서"}})
+
+        resp = client.get("/api/v1/workflow/stream/thread-a")
+
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        events = _parse(resp.text)
+        assert [name for _, name, _ in events] == ["node_start", "node_end", "result"]
+        assert events[-1][2]["result"]["final_output"] == "# 기획서"
+
+    def test_resume_from_last_event_id(self, client, registry):
+        broker = registry.open("thread-b")
+        for node in ("analyze", "structure", "write"):
+            broker.publish("node_start", {"node": node})
+        broker.publish("result", {"status": "completed", "result": {"final_output": "ok"}})
+
+        resp = client.get("/api/v1/workflow/stream/thread-b", headers={"Last-Event-ID": "2"})
+        ids = [event_id for event_id, _, _ in _parse(resp.text)]
+        assert ids == ["3", "4"]
+
+        resp = client.get("/api/v1/workflow/stream/thread-b?last_event_id=3")
+        assert [event_id for event_id, _, _ in _parse(resp.text)] == ["4"]
+
+    def test_live_events_delivered_while_running(self, client, registry):
+        broker = registry.open("thread-c")
+
+        def produce():
+            time.sleep(0.1)
+            broker.publish("node_start", {"node": "write"})
+            time.sleep(0.1)
+            broker.publish("interrupt", {"status": "interrupted", "result": {"__interrupt__": {"type": "option"}}})
+
+        threading.Thread(target=produce).start()
+        resp = client.get("/api/v1/workflow/stream/thread-c")
+
+        names = [name for _, name, _ in _parse(resp.text)]
+        assert names == ["node_start", "interrupt"]
+
+    def test_resumed_run_starts_after_previous_terminal_event(self, client, registry):
+        broker = registry.open("thread-d")
+        broker.publish("interrupt", {"status": "interrupted", "result": {"__interrupt__": {}}})
+        registry.open("thread-d")  # /resume
+        broker.publish("result", {"status": "completed", "result": {"final_output": "done"}})
+
+        events = _parse(client.get("/api/v1/workflow/stream/thread-d").text)
+
+        assert [name for _, name, _ in events] == ["result"]
+
+    def test_no_live_events_returns_status_snapshot(self, client):
+        from api.schemas.workflow import WorkflowStatus, WorkflowStatusResponse
+
+        snapshot = WorkflowStatusResponse(
+            thread_id="thread-e",
+            status=WorkflowStatus.COMPLETED,
+            result={"final_output": "saved"},
+        )
+        with patch(
+            "api.services.workflow_service.WorkflowService.get_status",
+            new=AsyncMock(return_value=snapshot),
+        ):
+            resp = client.get("/api/v1/workflow/stream/thread-e")
+
+        events = _parse(resp.text)
+        assert len(events) == 1
+        assert events[0][1] == "status"
+        assert events[0][2]["result"]["final_output"] == "saved"
+
+    def test_unknown_thread_returns_404(self, client):
+        with patch(
+            "api.services.workflow_service.WorkflowService.get_status",
+            new=AsyncMock(return_value=None),
+        ):
+            resp = client.get("/api/v1/workflow/stream/missing")
+
+        assert resp.status_code == 404
+
+
+class TestPublishOutcome:
+    """WorkflowService 종료 이벤트 발행"""
+
+    @pytest.mark.parametrize("result,expected", [
+        ({"__interrupt__": {"type": "option_selector"}}, "interrupt"),
+        ({"error": "LLM 실패"}, "error"),
+        ({"final_output": "# 기획서"}, "result"),
+    ])
+    def test_terminal_event_type(self, result, expected):
+        from api.services.workflow_service import WorkflowService
+
+        broker = EventBroker("t1")
+        WorkflowService()._publish_outcome(broker, "t1", result)
+
+        events, _ = broker.events_after(0)
+        assert events[-1].event == expected
+        assert events[-1].data["result"] == result
+        assert broker.closed
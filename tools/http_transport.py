@@ -0,0 +1,221 @@
+"""
+PlanCraft Agent - 공유 HTTP Transport
+
+검색/페치 클라이언트가 호출마다 requests.get/post 를 새로 열면서
+DNS + TCP + TLS 연결 비용을 매번 치르던 문제를 해결합니다.
+
+기능:
+    - Keep-alive 연결 풀 (프로세스 전역 requests.Session 1개)
+    - 호스트별 최대 연결 수 제한 (초과 요청은 빈 연결을 대기)
+    - 429/503 응답의 Retry-After 준수 (초 / HTTP-date)
+    - 호출 노드의 전체 마감 시간(deadline) 전파 (contextvars)
+
+사용 예시:
+    from tools.http_transport import get_http_transport, request_deadline
+
+    with request_deadline(30):          # 노드 전체 30초
+        resp = get_http_transport().get(url, timeout=10)   # 남은 시간으로 자동 단축
+"""
+
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+# =============================================================================
+# 마감 시간 (Deadline) 전파
+# =============================================================================
+
+class DeadlineExceeded(TimeoutError):
+    """호출 노드의 전체 마감 시간 초과"""
+
+
+# time.monotonic() 기준 절대 마감 시각 (None = 제한 없음)
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("http_deadline", default=None)
+
+
+@contextmanager
+def request_deadline(seconds: Optional[float]):
+    """
+    블록 안의 모든 HTTP 호출에 전체 마감 시간을 적용합니다.
+
+    중첩 시 더 이른 마감 시간이 우선합니다.
+    ThreadPoolExecutor 작업에는 contextvars.copy_context().run 으로 전달해야 합니다.
+    """
+    if seconds is None:
+        yield
+        return
+
+    new_deadline = time.monotonic() + max(0.0, seconds)
+    current = _deadline.get()
+    if current is not None:
+        new_deadline = min(current, new_deadline)
+
+    token = _deadline.set(new_deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    """현재 컨텍스트의 남은 시간 (초). 마감 시간이 없으면 None"""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def _clamp_timeout(timeout: Any, remaining: Optional[float]) -> Any:
+    """requests timeout (float 또는 (connect, read))을 남은 시간으로 단축"""
+    if remaining is None:
+        return timeout
+    if timeout is None:
+        return remaining
+    if isinstance(timeout, tuple):
+        return tuple(remaining if t is None else min(t, remaining) for t in timeout)
+    return min(timeout, remaining)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더 (초 또는 HTTP-date) → 대기 초. 해석 불가 시 None"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+# =============================================================================
+# HTTP Transport
+# =============================================================================
+
+class HttpTransport:
+    """
+    공유 HTTP Transport (Thread-safe)
+
+    Args:
+        pool_connections: 연결 풀을 유지할 호스트 수
+        pool_maxsize: 호스트별 최대 연결 수 (초과 요청은 대기)
+        max_retries: 429/503 재시도 횟수
+        max_retry_after: 허용할 최대 Retry-After 대기 (초, 초과 시 재시도하지 않음)
+        default_timeout: timeout 미지정 시 기본값 (초)
+    """
+
+    RETRY_STATUS = (429, 503)
+
+    def __init__(
+        self,
+        pool_connections: int = 20,
+        pool_maxsize: int = 10,
+        max_retries: int = 2,
+        max_retry_after: float = 30.0,
+        default_timeout: float = 10.0,
+        user_agent: str = "Mozilla/5.0 (compatible; PlanCraftBot/1.0)",
+    ):
+        self.max_retries = max_retries
+        self.max_retry_after = max_retry_after
+        self.default_timeout = default_timeout
+
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=True)
+        self._session = requests.Session()
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers["User-Agent"] = user_agent
+
+        self._stats_lock = threading.Lock()
+        self._stats = {"requests": 0, "retries": 0, "deadline_exceeded": 0}
+
+    def request(self, method: str, url: str, timeout: Any = None, **kwargs) -> requests.Response:
+        """
+        HTTP 요청 (연결 풀 재사용 + Retry-After + 마감 시간 적용)
+
+        429/503 응답은 Retry-After(없으면 지수 백오프)만큼 기다려 재시도하며,
+        대기 시간이 마감 시간이나 max_retry_after를 넘으면 해당 응답을 그대로 반환합니다.
+
+        Raises:
+            DeadlineExceeded: 요청 전/대기 중 마감 시간 초과
+            requests.RequestException: 네트워크 오류
+        """
+        timeout = self.default_timeout if timeout is None else timeout
+
+        for attempt in range(self.max_retries + 1):
+            remaining = remaining_time()
+            if remaining is not None and remaining <= 0:
+                self._bump("deadline_exceeded")
+                raise DeadlineExceeded(f"HTTP 마감 시간 초과: {method} {url}")
+
+            self._bump("requests")
+            response = self._session.request(method, url, timeout=_clamp_timeout(timeout, remaining), **kwargs)
+            if response.status_code not in self.RETRY_STATUS or attempt == self.max_retries:
+                return response
+
+            wait = parse_retry_after(response.headers.get("Retry-After"))
+            if wait is None:
+                wait = 0.5 * (2 ** attempt)
+            remaining = remaining_time()
+            if wait > self.max_retry_after or (remaining is not None and wait >= remaining):
+                return response
+
+            print(f"[WARN] HTTP {response.status_code} - {wait:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries}): {url}")
+            response.close()
+            self._bump("retries")
+            time.sleep(wait)
+
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def close(self) -> None:
+        self._session.close()
+
+    def _bump(self, key: str) -> None:
+        with self._stats_lock:
+            self._stats[key] += 1
+
+
+# =============================================================================
+# 전역 인스턴스
+# =============================================================================
+
+_http_transport: Optional[HttpTransport] = None
+_http_transport_lock = threading.Lock()
+
+
+def get_http_transport() -> HttpTransport:
+    """전역 HttpTransport 인스턴스 반환 (싱글톤)"""
+    global _http_transport
+    if _http_transport is None:
+        with _http_transport_lock:
+            if _http_transport is None:
+                from utils.settings import settings
+                _http_transport = HttpTransport(
+                    pool_maxsize=settings.HTTP_POOL_MAXSIZE_PER_HOST,
+                    max_retries=settings.HTTP_MAX_RETRIES,
+                    max_retry_after=settings.HTTP_MAX_RETRY_AFTER_SEC,
+                )
+    return _http_transport
@@ -16,6 +16,9 @@ PlanCraft Agent - MCP 통합 클라이언트
     
     # 웹 검색
     results = await toolkit.search("AI 트렌드 2025")
+
+[NEW] 동기 래퍼(fetch_url_sync / search_sync)는 호출마다 서버를 띄우지 않고
+tools/mcp_pool.py의 웜 세션 풀을 재사용합니다.
 """
 
 import os
@@ -32,6 +35,11 @@ from urllib.parse import urlparse
 BLOCKED_HOSTS = {"localhost", "127.0.0.1", "0.0.0.0", "::1", "[::1]"}
 ALLOWED_SCHEMES = {"http", "https"}
 
+TAVILY_SEARCH_URL = "https://api.tavily.com/search"
+
+# 본문 추출 대상 콘텐츠 형식 (그 외 바이너리는 받지 않음)
+TEXT_CONTENT_TYPES = ("text/", "html", "xml", "json")
+
 
 def _is_safe_url(url: str) -> bool:
     """
@@ -56,6 +64,94 @@ def _is_safe_url(url: str) -> bool:
         return False
 
 
+def build_mcp_server_config() -> Dict[str, Dict[str, Any]]:
+    """
+    실행 가능한 MCP 서버 연결 설정을 구성합니다.
+
+    - fetch: uvx 필요
+    - tavily: npx + TAVILY_API_KEY 필요
+
+    Returns:
+        Dict: MultiServerMCPClient 연결 설정 (MCP 비활성화/실행 불가 시 빈 dict)
+    """
+    import shutil
+    from utils.config import Config
+
+    if not Config.MCP_ENABLED or not Config.TAVILY_API_KEY:
+        return {}
+
+    server_config = {}
+
+    # 1. URL Fetch 서버 (uvx 필요)
+    if shutil.which("uvx") is not None:
+        server_config["fetch"] = {
+            "command": Config.MCP_FETCH_COMMAND,
+            "args": [Config.MCP_FETCH_SERVER],
+            "transport": "stdio",
+        }
+
+    # 2. Tavily 검색 서버 (npx 필요)
+    if shutil.which("npx") is not None:
+        server_config["tavily"] = {
+            "command": Config.MCP_TAVILY_COMMAND,
+            "args": ["-y", Config.MCP_TAVILY_SERVER],
+            "transport": "stdio",
+            "env": {
+                "TAVILY_API_KEY": Config.TAVILY_API_KEY
+            }
+        }
+
+    return server_config
+
+
+def _read_limited(response, max_bytes: int) -> bytes:
+    """
+    응답 본문을 max_bytes까지만 스트리밍으로 읽습니다.
+
+    Content-Length가 없거나 거짓이어도 한도 이상은 받지 않으며,
+    한도를 넘는 문서는 앞부분만 사용합니다.
+    """
+    chunks = []
+    received = 0
+    for chunk in response.iter_content(chunk_size=16384):
+        if not chunk:
+            continue
+        chunks.append(chunk[:max_bytes - received])
+        received += len(chunks[-1])
+        if received >= max_bytes:
+            break
+    return b"".join(chunks)
+
+
+def html_to_text(html: str, max_length: int = 5000, budget_chars: int = 300_000) -> str:
+    """
+    HTML → 본문 텍스트 추출
+
+    Args:
+        html: HTML 문자열
+        max_length: 반환할 최대 문자 수
+        budget_chars: 파싱할 최대 HTML 문자 수 (파싱 비용 상한)
+    """
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html[:budget_chars], 'html.parser')
+    for tag in soup(['script', 'style', 'nav', 'footer', 'header']):
+        tag.decompose()
+
+    lines = []
+    length = 0
+    for line in soup.get_text(separator='\n', strip=True).split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+        lines.append(line)
+        length += len(line) + 1
+        if length >= max_length:
+            break
+    content = '\n'.join(lines)
+    return content[:max_length] if len(content) > max_length else content
+
+
 class MCPToolkit:
     """
     MCP 통합 도구 모음
@@ -83,7 +179,7 @@ class MCPToolkit:
         MCP 서버들에 연결합니다.
         
         Node.js/uvx 환경이 없는 경우(서버 등) 자동으로
-        Tavily Python SDK 모드로 동작하도록 처리합니다.
+        Fallback 모드(Tavily REST API 직접 호출)로 동작하도록 처리합니다.
         
         Returns:
             bool: 초기화 성공 여부
@@ -97,11 +193,11 @@ class MCPToolkit:
         has_uvx = shutil.which("uvx") is not None
         has_npx = shutil.which("npx") is not None
         
-        # 둘 다 없으면 MCP 연결 시도하지 않고 바로 SDK 모드 사용
+        # 둘 다 없으면 MCP 연결 시도하지 않고 바로 Fallback 모드 사용
         if not has_uvx and not has_npx:
-            print("[INFO] uvx/npx 미감지 - Tavily Python SDK 모드로 동작")
+            print("[INFO] uvx/npx 미감지 - Tavily REST API(Fallback) 모드로 동작")
             # _initialized를 True로 설정하여 search() 메서드가 호출되도록 함
-            # search() 내부에서 SDK로 분기됨
+            # search() 내부에서 _fallback_search()로 분기됨
             self._initialized = True 
             return True
         
@@ -115,30 +211,11 @@ class MCPToolkit:
                 return False
             
             # MCP 서버 설정 구성
-            server_config = {}
-            
-            # 1. URL Fetch 서버 (uvx 필요)
-            if has_uvx:
-                server_config["fetch"] = {
-                    "command": Config.MCP_FETCH_COMMAND,
-                    "args": [Config.MCP_FETCH_SERVER],
-                    "transport": "stdio",
-                }
+            server_config = build_mcp_server_config()
             
-            # 2. Tavily 검색 서버 (npx 필요)
-            if has_npx:
-                server_config["tavily"] = {
-                    "command": Config.MCP_TAVILY_COMMAND,
-                    "args": ["-y", Config.MCP_TAVILY_SERVER],
-                    "transport": "stdio",
-                    "env": {
-                        "TAVILY_API_KEY": Config.TAVILY_API_KEY
-                    }
-                }
-            
-            # 연결할 서버가 없으면 SDK 모드
+            # 연결할 서버가 없으면 Fallback 모드
             if not server_config:
-                 print("[INFO] 실행 가능한 MCP 서버 없음 - SDK 모드로 동작")
+                 print("[INFO] 실행 가능한 MCP 서버 없음 - Fallback 모드로 동작")
                  self._initialized = True
                  return True
 
@@ -160,14 +237,14 @@ class MCPToolkit:
             
         except ImportError:
             print("⚠️ langchain-mcp-adapters 패키지가 설치되지 않았습니다")
-            # 패키지 없어도 SDK는 동작 가능
+            # 패키지 없어도 Fallback(REST API)은 동작 가능
             self._initialized = True
             return True
             
         except Exception as e:
             print(f"⚠️ MCP 서버 연결 실패: {e}")
-            print("  → SDK/Fallback 모드로 전환")
-            # 실패해도 SDK 시도를 위해 True로 설정
+            print("  → Fallback 모드로 전환")
+            # 실패해도 Fallback 검색을 위해 True로 설정
             self._initialized = True
             return True
     
@@ -236,22 +313,25 @@ class MCPToolkit:
             return "[보안 오류: 접근할 수 없는 URL입니다]"
 
         try:
-            import requests
-            from bs4 import BeautifulSoup
+            from tools.http_transport import get_http_transport
+            from utils.settings import settings
 
-            headers = {"User-Agent": "Mozilla/5.0 (compatible; PlanCraftBot/1.0)"}
-            response = requests.get(url, headers=headers, timeout=10, verify=True)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            for tag in soup(['script', 'style', 'nav', 'footer', 'header']):
-                tag.decompose()
-            
-            text = soup.get_text(separator='\n', strip=True)
-            lines = [line.strip() for line in text.split('\n') if line.strip()]
-            content = '\n'.join(lines)
-            
-            return content[:max_length] if len(content) > max_length else content
+            # [UPDATE] 공유 Transport (Keep-alive 연결 재사용 + Retry-After + 마감 시간)
+            # [NEW] 스트리밍으로 크기 제한까지만 수신
+            response = get_http_transport().get(url, timeout=10, verify=True, stream=True)
+            try:
+                response.raise_for_status()
+                content_type = response.headers.get("Content-Type", "").lower()
+                if content_type and not any(t in content_type for t in TEXT_CONTENT_TYPES):
+                    return f"[웹 조회 실패: 지원하지 않는 콘텐츠 형식 ({content_type})]"
+                raw = _read_limited(response, settings.WEB_FETCH_MAX_BYTES)
+            finally:
+                response.close()
+
+            # charset 미지정 시 ISO-8859-1 대신 UTF-8로 해석 (한글 페이지)
+            encoding = response.encoding if "charset=" in content_type else "utf-8"
+            html = raw.decode(encoding or "utf-8", errors="replace")
+            return html_to_text(html, max_length, settings.WEB_FETCH_HTML_BUDGET_CHARS)
             
         except Exception as e:
             return f"[웹 조회 실패: {str(e)}]"
@@ -263,16 +343,17 @@ class MCPToolkit:
         search_depth: str = "basic"  # [NEW] 검색 깊이 파라미터
     ) -> Dict[str, Any]:
         """
-        Tavily Python SDK를 사용한 웹 검색
+        Tavily Search API를 사용한 웹 검색
 
         [UPDATE] v1.5.0 - search_depth 파라미터 추가
         - basic: 빠른 검색 (비용 절감)
         - advanced: 심층 검색 (품질 향상)
 
+        [UPDATE] 호출마다 TavilyClient를 만들지 않고 공유 HTTP Transport로 직접 호출
         MCP 없이도 Tavily API로 직접 검색합니다.
         """
         try:
-            from tavily import TavilyClient
+            from tools.http_transport import get_http_transport
             from utils.config import Config
 
             if not Config.TAVILY_API_KEY:
@@ -284,20 +365,20 @@ class MCPToolkit:
                     "source": "no-api-key"
                 }
 
-            # Tavily 클라이언트 생성
-            client = TavilyClient(api_key=Config.TAVILY_API_KEY)
-
             # [UPDATE] 프리셋 기반 검색 깊이 적용
             search_params = {
+                "api_key": Config.TAVILY_API_KEY,
                 "query": query,
                 "search_depth": search_depth,  # [NEW] 파라미터로 전달
                 "include_answer": True,     # AI 요약 답변 포함
                 "include_raw_content": search_depth == "advanced",  # advanced일 때만 본문 포함
                 "max_results": max_results
             }
-            print(f"[Tavily SDK] search_depth={search_depth}, max_results={max_results}")
+            print(f"[Tavily API] search_depth={search_depth}, max_results={max_results}")
             
-            response = client.search(**search_params)
+            http_response = get_http_transport().post(TAVILY_SEARCH_URL, json=search_params, timeout=30)
+            http_response.raise_for_status()
+            response = http_response.json()
             
             # 결과 포맷팅
             results = []
@@ -340,17 +421,9 @@ class MCPToolkit:
                 "query": query,
                 "results": results,
                 "formatted": "\n\n".join(formatted_parts),
-                "source": "tavily-python-sdk"
+                "source": "tavily-api"
             }
             
-        except ImportError:
-            return {
-                "success": False,
-                "query": query,
-                "results": [],
-                "error": "tavily-python not installed. Run: pip install tavily-python",
-                "source": "import-error"
-            }
         except Exception as e:
             return {
                 "success": False,
@@ -441,15 +514,18 @@ def fetch_url_sync(url: str, max_length: int = 5000) -> str:
     has_uvx = shutil.which("uvx") is not None
     
     if Config.MCP_ENABLED and has_uvx:
-        try:
-            async def _async_fetch():
-                toolkit = MCPToolkit()
-                await toolkit.initialize()
-                return await toolkit.fetch_url(url, max_length)
-            
-            return _run_async(_async_fetch())
-        except Exception as e:
-            print(f"[WARN] MCP fetch 실패, Fallback 사용: {e}")
+        # [REFACTOR] 호출마다 서버 기동 → 웜 세션 풀 재사용
+        from tools.mcp_pool import get_mcp_pool
+
+        pool = get_mcp_pool()
+        if pool and pool.has_server("fetch"):
+            try:
+                # 호출 노드의 마감 시간이 있으면 남은 시간만 대기
+                from tools.http_transport import remaining_time
+                content = str(pool.call_tool("fetch", "fetch", {"url": url}, timeout=remaining_time()))
+                return content[:max_length] if len(content) > max_length else content
+            except Exception as e:
+                print(f"[WARN] MCP fetch 실패, Fallback 사용: {e}")
     
     # Fallback: requests 직접 사용
     toolkit = MCPToolkit(use_mcp=False)
@@ -471,8 +547,8 @@ def search_sync(
         max_results: 최대 결과 수
         search_depth: 검색 깊이 ("basic" 또는 "advanced")
 
-    MCP 모드: 비동기 Tavily MCP 호출을 동기로 변환
-    Fallback 모드: 빈 결과 반환 (DuckDuckGo 제거됨)
+    MCP 모드: 웜 세션 풀의 Tavily MCP 호출 (호출 실패 시 success=False, source="mcp-error")
+    Fallback 모드: 공유 HTTP Transport로 Tavily REST API 직접 호출 (MCP 비활성화 / 서버 실행 불가 시)
     """
     from utils.config import Config
     import shutil
@@ -481,23 +557,32 @@ def search_sync(
     has_npx = shutil.which("npx") is not None
 
     if Config.MCP_ENABLED and has_npx:
-        try:
-            async def _async_search():
-                toolkit = MCPToolkit()
-                await toolkit.initialize()
-                return await toolkit.search(query, max_results)
+        # [REFACTOR] 호출마다 서버 기동 → 웜 세션 풀 재사용
+        from tools.mcp_pool import get_mcp_pool
 
-            return _run_async(_async_search())
-        except Exception as e:
-            print(f"[WARN] MCP 검색 실패: {e}")
-            return {
-                "success": False,
-                "query": query,
-                "results": [],
-                "error": str(e),
-                "source": "mcp-error"
-            }
+        pool = get_mcp_pool()
+        if pool and pool.has_server("tavily"):
+            try:
+                from tools.http_transport import remaining_time
+                result = pool.call_tool(
+                    "tavily", "search", {"query": query, "max_results": max_results}, timeout=remaining_time()
+                )
+                return {
+                    "success": True,
+                    "query": query,
+                    "results": result,
+                    "source": "tavily-mcp"
+                }
+            except Exception as e:
+                print(f"[WARN] MCP 검색 실패: {e}")
+                return {
+                    "success": False,
+                    "query": query,
+                    "results": [],
+                    "error": str(e),
+                    "source": "mcp-error"
+                }
 
-    # Fallback: Tavily Python SDK 사용
+    # Fallback: 공유 HTTP Transport로 Tavily REST API 직접 호출 (_fallback_search)
     toolkit = MCPToolkit(use_mcp=False)
     return toolkit._fallback_search(query, max_results, search_depth=search_depth)
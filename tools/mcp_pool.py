@@ -0,0 +1,424 @@
+"""
+PlanCraft Agent - MCP 세션 풀
+
+fetch_url_sync / search_sync 호출마다 stdio MCP 서버(uvx/npx)를 새로 띄우고
+핸드셰이크를 반복하던 비용을 없애기 위해, 프로세스 전역에서 재사용하는
+"웜(warm)" MCP 세션 풀을 제공합니다.
+
+구조:
+    - 전용 백그라운드 스레드에서 asyncio 이벤트 루프 1개를 상시 실행
+    - 서버별 세션 소유 태스크가 stdio 프로세스 + ClientSession 수명을 관리
+    - 동기 호출자는 run_coroutine_threadsafe로 루프에 작업을 제출
+
+기능:
+    - 헬스 체크: 주기적으로 ping, 실패 시 세션 폐기 후 재기동
+    - 자동 재기동: 비정상 종료된 서버를 백오프를 두고 다시 띄움
+    - 서버별 동시 호출 수 제한 (Semaphore)
+    - 종료 처리: atexit 및 FastAPI lifespan에서 shutdown_mcp_pool() 호출
+
+사용 예시:
+    from tools.mcp_pool import get_mcp_pool
+
+    pool = get_mcp_pool()
+    if pool and pool.has_server("fetch"):
+        content = pool.call_tool("fetch", "fetch", {"url": "https://example.com"})
+"""
+
+import asyncio
+import atexit
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+# =============================================================================
+# 서버 슬롯 (서버 1개의 세션 상태)
+# =============================================================================
+
+class _ServerSlot:
+    """서버 1개의 세션/도구/동시성 상태 (이벤트 루프 스레드에서만 접근)"""
+
+    def __init__(self, name: str, max_concurrency: int):
+        self.name = name
+        self.session = None
+        self.tools: Dict[str, Any] = {}
+        self.ready = asyncio.Event()
+        self.broken = asyncio.Event()
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.task: Optional[asyncio.Task] = None
+        self.keep_warm = False       # 한 번이라도 연결되면 크래시 시 자동 재기동
+        self.failures = 0            # 연속 기동 실패 횟수
+        self.next_spawn_at = 0.0     # 재기동 백오프 기준 시각 (monotonic)
+        self.spawns = 0
+        self.last_error: Optional[str] = None
+
+    @property
+    def running(self) -> bool:
+        return self.task is not None and not self.task.done()
+
+
+# =============================================================================
+# MCP 세션 풀
+# =============================================================================
+
+class MCPSessionPool:
+    """
+    프로세스 전역 MCP 세션 풀 (Thread-safe)
+
+    Args:
+        server_config: MultiServerMCPClient 연결 설정 {서버명: {...}}
+        max_concurrency: 서버별 최대 동시 호출 수
+        call_timeout: 도구 호출 타임아웃 (초)
+        startup_timeout: 서버 기동 + 핸드셰이크 타임아웃 (초)
+        health_interval: 헬스 체크(ping) 주기 (초)
+        max_restarts: 연속 기동 실패 허용 횟수 (초과 시 다음 호출까지 재기동 중단)
+        client_factory: 테스트용 클라이언트 생성 함수 (기본: MultiServerMCPClient)
+    """
+
+    def __init__(
+        self,
+        server_config: Dict[str, Dict[str, Any]],
+        max_concurrency: int = 4,
+        call_timeout: float = 30.0,
+        startup_timeout: float = 60.0,
+        health_interval: float = 30.0,
+        max_restarts: int = 3,
+        client_factory: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    ):
+        self._server_config = dict(server_config)
+        self._max_concurrency = max(1, max_concurrency)
+        self.call_timeout = call_timeout
+        self.startup_timeout = startup_timeout
+        self.health_interval = health_interval
+        self.max_restarts = max_restarts
+        self._client_factory = client_factory
+
+        self._client = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._closed = False
+        self._slots: Dict[str, _ServerSlot] = {}
+        self._health_task: Optional[asyncio.Task] = None
+        self._stats = {"calls": 0, "errors": 0, "spawns": 0, "respawns": 0, "health_failures": 0}
+
+    # =========================================================================
+    # Public API (동기)
+    # =========================================================================
+
+    def has_server(self, name: str) -> bool:
+        return name in self._server_config
+
+    def call_tool(self, server: str, tool_name: str, args: Dict[str, Any], timeout: Optional[float] = None) -> Any:
+        """
+        웜 세션으로 MCP 도구를 호출합니다 (동기).
+
+        Args:
+            server: 서버명 (예: "fetch", "tavily")
+            tool_name: 도구명 (정확히 일치하는 도구가 없으면 이름에 포함된 첫 도구)
+            args: 도구 인자
+            timeout: 전체 대기 시간 (기본: startup_timeout + call_timeout)
+
+        Raises:
+            KeyError: 등록되지 않은 서버
+            RuntimeError: 풀 종료 후 호출 / 서버 기동 실패
+            TimeoutError: 호출 타임아웃
+        """
+        if not self.has_server(server):
+            raise KeyError(f"등록되지 않은 MCP 서버: {server}")
+
+        loop = self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(self._call(server, tool_name, args), loop)
+        wait = timeout if timeout is not None else self.startup_timeout + self.call_timeout
+        try:
+            return future.result(timeout=wait)
+        except Exception:
+            future.cancel()
+            raise
+
+    def warmup(self, *servers: str, timeout: Optional[float] = None) -> Dict[str, bool]:
+        """서버를 미리 기동합니다. {서버명: 성공 여부} 반환"""
+        loop = self._ensure_loop()
+        names = servers or tuple(self._server_config)
+        future = asyncio.run_coroutine_threadsafe(self._warmup(names), loop)
+        return future.result(timeout=timeout or self.startup_timeout + 5)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """호출/기동 통계 및 서버별 상태"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats["servers"] = {
+            name: {
+                "ready": slot.ready.is_set(),
+                "spawns": slot.spawns,
+                "failures": slot.failures,
+                "last_error": slot.last_error,
+            }
+            for name, slot in list(self._slots.items())
+        }
+        return stats
+
+    def close(self, timeout: float = 10.0) -> None:
+        """모든 세션을 닫고 이벤트 루프 스레드를 종료합니다 (멱등)."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            loop, thread = self._loop, self._thread
+
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout=timeout)
+        except Exception as e:
+            print(f"[WARN] MCP 세션 풀 종료 중 오류: {e}")
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            if thread is not None:
+                thread.join(timeout=timeout)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    # =========================================================================
+    # 이벤트 루프 스레드
+    # =========================================================================
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("MCP 세션 풀이 이미 종료되었습니다")
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def _run():
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+                    loop.close()
+
+                self._thread = threading.Thread(target=_run, name="mcp-session-pool", daemon=True)
+                self._thread.start()
+                ready.wait()
+                self._loop = loop
+                asyncio.run_coroutine_threadsafe(self._start_health_loop(), loop).result()
+            return self._loop
+
+    def _get_client(self):
+        if self._client is None:
+            if self._client_factory is not None:
+                self._client = self._client_factory(self._server_config)
+            else:
+                from langchain_mcp_adapters.client import MultiServerMCPClient
+                self._client = MultiServerMCPClient(self._server_config)
+        return self._client
+
+    def _slot(self, name: str) -> _ServerSlot:
+        slot = self._slots.get(name)
+        if slot is None:
+            slot = _ServerSlot(name, self._max_concurrency)
+            self._slots[name] = slot
+        return slot
+
+    def _bump(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+
+    # =========================================================================
+    # 세션 수명 관리 (루프 스레드)
+    # =========================================================================
+
+    async def _serve(self, slot: _ServerSlot) -> None:
+        """서버 1회 수명: 기동 → 도구 로드 → broken/종료까지 대기 → 정리"""
+        from langchain_mcp_adapters.tools import load_mcp_tools
+
+        slot.broken.clear()
+        slot.spawns += 1
+        self._bump("respawns" if slot.spawns > 1 else "spawns")
+        try:
+            async with self._get_client().session(slot.name) as session:
+                tools = await load_mcp_tools(session)
+                slot.session = session
+                slot.tools = {tool.name: tool for tool in tools}
+                slot.failures = 0
+                slot.last_error = None
+                slot.keep_warm = True
+                slot.ready.set()
+                print(f"[INFO] MCP 세션 연결: {slot.name} ({len(tools)}개 도구)")
+                await slot.broken.wait()
+        except asyncio.CancelledError:
+            raise
+        except BaseException as e:  # stdio 프로세스 종료 시 ExceptionGroup 가능
+            slot.failures += 1
+            slot.last_error = str(e)
+            slot.next_spawn_at = time.monotonic() + min(2 ** slot.failures, 30)
+            print(f"[WARN] MCP 서버 세션 종료 ({slot.name}): {e}")
+        finally:
+            slot.ready.clear()
+            slot.session = None
+            slot.tools = {}
+
+    def _spawn(self, slot: _ServerSlot) -> None:
+        if not slot.running:
+            slot.task = asyncio.get_running_loop().create_task(self._serve(slot))
+
+    async def _wait_ready(self, slot: _ServerSlot) -> None:
+        """세션 준비 대기 (필요 시 기동). 기동 실패 시 RuntimeError"""
+        if slot.ready.is_set():
+            return
+        self._spawn(slot)
+        ready_waiter = asyncio.ensure_future(slot.ready.wait())
+        try:
+            done, _ = await asyncio.wait(
+                {ready_waiter, slot.task},
+                timeout=self.startup_timeout,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            ready_waiter.cancel()
+        if not slot.ready.is_set():
+            if not done:
+                slot.broken.set()
+                raise TimeoutError(f"MCP 서버 기동 타임아웃: {slot.name}")
+            raise RuntimeError(f"MCP 서버 기동 실패 ({slot.name}): {slot.last_error}")
+
+    async def _warmup(self, names) -> Dict[str, bool]:
+        results = {}
+        for name in names:
+            try:
+                await self._wait_ready(self._slot(name))
+                results[name] = True
+            except Exception:
+                results[name] = False
+        return results
+
+    async def _is_alive(self, slot: _ServerSlot) -> bool:
+        if not slot.ready.is_set() or slot.session is None:
+            return False
+        try:
+            await asyncio.wait_for(slot.session.send_ping(), timeout=min(5.0, self.call_timeout))
+            return True
+        except Exception:
+            return False
+
+    def _find_tool(self, slot: _ServerSlot, tool_name: str):
+        tool = slot.tools.get(tool_name)
+        if tool is None:
+            tool = next((t for name, t in slot.tools.items() if tool_name in name.lower()), None)
+        if tool is None:
+            raise KeyError(f"MCP 도구 없음 ({slot.name}): {tool_name}")
+        return tool
+
+    async def _call(self, server: str, tool_name: str, args: Dict[str, Any]) -> Any:
+        """도구 호출. 세션이 죽어 있으면 1회 재기동 후 재시도"""
+        slot = self._slot(server)
+        self._bump("calls")
+        for attempt in range(2):
+            await self._wait_ready(slot)
+            async with slot.semaphore:
+                tool = self._find_tool(slot, tool_name)
+                try:
+                    return await asyncio.wait_for(tool.ainvoke(args), timeout=self.call_timeout)
+                except Exception:
+                    # 세션 자체가 죽은 경우만 재기동/재시도 (도구 오류는 그대로 전달)
+                    if attempt == 0 and not await self._is_alive(slot):
+                        self._bump("health_failures")
+                        slot.broken.set()
+                        if slot.task is not None:
+                            await asyncio.gather(slot.task, return_exceptions=True)
+                        continue
+                    self._bump("errors")
+                    raise
+        raise RuntimeError(f"MCP 호출 실패: {server}")
+
+    # =========================================================================
+    # 헬스 체크 / 종료
+    # =========================================================================
+
+    async def _start_health_loop(self) -> None:
+        self._health_task = asyncio.get_running_loop().create_task(self._health_loop())
+
+    async def _health_loop(self) -> None:
+        """주기적 ping + 크래시된 웜 서버 재기동"""
+        while True:
+            await asyncio.sleep(self.health_interval)
+            now = time.monotonic()
+            for slot in list(self._slots.values()):
+                if slot.ready.is_set():
+                    if not await self._is_alive(slot):
+                        self._bump("health_failures")
+                        print(f"[WARN] MCP 헬스 체크 실패: {slot.name} → 재기동")
+                        slot.broken.set()
+                elif (
+                    slot.keep_warm
+                    and not slot.running
+                    and slot.failures <= self.max_restarts
+                    and now >= slot.next_spawn_at
+                ):
+                    self._spawn(slot)
+
+    async def _shutdown(self) -> None:
+        if self._health_task is not None:
+            self._health_task.cancel()
+        tasks = []
+        for slot in self._slots.values():
+            slot.keep_warm = False
+            slot.broken.set()
+            if slot.task is not None:
+                tasks.append(slot.task)
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+# =============================================================================
+# 전역 인스턴스
+# =============================================================================
+
+_mcp_pool: Optional[MCPSessionPool] = None
+_mcp_pool_lock = threading.Lock()
+_mcp_pool_checked = False
+
+
+def get_mcp_pool() -> Optional[MCPSessionPool]:
+    """
+    전역 MCPSessionPool 반환 (싱글톤)
+
+    MCP 비활성화, 실행 가능한 서버 없음, langchain-mcp-adapters 미설치 시 None.
+    """
+    global _mcp_pool, _mcp_pool_checked
+    if _mcp_pool_checked:
+        return _mcp_pool
+
+    with _mcp_pool_lock:
+        if not _mcp_pool_checked:
+            from tools.mcp_client import build_mcp_server_config
+            from utils.settings import settings
+
+            server_config = build_mcp_server_config()
+            if server_config:
+                try:
+                    import langchain_mcp_adapters  # noqa: F401
+                    _mcp_pool = MCPSessionPool(
+                        server_config,
+                        max_concurrency=settings.MCP_POOL_MAX_CONCURRENCY,
+                        call_timeout=settings.MCP_POOL_CALL_TIMEOUT_SEC,
+                        startup_timeout=settings.MCP_POOL_STARTUP_TIMEOUT_SEC,
+                        health_interval=settings.MCP_POOL_HEALTH_INTERVAL_SEC,
+                    )
+                    atexit.register(shutdown_mcp_pool)
+                except ImportError:
+                    print("⚠️ langchain-mcp-adapters 패키지가 설치되지 않았습니다")
+            _mcp_pool_checked = True
+    return _mcp_pool
+
+
+def shutdown_mcp_pool() -> None:
+    """전역 세션 풀 종료 (앱 종료 시 호출, 멱등)"""
+    global _mcp_pool, _mcp_pool_checked
+    with _mcp_pool_lock:
+        pool, _mcp_pool = _mcp_pool, None
+        _mcp_pool_checked = False
+    if pool is not None:
+        pool.close()
@@ -1,116 +1,382 @@
 """
 PlanCraft Agent - 웹 검색 결과 캐싱
 
-세션 기반 검색 결과 캐싱으로 동일 쿼리 중복 호출을 방지합니다.
-- LRU 방식으로 메모리 관리
+동일 쿼리 중복 호출을 방지하는 2단계 검색 결과 캐시입니다.
+- L1: 프로세스 메모리 LRU (OrderedDict)
+- L2: SQLite 파일 (재시작/다른 uvicorn 워커와 공유)
 - SHA256 해시 기반 키 생성 (보안 강화)
-- TTL 없음 (세션 종료 시 자동 초기화)
+- 쿼리 유형별 TTL (뉴스/시장 동향은 짧게, 개념/가이드는 길게)
+- Single-flight: 동시에 들어온 동일 쿼리 미스는 1번만 검색
 
 사용법:
-    from tools.search_cache import get_cached_search, cache_search_result
+    from tools.search_cache import get_search_cache
 
-    # 캐시 조회
+    cache = get_search_cache()
+    result, source = cache.get_or_fetch(query, lambda: perform_search(query))
+
+    # 기존 방식도 그대로 지원
     cached = get_cached_search("피트니스 앱 시장 규모")
     if cached:
         return cached
-
-    # 검색 수행 후 캐싱
-    result = perform_search(query)
     cache_search_result(query, result)
 """
 
+import json
+import os
+import sqlite3
+import threading
+import time
 from hashlib import sha256
-from typing import Dict, Any, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 from collections import OrderedDict
 
 
+# =============================================================================
+# TTL 정책 (쿼리 유형별)
+# =============================================================================
+
+# 시점에 민감한 쿼리 (시장 규모, 뉴스, 트렌드)
+NEWS_KEYWORDS = (
+    "뉴스", "최신", "최근", "동향", "트렌드", "현황", "전망", "속보", "발표",
+    "주가", "시세", "금리", "환율", "올해", "이번", "news", "latest", "trend",
+)
+# 잘 변하지 않는 쿼리 (개념, 방법론, 가이드)
+EVERGREEN_KEYWORDS = (
+    "정의", "개념", "이란", "란 무엇", "방법론", "가이드", "원칙", "프레임워크",
+    "사례 연구", "what is", "how to", "definition", "framework",
+)
+
+DEFAULT_TTL_BY_CLASS: Dict[str, float] = {
+    "news": 6 * 3600,          # 6시간
+    "general": 24 * 3600,      # 1일
+    "evergreen": 7 * 24 * 3600,  # 7일
+}
+
+# 영속 캐시 경로 (SEARCH_CACHE_PATH="" 이면 메모리 전용)
+DEFAULT_CACHE_DB_PATH = os.getenv("SEARCH_CACHE_PATH", "./data/search_cache.db")
+
+
+def classify_query(query: str) -> str:
+    """
+    쿼리 유형 분류 (TTL 결정용)
+
+    Returns:
+        "news" | "evergreen" | "general"
+    """
+    q = query.lower()
+    if any(kw in q for kw in NEWS_KEYWORDS):
+        return "news"
+    # 연도가 포함된 쿼리는 시점 의존 (예: "2025 시장 규모")
+    if any(str(year) in q for year in range(2015, 2041)):
+        return "news"
+    if any(kw in q for kw in EVERGREEN_KEYWORDS):
+        return "evergreen"
+    return "general"
+
+
+class _InFlight:
+    """진행 중인 검색 1건 (Single-flight 대기용)"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[BaseException] = None
+
+
 class SearchCache:
     """
-    LRU 기반 검색 결과 캐시
+    2단계(메모리 LRU + SQLite) 검색 결과 캐시
 
     동일 쿼리에 대한 중복 API 호출을 방지하여 비용을 절감합니다.
-    OrderedDict를 사용하여 LRU(Least Recently Used) 방식으로 관리합니다.
+    메모리 계층은 OrderedDict로 LRU(Least Recently Used) 방식으로 관리하고,
+    db_path가 주어지면 SQLite 계층에 결과를 영속 저장하여 프로세스 간 공유합니다.
 
     Attributes:
-        max_size: 최대 캐시 항목 수 (기본: 50)
-        _cache: OrderedDict 기반 캐시 저장소
+        max_size: 메모리 계층 최대 항목 수 (기본: 50)
+        db_path: SQLite 파일 경로 (None이면 메모리 전용)
+        ttl_by_class: 쿼리 유형별 TTL (초)
 
     Example:
-        >>> cache = SearchCache(max_size=10)
+        >>> cache = SearchCache(max_size=10, db_path="./data/search_cache.db")
         >>> cache.set("query1", {"results": [...]})
         >>> cache.get("query1")
         {"results": [...]}
     """
 
-    def __init__(self, max_size: int = 50):
-        self._cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+    # 디스크 계층 최대 항목 수 / 만료 항목 정리 주기 (set 호출 횟수)
+    MAX_DISK_ENTRIES = 5000
+    PURGE_EVERY = 50
+
+    def __init__(
+        self,
+        max_size: int = 50,
+        db_path: Optional[str] = None,
+        ttl_by_class: Optional[Dict[str, float]] = None,
+        clock: Callable[[], float] = time.time
+    ):
+        # key -> (result, expires_at)
+        self._cache: OrderedDict[str, Tuple[Dict[str, Any], float]] = OrderedDict()
         self._max_size = max_size
+        self._ttl_by_class = {**DEFAULT_TTL_BY_CLASS, **(ttl_by_class or {})}
+        self._clock = clock
+        self._lock = threading.RLock()
+
+        self._inflight: Dict[str, _InFlight] = {}
+        self._inflight_lock = threading.Lock()
+
         self._hits = 0
+        self._disk_hits = 0
         self._misses = 0
+        self._expired = 0
+        self._coalesced = 0
+        self._sets = 0
+
+        self._db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        if db_path:
+            self._conn = self._open_db(db_path)
+
+    # =========================================================================
+    # SQLite 계층
+    # =========================================================================
+
+    @staticmethod
+    def _open_db(db_path: str) -> Optional[sqlite3.Connection]:
+        try:
+            if db_path != ":memory:":
+                os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+            conn = sqlite3.connect(db_path, check_same_thread=False, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS search_cache ("
+                " key TEXT PRIMARY KEY, query_class TEXT NOT NULL,"
+                " result TEXT NOT NULL, created_at REAL NOT NULL, expires_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_search_cache_expires ON search_cache(expires_at)"
+            )
+            conn.commit()
+            return conn
+        except sqlite3.Error as e:
+            print(f"[WARN] Search cache DB unavailable, using memory only: {e}")
+            return None
+
+    def _disk_get(self, key: str, now: float) -> Optional[Tuple[Dict[str, Any], float]]:
+        if self._conn is None:
+            return None
+        try:
+            row = self._conn.execute(
+                "SELECT result, expires_at FROM search_cache WHERE key = ? AND expires_at > ?",
+                (key, now)
+            ).fetchone()
+        except sqlite3.Error as e:
+            print(f"[WARN] Search cache DB read failed: {e}")
+            return None
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1]
+
+    def _disk_set(self, key: str, query_class: str, result: Dict[str, Any], now: float, expires_at: float) -> None:
+        if self._conn is None:
+            return
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_cache (key, query_class, result, created_at, expires_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, query_class, json.dumps(result, ensure_ascii=False, default=str), now, expires_at)
+            )
+            if self._sets % self.PURGE_EVERY == 0:
+                self._conn.execute("DELETE FROM search_cache WHERE expires_at <= ?", (now,))
+                self._conn.execute(
+                    "DELETE FROM search_cache WHERE key IN ("
+                    " SELECT key FROM search_cache ORDER BY expires_at DESC LIMIT -1 OFFSET ?)",
+                    (self.MAX_DISK_ENTRIES,)
+                )
+            self._conn.commit()
+        except sqlite3.Error as e:
+            print(f"[WARN] Search cache DB write failed: {e}")
+
+    # =========================================================================
+    # 공개 API
+    # =========================================================================
 
     def _make_key(self, query: str) -> str:
         """쿼리 문자열을 SHA256 해시 키로 변환"""
         normalized = query.strip().lower()
         return sha256(normalized.encode()).hexdigest()[:32]  # 32자로 truncate
 
+    def ttl_for(self, query: str) -> float:
+        """쿼리 유형에 따른 TTL (초)"""
+        return self._ttl_by_class.get(classify_query(query), self._ttl_by_class["general"])
+
+    def _lookup(self, query: str) -> Tuple[Optional[Dict[str, Any]], str]:
+        """캐시 조회 → (결과, 출처: memory|disk|miss)"""
+        key = self._make_key(query)
+        now = self._clock()
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                result, expires_at = entry
+                if expires_at > now:
+                    # LRU: 최근 사용으로 이동
+                    self._cache.move_to_end(key)
+                    self._hits += 1
+                    return result, "memory"
+                # 만료 항목 제거
+                del self._cache[key]
+                self._expired += 1
+
+            disk_entry = self._disk_get(key, now)
+            if disk_entry is not None:
+                result, expires_at = disk_entry
+                self._put_memory(key, result, expires_at)
+                self._hits += 1
+                self._disk_hits += 1
+                return result, "disk"
+
+            self._misses += 1
+            return None, "miss"
+
     def get(self, query: str) -> Optional[Dict[str, Any]]:
         """
-        캐시에서 검색 결과 조회
+        캐시에서 검색 결과 조회 (메모리 → SQLite 순)
 
         Args:
             query: 검색 쿼리 문자열
 
         Returns:
-            캐시된 결과 (없으면 None)
+            캐시된 결과 (없거나 만료되었으면 None)
         """
-        key = self._make_key(query)
+        return self._lookup(query)[0]
+
+    def _put_memory(self, key: str, result: Dict[str, Any], expires_at: float) -> None:
+        # 이미 있으면 업데이트 후 최근으로 이동
         if key in self._cache:
-            # LRU: 최근 사용으로 이동
+            self._cache[key] = (result, expires_at)
             self._cache.move_to_end(key)
-            self._hits += 1
-            return self._cache[key]
-        self._misses += 1
-        return None
+            return
+
+        # 용량 초과 시 가장 오래된 항목 제거 (LRU)
+        if len(self._cache) >= self._max_size:
+            self._cache.popitem(last=False)
 
-    def set(self, query: str, result: Dict[str, Any]) -> None:
+        self._cache[key] = (result, expires_at)
+
+    def set(self, query: str, result: Dict[str, Any], ttl: Optional[float] = None) -> None:
         """
         검색 결과를 캐시에 저장
 
         Args:
             query: 검색 쿼리 문자열
             result: 저장할 검색 결과
+            ttl: 만료 시간 (초, 기본값: 쿼리 유형별 TTL)
         """
         key = self._make_key(query)
+        query_class = classify_query(query)
+        now = self._clock()
+        expires_at = now + (ttl if ttl is not None else self.ttl_for(query))
+
+        with self._lock:
+            self._sets += 1
+            self._put_memory(key, result, expires_at)
+            self._disk_set(key, query_class, result, now, expires_at)
+
+    def get_or_fetch(
+        self,
+        query: str,
+        fetch_fn: Callable[[], Dict[str, Any]],
+        should_cache: Callable[[Dict[str, Any]], bool] = lambda r: bool(r.get("success")),
+    ) -> Tuple[Dict[str, Any], str]:
+        """
+        캐시 조회 후 미스면 fetch_fn으로 검색하여 저장합니다.
 
-        # 이미 있으면 업데이트 후 최근으로 이동
-        if key in self._cache:
-            self._cache[key] = result
-            self._cache.move_to_end(key)
-            return
+        동시에 같은 쿼리가 미스되면 첫 호출만 fetch_fn을 실행하고,
+        나머지는 그 결과를 기다려 공유합니다. (Single-flight)
 
-        # 용량 초과 시 가장 오래된 항목 제거 (LRU)
-        if len(self._cache) >= self._max_size:
-            self._cache.popitem(last=False)
+        Args:
+            query: 검색 쿼리
+            fetch_fn: 실제 검색 함수
+            should_cache: 결과 저장 여부 판단 (기본: success=True만 저장)
+
+        Returns:
+            (결과, 출처): 출처는 "memory" | "disk" | "fetched" | "coalesced"
+        """
+        cached, source = self._lookup(query)
+        if cached is not None:
+            return cached, source
 
-        self._cache[key] = result
+        key = self._make_key(query)
+        with self._inflight_lock:
+            flight = self._inflight.get(key)
+            is_leader = flight is None
+            if is_leader:
+                flight = _InFlight()
+                self._inflight[key] = flight
+            else:
+                self._coalesced += 1
+
+        if not is_leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result, "coalesced"
+
+        try:
+            result = fetch_fn()
+            flight.result = result
+            if result is not None and should_cache(result):
+                self.set(query, result)
+            return result, "fetched"
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+            flight.event.set()
 
     def clear(self) -> None:
-        """캐시 초기화"""
-        self._cache.clear()
-        self._hits = 0
-        self._misses = 0
+        """캐시 초기화 (메모리 + SQLite)"""
+        with self._lock:
+            self._cache.clear()
+            if self._conn is not None:
+                try:
+                    self._conn.execute("DELETE FROM search_cache")
+                    self._conn.commit()
+                except sqlite3.Error as e:
+                    print(f"[WARN] Search cache DB clear failed: {e}")
+            self._hits = 0
+            self._disk_hits = 0
+            self._misses = 0
+            self._expired = 0
+            self._coalesced = 0
 
     def stats(self) -> Dict[str, Any]:
         """캐시 통계 반환"""
-        total = self._hits + self._misses
-        hit_rate = (self._hits / total * 100) if total > 0 else 0
-        return {
-            "size": len(self._cache),
-            "max_size": self._max_size,
-            "hits": self._hits,
-            "misses": self._misses,
-            "hit_rate": f"{hit_rate:.1f}%"
-        }
+        with self._lock:
+            total = self._hits + self._misses
+            hit_rate = (self._hits / total * 100) if total > 0 else 0
+            disk_size = None
+            if self._conn is not None:
+                try:
+                    disk_size = self._conn.execute(
+                        "SELECT COUNT(*) FROM search_cache WHERE expires_at > ?", (self._clock(),)
+                    ).fetchone()[0]
+                except sqlite3.Error:
+                    pass
+            return {
+                "size": len(self._cache),
+                "max_size": self._max_size,
+                "hits": self._hits,
+                "memory_hits": self._hits - self._disk_hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "expired": self._expired,
+                "coalesced": self._coalesced,
+                "persistent": self._conn is not None,
+                "disk_size": disk_size,
+                "hit_rate": f"{hit_rate:.1f}%"
+            }
 
 
 # =============================================================================
@@ -120,11 +386,16 @@ class SearchCache:
 _search_cache: Optional[SearchCache] = None
 
 
+_search_cache_lock = threading.Lock()
+
+
 def get_search_cache() -> SearchCache:
-    """전역 검색 캐시 인스턴스 반환"""
+    """전역 검색 캐시 인스턴스 반환 (SQLite 계층 포함)"""
     global _search_cache
     if _search_cache is None:
-        _search_cache = SearchCache()
+        with _search_cache_lock:
+            if _search_cache is None:
+                _search_cache = SearchCache(db_path=DEFAULT_CACHE_DB_PATH or None)
     return _search_cache
 
 
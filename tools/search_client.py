@@ -6,10 +6,10 @@ Tavily API를 HTTP Request로 직접 호출하여 의존성을 최소화합니
 """
 
 import os
-import requests
 from typing import List, Dict, Optional
 from urllib.parse import urlparse
 from utils.config import Config
+from tools.http_transport import get_http_transport
 
 # =============================================================================
 # 도메인 필터링 설정 (관련 없는 사이트 제외)
@@ -117,7 +117,8 @@ class SearchClient:
                 "max_results": max_results  # 필터링 손실 고려하여 더 많이 요청
             }
             
-            response = requests.post(self.base_url, json=payload, timeout=10)
+            # [UPDATE] 공유 Transport (Keep-alive 연결 재사용 + Retry-After + 마감 시간)
+            response = get_http_transport().post(self.base_url, json=payload, timeout=10)
             response.raise_for_status()
             
             data = response.json()
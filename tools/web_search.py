@@ -137,7 +137,8 @@ def _generate_search_query_with_llm(user_input: str, max_queries: int = 3) -> st
             print("[WARN] 입력이 정제 후 비어있음, 검색 스킵")
             return []
 
-        llm = get_llm(model_type="gpt-4o-mini", temperature=0.3)
+        # 같은 입력이면 같은 쿼리로 충분 → 응답 캐시 사용 (1일)
+        llm = get_llm(model_type="gpt-4o-mini", temperature=0.3, cache=24 * 3600)
 
         # [수정] 입력이 너무 길면 가장 최근 내용(뒤쪽) 위주로 자름 (컨텍스트 오염 방지)
         # 이전 턴의 전체 대화나 로그가 넘어올 경우를 대비해 뒷부분(최신 요청)을 우선합니다.
@@ -7,21 +7,70 @@ URL 직접 조회(Fetch) 및 Tavily 검색(Search)을 병렬로 처리합니다.
 [UPDATE] v1.5.0
 - 프리셋 기반 검색 제어 (max_queries, search_depth)
 - 검색 결과 캐싱 연동
+
+[UPDATE] 영속 캐시 + Single-flight
+- 동일 쿼리 동시 미스는 1번만 검색 (SearchCache.get_or_fetch)
+- 캐시 통계를 결과에 포함 (cache_stats)
+
+[UPDATE] 병렬 URL 조회
+- URL 조회와 검색 쿼리를 공유 마감 시간 아래 동시에 실행 (느린 사이트가 전체를 막지 않음)
+- 호스트별 동시 요청 제한, 마감 시 부분 결과 반환
 """
 
+import contextvars
 import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict
+from urllib.parse import urlparse
 from tools.mcp_client import fetch_url_sync, search_sync
 from tools.web_search import should_search_web
 from tools.search_client import _is_blocked_domain  # [NEW] 도메인 필터링
-from tools.search_cache import get_cached_search, cache_search_result, get_cache_stats  # [NEW] 캐싱
+from tools.search_cache import get_search_cache, get_cache_stats  # [NEW] 캐싱
+from tools.http_transport import request_deadline, remaining_time
+from utils.tracing import span
+
+
+# =============================================================================
+# 호스트별 동시 요청 제한 (Politeness)
+# =============================================================================
+
+_host_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+_host_semaphores_lock = threading.Lock()
+
+
+def _host_semaphore(url: str) -> threading.BoundedSemaphore:
+    """호스트별 세마포어 (프로세스 전역 - 동시에 실행되는 워크플로우 간 공유)"""
+    from utils.settings import settings
+
+    host = (urlparse(url).hostname or "").lower()
+    with _host_semaphores_lock:
+        semaphore = _host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = threading.BoundedSemaphore(max(1, settings.WEB_FETCH_PER_HOST_LIMIT))
+            _host_semaphores[host] = semaphore
+        return semaphore
+
+
+def _fetch_url_polite(url: str) -> str:
+    """호스트별 동시 요청 수 제한 하에 URL 조회 (마감 시간까지만 슬롯 대기)"""
+    with span("fetch_url", kind="search", host=urlparse(url).netloc):
+        semaphore = _host_semaphore(url)
+        remaining = remaining_time()
+        if not semaphore.acquire(timeout=max(0.0, remaining) if remaining is not None else None):
+            return "[웹 조회 실패: 호스트 대기 시간 초과]"
+        try:
+            return fetch_url_sync(url, max_length=3000)
+        finally:
+            semaphore.release()
 
 
 def execute_web_search(
     user_input: str,
     rag_context: str = "",
     max_queries: int = 3,      # [NEW] 최대 쿼리 수
-    search_depth: str = "basic"  # [NEW] 검색 깊이 (basic/advanced)
+    search_depth: str = "basic",  # [NEW] 검색 깊이 (basic/advanced)
+    deadline_sec: float = None  # [NEW] 전체 마감 시간 (None이면 호출 노드의 마감 시간 사용)
 ) -> dict:
     """
     웹 검색 또는 URL 조회를 수행하고 결과를 반환합니다.
@@ -31,138 +80,164 @@ def execute_web_search(
     - search_depth: 검색 깊이 (basic=빠른, advanced=심층)
     - 캐싱: 동일 쿼리 중복 호출 방지
 
+    [UPDATE] 병렬 URL 조회
+    - URL 조회와 검색 쿼리를 하나의 마감 시간 아래 동시에 실행
+    - 호스트별 동시 요청 수 제한 (WEB_FETCH_PER_HOST_LIMIT)
+    - 마감 시간 도달 시 완료된 결과만 반환 (partial=True)
+
     Args:
         user_input: 사용자 입력 문자열
         rag_context: RAG 검색 컨텍스트 (참고용)
         max_queries: 최대 검색 쿼리 수 (기본 3)
         search_depth: 검색 깊이 - "basic" 또는 "advanced" (기본 "basic")
+        deadline_sec: 전체 마감 시간 (초)
 
     Returns:
         dict: {
             "context": str | None,  # 포맷팅된 검색 결과 문자열
             "urls": List[str],      # 참조된 URL 목록
             "sources": List[dict],  # [{"title":, "url":}] 형태의 소스 목록
-            "error": str | None     # 에러 발생 시 메시지
+            "error": str | None,    # 에러 발생 시 메시지
+            "cache_stats": dict,    # 검색 캐시 통계 (hits, disk_hits, coalesced...)
+            "partial": bool,        # 마감 시간으로 일부 작업이 누락되었는지 여부
+            "timed_out": List[str]  # 마감 시간 내 끝나지 않은 URL/쿼리
         }
     """
     web_contents = []
     web_urls = []
     web_sources = []
+    timed_out = []
     error = None
 
+    executor = ThreadPoolExecutor(max_workers=8)
     try:
-        # 1. URL이 직접 제공된 경우
-        url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-        urls = re.findall(url_pattern, user_input)
-
-        if urls:
-            for url in urls[:3]:
+        with request_deadline(deadline_sec):
+            # 1. URL이 직접 제공된 경우 - 즉시 병렬 조회 시작
+            url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
+            urls = []
+            for url in re.findall(url_pattern, user_input)[:3]:
                 # [NEW] 차단 도메인 체크
                 if _is_blocked_domain(url):
                     print(f"[INFO] 관련 없는 URL 제외: {url}")
                     continue
-                    
-                try:
-                    content = fetch_url_sync(url, max_length=3000)
-                    if content and not content.startswith("[웹 조회 실패"):
-                        web_contents.append(f"[URL 참조: {url}]\n{content}")
-                        web_urls.append(url)
-                except Exception as e:
-                    print(f"[WARN] URL 조회 실패 ({url}): {e}")
-        
-        # 2. URL이 없으면 조건부 웹 검색
-        else:
+                urls.append(url)
+
+            # 호출 노드의 HTTP 마감 시간(contextvars)을 작업 스레드로 전달
+            url_futures = [
+                (url, executor.submit(contextvars.copy_context().run, _fetch_url_polite, url))
+                for url in urls
+            ]
+
+            # 2. 조건부 웹 검색 (URL 조회와 동시에 진행)
+            query_futures = []
             # [NEW] max_queries 파라미터 전달
             decision = should_search_web(user_input, rag_context if rag_context else "", max_queries=max_queries)
             print(f"[WebSearch] Decision: should_search={decision['should_search']}, reason={decision.get('reason', 'N/A')}, max_queries={max_queries}, depth={search_depth}")
 
             if decision["should_search"]:
                 search_queries = decision["search_query"]
-                
+
                 # 리스트가 아니면 리스트로 변환 (하위 호환)
                 if isinstance(search_queries, str):
                     queries = [search_queries]
                 else:
                     queries = search_queries
-                    
+
                 print(f"[WebSearch] Executing Queries: {queries}")
 
-                if queries:
-                    # [Optimization] 다중 쿼리 병렬 실행 + 캐싱
-                    def run_query(idx, q):
+                # [Optimization] 다중 쿼리 병렬 실행 + 캐싱
+                cache = get_search_cache()
+
+                def run_query(q):
+                    with span("web_search", kind="search", query=q[:80]) as search_span:
                         try:
-                            # [NEW] 캐시 먼저 확인
-                            cached = get_cached_search(q)
-                            if cached:
-                                print(f"[WebSearch] Cache HIT: {q[:30]}...")
-                                return idx, q, cached
+                            # [NEW] 캐시 조회 → 미스면 검색 (동시 동일 쿼리는 1회만 검색)
+                            result, source = cache.get_or_fetch(
+                                q, lambda: search_sync(q, search_depth=search_depth)
+                            )
+                            search_span.set(cache=source)
+                            if source != "fetched":
+                                print(f"[WebSearch] Cache HIT ({source}): {q[:30]}...")
 
-                            # 캐시 미스 → 실제 검색
-                            result = search_sync(q, search_depth=search_depth)
+                            return result
+                        except Exception as e:
+                            return {"success": False, "error": str(e)}
 
-                            # [NEW] 결과 캐싱
-                            if result.get("success"):
-                                cache_search_result(q, result)
+                query_futures = [
+                    (q, executor.submit(contextvars.copy_context().run, run_query, q))
+                    for q in queries
+                ]
 
-                            return idx, q, result
-                        except Exception as e:
-                            return idx, q, {"success": False, "error": str(e)}
-
-                    with ThreadPoolExecutor(max_workers=3) as executor:
-                        futures = [executor.submit(run_query, i, q) for i, q in enumerate(queries)]
-                        
-                        # 순서 보장을 위해 인덱스로 정렬할 수 있도록 결과 수집
-                        results = []
-                        for future in as_completed(futures):
-                            results.append(future.result())
-                        
-                        # 인덱스 순 정렬
-                        results.sort(key=lambda x: x[0])
-                        
-                        for idx, q, search_result in results:
-                            print(f"[WebSearch] Query '{q}' result: success={search_result.get('success')}, source={search_result.get('source', 'unknown')}")
-
-                            if search_result.get("success"):
-                                if "results" in search_result and isinstance(search_result["results"], list):
-                                    for res in search_result["results"][:5]:  # 필터링 고려하여 더 확인
-                                        title = res.get("title", "제목 없음")
-                                        url = res.get("url", "URL 없음")
-                                        
-                                        # [NEW] 차단 도메인 체크
-                                        if _is_blocked_domain(url):
-                                            print(f"[INFO] 관련 없는 검색 결과 제외: {url}")
-                                            continue
-                                        
-                                        snippet = res.get("snippet", "")[:300]
-                                        full_content = f"- [{title}]({url})\n  {snippet}"
-                                        
-                                        if url and url.startswith("http"):
-                                            # 제목+URL+내용 함께 저장 (중복 제거)
-                                            if not any(s.get("url") == url for s in web_sources):
-                                                web_sources.append({
-                                                    "title": title, 
-                                                    "url": url,
-                                                    "content": full_content
-                                                })
-                                        
-                                if not web_sources and "formatted" in search_result:
-                                    # 구조화된 결과가 없을 때 (fallback)
-                                    web_contents.append(f"[웹 검색 결과 {idx+1} - {q}]\n{search_result['formatted']}")
-                            else:
-                                print(f"[WARN] 검색 실패 ({q}): {search_result.get('error')}")
-                else:
-                    pass
+            # 3. 마감 시간까지 대기 (끝나지 않은 작업은 버리고 완료된 결과만 사용)
+            remaining = remaining_time()
+            all_futures = [f for _, f in url_futures + query_futures]
+            if all_futures:
+                wait(all_futures, timeout=max(0.0, remaining) if remaining is not None else None)
+
+        for url, future in url_futures:
+            if not future.done():
+                timed_out.append(url)
+                continue
+            try:
+                content = future.result()
+                if content and not content.startswith("[웹 조회 실패"):
+                    web_contents.append(f"[URL 참조: {url}]\n{content}")
+                    web_urls.append(url)
+            except Exception as e:
+                print(f"[WARN] URL 조회 실패 ({url}): {e}")
+
+        for idx, (q, future) in enumerate(query_futures):
+            if not future.done():
+                timed_out.append(q)
+                continue
+            search_result = future.result()
+            print(f"[WebSearch] Query '{q}' result: success={search_result.get('success')}, source={search_result.get('source', 'unknown')}")
+
+            if search_result.get("success"):
+                if "results" in search_result and isinstance(search_result["results"], list):
+                    for res in search_result["results"][:5]:  # 필터링 고려하여 더 확인
+                        title = res.get("title", "제목 없음")
+                        url = res.get("url", "URL 없음")
+
+                        # [NEW] 차단 도메인 체크
+                        if _is_blocked_domain(url):
+                            print(f"[INFO] 관련 없는 검색 결과 제외: {url}")
+                            continue
+
+                        snippet = res.get("snippet", "")[:300]
+                        full_content = f"- [{title}]({url})\n  {snippet}"
+
+                        if url and url.startswith("http"):
+                            # 제목+URL+내용 함께 저장 (중복 제거)
+                            if not any(s.get("url") == url for s in web_sources):
+                                web_sources.append({
+                                    "title": title,
+                                    "url": url,
+                                    "content": full_content
+                                })
+
+                if not web_sources and "formatted" in search_result:
+                    # 구조화된 결과가 없을 때 (fallback)
+                    web_contents.append(f"[웹 검색 결과 {idx+1} - {q}]\n{search_result['formatted']}")
+            else:
+                print(f"[WARN] 검색 실패 ({q}): {search_result.get('error')}")
+
+        if timed_out:
+            print(f"[WARN] 마감 시간 초과 - 부분 결과 반환 (미완료: {timed_out})")
 
     except Exception as e:
         print(f"[WARN] 웹 조회 단계 오류: {e}")
         error = str(e)
+    finally:
+        # 미완료 작업은 기다리지 않음 (HTTP 호출은 마감 시간으로 곧 종료됨)
+        executor.shutdown(wait=False, cancel_futures=True)
 
-    # 3. 결과 조합 및 제한 (최대 5개)
+    # 4. 결과 조합 및 제한 (최대 5개)
     # [Optimization] 출처 수와 컨텍스트 내용을 모두 5개로 제한하여 일치시킴
     MAX_SOURCES = 5
     
-    # URL 직접 입력의 경우 web_contents에 이미 있음
-    # 검색 결과인 경우 web_sources에서 재조합
+    # URL 직접 조회 결과는 web_contents에 이미 있음
+    # 검색 결과는 web_sources에서 재조합
     
     search_context_list = []
     if web_sources:
@@ -179,7 +254,8 @@ def execute_web_search(
             unique_sources = unique_sources[:MAX_SOURCES]
             
         web_sources = unique_sources
-        web_urls = [s["url"] for s in web_sources]
+        # 직접 조회한 URL + 검색 결과 URL
+        web_urls = list(dict.fromkeys(web_urls + [s["url"] for s in web_sources]))
         
         # 컨텍스트 재조합
         for i, src in enumerate(web_sources):
@@ -193,6 +269,9 @@ def execute_web_search(
         "context": final_context_str,
         "urls": web_urls,
         "sources": web_sources,
-        "error": error
+        "error": error,
+        "cache_stats": get_cache_stats(),
+        "partial": bool(timed_out),
+        "timed_out": timed_out
     }
 
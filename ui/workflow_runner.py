@@ -175,26 +175,236 @@ def execute_workflow_api(
     return response
 
 
+def _update_progress(
+    current_step: str,
+    current_progress: int,
+    elapsed: int,
+    status_widget,
+    progress_bar,
+    current_step_display
+) -> int:
+    """현재 단계에 맞춰 진행률/라벨을 갱신하고 새 진행률을 반환합니다."""
+    for step_key, progress in STEP_PROGRESS.items():
+        if current_step and step_key in current_step.lower():
+            if progress > current_progress:
+                current_progress = progress
+                progress_bar.progress(min(current_progress / 100, 0.95))
+                icon, label = STEP_LABELS.get(step_key, ("▶️", current_step))
+                status_widget.update(label=f"{icon} {label} ({elapsed}초)", state="running")
+                current_step_display.markdown(f"🟢 **진행 중:** {label} 단계")
+            break
+    return current_progress
+
+
+def _emit_step_log(step: Dict[str, Any], status_widget, execution_log: list, on_log_callback=None) -> None:
+    """완료된 단계(step_history 항목)를 실행 로그에 추가하고 UI에 표시합니다."""
+    step_name = step.get("step", "Unknown")
+    summary = step.get("summary", "")
+    exec_time = step.get("execution_time", "")
+
+    icon = "✔"
+    for key, (ic, _) in STEP_LABELS.items():
+        if key in step_name.lower():
+            icon = ic
+            break
+
+    log_entry = {
+        "step": step_name,
+        "summary": f"[{icon}] {step_name} 완료: {summary} ({exec_time})",
+        "timestamp": time.time()
+    }
+    if not on_log_callback:
+        status_widget.write(log_entry["summary"])
+
+    execution_log.append(log_entry)
+
+    if on_log_callback:
+        # [FIX] 문자열 대신 Dict 객체 전체 전달 (TypeError 해결)
+        on_log_callback({
+            "step": step_name,
+            "icon": icon,
+            "summary": summary,
+            "execution_time": exec_time  # [FIX] 실행 시간 전달
+        })
+
+
+def _format_agent_event(data: Dict[str, Any]) -> str:
+    """Supervisor 커스텀 이벤트를 한 줄 메시지로 변환합니다."""
+    name = data.get("name", "")
+    if name == "supervisor_start":
+        return "전문 에이전트 분석 시작"
+    if name == "supervisor_agent_complete":
+        agent_id = data.get("agent_id", "agent")
+        if data.get("success"):
+            duration = data.get("duration_ms")
+            return f"{agent_id} 완료" + (f" ({duration:.0f}ms)" if isinstance(duration, (int, float)) else "")
+        return f"{agent_id} 실패: {data.get('error', '')}"
+    if name == "supervisor_complete":
+        return f"전문 에이전트 분석 완료 ({data.get('agent_count', 0)}개)"
+    return name
+
+
+def iter_sse_events(lines):
+    """
+    SSE 텍스트 라인을 이벤트 단위로 파싱합니다.
+
+    Args:
+        lines: text/event-stream 응답의 라인 이터레이터
+
+    Yields:
+        Tuple[Optional[str], str, Dict]: (event_id, event_name, data)
+    """
+    event_id, event_name, data_lines = None, "message", []
+    for line in lines:
+        if line == "":
+            if data_lines:
+                try:
+                    data = json.loads("\n".join(data_lines))
+                except json.JSONDecodeError:
+                    data = {"raw": "\n".join(data_lines)}
+                yield event_id, event_name, data
+            event_id, event_name, data_lines = None, "message", []
+            continue
+        if line.startswith(":"):
+            continue  # keep-alive 주석
+        field_name, _, value = line.partition(":")
+        value = value[1:] if value.startswith(" ") else value
+        if field_name == "id":
+            event_id = value
+        elif field_name == "event":
+            event_name = value
+        elif field_name == "data":
+            data_lines.append(value)
+
+
+def stream_workflow_events(
+    thread_id: str,
+    status_widget,
+    progress_bar,
+    current_step_display,
+    on_log_callback=None
+) -> Optional[Tuple[Dict[str, Any], list]]:
+    """
+    SSE 스트림으로 워크플로우 진행 이벤트를 받아 완료될 때까지 대기합니다.
+
+    연결이 끊기면 마지막 이벤트 ID(Last-Event-ID)로 재연결하여 이어 받습니다.
+    실행 중에는 서버의 체크포인트 조회가 발생하지 않습니다.
+
+    Returns:
+        Tuple[final_result, execution_log] 또는
+        None (서버가 스트림을 지원하지 않거나 라이브 이벤트가 없는 경우 → 폴링으로 전환)
+    """
+    MAX_STREAM_DURATION = 600  # 최대 10분
+    MAX_CONSECUTIVE_ERRORS = 10
+    RECONNECT_DELAY = 1.0
+
+    start_time = time.time()
+    execution_log = []
+    consecutive_errors = 0
+    current_progress = 0
+    last_event_id = None
+
+    while True:
+        if time.time() - start_time > MAX_STREAM_DURATION:
+            raise TimeoutError(f"작업 시간이 초과되었습니다 ({MAX_STREAM_DURATION}초)")
+
+        headers = {"Accept": "text/event-stream"}
+        if last_event_id:
+            headers["Last-Event-ID"] = last_event_id
+
+        try:
+            with httpx.stream(
+                "GET",
+                f"{Config.API_BASE_URL}/workflow/stream/{thread_id}",
+                headers=headers,
+                timeout=httpx.Timeout(10.0, read=60.0),
+            ) as response:
+                if response.status_code in (404, 405):
+                    return None  # 스트림 미지원 또는 아직 시작 전 → 폴링
+                if response.status_code != 200:
+                    raise httpx.HTTPStatusError(
+                        f"stream status {response.status_code}",
+                        request=response.request, response=response
+                    )
+                consecutive_errors = 0
+
+                for event_id, event_name, data in iter_sse_events(response.iter_lines()):
+                    if event_id:
+                        last_event_id = event_id
+                    elapsed = int(time.time() - start_time)
+
+                    if event_name == "node_start":
+                        current_progress = _update_progress(
+                            data.get("node", ""), current_progress, elapsed,
+                            status_widget, progress_bar, current_step_display
+                        )
+                    elif event_name == "node_end" and data.get("step"):
+                        _emit_step_log(data["step"], status_widget, execution_log, on_log_callback)
+                    elif event_name == "agent":
+                        msg = _format_agent_event(data)
+                        if msg:
+                            if not on_log_callback:
+                                status_widget.write(f"  ↳ {msg}")
+                            else:
+                                on_log_callback({"step": "Running", "icon": "⚡", "summary": msg})
+                    elif event_name in ("interrupt", "result", "error"):
+                        final_result = data.get("result")
+                        if not final_result:
+                            if event_name == "error":
+                                raise RuntimeError(data.get("error") or "워크플로우 실행 실패")
+                            raise Exception("작업이 완료되었으나 결과 데이터를 받아올 수 없습니다.")
+                        return final_result, execution_log
+                    elif event_name == "status":
+                        # 라이브 이벤트 없이 체크포인트 스냅샷만 받은 경우
+                        if data.get("status") in ("completed", "interrupted", "failed") and data.get("result"):
+                            return data["result"], execution_log
+                        return None
+
+        except (httpx.RequestError, httpx.HTTPStatusError) as e:
+            consecutive_errors += 1
+            if consecutive_errors >= MAX_CONSECUTIVE_ERRORS:
+                raise ConnectionError(f"네트워크 연결 오류: {e}")
+
+        # 스트림이 종료 이벤트 없이 끊김 → 마지막 이벤트 ID로 재연결
+        time.sleep(RECONNECT_DELAY)
+
+
 def poll_workflow_status(
     thread_id: str,
     status_widget,
     progress_bar,
     current_step_display,
-    on_log_callback=None  # [NEW] Callback for real-time logging
+    on_log_callback=None,  # [NEW] Callback for real-time logging
+    use_stream: Optional[bool] = None  # [NEW] SSE 스트림 사용 여부 (None: Config.API_USE_SSE)
 ) -> Tuple[Dict[str, Any], list]:
     """
     워크플로우 상태를 폴링하여 완료될 때까지 대기합니다.
 
+    use_stream이 켜져 있으면 SSE 스트림(/workflow/stream)으로 이벤트를 받고,
+    서버가 스트림을 지원하지 않으면 기존 폴링으로 전환합니다.
+
     Args:
         thread_id: 스레드 ID
         status_widget: Streamlit status 위젯
         progress_bar: 진행률 바
         current_step_display: 현재 단계 표시 위젯
         on_log_callback: 로그 발생 시 호출할 콜백 함수
+        use_stream: SSE 스트림 사용 여부
 
     Returns:
         Tuple[final_result, execution_log]: 최종 결과와 실행 로그
     """
+    if use_stream is None:
+        use_stream = Config.API_USE_SSE
+
+    if use_stream:
+        streamed = stream_workflow_events(
+            thread_id, status_widget, progress_bar, current_step_display,
+            on_log_callback=on_log_callback
+        )
+        if streamed is not None:
+            return streamed
+
     MAX_POLL_DURATION = 600  # 최대 10분
     MAX_CONSECUTIVE_ERRORS = 10
     POLL_INTERVAL = 1.0
@@ -253,15 +463,10 @@ def poll_workflow_status(
         current_step = status_data.get("current_step", "")
 
         # 현재 단계 업데이트
-        for step_key, progress in STEP_PROGRESS.items():
-            if current_step and step_key in current_step.lower():
-                if progress > current_progress:
-                    current_progress = progress
-                    progress_bar.progress(min(current_progress / 100, 0.95))
-                    icon, label = STEP_LABELS.get(step_key, ("▶️", current_step))
-                    status_widget.update(label=f"{icon} {label} ({elapsed}초)", state="running")
-                    current_step_display.markdown(f"🟢 **진행 중:** {label} 단계")
-                break
+        current_progress = _update_progress(
+            current_step, current_progress, elapsed,
+            status_widget, progress_bar, current_step_display
+        )
 
         # 로그 수집 & 콜백 실행 (Step History + Execution Log)
         # 1. Step History 처리
@@ -270,34 +475,7 @@ def poll_workflow_status(
             last_step_count = len(step_history)
             
             for step in new_steps:
-                step_name = step.get("step", "Unknown")
-                summary = step.get("summary", "")
-                exec_time = step.get("execution_time", "")
-                
-                icon = "✔"
-                for key, (ic, _) in STEP_LABELS.items():
-                    if key in step_name.lower():
-                        icon = ic
-                        break
-                        
-                log_entry = {
-                    "step": step_name,
-                    "summary": f"[{icon}] {step_name} 완료: {summary} ({exec_time})",
-                    "timestamp": time.time()
-                }
-                if not on_log_callback:
-                     status_widget.write(log_entry["summary"])
-                
-                execution_log.append(log_entry)
-                
-                if on_log_callback:
-                    # [FIX] 문자열 대신 Dict 객체 전체 전달 (TypeError 해결)
-                    on_log_callback({
-                        "step": step_name,
-                        "icon": icon,
-                        "summary": summary,
-                        "execution_time": exec_time  # [FIX] 실행 시간 전달
-                    })
+                _emit_step_log(step, status_widget, execution_log, on_log_callback)
 
         # 2. Execution Log (Real-time Events) 처리
         server_exec_log = status_data.get("execution_log", [])
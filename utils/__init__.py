@@ -1,6 +1,5 @@
 # Utils 모듈
 from utils.config import Config
-from utils.llm import get_llm, get_embeddings
 from utils.file_logger import get_file_logger
 from utils.settings import settings, GENERATION_PRESETS
 
@@ -12,3 +11,16 @@ __all__ = [
     "settings",
     "GENERATION_PRESETS",
 ]
+
+
+def __getattr__(name: str):
+    """
+    [UPDATE] LLM 팩토리는 Lazy import
+
+    utils.llm 은 langchain_openai(약 1초)를 로드하므로, utils.settings 등
+    가벼운 하위 모듈만 필요한 경우(API 시작, 테스트 수집)에 비용을 치르지 않도록 합니다.
+    """
+    if name in ("get_llm", "get_embeddings"):
+        from utils import llm
+        return getattr(llm, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
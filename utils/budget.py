@@ -0,0 +1,489 @@
+"""
+PlanCraft Agent - 실행 예산 (Token / Cost Budget)
+
+TokenTrackingCallback 은 실행이 끝난 뒤 비용을 보고할 뿐이라, quality 프리셋 실행이
+허용 비용을 넘어도 멈출 방법이 없었습니다. 요청별 예산을 실행 중에 추적하고,
+임계치를 넘으면 남은 작업을 단계적으로 축소합니다.
+
+구성:
+    - PricingTable: config/pricing.yaml (버전 관리되는 모델별 토큰 단가)
+    - RunBudget: 요청별 한도 (max_tokens / max_cost_usd, 미지정 시 settings 기본값)
+    - BudgetController: 실행 1회의 사용량 누적 (Thread-safe) + 축소 결정 기록
+    - BudgetCallbackHandler: LLM 호출 종료 시 사용량 반영 (모든 노드 / Supervisor 스레드)
+
+축소 정책 (DEGRADATION_POLICY):
+    ┌──────────┬───────────────────────────┬─────────────────────────────────────┐
+    │ 단계     │ 조건                      │ 동작                                │
+    ├──────────┼───────────────────────────┼─────────────────────────────────────┤
+    │ soft     │ 사용률 >= soft_limit_ratio│ 토론 생략, Reranker/Multi-Query 끔, │
+    │          │                           │ 개선 루프 최대 1회                  │
+    │ exceeded │ 사용률 >= 1.0             │ + 개선 루프 중단                    │
+    └──────────┴───────────────────────────┴─────────────────────────────────────┘
+
+축소 결정은 state["budget"]["decisions"] 에 기록되어 최종 상태로 반환됩니다.
+
+사용 예시:
+    controller = BudgetController(RunBudget.from_settings({"max_cost_usd": 0.5}))
+    with budget_scope(controller):
+        app.invoke(inputs, config={"callbacks": [BudgetCallbackHandler(controller)]})
+
+    # 노드 / 라우터 내부
+    if not budget_allows("discussion", node="review"):
+        return RouteKey.SKIP_TO_REFINE
+    max_loops = budget_cap("max_refine_loops", preset.max_refine_loops, node="refine")
+"""
+
+import contextvars
+import os
+import threading
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+DEFAULT_PRICING_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config", "pricing.yaml"
+)
+
+# 설정 파일을 읽지 못할 때 사용하는 내장 단가 (config/pricing.yaml 과 동일)
+BUILTIN_PRICING = {
+    "version": "builtin",
+    "default_model": "gpt-4o",
+    "currency_rates": {"KRW": 1350},
+    "models": {
+        "gpt-4o": {"input_per_1m": 2.5, "cached_input_per_1m": 1.25, "output_per_1m": 10.0},
+        "gpt-4o-mini": {"input_per_1m": 0.15, "cached_input_per_1m": 0.075, "output_per_1m": 0.6},
+    },
+}
+
+OK, SOFT, EXCEEDED = "ok", "soft", "exceeded"
+
+# 단계별 축소 정책: 기능 → 허용 여부(bool) / 상한(int)
+DEGRADATION_POLICY: Dict[str, Dict[str, Any]] = {
+    SOFT: {
+        "discussion": False,
+        "reranker": False,
+        "multi_query": False,
+        "query_expansion": False,
+        "max_refine_loops": 1,
+    },
+    EXCEEDED: {
+        "discussion": False,
+        "reranker": False,
+        "multi_query": False,
+        "query_expansion": False,
+        "max_refine_loops": 0,
+    },
+}
+
+
+# =============================================================================
+# 단가표 (Pricing Table)
+# =============================================================================
+
+@dataclass(frozen=True)
+class ModelPrice:
+    """모델 1개의 토큰 단가 (USD / 1M tokens)"""
+    input_per_1m: float
+    output_per_1m: float
+    cached_input_per_1m: Optional[float] = None
+
+
+class PricingTable:
+    """버전이 있는 모델별 단가표"""
+
+    def __init__(
+        self,
+        models: Dict[str, ModelPrice],
+        default_model: str,
+        version: str = "builtin",
+        currency_rates: Optional[Dict[str, float]] = None,
+    ):
+        if default_model not in models:
+            raise ValueError(f"default_model '{default_model}' is not in pricing table")
+        self.models = models
+        self.default_model = default_model
+        self.version = str(version)
+        self.currency_rates = currency_rates or {}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PricingTable":
+        models = {
+            name: ModelPrice(
+                input_per_1m=float(spec["input_per_1m"]),
+                output_per_1m=float(spec["output_per_1m"]),
+                cached_input_per_1m=(
+                    float(spec["cached_input_per_1m"]) if spec.get("cached_input_per_1m") is not None else None
+                ),
+            )
+            for name, spec in (data.get("models") or {}).items()
+        }
+        return cls(
+            models=models,
+            default_model=data.get("default_model") or next(iter(models), ""),
+            version=data.get("version", "unversioned"),
+            currency_rates={k: float(v) for k, v in (data.get("currency_rates") or {}).items()},
+        )
+
+    def price_for(self, model: Optional[str]) -> ModelPrice:
+        """정확히 일치 → 가장 긴 접두사 일치 → default_model"""
+        if model:
+            name = model.lower()
+            if name in self.models:
+                return self.models[name]
+            prefixes = [m for m in self.models if name.startswith(m)]
+            if prefixes:
+                return self.models[max(prefixes, key=len)]
+        return self.models[self.default_model]
+
+    def cost(
+        self,
+        model: Optional[str],
+        input_tokens: int,
+        output_tokens: int,
+        cached_input_tokens: int = 0,
+    ) -> float:
+        """호출 비용 (USD). cached_input_tokens 는 input_tokens 에 포함된 캐시 적중분"""
+        price = self.price_for(model)
+        cached = min(cached_input_tokens, input_tokens)
+        cached_rate = price.cached_input_per_1m if price.cached_input_per_1m is not None else price.input_per_1m
+        return (
+            (input_tokens - cached) * price.input_per_1m
+            + cached * cached_rate
+            + output_tokens * price.output_per_1m
+        ) / 1_000_000
+
+    def convert(self, usd: float, currency: str = "KRW") -> float:
+        return usd * self.currency_rates.get(currency, 0.0)
+
+
+def load_pricing_table(path: Optional[str] = None) -> PricingTable:
+    """
+    YAML 단가표 로드
+
+    Note:
+        파일이 없거나 형식이 잘못되면 내장 단가(BUILTIN_PRICING)를 사용합니다.
+    """
+    path = path or DEFAULT_PRICING_PATH
+    if os.path.exists(path):
+        try:
+            import yaml
+            with open(path, "r", encoding="utf-8") as f:
+                return PricingTable.from_dict(yaml.safe_load(f) or {})
+        except Exception as e:
+            print(f"[WARN] Pricing table load failed ({path}): {e}")
+    return PricingTable.from_dict(BUILTIN_PRICING)
+
+
+_pricing_table: Optional[PricingTable] = None
+_pricing_lock = threading.Lock()
+
+
+def get_pricing_table() -> PricingTable:
+    """프로세스 전역 단가표 (PRICING_TABLE_PATH, 첫 호출 시 1회 로드)"""
+    global _pricing_table
+    if _pricing_table is None:
+        with _pricing_lock:
+            if _pricing_table is None:
+                from utils.settings import settings
+                _pricing_table = load_pricing_table(settings.PRICING_TABLE_PATH or None)
+    return _pricing_table
+
+
+# =============================================================================
+# 실행 예산 (Run Budget)
+# =============================================================================
+
+@dataclass
+class RunBudget:
+    """요청 1건의 예산 한도 (None 또는 0 이면 해당 한도 없음)"""
+    max_tokens: Optional[int] = None
+    max_cost_usd: Optional[float] = None
+    soft_limit_ratio: float = 0.8
+
+    def __post_init__(self):
+        self.max_tokens = self.max_tokens or None
+        self.max_cost_usd = self.max_cost_usd or None
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_tokens is not None or self.max_cost_usd is not None
+
+    @classmethod
+    def from_settings(cls, overrides: Optional[Dict[str, Any]] = None) -> "RunBudget":
+        """settings 기본값 + 요청별 오버라이드 (값이 None 인 항목은 기본값 유지)"""
+        from utils.settings import settings
+
+        values = {
+            "max_tokens": settings.BUDGET_MAX_TOKENS_PER_RUN,
+            "max_cost_usd": settings.BUDGET_MAX_COST_USD_PER_RUN,
+            "soft_limit_ratio": settings.BUDGET_SOFT_LIMIT_RATIO,
+        }
+        for key, value in (overrides or {}).items():
+            if key in values and value is not None:
+                values[key] = value
+        return cls(**values)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class BudgetController:
+    """
+    실행 1회의 토큰/비용 누적과 축소 결정 (Thread-safe)
+
+    Supervisor 병렬 에이전트 등 여러 스레드의 LLM 호출이 동시에 record() 를 호출합니다.
+    """
+
+    def __init__(
+        self,
+        budget: RunBudget,
+        pricing: Optional[PricingTable] = None,
+        spent: Optional[Dict[str, Any]] = None,
+        decisions: Optional[List[Dict[str, Any]]] = None,
+    ):
+        self.budget = budget
+        self.pricing = pricing or get_pricing_table()
+        self._lock = threading.Lock()
+        spent = spent or {}
+        self.input_tokens = int(spent.get("input_tokens", 0))
+        self.output_tokens = int(spent.get("output_tokens", 0))
+        self.cached_input_tokens = int(spent.get("cached_input_tokens", 0))
+        self.saved_tokens = int(spent.get("saved_tokens", 0))
+        self.llm_calls = int(spent.get("llm_calls", 0))
+        self.cost_usd = float(spent.get("cost_usd", 0.0))
+        self.by_model: Dict[str, Dict[str, Any]] = {k: dict(v) for k, v in (spent.get("by_model") or {}).items()}
+        self.decisions: List[Dict[str, Any]] = list(decisions or [])
+        self._decided = {(d.get("feature"), d.get("level")) for d in self.decisions}
+        self._announced_level = self.level
+
+    @classmethod
+    def from_summary(cls, summary: Dict[str, Any], budget: Optional[RunBudget] = None) -> "BudgetController":
+        """summary() 결과(체크포인트의 state["budget"])에서 복원 - Resume 실행용"""
+        limits = summary.get("limits") or {}
+        budget = budget or RunBudget(**{k: limits.get(k) for k in ("max_tokens", "max_cost_usd")},
+                                     soft_limit_ratio=limits.get("soft_limit_ratio", 0.8))
+        return cls(budget, spent=summary.get("spent"), decisions=summary.get("decisions"))
+
+    # ------------------------------------------------------------------
+    # 사용량
+    # ------------------------------------------------------------------
+
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+    def record(
+        self,
+        model: Optional[str],
+        input_tokens: int,
+        output_tokens: int,
+        cached_input_tokens: int = 0,
+        saved_tokens: int = 0,
+    ) -> None:
+        """LLM 호출 1회 사용량 반영"""
+        model_key = model or self.pricing.default_model
+        cost = self.pricing.cost(model_key, input_tokens, output_tokens, cached_input_tokens)
+        with self._lock:
+            self.input_tokens += input_tokens
+            self.output_tokens += output_tokens
+            self.cached_input_tokens += cached_input_tokens
+            self.saved_tokens += saved_tokens
+            self.llm_calls += 1
+            self.cost_usd += cost
+            entry = self.by_model.setdefault(model_key, {"input_tokens": 0, "output_tokens": 0, "cost_usd": 0.0})
+            entry["input_tokens"] += input_tokens
+            entry["output_tokens"] += output_tokens
+            entry["cost_usd"] += cost
+            level = self.level
+            changed = level != self._announced_level
+            self._announced_level = level
+
+        if changed and level != OK:
+            from utils.file_logger import get_file_logger
+            get_file_logger().warning(
+                f"[BUDGET] 예산 {level} 단계 진입 ({self.total_tokens} tokens, ${self.cost_usd:.4f})",
+                limits=self.budget.to_dict(),
+            )
+
+    def usage_ratio(self) -> float:
+        """한도 대비 사용률 (토큰/비용 중 큰 값, 한도 없으면 0)"""
+        ratios = [0.0]
+        if self.budget.max_tokens:
+            ratios.append(self.total_tokens / self.budget.max_tokens)
+        if self.budget.max_cost_usd:
+            ratios.append(self.cost_usd / self.budget.max_cost_usd)
+        return max(ratios)
+
+    @property
+    def level(self) -> str:
+        ratio = self.usage_ratio()
+        if ratio >= 1.0:
+            return EXCEEDED
+        if ratio >= self.budget.soft_limit_ratio:
+            return SOFT
+        return OK
+
+    # ------------------------------------------------------------------
+    # 축소 결정
+    # ------------------------------------------------------------------
+
+    def allows(self, feature: str, node: Optional[str] = None) -> bool:
+        """기능 사용 허용 여부 (거부 시 결정 기록)"""
+        level = self.level
+        allowed = DEGRADATION_POLICY.get(level, {}).get(feature, True)
+        if not allowed:
+            self._decide(feature, "skipped", node, level)
+        return bool(allowed)
+
+    def cap(self, name: str, value: int, node: Optional[str] = None) -> int:
+        """정수 설정 상한 적용 (낮아지면 결정 기록)"""
+        level = self.level
+        limit = DEGRADATION_POLICY.get(level, {}).get(name)
+        if limit is None or value <= limit:
+            return value
+        self._decide(name, "capped", node, level, original=value, value=limit)
+        return limit
+
+    def _decide(self, feature: str, action: str, node: Optional[str], level: str, **extra) -> None:
+        with self._lock:
+            if (feature, level) in self._decided:
+                return
+            self._decided.add((feature, level))
+            decision = {
+                "feature": feature,
+                "action": action,
+                "node": node,
+                "level": level,
+                "total_tokens": self.total_tokens,
+                "cost_usd": round(self.cost_usd, 6),
+                "at": datetime.now().isoformat(timespec="seconds"),
+                **extra,
+            }
+            self.decisions.append(decision)
+
+        from utils.file_logger import get_file_logger
+        get_file_logger().info(f"[BUDGET] {feature} {action} ({level}, node={node})", **extra)
+
+    def summary(self) -> Dict[str, Any]:
+        """state["budget"] 에 기록되는 요약 (JSON 직렬화 가능)"""
+        with self._lock:
+            return {
+                "pricing_version": self.pricing.version,
+                "limits": self.budget.to_dict(),
+                "level": self.level,
+                "usage_ratio": round(self.usage_ratio(), 4),
+                "spent": {
+                    "input_tokens": self.input_tokens,
+                    "output_tokens": self.output_tokens,
+                    "cached_input_tokens": self.cached_input_tokens,
+                    "total_tokens": self.total_tokens,
+                    "saved_tokens": self.saved_tokens,
+                    "llm_calls": self.llm_calls,
+                    "cost_usd": round(self.cost_usd, 6),
+                    "cost_krw": round(self.pricing.convert(self.cost_usd, "KRW"), 0),
+                    "by_model": {
+                        k: {**v, "cost_usd": round(v["cost_usd"], 6)} for k, v in self.by_model.items()
+                    },
+                },
+                "decisions": list(self.decisions),
+            }
+
+
+# =============================================================================
+# 실행 컨텍스트 (노드 / 라우터에서 조회)
+# =============================================================================
+
+_current_budget: contextvars.ContextVar[Optional[BudgetController]] = contextvars.ContextVar(
+    "plancraft_budget", default=None
+)
+
+
+def current_budget() -> Optional[BudgetController]:
+    """현재 실행의 BudgetController (예산 없는 실행이면 None)"""
+    return _current_budget.get()
+
+
+@contextmanager
+def budget_scope(controller: Optional[BudgetController]) -> Iterator[Optional[BudgetController]]:
+    """실행 범위에 controller 설정 (LangGraph 노드 / copy_context 스레드로 전파)"""
+    token = _current_budget.set(controller)
+    try:
+        yield controller
+    finally:
+        _current_budget.reset(token)
+
+
+def budget_allows(feature: str, node: Optional[str] = None) -> bool:
+    """예산이 없으면 항상 True"""
+    controller = _current_budget.get()
+    return controller is None or controller.allows(feature, node)
+
+
+def budget_cap(name: str, value: int, node: Optional[str] = None) -> int:
+    """예산이 없으면 value 그대로"""
+    controller = _current_budget.get()
+    return value if controller is None else controller.cap(name, value, node)
+
+
+# =============================================================================
+# LangChain 콜백
+# =============================================================================
+
+def _usage_from_result(response: LLMResult) -> Dict[str, int]:
+    """llm_output.token_usage → 입력/출력/캐시 입력 토큰"""
+    usage = (response.llm_output or {}).get("token_usage") or {}
+    details = usage.get("prompt_tokens_details") or {}
+    return {
+        "input_tokens": usage.get("prompt_tokens", 0) or 0,
+        "output_tokens": usage.get("completion_tokens", 0) or 0,
+        "cached_input_tokens": details.get("cached_tokens", 0) or 0,
+    }
+
+
+class BudgetCallbackHandler(BaseCallbackHandler):
+    """
+    LLM 호출 종료 시 BudgetController 에 사용량 반영
+
+    응답 캐시 히트(from_cache)는 비용이 없으므로 절감 토큰으로만 집계합니다.
+    """
+
+    def __init__(self, controller: BudgetController):
+        self.controller = controller
+        self._models: Dict[Any, str] = {}
+        self._lock = threading.Lock()
+
+    def _remember_model(self, run_id, kwargs) -> None:
+        params = kwargs.get("invocation_params") or {}
+        model = params.get("model_name") or params.get("model") or params.get("azure_deployment")
+        if model:
+            with self._lock:
+                self._models[run_id] = str(model)
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs):
+        self._remember_model(run_id, kwargs)
+
+    def on_llm_start(self, serialized, prompts, *, run_id, **kwargs):
+        self._remember_model(run_id, kwargs)
+
+    def on_llm_end(self, response: LLMResult, *, run_id, **kwargs):
+        from utils.streamlit_callback import _cached_usage
+
+        with self._lock:
+            model = self._models.pop(run_id, None)
+        try:
+            usage = _usage_from_result(response)
+            _, saved_input, saved_output = _cached_usage(response)
+            if not any(usage.values()) and not (saved_input or saved_output):
+                return
+            model = (response.llm_output or {}).get("model_name") or model
+            self.controller.record(model, saved_tokens=saved_input + saved_output, **usage)
+        except Exception as e:
+            print(f"[WARN] Budget usage record failed: {e}")
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        with self._lock:
+            self._models.pop(run_id, None)
@@ -0,0 +1,183 @@
+"""
+PlanCraft Agent - 인터럽트된 실행의 예산 보관소
+
+HITL 인터럽트로 멈춘 실행의 예산 집계(BudgetController.summary())를 thread_id 별로 저장하고,
+Resume 실행이 꺼내어 인터럽트 전후를 하나의 예산으로 이어서 집계합니다.
+
+체크포인트에 update_state 로 기록하면 __interrupt__ 가 없는 새 체크포인트가 생겨
+스레드가 응답 대기로 보이지 않으므로, 체크포인터와 같은 저장소의 별도 테이블에 둡니다.
+(프로세스 메모리에만 두면 재시작 / 다른 워커로 전달된 Resume 에서 사용량이 0 으로 초기화됨)
+
+저장소 (CHECKPOINTER_TYPE 기준):
+    - memory: SQLite ":memory:" (체크포인트도 재시작 시 사라지므로 수명이 같음)
+    - sqlite: 체크포인트 DB 파일(SQLITE_CHECKPOINT_PATH)의 interrupted_budgets 테이블
+    - postgres: 같은 DB 의 interrupted_budgets 테이블
+
+응답 없이 버려진 항목은 저장 시 CHECKPOINT_INTERRUPT_TTL_HOURS 보다 오래된 것부터 정리합니다.
+
+사용 예시:
+    store = get_budget_store()
+    store.put(thread_id, controller.summary())  # 인터럽트 시
+    previous = store.pop(thread_id)             # Resume 시 (없으면 None)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Optional
+
+
+def _default_ttl_sec() -> Optional[float]:
+    from utils.checkpoint_retention import RetentionPolicy
+
+    return RetentionPolicy.from_env().interrupt_ttl_sec
+
+
+class InterruptedBudgetStore:
+    """
+    인터럽트 예산 SQLite 저장소 (Thread-safe)
+
+    Args:
+        db_path: SQLite 경로 (":memory:" 또는 None이면 메모리)
+        ttl_sec: 보관 기간 (None = 무기한)
+        clock: 시간 함수 (테스트용)
+    """
+
+    def __init__(self, db_path: Optional[str] = ":memory:", ttl_sec: Optional[float] = None, clock=time.time):
+        self.ttl_sec = ttl_sec
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        path = db_path or ":memory:"
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # 체크포인터와 같은 DB 파일을 다른 연결이 동시에 쓰므로 잠금 대기 허용
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS interrupted_budgets ("
+                " thread_id TEXT PRIMARY KEY, summary TEXT NOT NULL, updated_at REAL NOT NULL)"
+            )
+            self._conn.commit()
+
+    def put(self, thread_id: str, summary: dict) -> None:
+        now = self._clock()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO interrupted_budgets (thread_id, summary, updated_at) VALUES (?, ?, ?)",
+                (thread_id, json.dumps(summary, ensure_ascii=False), now),
+            )
+            if self.ttl_sec is not None:
+                self._conn.execute("DELETE FROM interrupted_budgets WHERE updated_at < ?", (now - self.ttl_sec,))
+            self._conn.commit()
+
+    def pop(self, thread_id: str) -> Optional[dict]:
+        """저장된 예산을 꺼내고 삭제 (다른 프로세스가 먼저 꺼냈으면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT summary FROM interrupted_budgets WHERE thread_id = ?", (thread_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            cur = self._conn.execute("DELETE FROM interrupted_budgets WHERE thread_id = ?", (thread_id,))
+            self._conn.commit()
+        return json.loads(row[0]) if cur.rowcount else None
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class PostgresInterruptedBudgetStore:
+    """
+    인터럽트 예산 Postgres 저장소
+
+    Args:
+        conn: psycopg Connection 또는 psycopg_pool.ConnectionPool
+        ttl_sec: 보관 기간 (None = 무기한)
+    """
+
+    def __init__(self, conn: Any, ttl_sec: Optional[float] = None, clock=time.time):
+        self.conn = conn
+        self.ttl_sec = ttl_sec
+        self._clock = clock
+        with self._connection() as c:
+            c.execute(
+                "CREATE TABLE IF NOT EXISTS interrupted_budgets ("
+                " thread_id TEXT PRIMARY KEY, summary TEXT NOT NULL, updated_at DOUBLE PRECISION NOT NULL)"
+            )
+            c.commit()
+
+    def _connection(self):
+        from contextlib import nullcontext
+
+        if hasattr(self.conn, "connection"):
+            return self.conn.connection()
+        return nullcontext(self.conn)
+
+    def put(self, thread_id: str, summary: dict) -> None:
+        now = self._clock()
+        with self._connection() as c:
+            c.execute(
+                "INSERT INTO interrupted_budgets (thread_id, summary, updated_at) VALUES (%s, %s, %s) "
+                "ON CONFLICT (thread_id) DO UPDATE SET summary = EXCLUDED.summary, updated_at = EXCLUDED.updated_at",
+                (thread_id, json.dumps(summary, ensure_ascii=False), now),
+            )
+            if self.ttl_sec is not None:
+                c.execute("DELETE FROM interrupted_budgets WHERE updated_at < %s", (now - self.ttl_sec,))
+            c.commit()
+
+    def pop(self, thread_id: str) -> Optional[dict]:
+        with self._connection() as c:
+            row = c.execute(
+                "DELETE FROM interrupted_budgets WHERE thread_id = %s RETURNING summary", (thread_id,)
+            ).fetchone()
+            c.commit()
+        return json.loads(row[0]) if row else None
+
+
+# =============================================================================
+# 전역 인스턴스
+# =============================================================================
+
+_budget_store = None
+_budget_store_lock = threading.Lock()
+
+
+def _open_budget_store():
+    from utils.checkpointer import DEFAULT_SQLITE_PATH, get_checkpointer_type
+
+    ttl_sec = _default_ttl_sec()
+    cp_type = get_checkpointer_type()
+    if cp_type == "sqlite":
+        return InterruptedBudgetStore(os.getenv("SQLITE_CHECKPOINT_PATH", DEFAULT_SQLITE_PATH), ttl_sec)
+    if cp_type == "postgres":
+        from utils.checkpoint_retention import get_checkpoint_retention_service
+
+        # 실행 중인 보관 서비스의 연결 풀 재사용 (없으면 작은 풀을 별도로 엶)
+        service = get_checkpoint_retention_service()
+        if service and service.backend.name == "postgres":
+            return PostgresInterruptedBudgetStore(service.backend.conn, ttl_sec)
+        from psycopg_pool import ConnectionPool
+
+        db_url = os.getenv("DB_CONNECTION_STRING")
+        if not db_url:
+            raise ValueError("CHECKPOINTER_TYPE is postgres but DB_CONNECTION_STRING is missing")
+        return PostgresInterruptedBudgetStore(ConnectionPool(conninfo=db_url, max_size=2), ttl_sec)
+    return InterruptedBudgetStore(":memory:", ttl_sec)
+
+
+def get_budget_store():
+    """전역 인터럽트 예산 저장소 반환 (싱글톤, 체크포인터 저장소를 따름)"""
+    global _budget_store
+    if _budget_store is None:
+        with _budget_store_lock:
+            if _budget_store is None:
+                try:
+                    _budget_store = _open_budget_store()
+                except Exception as e:
+                    print(f"[WARN] 인터럽트 예산 저장소 열기 실패, 메모리 사용: {e}")
+                    _budget_store = InterruptedBudgetStore(":memory:", _default_ttl_sec())
+    return _budget_store
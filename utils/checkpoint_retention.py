@@ -0,0 +1,530 @@
+"""
+PlanCraft Agent - 체크포인트 보관(Retention) / 압축 서비스
+
+HITL 인터럽트, 개선(refine) 루프, Time-Travel 분기마다 체크포인트가 쌓여
+SQLite 파일이 끝없이 커지는 문제를 해결합니다.
+
+보관 정책 (RetentionPolicy):
+    - keep_last: 스레드(네임스페이스)별 최근 N개 체크포인트만 유지
+    - thread_ttl_sec: 마지막 활동 후 T초가 지난 스레드는 통째로 삭제
+    - interrupt_ttl_sec: HITL 응답 대기 중인 스레드의 보관 기간 (None = 무기한)
+    - preserve_interrupts: 인터럽트가 발생한 체크포인트는 keep_last 와 무관하게 유지
+
+응답 대기 판정:
+    루트 네임스페이스에서 update_state(metadata.source == "update")가 아닌 최신 체크포인트에
+    인터럽트 write 가 있으면 대기 중으로 봅니다. (인터럽트 뒤 update_state 로 생긴 체크포인트는
+    노드 실행이 아니므로 대기 상태를 가리지 않음)
+
+압축:
+    - SQLite: PRAGMA incremental_vacuum 으로 한 번에 vacuum_pages 페이지씩 반환
+      (auto_vacuum=INCREMENTAL 이 아닌 기존 DB는 최초 1회 전체 VACUUM 으로 전환)
+    - Postgres: 참조가 끊긴 checkpoint_blobs 정리 후 VACUUM (ANALYZE)
+
+백그라운드 실행:
+    get_checkpointer() 가 기본 경로의 SQLite / Postgres 체크포인터를 만들 때
+    start_checkpoint_retention() 으로 주기 실행 스레드를 띄웁니다.
+    (CHECKPOINT_RETENTION_INTERVAL_SEC=0 이면 비활성화)
+
+사용 예시:
+    from utils.checkpoint_retention import CheckpointRetentionService, RetentionPolicy, SqliteRetentionBackend
+
+    service = CheckpointRetentionService(SqliteRetentionBackend("./data/checkpoints.db"), RetentionPolicy(keep_last=10))
+    result = service.run_once()  # {"checkpoints_deleted", "threads_dropped", "bytes_reclaimed", ...}
+"""
+
+import os
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# LangGraph 가 인터럽트 발생 시 기록하는 pending write 채널명
+INTERRUPT_CHANNEL = "__interrupt__"
+
+# update_state() 로 만들어진 체크포인트의 metadata.source 값
+UPDATE_SOURCE = "update"
+
+# UUIDv6 타임스탬프 (1582-10-15 기준 100ns 단위) → Unix epoch 변환 오프셋
+_UUID_EPOCH_OFFSET = 0x01B21DD213814000
+
+# (thread_id, checkpoint_ns, checkpoint_id)
+CheckpointKey = Tuple[str, str, str]
+
+_DELETE_BATCH = 500
+
+
+def _env_float(name: str, default: Optional[float]) -> Optional[float]:
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    if value.lower() in ("none", "off"):
+        return None
+    return float(value)
+
+
+@dataclass
+class RetentionPolicy:
+    """체크포인트 보관 정책"""
+    keep_last: int = 20
+    thread_ttl_sec: Optional[float] = 7 * 24 * 3600
+    interrupt_ttl_sec: Optional[float] = 30 * 24 * 3600
+    preserve_interrupts: bool = True
+    vacuum_pages: int = 2000
+
+    @classmethod
+    def from_env(cls) -> "RetentionPolicy":
+        """
+        환경변수에서 정책 로드
+
+        CHECKPOINT_KEEP_LAST, CHECKPOINT_THREAD_TTL_HOURS, CHECKPOINT_INTERRUPT_TTL_HOURS
+        ("none" = 무기한), CHECKPOINT_PRESERVE_INTERRUPTS, CHECKPOINT_VACUUM_PAGES
+        """
+        thread_ttl = _env_float("CHECKPOINT_THREAD_TTL_HOURS", 7 * 24)
+        interrupt_ttl = _env_float("CHECKPOINT_INTERRUPT_TTL_HOURS", 30 * 24)
+        return cls(
+            keep_last=int(os.getenv("CHECKPOINT_KEEP_LAST", "20")),
+            thread_ttl_sec=thread_ttl * 3600 if thread_ttl is not None else None,
+            interrupt_ttl_sec=interrupt_ttl * 3600 if interrupt_ttl is not None else None,
+            preserve_interrupts=os.getenv("CHECKPOINT_PRESERVE_INTERRUPTS", "true").lower() != "false",
+            vacuum_pages=int(os.getenv("CHECKPOINT_VACUUM_PAGES", "2000")),
+        )
+
+
+def checkpoint_time(checkpoint_id: str) -> Optional[float]:
+    """체크포인트 ID(UUIDv6)에서 생성 시각(Unix epoch) 추출 (형식이 다르면 None)"""
+    from langgraph.checkpoint.base.id import UUID
+
+    try:
+        uid = UUID(checkpoint_id)
+    except (ValueError, TypeError, AttributeError):
+        return None
+    if uid.version != 6:
+        return None
+    return (uid.time - _UUID_EPOCH_OFFSET) / 1e7
+
+
+# =============================================================================
+# 삭제 대상 계산 (백엔드 무관)
+# =============================================================================
+
+@dataclass
+class RetentionPlan:
+    """정책 적용 결과"""
+    delete: List[CheckpointKey] = field(default_factory=list)
+    dropped_threads: List[str] = field(default_factory=list)
+    preserved_interrupts: int = 0
+
+
+def plan_retention(
+    rows: Iterable[CheckpointKey],
+    interrupts: Set[CheckpointKey],
+    policy: RetentionPolicy,
+    now: Optional[float] = None,
+    updates: Optional[Set[CheckpointKey]] = None,
+) -> RetentionPlan:
+    """
+    삭제할 체크포인트 계산
+
+    Args:
+        rows: 전체 체크포인트 키 목록
+        interrupts: 인터럽트 write 가 있는 체크포인트 키
+        policy: 보관 정책
+        now: 기준 시각 (테스트용)
+        updates: update_state 로 만들어진 체크포인트 키 (응답 대기 판정에서 건너뜀)
+    """
+    updates = updates or set()
+    now = time.time() if now is None else now
+    threads: Dict[str, Dict[str, List[str]]] = defaultdict(lambda: defaultdict(list))
+    for thread_id, ns, checkpoint_id in rows:
+        threads[thread_id][ns].append(checkpoint_id)
+
+    plan = RetentionPlan()
+    for thread_id, namespaces in threads.items():
+        for ids in namespaces.values():
+            ids.sort(reverse=True)  # UUIDv6 는 시간순 정렬 가능
+
+        # 루트 네임스페이스에서 노드 실행으로 생긴 최신 체크포인트에 인터럽트가 있으면 HITL 응답 대기 중
+        root_ns = "" if "" in namespaces else min(namespaces)
+        latest = next(
+            (cid for cid in namespaces[root_ns] if (thread_id, root_ns, cid) not in updates),
+            namespaces[root_ns][0],
+        )
+        waiting = (thread_id, root_ns, latest) in interrupts
+        times = [t for ids in namespaces.values() if (t := checkpoint_time(ids[0])) is not None]
+        last_active = max(times) if times else None
+
+        ttl = policy.interrupt_ttl_sec if waiting else policy.thread_ttl_sec
+        if ttl is not None and last_active is not None and now - last_active > ttl:
+            plan.dropped_threads.append(thread_id)
+            plan.delete.extend((thread_id, ns, cid) for ns, ids in namespaces.items() for cid in ids)
+            continue
+
+        for ns, ids in namespaces.items():
+            for checkpoint_id in ids[max(policy.keep_last, 1):]:
+                key = (thread_id, ns, checkpoint_id)
+                if policy.preserve_interrupts and key in interrupts:
+                    plan.preserved_interrupts += 1
+                    continue
+                plan.delete.append(key)
+    return plan
+
+
+def _batches(items: List[Any], size: int = _DELETE_BATCH):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+# =============================================================================
+# 백엔드
+# =============================================================================
+
+class SqliteRetentionBackend:
+    """langgraph-checkpoint-sqlite 스키마 (checkpoints / writes)"""
+
+    name = "sqlite"
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+
+    def _connect(self):
+        import sqlite3
+
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA busy_timeout=30000")
+        return conn
+
+    def exists(self) -> bool:
+        return os.path.exists(self.db_path)
+
+    def size_bytes(self) -> int:
+        return sum(
+            os.path.getsize(path) for path in (self.db_path, self.db_path + "-wal") if os.path.exists(path)
+        )
+
+    def load_index(self) -> Tuple[List[CheckpointKey], Set[CheckpointKey], Set[CheckpointKey]]:
+        """(전체 체크포인트, 인터럽트 체크포인트, update_state 체크포인트)"""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT thread_id, checkpoint_ns, checkpoint_id, "
+                "json_extract(CAST(metadata AS TEXT), '$.source') FROM checkpoints"
+            ).fetchall()
+            interrupts = conn.execute(
+                "SELECT DISTINCT thread_id, checkpoint_ns, checkpoint_id FROM writes WHERE channel = ?",
+                (INTERRUPT_CHANNEL,),
+            ).fetchall()
+        finally:
+            conn.close()
+        updates = {tuple(r[:3]) for r in rows if r[3] == UPDATE_SOURCE}
+        return [tuple(r[:3]) for r in rows], {tuple(r) for r in interrupts}, updates
+
+    def delete(self, keys: List[CheckpointKey], dropped_threads: List[str]) -> Dict[str, int]:
+        """배치마다 커밋해 쓰기 잠금을 짧게 유지"""
+        counts = {"checkpoints_deleted": 0, "writes_deleted": 0}
+        conn = self._connect()
+        try:
+            for batch in _batches(keys):
+                cur = conn.executemany(
+                    "DELETE FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?", batch
+                )
+                counts["checkpoints_deleted"] += cur.rowcount
+                cur = conn.executemany(
+                    "DELETE FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?", batch
+                )
+                counts["writes_deleted"] += cur.rowcount
+                conn.commit()
+            # 삭제된 스레드의 고아 writes (체크포인트 없이 남은 기록)
+            for batch in _batches([(t,) for t in dropped_threads]):
+                cur = conn.executemany("DELETE FROM writes WHERE thread_id = ?", batch)
+                counts["writes_deleted"] += cur.rowcount
+                conn.commit()
+        finally:
+            conn.close()
+        return counts
+
+    def vacuum(self, max_pages: int) -> Dict[str, Any]:
+        """
+        빈 페이지 반환
+
+        auto_vacuum=INCREMENTAL DB는 max_pages 만큼만 점진 반환,
+        기존(NONE) DB는 빈 페이지가 있을 때 1회 전체 VACUUM 으로 INCREMENTAL 전환.
+        """
+        conn = self._connect()
+        try:
+            auto_vacuum = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+            freelist = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            mode = None
+            if freelist:
+                if auto_vacuum == 2:
+                    conn.execute(f"PRAGMA incremental_vacuum({int(max_pages)})")
+                    mode = "incremental"
+                else:
+                    conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+                    conn.execute("VACUUM")
+                    mode = "full"
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            remaining = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        finally:
+            conn.close()
+        return {"vacuum": mode, "free_pages_before": freelist, "free_pages_after": remaining}
+
+    def stats(self) -> Dict[str, Any]:
+        conn = self._connect()
+        try:
+            count, threads, oldest, newest = conn.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT thread_id), MIN(checkpoint_id), MAX(checkpoint_id) FROM checkpoints"
+            ).fetchone()
+            writes = conn.execute("SELECT COUNT(*) FROM writes").fetchone()[0]
+            page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+            freelist = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        finally:
+            conn.close()
+        return {
+            "total_count": count,
+            "thread_count": threads,
+            "writes_count": writes,
+            "oldest_id": oldest,
+            "newest_id": newest,
+            "free_bytes": page_size * freelist,
+            "size_bytes": self.size_bytes(),
+        }
+
+
+class PostgresRetentionBackend:
+    """langgraph-checkpoint-postgres 스키마 (checkpoints / checkpoint_blobs / checkpoint_writes)"""
+
+    name = "postgres"
+    TABLES = ("checkpoints", "checkpoint_blobs", "checkpoint_writes")
+
+    def __init__(self, conn: Any):
+        # psycopg Connection 또는 psycopg_pool.ConnectionPool
+        self.conn = conn
+
+    def _connection(self):
+        from contextlib import nullcontext
+
+        if hasattr(self.conn, "connection"):
+            return self.conn.connection()
+        return nullcontext(self.conn)
+
+    def exists(self) -> bool:
+        return True
+
+    def size_bytes(self) -> int:
+        with self._connection() as conn:
+            row = conn.execute(
+                "SELECT COALESCE(SUM(pg_total_relation_size(c.oid)), 0) FROM pg_class c "
+                "WHERE c.relname = ANY(%s) AND c.relkind = 'r'",
+                (list(self.TABLES),),
+            ).fetchone()
+        return int(row[0])
+
+    def load_index(self) -> Tuple[List[CheckpointKey], Set[CheckpointKey], Set[CheckpointKey]]:
+        """(전체 체크포인트, 인터럽트 체크포인트, update_state 체크포인트)"""
+        with self._connection() as conn:
+            rows = conn.execute(
+                "SELECT thread_id, checkpoint_ns, checkpoint_id, metadata ->> 'source' FROM checkpoints"
+            ).fetchall()
+            interrupts = conn.execute(
+                "SELECT DISTINCT thread_id, checkpoint_ns, checkpoint_id FROM checkpoint_writes WHERE channel = %s",
+                (INTERRUPT_CHANNEL,),
+            ).fetchall()
+        updates = {tuple(r[:3]) for r in rows if r[3] == UPDATE_SOURCE}
+        return [tuple(r[:3]) for r in rows], {tuple(r) for r in interrupts}, updates
+
+    def delete(self, keys: List[CheckpointKey], dropped_threads: List[str]) -> Dict[str, int]:
+        counts = {"checkpoints_deleted": 0, "writes_deleted": 0, "blobs_deleted": 0}
+        touched = sorted({key[0] for key in keys})
+        with self._connection() as conn:
+            for batch in _batches(keys):
+                with conn.transaction():
+                    with conn.cursor() as cur:
+                        cur.executemany(
+                            "DELETE FROM checkpoints WHERE thread_id = %s AND checkpoint_ns = %s AND checkpoint_id = %s",
+                            batch,
+                        )
+                        counts["checkpoints_deleted"] += max(cur.rowcount, 0)
+                        cur.executemany(
+                            "DELETE FROM checkpoint_writes WHERE thread_id = %s AND checkpoint_ns = %s AND checkpoint_id = %s",
+                            batch,
+                        )
+                        counts["writes_deleted"] += max(cur.rowcount, 0)
+            for batch in _batches(dropped_threads):
+                with conn.transaction():
+                    cur = conn.execute("DELETE FROM checkpoint_writes WHERE thread_id = ANY(%s)", (batch,))
+                    counts["writes_deleted"] += max(cur.rowcount, 0)
+            # 남은 체크포인트의 channel_versions 가 참조하지 않는 blob 정리
+            for batch in _batches(touched):
+                with conn.transaction():
+                    cur = conn.execute(
+                        "DELETE FROM checkpoint_blobs b WHERE b.thread_id = ANY(%s) AND NOT EXISTS ("
+                        " SELECT 1 FROM checkpoints c WHERE c.thread_id = b.thread_id"
+                        " AND c.checkpoint_ns = b.checkpoint_ns"
+                        " AND (c.checkpoint -> 'channel_versions' ->> b.channel) = b.version)",
+                        (batch,),
+                    )
+                    counts["blobs_deleted"] += max(cur.rowcount, 0)
+        return counts
+
+    def vacuum(self, max_pages: int) -> Dict[str, Any]:
+        """VACUUM 은 트랜잭션 밖에서만 실행 가능 → autocommit 으로 잠시 전환"""
+        with self._connection() as conn:
+            previous = conn.autocommit
+            conn.autocommit = True
+            try:
+                conn.execute("VACUUM (ANALYZE) " + ", ".join(self.TABLES))
+            finally:
+                conn.autocommit = previous
+        return {"vacuum": "vacuum_analyze"}
+
+    def stats(self) -> Dict[str, Any]:
+        with self._connection() as conn:
+            count, threads, oldest, newest = conn.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT thread_id), MIN(checkpoint_id), MAX(checkpoint_id) FROM checkpoints"
+            ).fetchone()
+            writes = conn.execute("SELECT COUNT(*) FROM checkpoint_writes").fetchone()[0]
+            blobs = conn.execute("SELECT COUNT(*) FROM checkpoint_blobs").fetchone()[0]
+        return {
+            "total_count": count,
+            "thread_count": threads,
+            "writes_count": writes,
+            "blobs_count": blobs,
+            "oldest_id": oldest,
+            "newest_id": newest,
+            "size_bytes": self.size_bytes(),
+        }
+
+
+# =============================================================================
+# 서비스
+# =============================================================================
+
+class CheckpointRetentionService:
+    """정책 적용 + 압축 + 통계 (백그라운드 주기 실행 지원, Thread-safe)"""
+
+    def __init__(self, backend, policy: Optional[RetentionPolicy] = None):
+        self.backend = backend
+        self.policy = policy or RetentionPolicy()
+        self._run_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.last_run: Optional[Dict[str, Any]] = None
+        self.totals = {
+            "runs": 0,
+            "checkpoints_deleted": 0,
+            "writes_deleted": 0,
+            "threads_dropped": 0,
+            "bytes_reclaimed": 0,
+            "errors": 0,
+        }
+
+    def run_once(self, vacuum: bool = True, now: Optional[float] = None) -> Dict[str, Any]:
+        """정책 1회 적용 (동시 실행은 직렬화)"""
+        with self._run_lock:
+            if not self.backend.exists():
+                return {"skipped": "db_not_found"}
+
+            start = time.perf_counter()
+            size_before = self.backend.size_bytes()
+            rows, interrupts, updates = self.backend.load_index()
+            plan = plan_retention(rows, interrupts, self.policy, now=now, updates=updates)
+
+            result: Dict[str, Any] = {"checkpoints_deleted": 0, "writes_deleted": 0}
+            if plan.delete:
+                result.update(self.backend.delete(plan.delete, plan.dropped_threads))
+            if vacuum:
+                result.update(self.backend.vacuum(self.policy.vacuum_pages))
+
+            result.update({
+                "backend": self.backend.name,
+                "threads_dropped": len(plan.dropped_threads),
+                "preserved_interrupts": plan.preserved_interrupts,
+                "bytes_reclaimed": max(0, size_before - self.backend.size_bytes()),
+                "duration_ms": round((time.perf_counter() - start) * 1000, 1),
+                "ran_at": time.time(),
+            })
+
+            self.last_run = result
+            self.totals["runs"] += 1
+            for key in ("checkpoints_deleted", "writes_deleted", "threads_dropped", "bytes_reclaimed"):
+                self.totals[key] += result.get(key, 0)
+            return result
+
+    def stats(self) -> Dict[str, Any]:
+        return {"policy": dict(self.policy.__dict__), "totals": dict(self.totals), "last_run": self.last_run}
+
+    # =========================================================================
+    # 백그라운드 실행
+    # =========================================================================
+
+    def start(self, interval_sec: float, initial_delay_sec: Optional[float] = None) -> None:
+        """주기 실행 스레드 시작 (이미 실행 중이면 무시)"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        delay = min(interval_sec, 60.0) if initial_delay_sec is None else initial_delay_sec
+        self._thread = threading.Thread(
+            target=self._loop, args=(interval_sec, delay), daemon=True, name="CheckpointRetention"
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _loop(self, interval_sec: float, delay: float) -> None:
+        wait = delay
+        while not self._stop.wait(wait):
+            try:
+                result = self.run_once()
+                if result.get("checkpoints_deleted") or result.get("bytes_reclaimed"):
+                    print(
+                        f"[Checkpointer] Retention: {result['checkpoints_deleted']} checkpoints, "
+                        f"{result['threads_dropped']} threads removed, "
+                        f"{result['bytes_reclaimed'] / 1024:.0f}KB reclaimed"
+                    )
+            except Exception as e:
+                self.totals["errors"] += 1
+                print(f"[WARN] Checkpoint retention failed: {e}")
+            wait = interval_sec
+
+
+# =============================================================================
+# 싱글톤
+# =============================================================================
+
+_retention_service: Optional[CheckpointRetentionService] = None
+_retention_lock = threading.Lock()
+
+
+def start_checkpoint_retention(backend, policy: Optional[RetentionPolicy] = None) -> Optional[CheckpointRetentionService]:
+    """
+    프로세스 전역 보관 서비스 시작 (최초 1회만 적용)
+
+    CHECKPOINT_RETENTION_INTERVAL_SEC (기본 3600, 0 이면 비활성화)
+    """
+    global _retention_service
+    interval = float(os.getenv("CHECKPOINT_RETENTION_INTERVAL_SEC", "3600"))
+    if interval <= 0:
+        return None
+    with _retention_lock:
+        if _retention_service is None:
+            _retention_service = CheckpointRetentionService(backend, policy or RetentionPolicy.from_env())
+            _retention_service.start(interval)
+        return _retention_service
+
+
+def get_checkpoint_retention_service() -> Optional[CheckpointRetentionService]:
+    """실행 중인 보관 서비스 (없으면 None)"""
+    return _retention_service
+
+
+def stop_checkpoint_retention() -> None:
+    global _retention_service
+    with _retention_lock:
+        service, _retention_service = _retention_service, None
+    if service:
+        service.stop()
@@ -6,6 +6,7 @@ Last Updated: 2025-01-07
 Author: PlanCraft Team
 
 Changelog:
+- v1.2.0: 체크포인트 보관 정책 / 점진 VACUUM (utils/checkpoint_retention.py)
 - v1.1.0 (2025-01-07): SQLiteSaver 지원 추가 (프로덕션 권장)
 - v1.0.0 (2024-12-27): 초기 버전 (MemorySaver, PostgresSaver)
 
@@ -14,7 +15,8 @@ Description:
 프로덕션 환경에서는 SQLiteSaver 또는 PostgresSaver 사용을 권장합니다.
 """
 import os
-from typing import Literal, Optional
+from contextlib import contextmanager
+from typing import Iterator, Literal, Optional
 from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.checkpoint.memory import MemorySaver
 
@@ -85,11 +87,22 @@ def get_checkpointer(
             # [FIX] from_conn_string()은 context manager 반환 → 직접 connection 생성
             conn = sqlite3.connect(db_path, check_same_thread=False)
 
+            # [NEW] 새 DB는 점진 VACUUM 가능하도록 생성 (테이블 생성 전에만 적용됨)
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+
             # [Best Practice] WAL 모드 활성화 - 동시 읽기/쓰기 성능 향상
             conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("PRAGMA synchronous=NORMAL")  # 성능과 안정성 균형
 
-            return SqliteSaver(conn)
+            saver = SqliteSaver(conn)
+
+            # [NEW] 기본(운영) 경로만 백그라운드 보관 정책 적용 (명시 경로는 테스트/벤치마크용)
+            if sqlite_path is None:
+                from utils.checkpoint_retention import SqliteRetentionBackend, start_checkpoint_retention
+                saver.setup()
+                start_checkpoint_retention(SqliteRetentionBackend(db_path))
+
+            return saver
 
         except ImportError:
             print("[WARN] 'langgraph-checkpoint-sqlite' not installed. Falling back to MemorySaver.")
@@ -111,7 +124,12 @@ def get_checkpointer(
 
             print("[Checkpointer] Connecting to PostgreSQL...")
             pool = ConnectionPool(conninfo=db_url, max_size=20)
-            return PostgresSaver(pool)
+            saver = PostgresSaver(pool)
+
+            from utils.checkpoint_retention import PostgresRetentionBackend, start_checkpoint_retention
+            start_checkpoint_retention(PostgresRetentionBackend(pool))
+
+            return saver
 
         except ImportError:
             print("[WARN] 'psycopg_pool' or 'langgraph-checkpoint-postgres' not installed.")
@@ -126,53 +144,87 @@ def get_checkpointer(
     return MemorySaver()
 
 
+@contextmanager
+def _retention_backend(
+    sqlite_path: Optional[str] = None,
+    checkpointer_type: Optional[CheckpointerType] = None,
+) -> Iterator:
+    """
+    설정된 Checkpointer 저장소에 대한 보관(Retention) 백엔드 (memory 모드는 None)
+
+    타입 미지정 시 CHECKPOINTER_TYPE=postgres 가 아니면 기본 SQLite 경로를 사용합니다
+    (memory 모드로 실행 중이어도 Cron 등 외부 정리 작업이 기본 DB 를 대상으로 동작하도록).
+    Postgres 는 실행 중인 보관 서비스의 연결 풀을 재사용하고,
+    서비스가 없을 때만 임시 연결을 열어 사용 후 닫습니다.
+    """
+    from utils.checkpoint_retention import (
+        PostgresRetentionBackend,
+        SqliteRetentionBackend,
+        get_checkpoint_retention_service,
+    )
+
+    cp_type = checkpointer_type or ("postgres" if not sqlite_path and get_checkpointer_type() == "postgres" else "sqlite")
+    if cp_type == "sqlite":
+        yield SqliteRetentionBackend(sqlite_path or os.getenv("SQLITE_CHECKPOINT_PATH", DEFAULT_SQLITE_PATH))
+    elif cp_type == "postgres":
+        service = get_checkpoint_retention_service()
+        if service and service.backend.name == "postgres":
+            yield service.backend
+            return
+        import psycopg
+
+        db_url = os.getenv("DB_CONNECTION_STRING")
+        if not db_url:
+            raise ValueError("CHECKPOINTER_TYPE is postgres but DB_CONNECTION_STRING is missing")
+        with psycopg.connect(db_url) as conn:
+            yield PostgresRetentionBackend(conn)
+    else:
+        yield None
+
+
 def cleanup_old_checkpoints(
     days: int = 7,
-    sqlite_path: Optional[str] = None
+    sqlite_path: Optional[str] = None,
+    keep_last: Optional[int] = None,
+    checkpointer_type: Optional[CheckpointerType] = None,
 ) -> int:
     """
-    오래된 체크포인트 정리 (SQLite 전용)
+    오래된 체크포인트 정리 (SQLite / Postgres)
 
-    [Best Practice] 프로덕션 환경에서 주기적으로 실행 권장
-    - 일반적으로 7일 이상 된 체크포인트는 불필요
-    - Cron 또는 스케줄러로 매일 실행 권장
+    [UPDATE] 보관 정책 서비스(utils/checkpoint_retention.py)로 위임
+    - 마지막 활동 후 days일이 지난 스레드 삭제 (HITL 응답 대기 스레드는 CHECKPOINT_INTERRUPT_TTL_HOURS 적용)
+    - keep_last 지정 시 스레드별 최근 N개만 유지 (인터럽트 체크포인트는 보존)
+    - 삭제 후 점진 VACUUM 으로 디스크 공간 반환
 
     Args:
         days: 보관 기간 (기본 7일)
         sqlite_path: DB 경로 (기본값 사용 시 None)
+        keep_last: 스레드별 유지할 체크포인트 수 (None = 환경변수/기본값)
+        checkpointer_type: 저장소 타입 (None = CHECKPOINTER_TYPE=postgres 면 Postgres, 그 외 SQLite)
 
     Returns:
         int: 삭제된 체크포인트 수
     """
-    import sqlite3
-    from datetime import datetime, timedelta
-
-    db_path = sqlite_path or os.getenv("SQLITE_CHECKPOINT_PATH", DEFAULT_SQLITE_PATH)
-
-    if not os.path.exists(db_path):
-        print(f"[Checkpointer] DB not found: {db_path}")
-        return 0
+    from utils.checkpoint_retention import CheckpointRetentionService, RetentionPolicy
 
     try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
-        # 보관 기간 계산
-        cutoff_date = datetime.now() - timedelta(days=days)
-        cutoff_ts = cutoff_date.isoformat()
-
-        # 오래된 체크포인트 삭제
-        # LangGraph SQLite 스키마: checkpoints 테이블에 thread_ts 컬럼
-        cursor.execute("""
-            DELETE FROM checkpoints
-            WHERE thread_ts < ?
-        """, (cutoff_ts,))
-
-        deleted_count = cursor.rowcount
-        conn.commit()
-        conn.close()
-
-        print(f"[Checkpointer] Cleaned up {deleted_count} old checkpoints (older than {days} days)")
+        with _retention_backend(sqlite_path, checkpointer_type) as backend:
+            if backend is None or not backend.exists():
+                print(f"[Checkpointer] DB not found: {getattr(backend, 'db_path', None)}")
+                return 0
+
+            policy = RetentionPolicy.from_env()
+            policy.thread_ttl_sec = days * 24 * 3600
+            if keep_last is not None:
+                policy.keep_last = keep_last
+
+            result = CheckpointRetentionService(backend, policy).run_once()
+        deleted_count = result.get("checkpoints_deleted", 0)
+
+        print(
+            f"[Checkpointer] Cleaned up {deleted_count} old checkpoints (older than {days} days, "
+            f"{result.get('bytes_reclaimed', 0) / 1024:.0f}KB reclaimed)"
+        )
         return deleted_count
 
     except Exception as e:
@@ -180,44 +232,46 @@ def cleanup_old_checkpoints(
         return 0
 
 
-def get_checkpoint_stats(sqlite_path: Optional[str] = None) -> dict:
+def get_checkpoint_stats(
+    sqlite_path: Optional[str] = None,
+    checkpointer_type: Optional[CheckpointerType] = None,
+) -> dict:
     """
     체크포인트 통계 조회 (모니터링/디버깅용)
 
     Returns:
-        dict: {total_count, oldest_date, newest_date, db_size_mb}
+        dict: {total_count, thread_count, writes_count, oldest_date, newest_date, db_size_mb,
+               free_bytes(SQLite), retention: {policy, totals(bytes_reclaimed 등), last_run}}
     """
-    import sqlite3
+    from datetime import datetime
+    from utils.checkpoint_retention import checkpoint_time, get_checkpoint_retention_service
 
     db_path = sqlite_path or os.getenv("SQLITE_CHECKPOINT_PATH", DEFAULT_SQLITE_PATH)
 
-    if not os.path.exists(db_path):
-        return {"error": "DB not found", "path": db_path}
-
     try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
-        # 체크포인트 수
-        cursor.execute("SELECT COUNT(*) FROM checkpoints")
-        total_count = cursor.fetchone()[0]
-
-        # 날짜 범위
-        cursor.execute("SELECT MIN(thread_ts), MAX(thread_ts) FROM checkpoints")
-        oldest, newest = cursor.fetchone()
-
-        conn.close()
-
-        # 파일 크기
-        db_size_mb = os.path.getsize(db_path) / (1024 * 1024)
-
-        return {
-            "total_count": total_count,
-            "oldest_date": oldest,
-            "newest_date": newest,
-            "db_size_mb": round(db_size_mb, 2),
-            "path": db_path
-        }
+        with _retention_backend(sqlite_path, checkpointer_type) as backend:
+            if backend is None:
+                return {"error": "Checkpointer is in-memory", "path": None}
+            if not backend.exists():
+                return {"error": "DB not found", "path": db_path}
+            stats = backend.stats()
+            backend_name = backend.name
+            backend_path = getattr(backend, "db_path", None)
+
+        def _to_date(checkpoint_id):
+            ts = checkpoint_time(checkpoint_id) if checkpoint_id else None
+            return datetime.fromtimestamp(ts).isoformat() if ts else None
+
+        stats["oldest_date"] = _to_date(stats.pop("oldest_id"))
+        stats["newest_date"] = _to_date(stats.pop("newest_id"))
+        stats["db_size_mb"] = round(stats.pop("size_bytes") / (1024 * 1024), 2)
+        stats["backend"] = backend_name
+        stats["path"] = backend_path
+
+        service = get_checkpoint_retention_service()
+        if service and service.backend.name == backend_name:
+            stats["retention"] = service.stats()
+        return stats
 
     except Exception as e:
         return {"error": str(e), "path": db_path}
@@ -94,6 +94,8 @@ class Config:
     # Backend API 설정
     # =========================================================================
     API_BASE_URL = os.getenv("API_BASE_URL", "http://127.0.0.1:8000/api/v1")
+    # [NEW] 진행 상황 수신 방식 (true: SSE 스트림, false: /status 폴링)
+    API_USE_SSE = os.getenv("API_USE_SSE", "true").lower() == "true"
     
     @classmethod
     def setup_langsmith(cls) -> bool:
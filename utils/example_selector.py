@@ -2,11 +2,18 @@
 Few-shot Example Selector Module
 
 사용자 입력과 유사한 기획서 예시를 동적으로 선택하여 프롬프트에 주입합니다.
-SemanticSimilarityExampleSelector를 사용하여 임베딩 기반 유사도 검색을 수행합니다.
+예시 입력(주제)을 임베딩한 FAISS 인덱스에서 유사도 검색을 수행합니다.
+
+[UPDATE] 예시 인덱스 사전 빌드 + 영속화
+    - 호출마다 예시 파일을 읽고 전체 예시를 다시 임베딩하던 방식 제거
+    - rag/example_index/ 에 인덱스 + manifest.json(파일별 내용 해시) 저장
+    - 프로세스당 1회 로드, 예시 파일이 바뀐 경우에만 다시 빌드
+      (파일 mtime/size 시그니처로 변경 감지 → 내용 해시가 같으면 재임베딩 없이 로드)
+    - 선택 지연 시간 / 생략한 임베딩 수 통계 (get_example_selector_stats)
 
 사용 예시:
     from utils.example_selector import get_relevant_examples
-    
+
     examples = get_relevant_examples("점심 메뉴 추천 앱 기획해줘", k=2)
     for ex in examples:
         print(ex["input"], ex["output"][:200])
@@ -14,124 +21,289 @@ SemanticSimilarityExampleSelector를 사용하여 임베딩 기반 유사도 검
 
 import os
 import glob
-from typing import List, Dict, Any
+import hashlib
+import json
+import threading
+import time
+from typing import List, Dict, Any, Optional, Tuple
 
 # 예시 파일 디렉토리 경로
 EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), "..", "rag", "examples")
+# 예시 인덱스 저장 경로 (자동 생성)
+EXAMPLE_INDEX_PATH = os.path.join(os.path.dirname(__file__), "..", "rag", "example_index")
+
+MANIFEST_FILE = "manifest.json"
+MANIFEST_VERSION = 1
+
+
+def _parse_example(file_path: str, content: str) -> Dict[str, str]:
+    """예시 파일 내용 → {"input", "output", "file"}"""
+    # 파일명에서 주제 추출 (snake_case -> 공백)
+    # 예: lunch_recommendation_app.md -> "lunch recommendation app"
+    filename = os.path.basename(file_path)
+    topic = filename.replace("_", " ").replace(".md", "")
 
+    # 첫 번째 헤더에서 실제 프로젝트명 추출 시도
+    for line in content.split("\n"):
+        if line.startswith("# "):
+            topic = line[2:].strip()
+            break
 
-def load_examples() -> List[Dict[str, str]]:
+    return {"input": topic, "output": content, "file": filename}
+
+
+def load_examples(examples_dir: str = EXAMPLES_DIR) -> List[Dict[str, str]]:
     """
     rag/examples/*.md 파일들을 로드하여 예시 리스트로 반환
-    
+
     Returns:
-        List[Dict]: [{"input": "주제", "output": "기획서 내용"}, ...]
+        List[Dict]: [{"input": "주제", "output": "기획서 내용", "file": "파일명"}, ...]
     """
     examples = []
-    
+
     # examples 디렉토리가 없으면 빈 리스트 반환
-    if not os.path.exists(EXAMPLES_DIR):
-        print(f"[WARN] Examples directory not found: {EXAMPLES_DIR}")
+    if not os.path.exists(examples_dir):
+        print(f"[WARN] Examples directory not found: {examples_dir}")
         return examples
-    
-    # 모든 마크다운 파일 순회
-    for file_path in glob.glob(os.path.join(EXAMPLES_DIR, "*.md")):
+
+    # 모든 마크다운 파일 순회 (파일명 순 - 인덱스 순서 고정)
+    for file_path in sorted(glob.glob(os.path.join(examples_dir, "*.md"))):
         try:
             with open(file_path, "r", encoding="utf-8") as f:
                 content = f.read()
-            
-            # 파일명에서 주제 추출 (snake_case -> 공백)
-            # 예: lunch_recommendation_app.md -> "lunch recommendation app"
-            filename = os.path.basename(file_path)
-            topic = filename.replace("_", " ").replace(".md", "")
-            
-            # 첫 번째 헤더에서 실제 프로젝트명 추출 시도
-            lines = content.split("\n")
-            for line in lines:
-                if line.startswith("# "):
-                    topic = line[2:].strip()
-                    break
-            
-            examples.append({
-                "input": topic,
-                "output": content,
-                "file": filename
-            })
-            
+            examples.append(_parse_example(file_path, content))
+
         except Exception as e:
             print(f"[WARN] Failed to load example: {file_path} - {e}")
-    
+
     print(f"[INFO] Loaded {len(examples)} few-shot examples")
     return examples
 
 
+def _truncate(examples: List[Dict[str, str]], max_length: int) -> List[Dict[str, str]]:
+    """프롬프트 주입용 (output 길이 제한)"""
+    return [{"input": ex["input"], "output": ex["output"][:max_length]} for ex in examples]
+
+
+def _files_signature(examples_dir: str) -> Tuple:
+    """예시 파일 (이름, mtime_ns, size) 시그니처 - stat만 사용하므로 매 호출 확인 가능"""
+    signature = []
+    for file_path in sorted(glob.glob(os.path.join(examples_dir, "*.md"))):
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            continue
+        signature.append((os.path.basename(file_path), st.st_mtime_ns, st.st_size))
+    return tuple(signature)
+
+
+def _content_hash(example: Dict[str, str]) -> str:
+    return hashlib.sha256(example["output"].encode("utf-8")).hexdigest()
+
+
+# =============================================================================
+# [NEW] 예시 인덱스 (사전 빌드 + 영속화)
+# =============================================================================
+
+class ExampleIndex:
+    """
+    Few-shot 예시 인덱스 (Thread-safe)
+
+    - 예시 입력(주제)만 임베딩하여 FAISS 인덱스로 저장, 본문은 파일에서 로드
+    - manifest.json의 파일별 내용 해시 + 임베딩 모델이 같으면 디스크 인덱스 재사용
+
+    Args:
+        examples_dir: 예시 마크다운 폴더
+        index_path: 인덱스 저장 폴더
+        embeddings: 임베딩 모델 (기본값: get_embeddings())
+    """
+
+    def __init__(
+        self,
+        examples_dir: str = EXAMPLES_DIR,
+        index_path: str = EXAMPLE_INDEX_PATH,
+        embeddings: Any = None
+    ):
+        self.examples_dir = examples_dir
+        self.index_path = index_path
+        self._embeddings = embeddings
+        self._lock = threading.Lock()
+        self._store = None
+        self._examples: Dict[str, Dict[str, str]] = {}
+        self._signature: Optional[Tuple] = None
+        self._stats = {
+            "builds": 0,
+            "loads": 0,
+            "selections": 0,
+            "embedded_examples": 0,
+            "embeddings_avoided": 0,
+            "total_selection_ms": 0.0,
+            "last_selection_ms": 0.0,
+        }
+
+    def refresh(self) -> int:
+        """
+        예시 파일이 바뀐 경우에만 인덱스를 다시 로드/빌드합니다.
+
+        Returns:
+            이번 호출에서 임베딩한 예시 수 (변경 없으면 0)
+        """
+        signature = _files_signature(self.examples_dir)
+        with self._lock:
+            if signature == self._signature:
+                return 0
+
+            examples = load_examples(self.examples_dir)
+            embedded = 0
+            store = None
+            if len(examples) > 0:
+                store, embedded = self._load_or_build(examples)
+
+            self._examples = {ex["file"]: ex for ex in examples}
+            self._store = store
+            self._signature = signature
+            return embedded
+
+    def _load_or_build(self, examples: List[Dict[str, str]]) -> Tuple[Any, int]:
+        """Manifest가 일치하면 디스크 인덱스 로드, 아니면 빌드 후 저장 (lock 보유 상태에서 호출)"""
+        from langchain_community.vectorstores import FAISS
+        from rag.vectorstore import _embedding_model_name
+        from utils.llm import get_embeddings
+
+        embeddings = self._embeddings or get_embeddings()
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "embedding_model": _embedding_model_name(embeddings),
+            "files": {ex["file"]: _content_hash(ex) for ex in examples},
+        }
+
+        saved = self._load_manifest()
+        if saved is not None and all(saved.get(key) == manifest[key] for key in ("embedding_model", "files")):
+            try:
+                store = FAISS.load_local(self.index_path, embeddings, allow_dangerous_deserialization=True)
+                self._stats["loads"] += 1
+                return store, 0
+            except Exception as e:
+                print(f"[WARN] Example index load failed, rebuilding: {e}")
+
+        store = FAISS.from_texts(
+            [ex["input"] for ex in examples],
+            embeddings,
+            metadatas=[{"file": ex["file"]} for ex in examples],
+        )
+        try:
+            os.makedirs(self.index_path, exist_ok=True)
+            store.save_local(self.index_path)
+            self._save_manifest({**manifest, "built_at": time.time()})
+        except OSError as e:
+            print(f"[WARN] Example index save failed (memory only): {e}")
+
+        self._stats["builds"] += 1
+        self._stats["embedded_examples"] += len(examples)
+        print(f"[INFO] Built few-shot example index: {len(examples)} examples")
+        return store, len(examples)
+
+    def _load_manifest(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(os.path.join(self.index_path, MANIFEST_FILE), "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return manifest if manifest.get("version") == MANIFEST_VERSION else None
+
+    def _save_manifest(self, manifest: Dict[str, Any]) -> None:
+        """Manifest 저장 (임시 파일 기록 후 교체)"""
+        path = os.path.join(self.index_path, MANIFEST_FILE)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(path + ".tmp", path)
+
+    def select(self, user_input: str, k: int = 2, max_length: int = 2000) -> List[Dict[str, str]]:
+        """
+        사용자 입력과 가장 유사한 k개의 예시 반환 (유사도 순)
+
+        Raises:
+            Exception: 인덱스 빌드/검색 실패 시 (호출자에서 Fallback 처리)
+        """
+        start = time.perf_counter()
+        embedded = self.refresh()
+
+        with self._lock:
+            examples, store = dict(self._examples), self._store
+        if not examples:
+            return []
+
+        # 예시가 k개 이하면 전체 반환 (토큰 관리 위해 truncate)
+        if len(examples) <= k:
+            return _truncate(list(examples.values()), max_length)
+
+        docs = store.similarity_search(user_input, k=k)
+        selected = _truncate([examples[doc.metadata["file"]] for doc in docs if doc.metadata.get("file") in examples], max_length)
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        with self._lock:
+            self._stats["selections"] += 1
+            # 이전 방식은 선택마다 전체 예시를 다시 임베딩
+            self._stats["embeddings_avoided"] += len(examples) - embedded
+            self._stats["total_selection_ms"] += elapsed_ms
+            self._stats["last_selection_ms"] = elapsed_ms
+        print(f"[INFO] Selected {len(selected)} examples in {elapsed_ms:.1f}ms for: '{user_input[:50]}...'")
+        return selected
+
+    def stats(self) -> Dict[str, Any]:
+        """인덱스 통계 (빌드/로드 횟수, 선택 지연 시간, 생략한 임베딩 수)"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["examples"] = len(self._examples)
+        selections = stats["selections"]
+        stats["avg_selection_ms"] = round(stats["total_selection_ms"] / selections, 2) if selections else 0.0
+        stats["total_selection_ms"] = round(stats["total_selection_ms"], 2)
+        stats["last_selection_ms"] = round(stats["last_selection_ms"], 2)
+        return stats
+
+
+_example_index: Optional[ExampleIndex] = None
+_example_index_lock = threading.Lock()
+
+
+def get_example_index() -> ExampleIndex:
+    """전역 ExampleIndex 반환 (싱글톤)"""
+    global _example_index
+    if _example_index is None:
+        with _example_index_lock:
+            if _example_index is None:
+                _example_index = ExampleIndex()
+    return _example_index
+
+
+def get_example_selector_stats() -> Dict[str, Any]:
+    """예시 선택 통계 반환"""
+    return get_example_index().stats()
+
+
 def get_relevant_examples(user_input: str, k: int = 2, max_length: int = 2000) -> List[Dict[str, str]]:
     """
     사용자 입력과 가장 유사한 k개의 예시를 반환
-    
+
     Args:
         user_input: 사용자의 입력 텍스트
         k: 반환할 예시 개수 (기본값: 2)
         max_length: 각 예시의 최대 길이 (토큰 관리용)
-        
+
     Returns:
         List[Dict]: 선택된 예시 리스트 [{"input": "주제", "output": "내용(truncated)"}, ...]
     """
-    examples = load_examples()
-    
-    if not examples:
-        return []
-    
-    # 예시가 k개 이하면 전체 반환 (토큰 관리 위해 truncate)
-    if len(examples) <= k:
-        return [
-            {"input": ex["input"], "output": ex["output"][:max_length]}
-            for ex in examples
-        ]
-    
+    index = get_example_index()
     try:
-        from langchain_core.example_selectors import SemanticSimilarityExampleSelector
-        from langchain_community.vectorstores import FAISS
-        from rag.embedder import get_embeddings
-        
-        # 임베딩 모델 가져오기
-        embeddings = get_embeddings()
-        
-        # 예시 데이터 준비 (output 길이 제한)
-        prepared_examples = [
-            {"input": ex["input"], "output": ex["output"][:max_length]}
-            for ex in examples
-        ]
-        
-        # Semantic Similarity 기반 선택기 생성
-        selector = SemanticSimilarityExampleSelector.from_examples(
-            prepared_examples,
-            embeddings,
-            FAISS,
-            k=k,
-            input_keys=["input"]
-        )
-        
-        # 가장 유사한 예시 선택
-        selected = selector.select_examples({"input": user_input})
-        
-        print(f"[INFO] Selected {len(selected)} examples for: '{user_input[:50]}...'")
-        return selected
-        
+        return index.select(user_input, k=k, max_length=max_length)
+
     except ImportError as e:
-        print(f"[WARN] SemanticSimilarityExampleSelector not available: {e}")
-        # Fallback: 단순히 첫 k개 반환
-        return [
-            {"input": ex["input"], "output": ex["output"][:max_length]}
-            for ex in examples[:k]
-        ]
+        print(f"[WARN] FAISS not available: {e}")
     except Exception as e:
         print(f"[WARN] Example selection failed, using fallback: {e}")
-        # Fallback: 단순히 첫 k개 반환
-        return [
-            {"input": ex["input"], "output": ex["output"][:max_length]}
-            for ex in examples[:k]
-        ]
+
+    # Fallback: 단순히 첫 k개 반환
+    return _truncate(load_examples(index.examples_dir)[:k], max_length)
 
 
 def format_examples_for_prompt(examples: List[Dict[str, str]], format_type: str = "markdown") -> str:
@@ -17,64 +17,369 @@ PlanCraft - 구조적 JSONL 로깅 시스템
 
 import os
 import json
+import queue
+import atexit
 import datetime
+import threading
+import time
 import traceback
-from typing import Any, Optional, Dict
+from typing import Any, Optional, Dict, List
 
 LOG_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "logs")
 
+_LOG_PREFIX = "execution_"
+_LOG_SUFFIXES = (".jsonl", ".log")
 
-class FileLogger:
-    """구조적 JSONL 로깅 시스템"""
 
-    MAX_LOG_FILES = 10  # 최대 로그 파일 개수
+# =============================================================================
+# [NEW] 비동기 로그 기록 스레드
+# =============================================================================
+# 기존에는 log() 호출마다 JSONL / 텍스트 파일을 append 모드로 열어 호출 스레드에서
+# 동기 기록했습니다 (Supervisor 병렬 워커, 에이전트 핫패스 포함).
+# 이제 호출 스레드는 큐에 레코드만 넣고, 전용 스레드가 배치로 직렬화/기록합니다.
+
+class LogWriter:
+    """
+    큐 기반 로그 기록 스레드
+
+    - 배치 기록: 최대 batch_size 건 또는 flush_interval_sec 마다 한 번에 write + flush
+    - 파일 교체: 현재 파일이 max_file_bytes 를 넘거나 rotate_interval_sec 이 지나면 새 파일
+    - 보관: retention_sec 보다 오래됐거나 총 크기가 max_total_bytes 를 넘는 오래된 파일 삭제
+    - 큐가 가득 차면 레코드를 버리고 dropped 카운터 증가 (ERROR 는 잠시 대기 후 드롭)
+      → 드롭 발생 시 다음 배치에 log_dropped 경고 레코드 기록
+    - flush() / close(): 큐에 쌓인 레코드를 모두 기록 (프로세스 종료 시 atexit 로 close)
+    """
 
-    def __init__(self):
-        if not os.path.exists(LOG_DIR):
-            os.makedirs(LOG_DIR)
+    _STOP = object()
+
+    def __init__(
+        self,
+        log_dir: str = LOG_DIR,
+        queue_size: int = 10000,
+        batch_size: int = 256,
+        flush_interval_sec: float = 0.5,
+        max_file_bytes: int = 20 * 1024 * 1024,
+        rotate_interval_sec: float = 86400,
+        retention_sec: float = 14 * 86400,
+        max_total_bytes: int = 200 * 1024 * 1024,
+    ):
+        self.log_dir = log_dir
+        self.batch_size = max(1, batch_size)
+        self.flush_interval_sec = flush_interval_sec
+        self.max_file_bytes = max_file_bytes
+        self.rotate_interval_sec = rotate_interval_sec
+        self.retention_sec = retention_sec
+        self.max_total_bytes = max_total_bytes
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max(1, queue_size))
+        self._stats_lock = threading.Lock()
+        self._stats = {"enqueued": 0, "written": 0, "dropped": 0, "batches": 0, "rotations": 0, "write_errors": 0,
+                       "format_errors": 0}
+        self._unreported_drops = 0
+        self._closed = False
+
+        os.makedirs(self.log_dir, exist_ok=True)
+        self._json_fp = None
+        self._text_fp = None
+        self._open_new_files()
+        self._cleanup_old_logs()
+
+        self._thread = threading.Thread(target=self._run, daemon=True, name="FileLogWriter")
+        self._thread.start()
+        atexit.register(self.close)
+
+    # =========================================================================
+    # 호출 스레드 API
+    # =========================================================================
+
+    def submit(self, record: tuple, block: bool = False, timeout: float = 1.0) -> bool:
+        """레코드를 큐에 추가 (가득 차면 드롭 후 False)"""
+        if self._closed:
+            return False
+        try:
+            if block:
+                self._queue.put(record, timeout=timeout)
+            else:
+                self._queue.put_nowait(record)
+        except queue.Full:
+            with self._stats_lock:
+                self._stats["dropped"] += 1
+                self._unreported_drops += 1
+            return False
+        with self._stats_lock:
+            self._stats["enqueued"] += 1
+        return True
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """현재까지 큐에 들어간 레코드가 디스크에 기록될 때까지 대기"""
+        if self._closed or not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """남은 레코드를 기록하고 스레드 종료 (멱등)"""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._queue.put(self._STOP, timeout=timeout)
+        except queue.Full:
+            pass
+        self._thread.join(timeout)
+        self._close_files()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["queued"] = self._queue.qsize()
+        stats["log_file"] = self.log_file
+        return stats
+
+    # =========================================================================
+    # 기록 스레드
+    # =========================================================================
+
+    def _run(self) -> None:
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval_sec)
+            except queue.Empty:
+                continue
+
+            batch: List[tuple] = []
+            markers: List[threading.Event] = []
+            stop = False
+            deadline = time.monotonic() + self.flush_interval_sec
+            while True:
+                if item is self._STOP:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    markers.append(item)
+                else:
+                    batch.append(item)
+                if stop or markers or len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+
+            if stop:
+                # 종료 요청 이후 남은 레코드까지 모두 기록
+                while True:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if isinstance(item, threading.Event):
+                        markers.append(item)
+                    elif item is not self._STOP:
+                        batch.append(item)
+
+            self._write_batch(batch)
+            for marker in markers:
+                marker.set()
+            if stop:
+                return
+
+    def _write_batch(self, batch: List[tuple]) -> None:
+        with self._stats_lock:
+            dropped, self._unreported_drops = self._unreported_drops, 0
+        if dropped:
+            batch.append((
+                datetime.datetime.now(), "WARNING", "workflow", "file_logger", "log_dropped",
+                {"message": f"Log queue full - dropped {dropped} records", "dropped": dropped}, None,
+            ))
+        if not batch:
+            return
+
+        # 레코드별 포맷팅 (직렬화 실패한 레코드만 버리고 나머지는 기록)
+        json_lines, text_lines = [], []
+        for record in batch:
+            try:
+                json_line, text_line = self._format(record)
+            except Exception as e:
+                with self._stats_lock:
+                    self._stats["format_errors"] += 1
+                print(f"[FileLogger] Record format failed: {e}")
+                continue
+            json_lines.append(json_line)
+            text_lines.append(text_line)
+        if not json_lines:
+            return
+
+        try:
+            if self._should_rotate():
+                self._rotate()
+            self._json_fp.write("".join(json_lines))
+            self._text_fp.write("".join(text_lines))
+            self._json_fp.flush()
+            self._text_fp.flush()
+            with self._stats_lock:
+                self._stats["written"] += len(json_lines)
+                self._stats["batches"] += 1
+        except Exception as e:
+            with self._stats_lock:
+                self._stats["write_errors"] += 1
+            print(f"[FileLogger] Batch write failed: {e}")
+
+    @staticmethod
+    def _format(record: tuple):
+        """(ts, level, event_type, source, step, data, context) → (JSONL 줄, 텍스트 줄)"""
+        ts_now, level, event_type, source, step, data, context = record
+
+        log_entry = {
+            "timestamp": ts_now.isoformat(),
+            "level": level,
+            "event_type": event_type,
+            "source": source,
+            "step": step,
+            "data": data,
+            "context": context if context else None,
+        }
+        # None 값 제거
+        log_entry = {k: v for k, v in log_entry.items() if v is not None}
+        # 직렬화 불가 값(context kwargs 등)은 문자열로 기록
+        json_line = json.dumps(log_entry, ensure_ascii=False, default=str) + "\n"
+
+        # 메시지 추출 (data가 문자열이면 그대로, dict면 message 필드, 아니면 serialize)
+        if isinstance(data, str):
+            msg_str = data
+        elif isinstance(data, dict) and "message" in data:
+            msg_str = str(data["message"])
         else:
-            self._cleanup_old_logs()
+            msg_str = json.dumps(data, ensure_ascii=False, default=str)
 
-        # 실행 시마다 새로운 로그 파일 생성 (시간별)
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.log_file = os.path.join(LOG_DIR, f"execution_{timestamp}.jsonl")
-        self.text_log_file = os.path.join(LOG_DIR, f"execution_{timestamp}.log") # [NEW] 가독성용 로그
-        self._context: Dict[str, Any] = {}  # 글로벌 컨텍스트
+        # "Service Execution Log" 같은 배너는 이미 포맷팅 되어 있으므로 raw하게 출력
+        # (구분: 메시지 내에 개행문자가 있고 시작이 '='로 시작하면 raw 출력 고려)
+        if isinstance(data, str) and ("\n" in data or data.strip().startswith("=")):
+            text_line = f"{data}\n"  # 타임스탬프 없이 원문 그대로 출력 (배너용)
+        else:
+            # 포맷: [YYYY-MM-DD HH:MM:SS] [LEVEL] [STEP] Message
+            ts_readable = ts_now.strftime("%Y-%m-%d %H:%M:%S")
+            text_line = f"[{ts_readable}] [{level:<5}] [{step}] {msg_str}\n"
+        return json_line, text_line
 
-    def _cleanup_old_logs(self):
+    # =========================================================================
+    # 파일 교체 / 보관
+    # =========================================================================
+
+    def _open_new_files(self) -> None:
+        """실행(또는 교체) 시마다 새로운 로그 파일 생성 (시간별, 같은 초에 교체되면 순번 추가)"""
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        base, seq = f"execution_{timestamp}", 1
+        while os.path.exists(os.path.join(self.log_dir, base + ".jsonl")):
+            seq += 1
+            base = f"execution_{timestamp}_{seq}"
+        self.log_file = os.path.join(self.log_dir, base + ".jsonl")
+        self.text_log_file = os.path.join(self.log_dir, base + ".log")  # 가독성용 로그
+        self._json_fp = open(self.log_file, "a", encoding="utf-8")
+        self._text_fp = open(self.text_log_file, "a", encoding="utf-8")
+        self._opened_at = time.monotonic()
+
+    def _close_files(self) -> None:
+        for fp in (self._json_fp, self._text_fp):
+            try:
+                if fp and not fp.closed:
+                    fp.close()
+            except Exception:
+                pass
+
+    def _should_rotate(self) -> bool:
+        if time.monotonic() - self._opened_at >= self.rotate_interval_sec:
+            return True
+        return max(self._json_fp.tell(), self._text_fp.tell()) >= self.max_file_bytes
+
+    def _rotate(self) -> None:
+        self._close_files()
+        self._open_new_files()
+        with self._stats_lock:
+            self._stats["rotations"] += 1
+        self._cleanup_old_logs()
+
+    def _cleanup_old_logs(self) -> None:
         """
-        로그 파일이 MAX_LOG_FILES개를 초과하지 않도록 오래된 파일 삭제
+        보관 기간이 지난 파일 삭제 후, 총 크기가 max_total_bytes 이하가 될 때까지 오래된 파일부터 삭제
+        (현재 기록 중인 파일 / LogWriter 가 만들지 않은 파일(traces.jsonl 등)은 제외)
         """
         try:
-            # .jsonl 및 .log 파일 모두 조회
-            all_files = [
-                f for f in os.listdir(LOG_DIR)
-                if (f.endswith(".jsonl") or f.endswith(".log")) and os.path.isfile(os.path.join(LOG_DIR, f))
-            ]
-
-            if len(all_files) < self.MAX_LOG_FILES * 2: # 파일 종류가 2개이므로
-                return
-
-            # 수정 시간 기준 정렬
-            files_with_time = [
-                (f, os.path.getmtime(os.path.join(LOG_DIR, f)))
-                for f in all_files
-            ]
-            files_with_time.sort(key=lambda x: x[1])
-
-            # 삭제 대상 선정
-            files_to_delete = len(all_files) - (self.MAX_LOG_FILES * 2)
-            
-            for i in range(max(0, files_to_delete)):
-                file_to_delete = os.path.join(LOG_DIR, files_with_time[i][0])
+            current = {os.path.abspath(self.log_file), os.path.abspath(self.text_log_file)}
+            files = []
+            for name in os.listdir(self.log_dir):
+                path = os.path.join(self.log_dir, name)
+                if (
+                    name.startswith(_LOG_PREFIX)
+                    and name.endswith(_LOG_SUFFIXES)
+                    and os.path.isfile(path)
+                    and os.path.abspath(path) not in current
+                ):
+                    st = os.stat(path)
+                    files.append((st.st_mtime, st.st_size, path))
+            files.sort()  # 오래된 파일부터
+
+            now = time.time()
+            total = sum(size for _, size, _ in files) + sum(
+                os.path.getsize(p) for p in current if os.path.exists(p)
+            )
+            for mtime, size, path in files:
+                if now - mtime <= self.retention_sec and total <= self.max_total_bytes:
+                    continue
                 try:
-                    os.unlink(file_to_delete)
+                    os.unlink(path)
+                    total -= size
                 except Exception as e:
-                    print(f"[FileLogger] Failed to delete {file_to_delete}: {e}")
-
+                    print(f"[FileLogger] Failed to delete {path}: {e}")
         except Exception as e:
             print(f"[FileLogger] Log cleanup failed: {e}")
-        
+
+
+class FileLogger:
+    """구조적 JSONL 로깅 시스템 (기록은 LogWriter 스레드가 비동기 수행)"""
+
+    def __init__(self, log_dir: Optional[str] = None, writer: Optional[LogWriter] = None):
+        if writer is None:
+            from utils.settings import settings
+
+            writer = LogWriter(
+                log_dir=log_dir or LOG_DIR,
+                queue_size=settings.LOG_QUEUE_SIZE,
+                batch_size=settings.LOG_BATCH_SIZE,
+                flush_interval_sec=settings.LOG_FLUSH_INTERVAL_SEC,
+                max_file_bytes=int(settings.LOG_MAX_FILE_MB * 1024 * 1024),
+                rotate_interval_sec=settings.LOG_ROTATE_INTERVAL_SEC,
+                retention_sec=settings.LOG_RETENTION_DAYS * 86400,
+                max_total_bytes=int(settings.LOG_MAX_TOTAL_MB * 1024 * 1024),
+            )
+        self._writer = writer
+        self._context: Dict[str, Any] = {}  # 글로벌 컨텍스트
+
+    @property
+    def log_file(self) -> str:
+        """현재 기록 중인 JSONL 파일 (교체 시 변경됨)"""
+        return self._writer.log_file
+
+    @property
+    def text_log_file(self) -> str:
+        """현재 기록 중인 텍스트 로그 파일"""
+        return self._writer.text_log_file
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """대기 중인 로그를 모두 기록 (테스트 / 종료 직전용)"""
+        return self._writer.flush(timeout)
+
+    def close(self) -> None:
+        """남은 로그 기록 후 기록 스레드 종료"""
+        self._writer.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """기록 / 드롭 / 교체 통계"""
+        return self._writer.stats()
+
     def set_context(self, **kwargs):
         """글로벌 컨텍스트 설정 (thread_id, session_id 등)"""
         self._context.update(kwargs)
@@ -93,57 +398,16 @@ class FileLogger:
         **extra_context
     ):
         """
-        구조적 JSONL 로그 기록 + Plain Text 로그 기록
+        구조적 JSONL 로그 + Plain Text 로그 기록 요청
+
+        [UPDATE] 호출 스레드에서는 직렬화 가능한 사본만 만들어 큐에 넣고,
+        JSON 인코딩 / 파일 쓰기는 LogWriter 스레드에서 수행합니다.
         """
         # 컨텍스트 병합
         context = {**self._context, **extra_context}
-        ts_now = datetime.datetime.now()
-        ts_iso = ts_now.isoformat()
-
-        # [1] JSONL 기록
-        log_entry = {
-            "timestamp": ts_iso,
-            "level": level,
-            "event_type": event_type,
-            "source": source,
-            "step": step,
-            "data": self._serialize(data),
-            "context": context if context else None,
-        }
-        # None 값 제거
-        log_entry = {k: v for k, v in log_entry.items() if v is not None}
-
-        try:
-            with open(self.log_file, "a", encoding="utf-8") as f:
-                f.write(json.dumps(log_entry, ensure_ascii=False) + "\n")
-        except Exception as e:
-            print(f"[FileLogger] JSON logging failed: {e}")
-
-        # [2] Plain Text 기록 (가독성용)
-        try:
-            # 메시지 추출 (data가 문자열이면 그대로, dict면 message 필드, 아니면 serialize)
-            msg_str = ""
-            if isinstance(data, str):
-                msg_str = data
-            elif isinstance(data, dict) and "message" in data:
-                msg_str = str(data["message"])
-            else:
-                msg_str = json.dumps(self._serialize(data), ensure_ascii=False)
-
-            # 포맷: [YYYY-MM-DD HH:MM:SS] [LEVEL] [STEP] Message
-            ts_readable = ts_now.strftime("%Y-%m-%d %H:%M:%S")
-            text_line = f"[{ts_readable}] [{level:<5}] [{step}] {msg_str}\n"
-
-            # "Service Execution Log" 같은 배너는 이미 포맷팅 되어 있으므로 raw하게 출력
-            # (구분: 메시지 내에 개행문자가 있고 시작이 '='로 시작하면 raw 출력 고려)
-            if isinstance(data, str) and ("\n" in data or data.strip().startswith("=")):
-                text_line = f"{data}\n" # 타임스탬프 없이 원문 그대로 출력 (배너용)
-            
-            with open(self.text_log_file, "a", encoding="utf-8") as f:
-                f.write(text_line)
-                
-        except Exception as e:
-            print(f"[FileLogger] Text logging failed: {e}")
+        record = (datetime.datetime.now(), level, event_type, source, step, self._serialize(data), context)
+        # ERROR 는 큐가 가득 차도 잠시 대기 (유실 최소화)
+        self._writer.submit(record, block=(level == "ERROR"))
 
     def info(self, message: str, source: Optional[str] = None, **kwargs):
         """정보 로그 기록"""
@@ -292,17 +556,15 @@ class FileLogger:
         except (TypeError, ValueError):
             return str(obj)
 
-# 전역 로거 인스턴스 (필요할 때마다 이 인스턴스를 사용하거나 새로 생성)
-# 여기서는 싱글톤처럼 파일 하나에 계속 쓰기 위해 모듈 레벨에서 초기화하지 않고,
-# 워크플로우 실행 시마다 생성하거나 관리하는 것이 좋지만,
-# 편의상 모듈 로딩 시 파일이 생성되게 하거나, 
-# 함수 호출 시 get_logger() 패턴을 사용할 수 있음.
-# 간단하게 전역 인스턴스 제공.
-
+# 전역 로거 인스턴스 (프로세스당 로그 파일 1쌍 + 기록 스레드 1개)
 _logger_instance = None
+_logger_lock = threading.Lock()
+
 
-def get_file_logger():
+def get_file_logger() -> FileLogger:
     global _logger_instance
     if _logger_instance is None:
-        _logger_instance = FileLogger()
+        with _logger_lock:
+            if _logger_instance is None:
+                _logger_instance = FileLogger()
     return _logger_instance
@@ -23,11 +23,20 @@ LangChain의 AzureChatOpenAI와 AzureOpenAIEmbeddings를 래핑합니다.
     # Embedding 모델 가져오기
     embeddings = get_embeddings()
     vector = embeddings.embed_query("텍스트")
+
+[NEW] 응답 캐시 (utils/llm_cache.py):
+    - 저온도(LLM_CACHE_MAX_TEMPERATURE 이하) 호출은 기본으로 캐시
+    - 호출 지점별 지정: get_llm(..., cache=True | False | TTL초)
+
+[NEW] Rate Limiter (utils/rate_limiter.py):
+    - Chat / Embedding 클라이언트가 배포별 RPM/TPM 토큰 버킷을 공유 (LLM_RATE_LIMIT_ENABLED)
 """
 
 from functools import lru_cache
+from typing import Optional, Tuple, Union
 from langchain_openai import AzureChatOpenAI, AzureOpenAIEmbeddings
 from utils.config import Config
+from utils.rate_limiter import get_rate_limited_http_client
 
 
 # =============================================================================
@@ -36,14 +45,21 @@ from utils.config import Config
 # 동일한 (model_type, temperature) 조합에 대해 인스턴스 재사용
 # 효과: 30-40% 응답 시간 단축 (인스턴스 생성 오버헤드 제거)
 
-@lru_cache(maxsize=10)
-def _get_cached_llm(model_type: str, temperature_key: int) -> AzureChatOpenAI:
+@lru_cache(maxsize=20)
+def _get_cached_llm(
+    model_type: str,
+    temperature_key: int,
+    use_cache: bool = False,
+    cache_ttl: Optional[float] = None
+) -> AzureChatOpenAI:
     """
     캐싱된 LLM 인스턴스 반환 (내부용)
 
     Args:
         model_type: 모델 타입 (gpt-4o, gpt-4o-mini)
         temperature_key: temperature * 100 (정수화하여 hashable)
+        use_cache: 응답 캐시 연결 여부
+        cache_ttl: 응답 캐시 TTL (초, None이면 만료 없음)
 
     Returns:
         AzureChatOpenAI: 캐싱된 LLM 인스턴스
@@ -51,16 +67,50 @@ def _get_cached_llm(model_type: str, temperature_key: int) -> AzureChatOpenAI:
     temperature = temperature_key / 100.0
     deployment_name = Config.get_model_deployment(model_type)
 
+    extra = {}
+    # [NEW] 배포별 RPM/TPM 토큰 버킷을 거치는 공유 HTTP 클라이언트 (utils/rate_limiter.py)
+    http_client = get_rate_limited_http_client()
+    if http_client is not None:
+        extra["http_client"] = http_client
+    if use_cache:
+        from utils.llm_cache import get_llm_cache
+        extra["cache"] = get_llm_cache(cache_ttl)
+
     return AzureChatOpenAI(
         azure_endpoint=Config.AOAI_ENDPOINT,
         api_key=Config.AOAI_API_KEY,
         api_version=Config.AOAI_API_VERSION,
         azure_deployment=deployment_name,
-        temperature=temperature
+        temperature=temperature,
+        **extra
     )
 
 
-def get_llm(model_type: str = "gpt-4o", temperature: float = 0.7) -> AzureChatOpenAI:
+def _resolve_cache_policy(temperature: float, cache: Union[bool, float, None]) -> Tuple[bool, Optional[float]]:
+    """
+    호출 지점의 cache 인자 → (캐시 사용 여부, TTL)
+
+    - None: 기본 정책 (temperature <= LLM_CACHE_MAX_TEMPERATURE 이면 사용)
+    - True / False: 명시적 사용 / 미사용
+    - 숫자: 해당 TTL(초)로 사용
+    """
+    from utils.settings import settings
+
+    if not settings.LLM_CACHE_ENABLED or cache is False:
+        return False, None
+    default_ttl = settings.LLM_CACHE_TTL_SEC or None
+    if cache is None:
+        return temperature <= settings.LLM_CACHE_MAX_TEMPERATURE, default_ttl
+    if cache is True:
+        return True, default_ttl
+    return True, float(cache)
+
+
+def get_llm(
+    model_type: str = "gpt-4o",
+    temperature: float = 0.7,
+    cache: Union[bool, float, None] = None
+) -> AzureChatOpenAI:
     """
     Azure OpenAI Chat 모델 인스턴스를 생성합니다.
     
@@ -72,6 +122,7 @@ def get_llm(model_type: str = "gpt-4o", temperature: float = 0.7) -> AzureChatOp
             - 0.0: 결정적, 일관된 응답
             - 1.0: 기본값
             - 2.0: 매우 창의적, 다양한 응답
+        cache: 응답 캐시 정책 (None=저온도 자동, True/False, 또는 TTL 초)
     
     Returns:
         AzureChatOpenAI: 설정된 LLM 클라이언트 인스턴스
@@ -89,8 +140,9 @@ def get_llm(model_type: str = "gpt-4o", temperature: float = 0.7) -> AzureChatOp
     # temperature를 정수 키로 변환 (lru_cache는 hashable 인자 필요)
     # 소수점 2자리까지 지원 (0.01 단위)
     temperature_key = int(round(temperature * 100))
+    use_cache, cache_ttl = _resolve_cache_policy(temperature, cache)
 
-    return _get_cached_llm(model_type, temperature_key)
+    return _get_cached_llm(model_type, temperature_key, use_cache, cache_ttl)
 
 
 @lru_cache(maxsize=1)
@@ -113,14 +165,22 @@ def get_embeddings() -> AzureOpenAIEmbeddings:
         - RAG 파이프라인에서 문서 임베딩 및 쿼리 임베딩에 사용됩니다.
         - 동일한 텍스트는 항상 동일한 벡터를 생성합니다.
         - 싱글톤 패턴으로 인스턴스가 캐싱됩니다.
+        - [NEW] 벡터 캐시(rag/embedding_cache.py)로 감싸 반복 쿼리의 API 호출을 생략합니다.
+          (EMBED_CACHE_ENABLED=false 이면 원래 모델 반환)
     """
-    return AzureOpenAIEmbeddings(
+    http_client = get_rate_limited_http_client()
+    embeddings = AzureOpenAIEmbeddings(
         azure_endpoint=Config.AOAI_ENDPOINT,
         api_key=Config.AOAI_API_KEY,
         api_version=Config.AOAI_API_VERSION,
-        azure_deployment=Config.AOAI_DEPLOY_EMBED_LARGE
+        azure_deployment=Config.AOAI_DEPLOY_EMBED_LARGE,
+        **({"http_client": http_client} if http_client is not None else {})
     )
 
+    from rag.embedding_cache import CachedEmbeddings, get_embedding_cache
+    store = get_embedding_cache()
+    return CachedEmbeddings(embeddings, store) if store is not None else embeddings
+
 
 # =============================================================================
 # Retry 적용 LLM (프로덕션 권장)
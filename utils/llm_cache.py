@@ -0,0 +1,245 @@
+"""
+PlanCraft Agent - LLM 응답 캐시
+
+라우터 Fallback, 검색 쿼리 생성, RAG 쿼리 재작성, 인용 검증처럼
+사실상 결정적인(저온도) LLM 호출은 실행 간에 같은 입력이 반복됩니다.
+get_llm()이 반환하는 모델에 LangChain BaseCache를 연결해 이런 호출을 재사용합니다.
+
+캐시 키 (LangChain 표준):
+    - prompt: 메시지 목록 직렬화 (메시지 id 제거된 정규화 형태)
+    - llm_string: 모델 배포명, temperature 등 모델 파라미터
+                  + with_structured_output 이 바인딩한 스키마(tools/response_format)
+
+저장소:
+    - SQLite (LLM_CACHE_PATH, ":memory:" 가능)
+    - 항목별 TTL, 최대 항목 수 초과 시 오래 사용되지 않은 항목부터 제거
+
+절감 토큰 기록:
+    - 캐시 히트 시 원래 응답의 usage_metadata를 "saved" 토큰으로 집계
+    - 히트한 Generation에 generation_info["from_cache"]=True 표시
+      (TokenTrackingCallback이 실제 사용량과 분리하여 보고)
+
+사용 예시:
+    llm = get_llm(temperature=0)                       # 기본 정책 (저온도 자동 캐시)
+    llm = get_llm(temperature=0.3, cache=True)         # 호출 지점에서 명시적 사용
+    llm = get_llm(temperature=0.3, cache=3600)         # TTL 1시간
+    llm = get_llm(temperature=0, cache=False)          # 캐시 사용 안 함
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import warnings
+from typing import Any, Dict, Optional, Sequence
+
+from langchain_core.caches import BaseCache
+from langchain_core.load import dumps, loads
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, Generation
+
+# 기본 영속 경로 (LLM_CACHE_PATH="" 이면 메모리 전용)
+DEFAULT_LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", "./data/llm_cache.db")
+
+_ALLOWED_OBJECTS = [ChatGeneration, Generation, AIMessage]
+
+
+def _cache_key(prompt: str, llm_string: str) -> str:
+    return hashlib.sha256(f"{llm_string}\x00{prompt}".encode("utf-8")).hexdigest()
+
+
+def _usage_of(generations: Sequence[Generation]) -> Dict[str, int]:
+    usage = {"input_tokens": 0, "output_tokens": 0}
+    for gen in generations:
+        metadata = getattr(getattr(gen, "message", None), "usage_metadata", None) or {}
+        usage["input_tokens"] += metadata.get("input_tokens", 0) or 0
+        usage["output_tokens"] += metadata.get("output_tokens", 0) or 0
+    return usage
+
+
+# =============================================================================
+# SQLite 저장소
+# =============================================================================
+
+class LLMCacheStore:
+    """
+    LLM 응답 SQLite 저장소 (Thread-safe)
+
+    Args:
+        db_path: SQLite 경로 (":memory:" 또는 None이면 메모리)
+        max_entries: 최대 항목 수 (초과 시 last_used_at 오래된 순 제거)
+        clock: 시간 함수 (테스트용)
+    """
+
+    def __init__(self, db_path: Optional[str] = ":memory:", max_entries: int = 5000, clock=time.time):
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0, "misses": 0, "writes": 0, "evictions": 0,
+            "saved_input_tokens": 0, "saved_output_tokens": 0,
+        }
+
+        path = db_path or ":memory:"
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                " key TEXT PRIMARY KEY, value TEXT NOT NULL,"
+                " expires_at REAL, last_used_at REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_used ON llm_cache(last_used_at)")
+            self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        now = self._clock()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or (row[1] is not None and row[1] <= now):
+                if row is not None:
+                    self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                    self._conn.commit()
+                self._stats["misses"] += 1
+                return None
+            self._conn.execute("UPDATE llm_cache SET last_used_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self._stats["hits"] += 1
+            return row[0]
+
+    def set(self, key: str, value: str, ttl: Optional[float]) -> None:
+        now = self._clock()
+        expires_at = now + ttl if ttl else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, expires_at, last_used_at) VALUES (?, ?, ?, ?)",
+                (key, value, expires_at, now),
+            )
+            self._stats["writes"] += 1
+            self._enforce_limits(now)
+            self._conn.commit()
+
+    def _enforce_limits(self, now: float) -> None:
+        """만료 항목 삭제 + 최대 항목 수 초과분 제거 (lock 보유 상태에서 호출)"""
+        self._conn.execute("DELETE FROM llm_cache WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
+        count = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM llm_cache WHERE key IN "
+                "(SELECT key FROM llm_cache ORDER BY last_used_at ASC LIMIT ?)",
+                (overflow,),
+            )
+            self._stats["evictions"] += overflow
+
+    def record_saved(self, usage: Dict[str, int]) -> None:
+        with self._lock:
+            self._stats["saved_input_tokens"] += usage["input_tokens"]
+            self._stats["saved_output_tokens"] += usage["output_tokens"]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache")
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+        stats["size"] = len(self)
+        return stats
+
+
+# =============================================================================
+# LangChain BaseCache 어댑터
+# =============================================================================
+
+class LLMResponseCache(BaseCache):
+    """
+    LangChain 모델에 연결하는 캐시 (저장소 공유, 호출 지점별 TTL)
+
+    Args:
+        store: 공유 LLMCacheStore
+        ttl: 항목 유효 시간 (초, None이면 만료 없음)
+    """
+
+    def __init__(self, store: LLMCacheStore, ttl: Optional[float] = None):
+        self.store = store
+        self.ttl = ttl
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[Sequence[Generation]]:
+        value = self.store.get(_cache_key(prompt, llm_string))
+        if value is None:
+            return None
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                generations = loads(value, allowed_objects=_ALLOWED_OBJECTS)
+        except Exception as e:
+            print(f"[WARN] LLM 캐시 역직렬화 실패 (무시): {e}")
+            return None
+
+        for gen in generations:
+            gen.generation_info = {**(gen.generation_info or {}), "from_cache": True}
+        self.store.record_saved(_usage_of(generations))
+        return generations
+
+    def update(self, prompt: str, llm_string: str, return_val: Sequence[Generation]) -> None:
+        try:
+            value = dumps(list(return_val))
+        except Exception as e:
+            print(f"[WARN] LLM 캐시 직렬화 실패 (저장 생략): {e}")
+            return
+        self.store.set(_cache_key(prompt, llm_string), value, self.ttl)
+
+    def clear(self, **kwargs: Any) -> None:
+        self.store.clear()
+
+
+# =============================================================================
+# 전역 인스턴스
+# =============================================================================
+
+_llm_cache_store: Optional[LLMCacheStore] = None
+_llm_cache_views: Dict[Optional[float], LLMResponseCache] = {}
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm_cache_store() -> LLMCacheStore:
+    """전역 LLMCacheStore 반환 (싱글톤)"""
+    global _llm_cache_store
+    if _llm_cache_store is None:
+        with _llm_cache_lock:
+            if _llm_cache_store is None:
+                from utils.settings import settings
+                try:
+                    _llm_cache_store = LLMCacheStore(DEFAULT_LLM_CACHE_PATH or ":memory:", settings.LLM_CACHE_MAX_ENTRIES)
+                except sqlite3.Error as e:
+                    print(f"[WARN] LLM 캐시 DB 열기 실패, 메모리 사용: {e}")
+                    _llm_cache_store = LLMCacheStore(":memory:", settings.LLM_CACHE_MAX_ENTRIES)
+    return _llm_cache_store
+
+
+def get_llm_cache(ttl: Optional[float] = None) -> LLMResponseCache:
+    """TTL별 LLMResponseCache 반환 (저장소 공유)"""
+    store = get_llm_cache_store()
+    with _llm_cache_lock:
+        view = _llm_cache_views.get(ttl)
+        if view is None or view.store is not store:
+            view = LLMResponseCache(store, ttl)
+            _llm_cache_views[ttl] = view
+        return view
+
+
+def get_llm_cache_stats() -> Dict[str, Any]:
+    """전역 LLM 캐시 통계 (hits, misses, saved_input_tokens, saved_output_tokens...)"""
+    return get_llm_cache_store().stats()
@@ -0,0 +1,636 @@
+"""
+PlanCraft Agent - Azure OpenAI 배포별 적응형 Rate Limiter
+
+병렬 전문 에이전트 / Writer / Reviewer / 동시 API 실행이 같은 배포를 조율 없이 호출하면
+RPM/TPM 한도는 429 응답을 받은 뒤에야 드러나고, 재시도는 맹목적으로 대기합니다.
+이 모듈은 프로세스 전역에서 배포별 토큰 버킷을 공유해 호출 전에 대기시킵니다.
+
+구성:
+    - DeploymentLimiter: 요청(RPM) / 토큰(TPM) 버킷 2개 + 우선순위 대기열
+    - 호출 전 프롬프트 토큰 추정 (문자 수 휴리스틱 + max_tokens 예약)
+    - 응답 헤더(x-ratelimit-remaining-*, x-ratelimit-limit-*)로 버킷 보정 (다른 프로세스의 사용량 반영)
+    - 429 응답의 retry-after-ms / Retry-After 동안 배포 전체 일시 정지
+    - 우선순위: INTERACTIVE(HITL 재개) > NORMAL > BACKGROUND(병렬 전문 에이전트),
+      같은 우선순위는 도착 순서(FIFO)
+    - RateLimitedTransport: httpx Transport 로 AzureChatOpenAI / AzureOpenAIEmbeddings 에 연결
+      (응답 캐시 히트는 HTTP 호출이 없으므로 한도를 소모하지 않음)
+
+설정:
+    config/rate_limits.yaml (배포별 rpm / tpm), LLM_RATE_LIMIT_* 설정
+    기본 비활성 (LLM_RATE_LIMIT_ENABLED=true + 배포별 한도 명시 시 사용)
+
+사용 예시:
+    from utils.rate_limiter import INTERACTIVE, llm_priority, get_rate_limiter_registry
+
+    with llm_priority(INTERACTIVE):
+        llm.invoke(messages)            # 대기열에서 앞순서
+
+    get_rate_limiter_registry().get_stats()   # 배포별 대기 시간 / 429 횟수
+"""
+
+import contextvars
+import heapq
+import itertools
+import json
+import math
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import httpx
+import yaml
+
+
+# =============================================================================
+# 우선순위 (컨텍스트 로컬)
+# =============================================================================
+
+INTERACTIVE = 0   # HITL 재개 등 사용자가 기다리는 호출
+NORMAL = 1        # 일반 워크플로우 실행
+BACKGROUND = 2    # 병렬 전문 에이전트 등 배경 작업
+
+PRIORITY_NAMES = {INTERACTIVE: "interactive", NORMAL: "normal", BACKGROUND: "background"}
+
+_priority: contextvars.ContextVar[int] = contextvars.ContextVar("llm_priority", default=NORMAL)
+
+
+def current_priority() -> int:
+    """현재 컨텍스트의 LLM 호출 우선순위"""
+    return _priority.get()
+
+
+@contextmanager
+def llm_priority(level: int):
+    """
+    블록 안의 LLM 호출 우선순위를 지정합니다. (INTERACTIVE ~ BACKGROUND 범위로 보정)
+
+    ThreadPoolExecutor 작업에는 contextvars.copy_context().run 으로 전달해야 합니다.
+    """
+    token = _priority.set(min(max(int(level), INTERACTIVE), BACKGROUND))
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class RateLimitWaitTimeout(TimeoutError):
+    """Rate Limiter 대기 시간 초과"""
+
+
+# =============================================================================
+# 토큰 추정
+# =============================================================================
+
+# 응답 길이를 지정하지 않은 호출의 완료 토큰 예약분 (Azure 도 TPM 계산 시 max_tokens 를 합산)
+DEFAULT_COMPLETION_TOKENS = 1000
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def estimate_text_tokens(text: str) -> int:
+    """
+    문자 수 기반 토큰 추정 (tokenizer 없이)
+
+    영문/코드는 약 4자당 1토큰, 한글 등 비 ASCII 문자는 약 1.5자당 1토큰으로 계산합니다.
+    """
+    if not text:
+        return 0
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    other_chars = len(text) - ascii_chars
+    return int(math.ceil(ascii_chars / 4 + other_chars / 1.5))
+
+
+def _content_text(content: Any) -> str:
+    """메시지 content (문자열 또는 parts 리스트) → 텍스트"""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return " ".join(part.get("text", "") if isinstance(part, dict) else str(part) for part in content)
+    return ""
+
+
+def estimate_request_tokens(
+    body: Any,
+    kind: str = "chat",
+    default_completion_tokens: int = DEFAULT_COMPLETION_TOKENS
+) -> int:
+    """
+    요청 본문(JSON dict 또는 bytes) → 예상 소모 토큰 (프롬프트 + 완료 예약)
+
+    Chat: 메시지 + 도구/응답 스키마 + max_tokens (없으면 기본 예약분)
+    Embeddings: 입력 텍스트만
+    """
+    if isinstance(body, (bytes, bytearray, str)):
+        try:
+            body = json.loads(body or b"{}")
+        except (TypeError, ValueError):
+            return default_completion_tokens if kind == "chat" else 1
+    if not isinstance(body, dict):
+        body = {}
+
+    if kind == "embeddings":
+        inputs = body.get("input", "")
+        if not isinstance(inputs, list):
+            inputs = [inputs]
+        return max(1, sum(estimate_text_tokens(x) if isinstance(x, str) else len(x) for x in inputs))
+
+    prompt = 0
+    for message in body.get("messages", []) or []:
+        prompt += MESSAGE_OVERHEAD_TOKENS + estimate_text_tokens(_content_text(message.get("content")))
+    for key in ("tools", "functions", "response_format"):
+        if body.get(key):
+            prompt += estimate_text_tokens(json.dumps(body[key], ensure_ascii=False))
+
+    completion = body.get("max_completion_tokens") or body.get("max_tokens") or default_completion_tokens
+    return prompt + int(completion) * max(1, int(body.get("n") or 1))
+
+
+# =============================================================================
+# 토큰 버킷 / 배포별 Limiter
+# =============================================================================
+
+class _Bucket:
+    """
+    분당 한도 기반 토큰 버킷 (호출자가 락 보유)
+
+    초당 per_minute/60 씩 채우고, 한 번에 몰아 쓸 수 있는 양은 burst_sec 초 분량으로 제한합니다.
+    """
+
+    def __init__(self, per_minute: float, now: float, burst_sec: float = 60.0):
+        self.per_minute = float(per_minute)
+        self.burst_sec = burst_sec
+        self.capacity = self.per_minute * burst_sec / 60.0
+        self.level = self.capacity
+        self.updated = now
+
+    @property
+    def rate(self) -> float:
+        return self.per_minute / 60.0
+
+    def refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def time_until(self, amount: float) -> float:
+        """amount 만큼 쌓일 때까지 남은 초 (버킷 용량보다 큰 요청은 가득 찰 때까지)"""
+        amount = min(amount, self.capacity)
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) / self.rate
+
+    def resize(self, per_minute: float) -> None:
+        if per_minute > 0 and per_minute != self.per_minute:
+            self.per_minute = float(per_minute)
+            self.capacity = self.per_minute * self.burst_sec / 60.0
+            self.level = min(self.level, self.capacity)
+
+
+class DeploymentLimiter:
+    """
+    배포 1개의 RPM / TPM 한도
+
+    대기열 맨 앞(우선순위 → 도착 순) 호출자만 버킷에서 꺼낼 수 있어
+    큰 요청이 작은 요청에 계속 추월당하는 기아 상태가 생기지 않습니다.
+    """
+
+    def __init__(self, name: str, rpm: float, tpm: float, burst_sec: float = 60.0, clock=time.monotonic):
+        self.name = name
+        self._clock = clock
+        now = clock()
+        self._requests = _Bucket(rpm, now, burst_sec)
+        self._tokens = _Bucket(tpm, now, burst_sec)
+        self._paused_until = 0.0
+        self._cond = threading.Condition()
+        self._waiters: List[Tuple[int, int]] = []
+        self._seq = itertools.count()
+        self._inflight_requests = 0
+        self._inflight_tokens = 0
+
+        self._calls = 0
+        self._waited_calls = 0
+        self._throttled = 0
+        self._header_updates = 0
+        self._timeouts = 0
+        self._waits: List[float] = []
+        self._by_priority: Dict[int, List[float]] = {}  # 우선순위 -> [호출 수, 총 대기, 최대 대기]
+        self._max_queue = 0
+
+    @property
+    def rpm(self) -> float:
+        return self._requests.per_minute
+
+    @property
+    def tpm(self) -> float:
+        return self._tokens.per_minute
+
+    def acquire(self, tokens: int, priority: int = NORMAL, timeout: Optional[float] = None) -> float:
+        """
+        요청 1건 + 추정 토큰을 확보할 때까지 대기합니다.
+
+        Returns:
+            float: 대기한 시간 (초)
+
+        Raises:
+            RateLimitWaitTimeout: timeout 안에 확보할 수 없을 때 (대기열에서 제거됨)
+        """
+        ticket = (priority, next(self._seq))
+        start = self._clock()
+        with self._cond:
+            heapq.heappush(self._waiters, ticket)
+            self._max_queue = max(self._max_queue, len(self._waiters))
+            try:
+                while True:
+                    now = self._clock()
+                    wait = None
+                    if self._waiters[0] == ticket:
+                        self._requests.refill(now)
+                        self._tokens.refill(now)
+                        wait = max(
+                            self._paused_until - now,
+                            self._requests.time_until(1),
+                            self._tokens.time_until(tokens),
+                        )
+                        if wait <= 0:
+                            break
+
+                    if timeout is not None:
+                        remaining = start + timeout - now
+                        if remaining <= 0 or (wait is not None and wait > remaining):
+                            self._timeouts += 1
+                            raise RateLimitWaitTimeout(
+                                f"{self.name}: rate limit wait exceeded {timeout:.1f}s "
+                                f"(need {tokens} tokens, queue {len(self._waiters)})"
+                            )
+                        wait = remaining if wait is None else wait
+                    self._cond.wait(wait)
+            except BaseException:
+                self._waiters.remove(ticket)
+                heapq.heapify(self._waiters)
+                self._cond.notify_all()
+                raise
+
+            heapq.heappop(self._waiters)
+            self._requests.level -= 1
+            self._tokens.level -= min(tokens, self._tokens.capacity)
+            self._inflight_requests += 1
+            self._inflight_tokens += tokens
+
+            waited = self._clock() - start
+            self._calls += 1
+            if waited > 0.001:
+                self._waited_calls += 1
+            self._waits.append(waited)
+            agg = self._by_priority.setdefault(priority, [0, 0.0, 0.0])
+            agg[0] += 1
+            agg[1] += waited
+            agg[2] = max(agg[2], waited)
+            if len(self._waits) > 1000:
+                del self._waits[:500]
+            self._cond.notify_all()
+        return waited
+
+    def release(self, tokens: int) -> None:
+        """응답 없이 끝난 호출 (네트워크 오류)의 진행 중 카운트 해제"""
+        with self._cond:
+            self._inflight_requests = max(0, self._inflight_requests - 1)
+            self._inflight_tokens = max(0, self._inflight_tokens - tokens)
+
+    def observe(self, status_code: int, headers: Mapping[str, str], tokens: int = 0) -> None:
+        """
+        응답 헤더로 버킷을 보정합니다.
+
+        - x-ratelimit-limit-*: 서버 한도로 용량 변경
+        - x-ratelimit-remaining-*: 진행 중 호출분을 뺀 값이 로컬 잔량보다 작으면 그 값으로 낮춤
+        - 429: retry-after-ms / Retry-After 동안 배포 전체 일시 정지
+        """
+        from tools.http_transport import parse_retry_after
+
+        with self._cond:
+            now = self._clock()
+            self._inflight_requests = max(0, self._inflight_requests - 1)
+            self._inflight_tokens = max(0, self._inflight_tokens - tokens)
+            self._requests.refill(now)
+            self._tokens.refill(now)
+
+            updated = False
+            for bucket, kind, inflight in (
+                (self._requests, "requests", self._inflight_requests),
+                (self._tokens, "tokens", self._inflight_tokens),
+            ):
+                limit = _header_number(headers, f"x-ratelimit-limit-{kind}")
+                if limit:
+                    bucket.resize(limit)
+                    updated = True
+                # 응답 순서가 뒤바뀌면 오래된 헤더가 잔량을 부풀릴 수 있으므로 낮추는 방향으로만 반영
+                # (다른 프로세스가 같은 배포를 쓰는 만큼 줄어듦)
+                remaining = _header_number(headers, f"x-ratelimit-remaining-{kind}")
+                if remaining is not None:
+                    bucket.level = min(bucket.level, max(0.0, remaining - inflight))
+                    updated = True
+            if updated:
+                self._header_updates += 1
+
+            if status_code == 429:
+                self._throttled += 1
+                retry_after = None
+                retry_after_ms = _header_number(headers, "retry-after-ms")
+                if retry_after_ms is not None:
+                    retry_after = retry_after_ms / 1000.0
+                if retry_after is None:
+                    retry_after = parse_retry_after(headers.get("retry-after"))
+                if retry_after is None:
+                    retry_after = 1.0
+                self._paused_until = max(self._paused_until, now + retry_after)
+                self._tokens.level = min(self._tokens.level, 0.0)
+
+            self._cond.notify_all()
+
+    def pause_remaining(self) -> float:
+        """429 로 인한 일시 정지 남은 시간 (초)"""
+        with self._cond:
+            return max(0.0, self._paused_until - self._clock())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """대기 시간 / 429 / 대기열 지표"""
+        with self._cond:
+            now = self._clock()
+            self._requests.refill(now)
+            self._tokens.refill(now)
+            waits = sorted(self._waits)
+            return {
+                "rpm": self._requests.per_minute,
+                "tpm": self._tokens.per_minute,
+                "calls": self._calls,
+                "waited_calls": self._waited_calls,
+                "throttled_429": self._throttled,
+                "timeouts": self._timeouts,
+                "header_updates": self._header_updates,
+                "wait_ms": {
+                    "total": round(sum(waits) * 1000, 1),
+                    "p50": round(_percentile(waits, 0.5) * 1000, 1),
+                    "p95": round(_percentile(waits, 0.95) * 1000, 1),
+                    "max": round((waits[-1] if waits else 0.0) * 1000, 1),
+                },
+                "by_priority": {
+                    PRIORITY_NAMES.get(p, str(p)): {
+                        "calls": count,
+                        "mean_wait_ms": round(total / count * 1000, 1),
+                        "max_wait_ms": round(peak * 1000, 1),
+                    }
+                    for p, (count, total, peak) in sorted(self._by_priority.items())
+                },
+                "queue_depth": len(self._waiters),
+                "max_queue_depth": self._max_queue,
+                "inflight": self._inflight_requests,
+                "available_tokens": int(self._tokens.level),
+                "paused_sec": round(max(0.0, self._paused_until - now), 3),
+            }
+
+
+def _header_number(headers: Mapping[str, str], name: str) -> Optional[float]:
+    value = headers.get(name) if headers is not None else None
+    if value in (None, ""):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+# =============================================================================
+# 설정 / 레지스트리
+# =============================================================================
+
+DEFAULT_BURST_SEC = 60.0
+
+
+def _resolve_deployment_name(key: str) -> Optional[str]:
+    """
+    설정 키 → 실제 배포 이름
+
+    AOAI_DEPLOY_* 이름이면 utils.config.Config 의 같은 속성(없으면 같은 이름의 환경변수) 값으로 치환하고,
+    그 외에는 키를 배포 이름으로 그대로 사용합니다.
+    """
+    if not key.startswith("AOAI_DEPLOY_"):
+        return key
+    from utils.config import Config  # .env 로드 포함
+
+    value = getattr(Config, key, None) or os.getenv(key)
+    return str(value) if value else None
+
+
+def load_rate_limit_config(path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    config/rate_limits.yaml 로드 (파일이 없거나 형식이 잘못되면 빈 설정)
+
+    Azure OpenAI 는 응답에 한도 헤더를 보내지 않으므로 한도를 추측하지 않습니다.
+    rpm / tpm 이 명시된 배포만 제한하고, default 에 rpm / tpm 이 없으면 나머지 배포는 통과시킵니다.
+
+    Returns:
+        dict: {"default": {burst_sec[, rpm, tpm]}, "default_completion_tokens": int, "deployments": {배포 이름: {rpm, tpm}}}
+    """
+    if not path:
+        path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config", "rate_limits.yaml")
+
+    config = {
+        "default": {"burst_sec": DEFAULT_BURST_SEC},
+        "default_completion_tokens": DEFAULT_COMPLETION_TOKENS,
+        "deployments": {},
+    }
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = yaml.safe_load(f) or {}
+        config["default"].update(data.get("default") or {})
+        config["default_completion_tokens"] = int(data.get("default_completion_tokens") or DEFAULT_COMPLETION_TOKENS)
+        for key, limits in (data.get("deployments") or {}).items():
+            name = _resolve_deployment_name(str(key))
+            if name is None:
+                print(f"[WARN] Rate limit 설정: 배포 이름을 알 수 없는 키 무시 ({key})")
+                continue
+            config["deployments"][name] = dict(limits or {})
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"[WARN] Rate limit 설정 로드 실패 ({path}): {e}")
+    return config
+
+
+class RateLimiterRegistry:
+    """배포 이름 → DeploymentLimiter (처음 호출 시 설정값으로 생성, 한도가 없는 배포는 None)"""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None, max_wait: Optional[float] = None):
+        self.config = config or load_rate_limit_config()
+        self.max_wait = max_wait
+        self._limiters: Dict[str, DeploymentLimiter] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def default_completion_tokens(self) -> int:
+        return int(self.config.get("default_completion_tokens") or DEFAULT_COMPLETION_TOKENS)
+
+    def get(self, deployment: str) -> Optional[DeploymentLimiter]:
+        with self._lock:
+            limiter = self._limiters.get(deployment)
+            if limiter is None:
+                limits = {**(self.config.get("default") or {}), **self.config.get("deployments", {}).get(deployment, {})}
+                if not limits.get("rpm") or not limits.get("tpm"):
+                    return None
+                limiter = DeploymentLimiter(
+                    deployment, float(limits["rpm"]), float(limits["tpm"]),
+                    burst_sec=float(limits.get("burst_sec") or DEFAULT_BURST_SEC),
+                )
+                self._limiters[deployment] = limiter
+            return limiter
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            limiters = list(self._limiters.values())
+        return {limiter.name: limiter.get_stats() for limiter in limiters}
+
+
+_registry: Optional[RateLimiterRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_rate_limiter_registry() -> RateLimiterRegistry:
+    """프로세스 전역 Rate Limiter 레지스트리 (설정: LLM_RATE_LIMIT_*)"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                from utils.settings import settings
+                _registry = RateLimiterRegistry(
+                    load_rate_limit_config(settings.LLM_RATE_LIMIT_CONFIG_PATH or None),
+                    max_wait=settings.LLM_RATE_LIMIT_MAX_WAIT_SEC or None,
+                )
+    return _registry
+
+
+# =============================================================================
+# httpx Transport (OpenAI SDK 연결 지점)
+# =============================================================================
+
+_AZURE_PATH = re.compile(r"/openai/deployments/([^/]+)/(chat/completions|embeddings)$")
+_V1_PATH = re.compile(r"/(?:openai/)?(?:v1/)?(chat/completions|embeddings)$")
+
+
+def parse_llm_request(path: str, body: Any = None) -> Tuple[Optional[str], Optional[str]]:
+    """
+    요청 경로 (+ 본문의 model) → (배포 이름, "chat" | "embeddings"). LLM 호출이 아니면 (None, None)
+    """
+    match = _AZURE_PATH.search(path)
+    if match:
+        return match.group(1), "embeddings" if match.group(2) == "embeddings" else "chat"
+    match = _V1_PATH.search(path)
+    if match and isinstance(body, dict) and body.get("model"):
+        return str(body["model"]), "embeddings" if match.group(1) == "embeddings" else "chat"
+    return None, None
+
+
+class RateLimitedTransport(httpx.BaseTransport):
+    """
+    OpenAI SDK 의 HTTP 호출 앞에서 배포별 한도를 확보하고 응답 헤더로 보정하는 Transport
+
+    SDK 내부 재시도(max_retries)도 이 Transport 를 거치므로 429 이후 재시도는
+    Limiter 의 일시 정지가 끝날 때까지 대기열에서 기다립니다.
+
+    대기 시간 초과(RateLimitWaitTimeout)는 예외 대신 x-should-retry: false 가 붙은 429 응답으로
+    돌려줍니다. Transport 예외는 SDK 가 연결 오류로 감싸 재시도하므로 대기가 max_retries 배로 늘어납니다.
+    SDK 는 이 응답을 재시도 없이 openai.RateLimitError (code: rate_limit_wait_timeout) 로 올립니다.
+    """
+
+    def __init__(
+        self,
+        registry: Optional[RateLimiterRegistry] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+    ):
+        self._registry = registry
+        self._transport = transport or httpx.HTTPTransport()
+
+    @property
+    def registry(self) -> RateLimiterRegistry:
+        return self._registry or get_rate_limiter_registry()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        body = None
+        try:
+            body = json.loads(request.read() or b"{}")
+        except ValueError:
+            pass
+        deployment, kind = parse_llm_request(request.url.path, body)
+        if deployment is None:
+            return self._transport.handle_request(request)
+
+        from tools.http_transport import remaining_time
+
+        registry = self.registry
+        limiter = registry.get(deployment)
+        if limiter is None:  # 한도가 설정되지 않은 배포
+            return self._transport.handle_request(request)
+        tokens = estimate_request_tokens(body, kind, registry.default_completion_tokens)
+        # 호출 노드의 마감 시간(request_deadline)이 더 짧으면 그만큼만 대기
+        timeout = registry.max_wait
+        remaining = remaining_time()
+        if remaining is not None:
+            timeout = remaining if timeout is None else min(timeout, remaining)
+        try:
+            limiter.acquire(tokens, current_priority(), timeout=timeout)
+        except RateLimitWaitTimeout as e:
+            return _wait_timeout_response(request, e)
+        try:
+            response = self._transport.handle_request(request)
+        except BaseException:
+            limiter.release(tokens)
+            raise
+        limiter.observe(response.status_code, response.headers, tokens)
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+WAIT_TIMEOUT_CODE = "rate_limit_wait_timeout"
+
+
+def _wait_timeout_response(request: httpx.Request, error: RateLimitWaitTimeout) -> httpx.Response:
+    """Limiter 대기 시간 초과 → 재시도하지 않는 429 응답 (OpenAI 오류 형식)"""
+    return httpx.Response(
+        429,
+        headers={"x-should-retry": "false"},
+        json={"error": {"code": WAIT_TIMEOUT_CODE, "type": "rate_limit_error", "message": str(error)}},
+        request=request,
+    )
+
+
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+
+def get_rate_limited_http_client() -> Optional[httpx.Client]:
+    """
+    AzureChatOpenAI / AzureOpenAIEmbeddings 에 전달할 공유 httpx.Client
+
+    LLM_RATE_LIMIT_ENABLED=false 이면 None (SDK 기본 클라이언트 사용)
+    """
+    global _http_client
+    from utils.settings import settings
+
+    if not settings.LLM_RATE_LIMIT_ENABLED:
+        return None
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = httpx.Client(
+                    transport=RateLimitedTransport(),
+                    timeout=httpx.Timeout(600.0, connect=5.0),
+                    follow_redirects=True,
+                )
+    return _http_client
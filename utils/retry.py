@@ -76,7 +76,7 @@ def is_retriable_error(exception: Exception) -> bool:
         bool: 재시도 가능 여부
 
     판단 기준:
-        1. RETRIABLE_EXCEPTIONS 타입 체크
+        1. RETRIABLE_EXCEPTIONS 타입 체크 (응답 헤더 x-should-retry: false 면 재시도 안 함)
         2. 에러 메시지에 retriable 키워드 포함 여부
         3. HTTP 상태 코드 확인 (429, 5xx)
     """
@@ -84,6 +84,11 @@ def is_retriable_error(exception: Exception) -> bool:
     if isinstance(exception, NON_RETRIABLE_EXCEPTIONS):
         return False
 
+    # [NEW] 응답이 재시도 금지를 명시한 경우 (예: Rate Limiter 대기 시간 초과 429)
+    headers = getattr(getattr(exception, "response", None), "headers", None)
+    if headers and str(headers.get("x-should-retry", "")).lower() == "false":
+        return False
+
     # 명시적으로 재시도 가능한 예외
     if isinstance(exception, RETRIABLE_EXCEPTIONS):
         return True
@@ -200,6 +205,26 @@ def calculate_backoff_wait(
     return min(wait, config.max_wait)
 
 
+def get_retry_after(exception: Exception) -> Optional[float]:
+    """
+    예외에 담긴 HTTP 응답의 retry-after-ms / Retry-After 헤더 → 대기 초
+
+    openai.RateLimitError 등 response 속성이 있는 예외만 해석하며, 없으면 None
+    """
+    headers = getattr(getattr(exception, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        retry_after_ms = headers.get("retry-after-ms")
+        if retry_after_ms:
+            return max(0.0, float(retry_after_ms) / 1000.0)
+    except (TypeError, ValueError):
+        pass
+
+    from tools.http_transport import parse_retry_after
+    return parse_retry_after(headers.get("retry-after"))
+
+
 # =============================================================================
 # Retry Decorator
 # =============================================================================
@@ -252,7 +277,12 @@ def with_retry(
                         raise
 
                     # 대기 시간 계산
-                    wait_time = calculate_backoff_wait(attempt, config)
+                    # [NEW] 서버가 Retry-After 를 알려주면 맹목적 백오프 대신 그 시간만큼 대기
+                    retry_after = get_retry_after(e)
+                    if retry_after is not None:
+                        wait_time = min(retry_after, config.max_wait)
+                    else:
+                        wait_time = calculate_backoff_wait(attempt, config)
 
                     # 콜백 호출
                     if on_retry:
@@ -254,6 +254,22 @@ class JudgeResult(BaseModel):
         return 'REVISE'  # 기본값
 
 
+class CitationCheck(BaseModel):
+    """인용 1건의 내용 일치 판정"""
+    index: int = Field(description="검증 대상 인용 번호 (1부터)")
+    supported: bool = Field(description="원본 출처가 해당 주장을 뒷받침하는지 여부")
+    reason: str = Field(default="", description="불일치 시 이유 (1문장)")
+
+
+class CitationCheckResult(BaseModel):
+    """
+    인용 내용 일괄 검증 결과 (CitationValidator)
+
+    검증 대상 인용 전체를 한 번의 LLM 호출로 판정합니다.
+    """
+    checks: List[CitationCheck] = Field(default_factory=list, description="인용별 판정 목록")
+
+
 class RefinementStrategy(BaseModel):
     """
     기획서 개선 전략 (Refiner Agent Output)
@@ -262,6 +278,11 @@ class RefinementStrategy(BaseModel):
     key_focus_areas: List[str] = Field(description="중점적으로 보완해야 할 핵심 영역 (최대 3개)")
     specific_guidelines: List[str] = Field(description="Writer에게 전달할 구체적인 수정 지침 목록")
     additional_search_keywords: List[str] = Field(description="내용 보강을 위해 추가 검색이 필요한 키워드", default_factory=list)
+    # [NEW] 섹션 단위 재작성 (비어 있으면 전체 재작성)
+    target_sections: List[str] = Field(
+        default_factory=list,
+        description="다시 작성할 섹션 이름 또는 ID 목록 (전체 재작성이 필요하면 비워둠)"
+    )
 
 
 # 하위 호환성을 위한 별칭
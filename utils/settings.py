@@ -278,6 +278,71 @@ class ProjectSettings(BaseModel):
     MAX_PARALLEL_AGENTS: int = Field(default=5, description="Supervisor 최대 병렬 실행 에이전트 수")
     AGENT_TIMEOUT_SEC: int = Field(default=60, description="전문 에이전트 실행 타임아웃 (초)")
 
+    # === RAG Settings ===
+    RAG_MAX_PARALLEL_QUERIES: int = Field(default=4, description="Multi-Query 검색 최대 병렬 수")
+
+    # === API Settings ===
+    EVENT_STREAM_BUFFER_SIZE: int = Field(default=500, description="스레드별 SSE 이벤트 버퍼 크기 (재연결 재전송용)")
+    EVENT_STREAM_HEARTBEAT_SEC: float = Field(default=15.0, description="SSE keep-alive 주기 (초)")
+    EVENT_STREAM_RETENTION_SEC: int = Field(default=600, description="종료된 실행의 이벤트 보관 시간 (초)")
+    JOB_QUEUE_WORKERS: int = Field(default=2, description="워크플로우 실행 워커 스레드 수")
+    JOB_QUEUE_MAX_DEPTH: int = Field(default=20, description="대기 작업 최대 수 (초과 시 429)")
+    JOB_QUEUE_DB_PATH: str = Field(default="./data/workflow_jobs.db", description="작업 큐 SQLite 경로 (재시작 시 대기 작업 복구)")
+    JOB_QUEUE_RETENTION_SEC: int = Field(default=86400, description="완료된 작업 기록 보관 시간 (초)")
+
+    # === MCP Settings ===
+    MCP_POOL_MAX_CONCURRENCY: int = Field(default=4, description="MCP 서버별 최대 동시 호출 수")
+    MCP_POOL_CALL_TIMEOUT_SEC: float = Field(default=30.0, description="MCP 도구 호출 타임아웃 (초)")
+    MCP_POOL_STARTUP_TIMEOUT_SEC: float = Field(default=60.0, description="MCP 서버 기동/핸드셰이크 타임아웃 (초)")
+    MCP_POOL_HEALTH_INTERVAL_SEC: float = Field(default=30.0, description="MCP 세션 헬스 체크(ping) 주기 (초)")
+
+    # === HTTP Transport Settings ===
+    HTTP_POOL_MAXSIZE_PER_HOST: int = Field(default=10, description="호스트별 최대 HTTP 연결 수 (Keep-alive 풀)")
+    HTTP_MAX_RETRIES: int = Field(default=2, description="429/503 응답 재시도 횟수 (Retry-After 준수)")
+    HTTP_MAX_RETRY_AFTER_SEC: float = Field(default=30.0, description="허용할 최대 Retry-After 대기 (초)")
+    WEB_SEARCH_DEADLINE_SEC: float = Field(default=60.0, description="웹 검색 노드 전체 마감 시간 (초)")
+    WEB_FETCH_PER_HOST_LIMIT: int = Field(default=2, description="URL 조회 시 호스트별 최대 동시 요청 수")
+    WEB_FETCH_MAX_BYTES: int = Field(default=2_000_000, description="URL 조회 최대 수신 바이트 (스트리밍 제한)")
+    WEB_FETCH_HTML_BUDGET_CHARS: int = Field(default=300_000, description="본문 추출 시 파싱할 최대 HTML 문자 수")
+
+    # === LLM Cache Settings ===
+    LLM_CACHE_ENABLED: bool = Field(default=True, description="LLM 응답 캐시 사용 여부")
+    LLM_CACHE_MAX_TEMPERATURE: float = Field(default=0.0, description="호출 지점 지정이 없을 때 자동 캐시할 최대 temperature")
+    LLM_CACHE_TTL_SEC: float = Field(default=7 * 24 * 3600, description="LLM 응답 캐시 기본 TTL (초, 0이면 만료 없음)")
+    LLM_CACHE_MAX_ENTRIES: int = Field(default=5000, description="LLM 응답 캐시 최대 항목 수")
+
+    # === Single-flight Settings ===
+    SINGLEFLIGHT_ENABLED: bool = Field(default=True, description="동시 실행 간 같은 주제/프리셋의 RAG·웹 검색을 1회로 공유")
+    SINGLEFLIGHT_BUCKET_SEC: float = Field(default=300.0, description="공유 키 시간 구간 (초, 이 구간 안에 시작된 작업만 공유)")
+    SINGLEFLIGHT_MAX_WORKERS: int = Field(default=8, description="공유 작업 실행 스레드 수")
+
+    # === LLM Rate Limit Settings ===
+    LLM_RATE_LIMIT_ENABLED: bool = Field(default=False, description="배포별 RPM/TPM 토큰 버킷으로 Azure OpenAI 호출 조율 (config/rate_limits.yaml 에 실제 한도 명시 후 활성화)")
+    LLM_RATE_LIMIT_CONFIG_PATH: str = Field(default="", description="배포별 한도 YAML 경로 (비우면 config/rate_limits.yaml)")
+    LLM_RATE_LIMIT_MAX_WAIT_SEC: float = Field(default=120.0, description="한도 확보 최대 대기 시간 (초과 시 재시도 없는 429 → openai.RateLimitError, 0이면 무제한)")
+
+    # === File Logger Settings ===
+    LOG_QUEUE_SIZE: int = Field(default=10000, description="로그 기록 대기 큐 크기 (초과 시 드롭)")
+    LOG_BATCH_SIZE: int = Field(default=256, description="쓰기 스레드가 한 번에 기록할 최대 로그 수")
+    LOG_FLUSH_INTERVAL_SEC: float = Field(default=0.5, description="로그 배치 최대 대기 시간 (초)")
+    LOG_MAX_FILE_MB: float = Field(default=20.0, description="로그 파일 1개 최대 크기 (초과 시 교체)")
+    LOG_ROTATE_INTERVAL_SEC: float = Field(default=86400, description="로그 파일 교체 주기 (초)")
+    LOG_RETENTION_DAYS: float = Field(default=14, description="로그 파일 보관 기간 (일)")
+    LOG_MAX_TOTAL_MB: float = Field(default=200.0, description="로그 디렉터리 최대 총 크기 (초과 시 오래된 파일부터 삭제)")
+
+    # === Budget Settings ===
+    BUDGET_MAX_TOKENS_PER_RUN: int = Field(default=0, description="실행 1회 기본 토큰 한도 (0이면 제한 없음, 요청별 오버라이드)")
+    BUDGET_MAX_COST_USD_PER_RUN: float = Field(default=0.0, description="실행 1회 기본 비용 한도 USD (0이면 제한 없음)")
+    BUDGET_SOFT_LIMIT_RATIO: float = Field(default=0.8, description="이 사용률부터 토론/Reranker/Multi-Query 생략 및 개선 루프 축소")
+    PRICING_TABLE_PATH: str = Field(default="", description="모델 단가표 YAML 경로 (비우면 config/pricing.yaml)")
+
+    # === Tracing Settings ===
+    TRACE_BUFFER_TRACES: int = Field(default=50, description="메모리에 보관할 최근 실행 trace 수")
+    TRACE_MAX_SPANS_PER_TRACE: int = Field(default=5000, description="trace 1개당 최대 Span 수 (초과분 드롭)")
+    TRACE_EXPORT_ENABLED: bool = Field(default=True, description="종료된 trace 를 JSONL 파일로 내보내기")
+    TRACE_EXPORT_PATH: str = Field(default="", description="trace JSONL 경로 (비우면 logs/traces/traces.jsonl)")
+    TRACE_EXPORT_MAX_MB: float = Field(default=50.0, description="trace 파일 최대 크기 (초과 시 .1 로 교체)")
+
     def get_effective_settings(self) -> dict:
         """
         현재 프리셋이 적용된 효과적인 설정값 반환
@@ -0,0 +1,228 @@
+"""
+PlanCraft Agent - 실행 간 Single-flight (컨텍스트 수집 공유)
+
+여러 사용자가 비슷한 아이디어로 동시에 기획을 시작하면 각 실행이 같은 RAG 검색과
+웹 검색을 따로 수행합니다. 이 모듈은 (정규화된 주제, 프리셋, 시간 구간) 키로
+진행 중인 작업을 하나로 묶어, 늦게 도착한 실행은 먼저 시작된 작업의 결과를 기다려 공유합니다.
+
+동작:
+    - 첫 실행(leader)이 공유 스레드 풀에 작업을 제출하고, 이후 실행(follower)은 같은 Future 를 대기
+    - 결과는 호출자마다 deepcopy 로 전달 (공유 원본은 어떤 실행도 수정하지 않음)
+    - 실행별 취소: 대기 중인 실행이 timeout(노드 마감 시간)으로 빠져도 공유 작업은 계속됨
+      (leader 가 먼저 빠져도 남은 follower 는 결과를 받음)
+    - 모든 대기자가 빠졌고 작업이 아직 시작 전이면 작업 자체를 취소
+    - 완료된 작업은 즉시 제거 (결과 캐시가 아님 - 캐시는 search_cache / llm_cache 담당)
+
+사용 예시:
+    from utils.singleflight import get_singleflight, make_flight_key
+
+    key = make_flight_key(user_input, preset_key, max_queries)
+    result, shared = get_singleflight("web_search").do(key, lambda: execute_web_search(...), timeout=30)
+"""
+
+import contextvars
+import copy
+import hashlib
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class SingleFlightCancelled(TimeoutError):
+    """대기 중인 실행이 timeout 으로 공유 작업 대기를 중단"""
+
+
+# =============================================================================
+# 키 생성
+# =============================================================================
+
+def normalize_topic(text: str) -> str:
+    """대소문자 / 공백 / 끝 문장부호 차이를 없앤 주제 문자열"""
+    return " ".join((text or "").lower().split()).strip(" .,!?~。")
+
+
+def make_flight_key(topic: str, *parts: Any, bucket_sec: Optional[float] = None, now: Optional[float] = None) -> str:
+    """
+    (정규화된 주제, 추가 구분값, 시간 구간) → 키
+
+    같은 시간 구간(bucket_sec) 안에서 시작된 작업만 공유합니다.
+    bucket_sec 생략 시 SINGLEFLIGHT_BUCKET_SEC 설정값을 사용합니다.
+    """
+    if bucket_sec is None:
+        from utils.settings import settings
+        bucket_sec = settings.SINGLEFLIGHT_BUCKET_SEC
+    bucket = int((time.time() if now is None else now) // bucket_sec) if bucket_sec and bucket_sec > 0 else 0
+    raw = "\x1f".join([normalize_topic(topic), *(str(p) for p in parts), str(bucket)])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+
+# =============================================================================
+# Single-flight
+# =============================================================================
+
+class _Flight:
+    """진행 중인 공유 작업 1개"""
+
+    __slots__ = ("key", "future", "waiters")
+
+    def __init__(self, key: str):
+        self.key = key
+        self.future: Optional[Future] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    키별로 진행 중인 작업을 1개로 묶는 그룹
+
+    Args:
+        name: 통계 / 로그용 이름
+        executor: 공유 작업을 실행할 풀 (기본: 프로세스 공유 풀)
+    """
+
+    def __init__(self, name: str, executor: Optional[ThreadPoolExecutor] = None):
+        self.name = name
+        self._executor = executor
+        self._flights: Dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+
+        self._leaders = 0
+        self._shared = 0
+        self._cancelled_waiters = 0
+        self._abandoned = 0
+
+    def do(
+        self,
+        key: str,
+        fn: Callable[[], Any],
+        timeout: Optional[float] = None,
+    ) -> Tuple[Any, bool]:
+        """
+        key 로 진행 중인 작업이 있으면 기다려 공유하고, 없으면 fn 을 공유 작업으로 시작합니다.
+
+        fn 은 호출한(leader) 실행의 컨텍스트(Span, 마감 시간, 예산, 우선순위)로 실행됩니다.
+
+        Args:
+            key: make_flight_key() 결과
+            fn: 공유 작업 (인자 없음, 반환값은 deepcopy 가능해야 함)
+            timeout: 이 실행이 기다릴 최대 시간 (초, None 이면 완료까지)
+
+        Returns:
+            (결과 사본, 다른 실행이 시작한 작업을 공유했는지 여부)
+
+        Raises:
+            SingleFlightCancelled: timeout 으로 대기 중단 (공유 작업은 계속됨)
+            Exception: 공유 작업에서 발생한 예외 (모든 대기자에게 전달)
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            shared = flight is not None
+            if shared:
+                self._shared += 1
+            else:
+                flight = _Flight(key)
+                self._flights[key] = flight
+                self._leaders += 1
+                flight.future = self._get_executor().submit(contextvars.copy_context().run, self._run, flight, fn)
+            flight.waiters += 1
+
+        try:
+            result = self._wait(flight.future, timeout)
+        except SingleFlightCancelled:
+            with self._lock:
+                flight.waiters -= 1
+                self._cancelled_waiters += 1
+                # 기다리는 실행이 없고 아직 시작 전인 작업만 취소 (실행 중이면 끝까지 진행)
+                if flight.waiters == 0 and flight.future.cancel():
+                    self._abandoned += 1
+                    if self._flights.get(key) is flight:
+                        del self._flights[key]
+            raise
+
+        with self._lock:
+            flight.waiters -= 1
+        return copy.deepcopy(result), shared
+
+    def _run(self, flight: _Flight, fn: Callable[[], Any]) -> Any:
+        try:
+            return fn()
+        finally:
+            with self._lock:
+                if self._flights.get(flight.key) is flight:
+                    del self._flights[flight.key]
+
+    def _wait(self, future: Future, timeout: Optional[float]) -> Any:
+        try:
+            return future.result(timeout=None if timeout is None else max(0.0, timeout))
+        except FutureTimeoutError:
+            # Python 3.10 은 concurrent.futures.TimeoutError 가 내장 TimeoutError 와 별개 클래스 (3.11+ 는 동일)
+            # 공유 작업 자체가 TimeoutError 로 끝난 경우는 그대로 전달
+            if future.done():
+                return future.result()
+            raise SingleFlightCancelled(f"{self.name}: timed out waiting for shared work") from None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        return self._executor or _get_shared_executor()
+
+    def in_flight(self) -> int:
+        """진행 중인 공유 작업 수"""
+        with self._lock:
+            return len(self._flights)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self._leaders + self._shared
+            return {
+                "leaders": self._leaders,
+                "shared": self._shared,
+                "share_rate": round(self._shared / total, 3) if total else 0.0,
+                "cancelled_waiters": self._cancelled_waiters,
+                "abandoned": self._abandoned,
+                "in_flight": len(self._flights),
+            }
+
+
+# =============================================================================
+# 공유 실행 풀 / 그룹 레지스트리
+# =============================================================================
+# 공유 작업은 대기하는 실행과 분리된 스레드에서 돌아야 특정 실행이 빠져도 끊기지 않습니다.
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+_groups: Dict[str, SingleFlight] = {}
+_groups_lock = threading.Lock()
+
+
+def _get_shared_executor() -> ThreadPoolExecutor:
+    """공유 작업 실행용 스레드 풀 (싱글톤)"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                from utils.settings import settings
+                _executor = ThreadPoolExecutor(
+                    max_workers=max(1, settings.SINGLEFLIGHT_MAX_WORKERS),
+                    thread_name_prefix="singleflight"
+                )
+    return _executor
+
+
+def get_singleflight(name: str) -> SingleFlight:
+    """이름별 Single-flight 그룹 (싱글톤)"""
+    group = _groups.get(name)
+    if group is None:
+        with _groups_lock:
+            group = _groups.get(name)
+            if group is None:
+                group = SingleFlight(name)
+                _groups[name] = group
+    return group
+
+
+def get_singleflight_stats() -> Dict[str, Dict[str, Any]]:
+    """모든 그룹의 공유 / 취소 통계"""
+    with _groups_lock:
+        groups = list(_groups.values())
+    return {group.name: group.get_stats() for group in groups}
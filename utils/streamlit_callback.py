@@ -3,9 +3,63 @@ from typing import Any, Dict, List, Optional
 from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.outputs import LLMResult
 
-# 토큰당 비용 (USD) - GPT-4o 기준
-COST_PER_INPUT_TOKEN = 2.5 / 1_000_000  # $2.5 per 1M tokens
-COST_PER_OUTPUT_TOKEN = 10 / 1_000_000  # $10 per 1M tokens
+from utils.budget import get_pricing_table
+
+
+def _cached_usage(response: LLMResult) -> tuple:
+    """
+    [NEW] 응답 캐시 히트분 집계 → (캐시 호출 수, 절감 입력 토큰, 절감 출력 토큰)
+
+    캐시 히트 응답은 llm_output이 없으므로 실제 사용량에 포함되지 않으며,
+    원래 응답의 usage_metadata를 "saved" 토큰으로 따로 집계합니다.
+    """
+    calls = saved_input = saved_output = 0
+    for generations in response.generations:
+        for gen in generations:
+            if not (gen.generation_info or {}).get("from_cache"):
+                continue
+            calls += 1
+            usage = getattr(getattr(gen, "message", None), "usage_metadata", None) or {}
+            saved_input += usage.get("input_tokens", 0) or 0
+            saved_output += usage.get("output_tokens", 0) or 0
+    return calls, saved_input, saved_output
+
+
+def _record_model_usage(model_usage: Dict[Optional[str], List[int]], response: LLMResult) -> None:
+    """[NEW] 모델별 입력/출력 토큰 누적 (단가표 기반 비용 계산용)"""
+    llm_output = response.llm_output or {}
+    usage = llm_output.get("token_usage", {})
+    entry = model_usage.setdefault(llm_output.get("model_name"), [0, 0])
+    entry[0] += usage.get("prompt_tokens", 0)
+    entry[1] += usage.get("completion_tokens", 0)
+
+
+def _build_usage_summary(tracker: Any) -> dict:
+    """
+    [UPDATE] 토큰 사용량 요약 - config/pricing.yaml 단가표 / 환율 적용
+
+    모델명을 알 수 없는 사용량(캐시 히트 절감분 등)은 단가표 default_model 기준으로 계산합니다.
+    """
+    pricing = get_pricing_table()
+    total_tokens = tracker.total_input_tokens + tracker.total_output_tokens
+    estimated_cost = sum(
+        pricing.cost(model, input_tokens, output_tokens)
+        for model, (input_tokens, output_tokens) in tracker.model_usage.items()
+    )
+    saved_cost = pricing.cost(None, tracker.saved_input_tokens, tracker.saved_output_tokens)
+    return {
+        "input_tokens": tracker.total_input_tokens,
+        "output_tokens": tracker.total_output_tokens,
+        "total_tokens": total_tokens,
+        "llm_calls": tracker.llm_call_count,
+        "cached_calls": tracker.cached_call_count,
+        "saved_input_tokens": tracker.saved_input_tokens,
+        "saved_output_tokens": tracker.saved_output_tokens,
+        "saved_cost_usd": round(saved_cost, 4),
+        "estimated_cost_usd": round(estimated_cost, 4),
+        "estimated_cost_krw": round(pricing.convert(estimated_cost, "KRW"), 0),
+        "pricing_version": pricing.version,
+    }
 
 
 class TokenTrackingCallback(BaseCallbackHandler):
@@ -18,6 +72,10 @@ class TokenTrackingCallback(BaseCallbackHandler):
         self.total_input_tokens = 0
         self.total_output_tokens = 0
         self.llm_call_count = 0
+        self.cached_call_count = 0
+        self.saved_input_tokens = 0
+        self.saved_output_tokens = 0
+        self.model_usage: Dict[Optional[str], List[int]] = {}
 
     def on_llm_start(
         self, serialized: Dict[str, Any], prompts: List[str], **kwargs: Any
@@ -32,24 +90,17 @@ class TokenTrackingCallback(BaseCallbackHandler):
                 usage = response.llm_output.get("token_usage", {})
                 self.total_input_tokens += usage.get("prompt_tokens", 0)
                 self.total_output_tokens += usage.get("completion_tokens", 0)
+                _record_model_usage(self.model_usage, response)
+            calls, saved_input, saved_output = _cached_usage(response)
+            self.cached_call_count += calls
+            self.saved_input_tokens += saved_input
+            self.saved_output_tokens += saved_output
         except Exception:
             pass
 
     def get_usage_summary(self) -> dict:
         """토큰 사용량 요약"""
-        total_tokens = self.total_input_tokens + self.total_output_tokens
-        estimated_cost = (
-            self.total_input_tokens * COST_PER_INPUT_TOKEN +
-            self.total_output_tokens * COST_PER_OUTPUT_TOKEN
-        )
-        return {
-            "input_tokens": self.total_input_tokens,
-            "output_tokens": self.total_output_tokens,
-            "total_tokens": total_tokens,
-            "llm_calls": self.llm_call_count,
-            "estimated_cost_usd": round(estimated_cost, 4),
-            "estimated_cost_krw": round(estimated_cost * 1350, 0)
-        }
+        return _build_usage_summary(self)
 
 # 단계별 표시 정보 (key, icon, label, progress%)
 STEP_INFO = {
@@ -92,6 +143,10 @@ class StreamlitStatusCallback(BaseCallbackHandler):
         self.total_input_tokens = 0
         self.total_output_tokens = 0
         self.llm_call_count = 0
+        self.cached_call_count = 0
+        self.saved_input_tokens = 0
+        self.saved_output_tokens = 0
+        self.model_usage: Dict[Optional[str], List[int]] = {}
 
     def set_step(self, step_key: str):
         """현재 단계 설정 - label과 progress 실시간 업데이트"""
@@ -162,6 +217,11 @@ class StreamlitStatusCallback(BaseCallbackHandler):
                 usage = response.llm_output.get("token_usage", {})
                 self.total_input_tokens += usage.get("prompt_tokens", 0)
                 self.total_output_tokens += usage.get("completion_tokens", 0)
+                _record_model_usage(self.model_usage, response)
+            calls, saved_input, saved_output = _cached_usage(response)
+            self.cached_call_count += calls
+            self.saved_input_tokens += saved_input
+            self.saved_output_tokens += saved_output
         except Exception:
             pass
 
@@ -179,19 +239,7 @@ class StreamlitStatusCallback(BaseCallbackHandler):
 
     def get_usage_summary(self) -> dict:
         """토큰 사용량 요약"""
-        total_tokens = self.total_input_tokens + self.total_output_tokens
-        estimated_cost = (
-            self.total_input_tokens * COST_PER_INPUT_TOKEN +
-            self.total_output_tokens * COST_PER_OUTPUT_TOKEN
-        )
-        return {
-            "input_tokens": self.total_input_tokens,
-            "output_tokens": self.total_output_tokens,
-            "total_tokens": total_tokens,
-            "llm_calls": self.llm_call_count,
-            "estimated_cost_usd": round(estimated_cost, 4),
-            "estimated_cost_krw": round(estimated_cost * 1350, 0)
-        }
+        return _build_usage_summary(self)
 
     def get_execution_summary(self) -> List[dict]:
         """실행 로그 요약"""
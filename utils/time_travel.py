@@ -360,8 +360,8 @@ def create_time_travel(thread_id: str = "default_thread") -> TimeTravel:
     Returns:
         TimeTravel 인스턴스
     """
-    from graph.workflow import app
-    return TimeTravel(app, thread_id)
+    from graph.workflow import get_app
+    return TimeTravel(get_app(), thread_id)
 
 
 def get_execution_timeline(thread_id: str = "default_thread") -> List[Dict[str, Any]]:
@@ -1,5 +1,5 @@
 """
-LangSmith Tracing Utility
+LangSmith Tracing Utility + 로컬 Span 트레이서
 
 노드별 상세 트레이싱을 위한 유틸리티 모듈입니다.
 LangSmith에서 노드 실행을 추적하고 디버깅할 수 있도록 메타데이터를 추가합니다.
@@ -9,6 +9,22 @@ LangSmith에서 노드 실행을 추적하고 디버깅할 수 있도록 메타
     - 태그 기반 필터링 지원
     - 메타데이터 (preset, refine_count 등) 기록
     - 실행 시간 측정
+    - [NEW] contextvars 기반 Span 트레이서 (LangSmith 없이 실행별 지연 분석)
+        run → node → agent → llm / retrieval / search 계층을 부모-자식 Span 으로 기록
+        스레드 풀 작업은 contextvars.copy_context().run 으로 제출하면 부모 Span 이 이어짐
+        종료된 실행은 메모리 링 버퍼 + JSONL 파일(logs/traces/traces.jsonl)로 내보냄
+        format_waterfall() / to_folded_stacks() 로 워터폴 / 플레임 그래프 생성
+
+Span 사용 예시:
+    with span("rerank", kind="retrieval", docs=len(docs)):
+        ...
+
+    @traced("retrieve", kind="retrieval")
+    def get_relevant_documents(self, query): ...
+
+워터폴 보기:
+    python -m utils.tracing --thread <thread_id>
+    python -m utils.tracing --flame > run.folded   # flamegraph.pl / speedscope 입력
 
 사용 예시:
     @trace_node("analyze", tags=["agent", "llm"])
@@ -21,19 +37,31 @@ LangSmith 대시보드에서 확인:
     - 그룹핑: run_name
 """
 
+import contextvars
 import functools
+import json
+import threading
 import time
 import os
-from typing import Callable, List, Optional, Dict, Any
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Dict, Any, Iterator
 from datetime import datetime
 
-from utils.file_logger import get_file_logger
+from langchain_core.callbacks import BaseCallbackHandler
+
+from utils.file_logger import get_file_logger, LOG_DIR
 
 
 # =============================================================================
 # Constants
 # =============================================================================
 
+# [FIX] 실행 로그 정리(LogWriter._cleanup_old_logs)와 섞이지 않도록 하위 디렉토리에 보관
+DEFAULT_TRACE_EXPORT_PATH = os.path.join(LOG_DIR, "traces", "traces.jsonl")
+
 # 노드 카테고리별 기본 태그
 NODE_TAGS = {
     "context": ["rag", "retrieval"],
@@ -61,6 +89,299 @@ NODE_DESCRIPTIONS = {
 }
 
 
+# =============================================================================
+# [NEW] Span Tracer (contextvars)
+# =============================================================================
+# 기존 trace_node 는 os.environ 에 LANGCHAIN_RUN_NAME / LANGCHAIN_TAGS 를 써서
+# 컨텍스트를 전달했기 때문에 동시 실행 / Supervisor 워커 스레드가 서로 값을 덮어썼습니다.
+# 현재 Span 은 ContextVar 로 관리하므로 실행(스레드/컨텍스트)마다 독립적입니다.
+
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar("plancraft_span", default=None)
+
+
+@dataclass
+class Span:
+    """실행 구간 1개 (시각은 epoch 초)"""
+    name: str
+    kind: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    start: float
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    end: Optional[float] = None
+    status: str = "ok"
+    error: Optional[str] = None
+    thread: str = ""
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end if self.end is not None else time.time()
+        return (end - self.start) * 1000
+
+    def set(self, **attributes) -> None:
+        """실행 중 속성 추가 (토큰 수, 결과 건수 등)"""
+        self.attributes.update(attributes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start": self.start,
+            "end": self.end,
+            "duration_ms": round(self.duration_ms, 2),
+            "status": self.status,
+            "error": self.error,
+            "thread": self.thread,
+            "attributes": _json_safe(self.attributes),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Span":
+        return cls(
+            name=data["name"], kind=data.get("kind", "internal"), trace_id=data["trace_id"],
+            span_id=data["span_id"], parent_id=data.get("parent_id"), start=data["start"],
+            attributes=data.get("attributes") or {}, end=data.get("end"),
+            status=data.get("status", "ok"), error=data.get("error"), thread=data.get("thread", ""),
+        )
+
+
+def _json_safe(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {str(k): _json_safe(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(v) for v in value]
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+class Tracer:
+    """
+    Span 수집기
+
+    - 메모리 링 버퍼: 최근 max_traces 개 실행(trace)의 Span 보관
+    - 파일 내보내기: 루트 Span 종료 시 해당 trace 의 Span 을 JSONL 로 1회 기록
+      (export_max_bytes 초과 시 traces.jsonl → traces.1.jsonl 로 교체)
+    """
+
+    def __init__(
+        self,
+        max_traces: int = 50,
+        max_spans_per_trace: int = 5000,
+        export_path: Optional[str] = None,
+        export_max_bytes: int = 50 * 1024 * 1024,
+    ):
+        self.max_traces = max_traces
+        self.max_spans_per_trace = max_spans_per_trace
+        self.export_path = export_path
+        self.export_max_bytes = export_max_bytes
+        self._traces: "OrderedDict[str, List[Span]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._export_lock = threading.Lock()
+        self.dropped_spans = 0
+
+    def start_span(self, name: str, kind: str = "internal", parent: Optional[Span] = None, **attributes) -> Span:
+        """Span 시작 (부모가 없으면 새 trace 의 루트)"""
+        trace_id = parent.trace_id if parent else uuid.uuid4().hex
+        span = Span(
+            name=name, kind=kind, trace_id=trace_id, span_id=uuid.uuid4().hex[:16],
+            parent_id=parent.span_id if parent else None, start=time.time(),
+            attributes=attributes, thread=threading.current_thread().name,
+        )
+        if parent is None:
+            with self._lock:
+                self._traces[trace_id] = []
+                while len(self._traces) > self.max_traces:
+                    self._traces.popitem(last=False)
+        return span
+
+    def end_span(self, span: Span, error: Optional[BaseException] = None) -> None:
+        """Span 종료 후 버퍼에 기록 (루트면 trace 내보내기)"""
+        span.end = time.time()
+        if error is not None:
+            span.status = "error"
+            span.error = f"{type(error).__name__}: {str(error)[:200]}"
+
+        with self._lock:
+            spans = self._traces.get(span.trace_id)
+            if spans is None or len(spans) >= self.max_spans_per_trace:
+                self.dropped_spans += 1
+                return
+            spans.append(span)
+            finished = list(spans) if span.parent_id is None else None
+
+        if finished is not None and self.export_path:
+            self._export(finished)
+
+    def _export(self, spans: List[Span]) -> None:
+        try:
+            lines = "".join(json.dumps(s.to_dict(), ensure_ascii=False) + "\n" for s in spans)
+            with self._export_lock:
+                directory = os.path.dirname(self.export_path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                if os.path.exists(self.export_path) and os.path.getsize(self.export_path) >= self.export_max_bytes:
+                    root, ext = os.path.splitext(self.export_path)
+                    os.replace(self.export_path, f"{root}.1{ext}")
+                with open(self.export_path, "a", encoding="utf-8") as f:
+                    f.write(lines)
+        except Exception as e:
+            print(f"[WARN] Trace export failed: {e}")
+
+    def get_trace(self, trace_id: str) -> List[Span]:
+        """trace 의 Span 목록 (시작 시각 순)"""
+        with self._lock:
+            spans = list(self._traces.get(trace_id, []))
+        return sorted(spans, key=lambda s: s.start)
+
+    def find_traces(self, thread_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """종료된 trace 요약 목록 (최근 순, thread_id 로 필터)"""
+        with self._lock:
+            items = [(tid, list(spans)) for tid, spans in self._traces.items()]
+        summaries = []
+        for trace_id, spans in reversed(items):
+            root = next((s for s in spans if s.parent_id is None), None)
+            if root is None:
+                continue  # 진행 중
+            if thread_id and root.attributes.get("thread_id") != thread_id:
+                continue
+            summaries.append({
+                "trace_id": trace_id,
+                "name": root.name,
+                "thread_id": root.attributes.get("thread_id"),
+                "start": root.start,
+                "duration_ms": round(root.duration_ms, 1),
+                "span_count": len(spans),
+                "status": root.status,
+            })
+        return summaries
+
+    def clear(self) -> None:
+        with self._lock:
+            self._traces.clear()
+            self.dropped_spans = 0
+
+
+_tracer: Optional[Tracer] = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    """프로세스 전역 Tracer (싱글톤)"""
+    global _tracer
+    if _tracer is None:
+        with _tracer_lock:
+            if _tracer is None:
+                from utils.settings import settings
+
+                export_path = None
+                if settings.TRACE_EXPORT_ENABLED:
+                    export_path = settings.TRACE_EXPORT_PATH or DEFAULT_TRACE_EXPORT_PATH
+                _tracer = Tracer(
+                    max_traces=settings.TRACE_BUFFER_TRACES,
+                    max_spans_per_trace=settings.TRACE_MAX_SPANS_PER_TRACE,
+                    export_path=export_path,
+                    export_max_bytes=int(settings.TRACE_EXPORT_MAX_MB * 1024 * 1024),
+                )
+    return _tracer
+
+
+def current_span() -> Optional[Span]:
+    """현재 컨텍스트의 Span (없으면 None)"""
+    return _current_span.get()
+
+
+@contextmanager
+def span(name: str, kind: str = "internal", **attributes) -> Iterator[Span]:
+    """
+    현재 Span 의 자식 Span 을 열고 컨텍스트에 설정 (없으면 새 trace 시작)
+
+    kind: run / node / agent / llm / retrieval / search / internal
+    """
+    tracer = get_tracer()
+    current = tracer.start_span(name, kind, parent=_current_span.get(), **attributes)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        tracer.end_span(current, error=e)
+        raise
+    else:
+        tracer.end_span(current)
+    finally:
+        _current_span.reset(token)
+
+
+def traced(name: Optional[str] = None, kind: str = "internal") -> Callable:
+    """[Decorator] 함수 실행을 Span 으로 기록"""
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(span_name, kind=kind):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class SpanCallbackHandler(BaseCallbackHandler):
+    """
+    LangChain LLM 호출 → llm Span
+
+    호출 시점의 현재 Span(노드/에이전트)을 부모로 하는 자식 Span 을 만듭니다.
+    run_plancraft 가 config callbacks 에 추가하므로 노드 내부 llm.invoke() 도 자동 상속됩니다.
+    """
+
+    def __init__(self):
+        self._spans: Dict[Any, Span] = {}
+        self._lock = threading.Lock()
+
+    def _start(self, run_id, serialized, kwargs) -> None:
+        parent = _current_span.get()
+        if parent is None:
+            return
+        params = (kwargs.get("invocation_params") or {})
+        model = params.get("azure_deployment") or params.get("model") or params.get("model_name") \
+            or ((serialized or {}).get("kwargs") or {}).get("azure_deployment") or "llm"
+        llm_span = get_tracer().start_span(str(model), "llm", parent=parent)
+        with self._lock:
+            self._spans[run_id] = llm_span
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs):
+        self._start(run_id, serialized, kwargs)
+
+    def on_llm_start(self, serialized, prompts, *, run_id, **kwargs):
+        self._start(run_id, serialized, kwargs)
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        with self._lock:
+            llm_span = self._spans.pop(run_id, None)
+        if llm_span is None:
+            return
+        usage = (response.llm_output or {}).get("token_usage") or {}
+        cached = any(
+            (gen.generation_info or {}).get("from_cache")
+            for generations in response.generations for gen in generations
+        )
+        llm_span.set(
+            prompt_tokens=usage.get("prompt_tokens", 0),
+            completion_tokens=usage.get("completion_tokens", 0),
+            cached=cached,
+        )
+        get_tracer().end_span(llm_span)
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        with self._lock:
+            llm_span = self._spans.pop(run_id, None)
+        if llm_span is not None:
+            get_tracer().end_span(llm_span, error=error)
+
+
 # =============================================================================
 # Tracing Decorator
 # =============================================================================
@@ -120,29 +441,25 @@ def trace_node(
             # run_name 생성
             run_name = NODE_DESCRIPTIONS.get(node_name, f"🔄 {node_name}")
 
-            # LangSmith 환경변수로 메타데이터 전달
-            # Note: RunnableConfig 방식이 더 안전하나, 현재 구조상 환경변수 방식 사용
-            _set_trace_context(run_name, all_tags, metadata)
-
-            # 트레이싱 로그 (LangSmith 비활성화 시에도 로컬 로그 유지)
-            logger.info(f"[TRACE] {run_name} 시작 | tags={all_tags}")
-
-            try:
-                result = func(state, *args, **kwargs)
+            # [UPDATE] 메타데이터는 환경변수 대신 컨텍스트 로컬 Span 속성으로 전달
+            # (os.environ 은 프로세스 전역이라 동시 실행 시 서로 덮어씀)
+            with span(node_name, kind="node", run_name=run_name, tags=sorted(all_tags), **metadata):
+                # 트레이싱 로그 (LangSmith 비활성화 시에도 로컬 로그 유지)
+                logger.info(f"[TRACE] {run_name} 시작 | tags={all_tags}")
 
-                # 실행 시간 측정
-                execution_ms = int((time.time() - start_time) * 1000)
-                logger.info(f"[TRACE] {run_name} 완료 | {execution_ms}ms")
+                try:
+                    result = func(state, *args, **kwargs)
 
-                return result
+                    # 실행 시간 측정
+                    execution_ms = int((time.time() - start_time) * 1000)
+                    logger.info(f"[TRACE] {run_name} 완료 | {execution_ms}ms")
 
-            except Exception as e:
-                execution_ms = int((time.time() - start_time) * 1000)
-                logger.error(f"[TRACE] {run_name} 실패 | {execution_ms}ms | {str(e)[:50]}")
-                raise
+                    return result
 
-            finally:
-                _clear_trace_context()
+                except Exception as e:
+                    execution_ms = int((time.time() - start_time) * 1000)
+                    logger.error(f"[TRACE] {run_name} 실패 | {execution_ms}ms | {str(e)[:50]}")
+                    raise
 
         return wrapper
     return decorator
@@ -180,28 +497,6 @@ def _build_metadata(state: dict, node_name: str, include_state_info: bool) -> Di
     return metadata
 
 
-def _set_trace_context(run_name: str, tags: List[str], metadata: Dict[str, Any]):
-    """
-    LangSmith 트레이싱 컨텍스트 설정
-
-    주의: 환경변수 방식은 임시 솔루션입니다.
-    프로덕션에서는 RunnableConfig + callbacks 사용 권장.
-    """
-    # LangSmith 환경변수 (참고용 - 실제로는 langchain callbacks 사용)
-    os.environ["LANGCHAIN_RUN_NAME"] = run_name
-    os.environ["LANGCHAIN_TAGS"] = ",".join(tags)
-
-    # 메타데이터는 JSON으로 저장하기 어려우므로 로그로만 기록
-    logger = get_file_logger()
-    logger.debug(f"[TRACE META] {metadata}")
-
-
-def _clear_trace_context():
-    """트레이싱 컨텍스트 정리"""
-    os.environ.pop("LANGCHAIN_RUN_NAME", None)
-    os.environ.pop("LANGCHAIN_TAGS", None)
-
-
 # =============================================================================
 # Utility Functions (외부에서 사용 가능)
 # =============================================================================
@@ -265,3 +560,145 @@ def format_trace_for_langsmith(state: dict) -> str:
             lines.append(f"  - {step}: {time_str}")
 
     return "\n".join(lines)
+
+
+# =============================================================================
+# [NEW] 워터폴 / 플레임 그래프 (LangSmith 없이 실행 지연 분석)
+# =============================================================================
+
+def load_traces(path: Optional[str] = None) -> Dict[str, List[Span]]:
+    """JSONL 내보내기 파일 → {trace_id: [Span, ...]} (파일 순서 = 실행 종료 순)"""
+    path = path or get_tracer().export_path or DEFAULT_TRACE_EXPORT_PATH
+    traces: Dict[str, List[Span]] = OrderedDict()
+    if not os.path.exists(path):
+        return traces
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                item = Span.from_dict(json.loads(line))
+            except (ValueError, KeyError):
+                continue
+            traces.setdefault(item.trace_id, []).append(item)
+    return traces
+
+
+def _tree(spans: List[Span]):
+    """(루트 목록, parent_id → 자식 목록) - 부모가 없는 Span 은 루트로 취급"""
+    ids = {s.span_id for s in spans}
+    children: Dict[str, List[Span]] = {}
+    roots = []
+    for s in sorted(spans, key=lambda x: x.start):
+        if s.parent_id and s.parent_id in ids:
+            children.setdefault(s.parent_id, []).append(s)
+        else:
+            roots.append(s)
+    return roots, children
+
+
+def format_waterfall(spans: List[Span], width: int = 40) -> str:
+    """
+    워터폴 텍스트 (시작 오프셋 / 소요 시간 / 계층 / 타임라인 막대)
+
+    예:
+        offset     dur  span
+           0.0  5210.3  run:plancraft          |########################################|
+           1.2   820.5    node:analyze         |######                                  |
+    """
+    if not spans:
+        return "(no spans)"
+    roots, children = _tree(spans)
+    t0 = min(s.start for s in spans)
+    total = max((s.end or s.start) for s in spans) - t0 or 1e-9
+
+    rows = []
+
+    def visit(s: Span, depth: int):
+        rows.append((s, depth))
+        for child in children.get(s.span_id, []):
+            visit(child, depth + 1)
+
+    for root in roots:
+        visit(root, 0)
+
+    label_width = min(60, max(len("  " * d + f"{s.kind}:{s.name}") for s, d in rows))
+    lines = [f"{'offset':>9} {'dur':>9}  {'span'.ljust(label_width)}  (ms, total {total * 1000:.1f})"]
+    for s, depth in rows:
+        begin = int((s.start - t0) / total * width)
+        length = max(1, int(round(s.duration_ms / 1000 / total * width)))
+        bar = (" " * begin + "#" * length)[:width].ljust(width)
+        label = ("  " * depth + f"{s.kind}:{s.name}")[:label_width].ljust(label_width)
+        flag = " !" if s.status == "error" else ""
+        lines.append(f"{(s.start - t0) * 1000:>9.1f} {s.duration_ms:>9.1f}  {label}  |{bar}|{flag}")
+    return "\n".join(lines)
+
+
+def to_folded_stacks(spans: List[Span]) -> str:
+    """
+    플레임 그래프 입력 (folded stacks: "a;b;c <self time us>")
+
+    self time = 자기 구간 - 자식 구간 합 (병렬 자식으로 음수가 되면 0)
+    """
+    roots, children = _tree(spans)
+    lines = []
+
+    def visit(s: Span, prefix: str):
+        frame = f"{prefix};{s.kind}:{s.name}" if prefix else f"{s.kind}:{s.name}"
+        kids = children.get(s.span_id, [])
+        self_us = int(round(max(0.0, s.duration_ms - sum(k.duration_ms for k in kids)) * 1000))
+        if self_us:
+            lines.append(f"{frame} {self_us}")
+        for child in kids:
+            visit(child, frame)
+
+    for root in roots:
+        visit(root, "")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="실행 trace 워터폴 / 플레임 그래프 출력")
+    parser.add_argument("--file", default=None, help="traces.jsonl 경로 (기본: logs/traces/traces.jsonl)")
+    parser.add_argument("--thread", default=None, help="thread_id 로 필터 (가장 최근 실행)")
+    parser.add_argument("--trace", default=None, help="trace_id 지정")
+    parser.add_argument("--flame", action="store_true", help="folded stacks 출력")
+    parser.add_argument("--list", action="store_true", help="trace 목록 출력")
+    args = parser.parse_args(argv)
+
+    traces = load_traces(args.file)
+    if not traces:
+        print("[Trace] No traces found")
+        return 1
+
+    def root_of(spans):
+        return next((s for s in spans if s.parent_id is None), spans[0])
+
+    if args.list:
+        for trace_id, spans in traces.items():
+            root = root_of(spans)
+            print(f"{trace_id}  {root.attributes.get('thread_id', '-'):<36}  "
+                  f"{root.duration_ms:>9.1f}ms  {len(spans)} spans")
+        return 0
+
+    if args.trace:
+        spans = traces.get(args.trace)
+    else:
+        candidates = [
+            spans for spans in traces.values()
+            if not args.thread or root_of(spans).attributes.get("thread_id") == args.thread
+        ]
+        spans = candidates[-1] if candidates else None
+    if not spans:
+        print("[Trace] Trace not found")
+        return 1
+
+    print(to_folded_stacks(spans) if args.flame else format_waterfall(spans))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())